@@ -98,6 +98,12 @@ type Py2JsRestyleMsg = Py2JsMsg & {
   restyle_traces?: null | number | number[];
 };
 
+type Py2JsExtendTracesMsg = Py2JsMsg & {
+  extend_data: any;
+  extend_traces: number[];
+  max_points?: null | number;
+};
+
 type Py2JsRelayoutMsg = Py2JsMsg & {
   relayout_data: any;
 };
@@ -231,6 +237,22 @@ export class FigureModel extends DOMWidgetModel {
        */
       _py2js_restyle: null,
 
+      /**
+       * @typedef {null|Object} Py2JsExtendTracesMsg
+       * @property {Object} extend_data
+       *  Update data as accepted by Plotly.extendTraces, mapping property
+       *  paths to an array of the points to append to each trace
+       * @property {Array.<Number>} extend_traces
+       *  Array of indexes of the traces that the extend operation applies to
+       * @property {null|Number} max_points
+       *  Maximum number of points to keep in each extended array, or null
+       *  to keep all points
+       * @property {Number} trace_edit_id
+       *  Edit ID to use when returning trace deltas using
+       *  the _js2py_traceDeltas message
+       */
+      _py2js_extendTraces: null,
+
       /**
        * @typedef {null|Object} Py2JsRelayoutMsg
        * @property {Object} relayout_data
@@ -517,6 +539,7 @@ export class FigureModel extends DOMWidgetModel {
     this.on("change:_py2js_deleteTraces", this.do_deleteTraces, this);
     this.on("change:_py2js_moveTraces", this.do_moveTraces, this);
     this.on("change:_py2js_restyle", this.do_restyle, this);
+    this.on("change:_py2js_extendTraces", this.do_extendTraces, this);
     this.on("change:_py2js_relayout", this.do_relayout, this);
     this.on("change:_py2js_update", this.do_update, this);
     this.on("change:_py2js_animate", this.do_animate, this);
@@ -633,6 +656,22 @@ export class FigureModel extends DOMWidgetModel {
     }
   }
 
+  /**
+   * Handle extendTraces message
+   */
+  do_extendTraces() {
+    /** @type {Py2JsExtendTracesMsg} */
+    var msgData: Py2JsExtendTracesMsg = this.get("_py2js_extendTraces");
+    if (msgData !== null) {
+      performExtendTracesLike(
+        this.get("_data"),
+        msgData.extend_data,
+        msgData.extend_traces,
+        msgData.max_points
+      );
+    }
+  }
+
   /**
    * Handle relayout message
    */
@@ -744,6 +783,10 @@ export class FigureModel extends DOMWidgetModel {
       deserialize: py2js_deserializer,
       serialize: js2py_serializer,
     },
+    _py2js_extendTraces: {
+      deserialize: py2js_deserializer,
+      serialize: js2py_serializer,
+    },
     _py2js_update: {
       deserialize: py2js_deserializer,
       serialize: js2py_serializer,
@@ -826,6 +869,7 @@ export class FigureView extends DOMWidgetView {
     this.model.on("change:_py2js_deleteTraces", this.do_deleteTraces, this);
     this.model.on("change:_py2js_moveTraces", this.do_moveTraces, this);
     this.model.on("change:_py2js_restyle", this.do_restyle, this);
+    this.model.on("change:_py2js_extendTraces", this.do_extendTraces, this);
     this.model.on("change:_py2js_relayout", this.do_relayout, this);
     this.model.on("change:_py2js_update", this.do_update, this);
     this.model.on("change:_py2js_animate", this.do_animate, this);
@@ -1418,6 +1462,63 @@ export class FigureView extends DOMWidgetView {
     }
   }
 
+  /**
+   * Handle Plotly.extendTraces request
+   */
+  do_extendTraces() {
+    /** @type {Py2JsExtendTracesMsg} */
+    var msgData: Py2JsExtendTracesMsg = this.model.get("_py2js_extendTraces");
+    if (msgData !== null) {
+      var that = this;
+      var data = (<Plotly.PlotlyHTMLElement>this.el).data;
+      var extendTraces = msgData.extend_traces;
+
+      // plotly.js only extends existing arrays with points of the same
+      // array type. Convert the points to the type of the arrays they
+      // extend, and fall back to assigning the extended arrays with restyle
+      // when a property is unset or the points can't be converted
+      var extendData: any = {};
+      var restyleData: any = {};
+      var canExtend = true;
+      for (var rawKey in msgData.extend_data) {
+        if (!msgData.extend_data.hasOwnProperty(rawKey)) {
+          continue;
+        }
+        extendData[rawKey] = [];
+        restyleData[rawKey] = [];
+        for (var i = 0; i < extendTraces.length; i++) {
+          var current = _.get(data[extendTraces[i]], rawKey);
+          var points = msgData.extend_data[rawKey][i];
+          var converted = convertExtendPoints(current, points);
+          canExtend = canExtend && converted !== null;
+          extendData[rawKey].push(converted);
+          restyleData[rawKey].push(
+            extendArray(current, points, msgData.max_points)
+          );
+        }
+      }
+
+      var edit;
+      if (canExtend) {
+        var maxPoints =
+          msgData.max_points === null ? undefined : msgData.max_points;
+        edit = Plotly.extendTraces(
+          this.el,
+          extendData,
+          extendTraces,
+          maxPoints
+        );
+      } else {
+        restyleData["_doNotReportToPy"] = true;
+        edit = Plotly.restyle(this.el, restyleData, extendTraces);
+      }
+      edit.then(function () {
+        // ### Send trace deltas ###
+        that._sendTraceDeltas(msgData.trace_edit_id);
+      });
+    }
+  }
+
   /**
    * Handle Plotly.relayout request
    */
@@ -1602,10 +1703,12 @@ function serializeTypedArray(v: ArrayConstructor) {
     // Don't understand it, return as is
     return v;
   }
+  // Typed arrays may be views into a larger shared buffer (e.g. the rows
+  // produced by reshapeArray), so only send the bytes this view covers
   var res = {
     dtype: numpyType,
     shape: [v.length],
-    value: v.buffer,
+    value: v.buffer.slice(v.byteOffset, v.byteOffset + v.byteLength),
   };
   return res;
 }
@@ -1644,6 +1747,30 @@ function js2py_serializer(v: any, widgetManager?: any) {
   return res;
 }
 
+/**
+ * Split a flat array into nested arrays of the given shape. The innermost
+ * arrays are views (or slices) of the flat array.
+ */
+function reshapeArray(flat: any, shape: number[]): any {
+  if (shape.length <= 1) {
+    return flat;
+  }
+  var rowSize = 1;
+  for (var i = 1; i < shape.length; i++) {
+    rowSize *= shape[i];
+  }
+  var res = new Array(shape[0]);
+  for (var r = 0; r < shape[0]; r++) {
+    res[r] = reshapeArray(
+      flat.subarray
+        ? flat.subarray(r * rowSize, (r + 1) * rowSize)
+        : flat.slice(r * rowSize, (r + 1) * rowSize),
+      shape.slice(1)
+    );
+  }
+  return res;
+}
+
 /**
  * ipywidget Python -> Javascript deserializer
  */
@@ -1668,10 +1795,26 @@ function py2js_deserializer(v: any, widgetManager?: any) {
       // Note plotly.py<=3.1.1 called the buffer object `buffer`
       // This was renamed `value` in 3.2 to work around a naming conflict
       // when saving widget state to a notebook.
-      // @ts-ignore
-      var typedarray_type = numpy_dtype_to_typedarray_type[v.dtype];
-      var buffer = _.has(v, "value") ? v.value.buffer : v.buffer.buffer;
-      res = new typedarray_type(buffer);
+      //
+      // datetime64 arrays are sent as float64 milliseconds since the epoch
+      // and converted into date strings. Multi-dimensional arrays are sent
+      // as a single flat buffer and split into nested arrays of rows.
+      var isDatetime = v.dtype === "datetime64[ms]";
+      var typedarray_type = isDatetime
+        ? Float64Array
+        : (numpy_dtype_to_typedarray_type as any)[v.dtype];
+      var view = _.has(v, "value") ? v.value : v.buffer;
+      var flat = new typedarray_type(
+        view.buffer,
+        view.byteOffset,
+        view.byteLength / typedarray_type.BYTES_PER_ELEMENT
+      );
+      if (isDatetime) {
+        flat = Array.from(flat, (ms: number) =>
+          isFinite(ms) ? new Date(ms).toISOString().replace("Z", "") : null
+        );
+      }
+      res = reshapeArray(flat, v.shape);
     } else {
       // Deserialize object properties recursively
       res = {};
@@ -1823,6 +1966,95 @@ function performRestyleLike(
   }
 }
 
+/**
+ * Perform a Plotly.extendTraces like operation on an input object array
+ *
+ * @param {Array.<Object>} parentArray
+ *  The object array that the extend operation should be applied to
+ * @param {Object} extendData
+ *  An update object as accepted by Plotly.extendTraces, mapping property
+ *  paths to an array of the points to append to each trace
+ * @param {Array.<Number>} extendTraces
+ *  Array of indexes of the traces that the extend operation applies to
+ * @param {null|Number} maxPoints
+ *  Maximum number of trailing points to keep, or null to keep all points
+ *
+ *  Examples:
+ *      var d = [{y: [1, 2]}, {y: [3]}]
+ *      performExtendTracesLike(d, {y: [[3], [4, 5]]}, [0, 1], 2)
+ *      d -> [{y: [2, 3]}, {y: [4, 5]}]
+ */
+function performExtendTracesLike(
+  parentArray: any[],
+  extendData: any,
+  extendTraces: number[],
+  maxPoints?: null | number
+) {
+  for (var rawKey in extendData) {
+    if (!extendData.hasOwnProperty(rawKey)) {
+      continue;
+    }
+
+    for (var i = 0; i < extendTraces.length; i++) {
+      var trace = parentArray[extendTraces[i]];
+      _.set(
+        trace,
+        rawKey,
+        extendArray(_.get(trace, rawKey), extendData[rawKey][i], maxPoints)
+      );
+    }
+  }
+}
+
+/**
+ * Concatenate `points` to the `current` array (which may be unset), keeping
+ * at most `maxPoints` trailing points
+ *
+ * The arrays are concatenated as plain arrays so that typed arrays of
+ * different types (or typed and plain arrays) can be combined
+ */
+function extendArray(current: any, points: any, maxPoints?: null | number) {
+  var extended = Array.from(current || []).concat(Array.from(points));
+  if (
+    maxPoints !== null &&
+    maxPoints !== undefined &&
+    extended.length > maxPoints
+  ) {
+    extended = extended.slice(extended.length - maxPoints);
+  }
+  return extended;
+}
+
+/**
+ * Convert the `points` to extend the `current` array with to the array type
+ * of `current`, as required by Plotly.extendTraces
+ *
+ * Returns null if `current` is not an array, or if the points can't be
+ * represented exactly by its typed array type
+ */
+function convertExtendPoints(current: any, points: any): any {
+  if (Array.isArray(current)) {
+    return Array.isArray(points) ? points : Array.from(points);
+  }
+  if (!ArrayBuffer.isView(current)) {
+    return null;
+  }
+  if (points.constructor === current.constructor) {
+    return points;
+  }
+  var converted = new (current.constructor as any)(points.length);
+  for (var i = 0; i < points.length; i++) {
+    converted[i] = points[i];
+    if (
+      typeof points[i] !== "number" ||
+      !Object.is(converted[i], points[i])
+    ) {
+      return null;
+    }
+  }
+  return converted;
+}
+
 /**
  * Perform a Plotly.moveTraces like operation on an input object array
  * @param parentArray
@@ -2,6 +2,8 @@ import base64
 import numbers
 import textwrap
 import uuid
+from contextlib import contextmanager
+from functools import lru_cache
 from importlib import import_module
 import copy
 import io
@@ -22,6 +24,122 @@ def fullmatch(regex, string, flags=0):
     return re.match("(?:" + regex_string + r")\Z", string, flags=flags)
 
 
+# Array ingestion configuration
+# -----------------------------
+class ArrayConfig(object):
+    """
+    Global options that control how array values are ingested by validators
+    """
+
+    def __init__(self):
+        self._no_copy = False
+
+    @property
+    def no_copy(self):
+        """
+        If True, C-contiguous numeric numpy arrays (and the numeric numpy
+        arrays backing pandas Series / Index objects) are stored as read-only
+        views instead of being copied when assigned to figure properties.
+
+        This halves peak memory when building figures from large arrays, but
+        it transfers ownership of the array buffer to the figure: the caller
+        must not modify the original array afterwards, since any change would
+        be reflected in the figure without going through validation or being
+        propagated to a FigureWidget.
+        """
+        return self._no_copy
+
+    @no_copy.setter
+    def no_copy(self, val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The no_copy property must be a bool\n"
+                "    Received {val}".format(val=repr(val))
+            )
+
+        self._no_copy = val
+
+
+array_config = ArrayConfig()
+
+
+@contextmanager
+def no_copy():
+    """
+    Context manager that enables `array_config.no_copy` for the duration of
+    the block
+
+    Examples
+    --------
+    >>> with no_copy():
+    ...     scatter = go.Scatter(x=big_x, y=big_y)  # doctest: +SKIP
+    """
+    previous = array_config.no_copy
+    array_config.no_copy = True
+    try:
+        yield
+    finally:
+        array_config.no_copy = previous
+
+
+class ValidationConfig(object):
+    """
+    Global options that control whether graph object properties are validated
+    """
+
+    def __init__(self):
+        self._enabled = True
+
+    @property
+    def enabled(self):
+        """
+        If False, properties assigned to graph objects and figures are stored
+        as-is, without being checked or coerced by their validators.
+        Property names are not checked either.
+
+        This is intended for trusted pipelines that produce known-good
+        figure specifications. Invalid values are not reported and are
+        passed through to plotly.js unchanged.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The enabled property must be a bool\n"
+                "    Received {val}".format(val=repr(val))
+            )
+
+        self._enabled = val
+
+
+validation_config = ValidationConfig()
+
+
+@contextmanager
+def skip_validation():
+    """
+    Context manager that disables `validation_config.enabled` for the
+    duration of the block
+
+    This should not be used to update a FigureWidget that is already
+    displayed, since only validated property updates are synchronized with
+    the front end.
+
+    Examples
+    --------
+    >>> with skip_validation():
+    ...     fig = go.Figure(trusted_fig_dict)  # doctest: +SKIP
+    """
+    previous = validation_config.enabled
+    validation_config.enabled = False
+    try:
+        yield
+    finally:
+        validation_config.enabled = previous
+
+
 # Utility functions
 # -----------------
 def to_scalar_or_list(v):
@@ -68,7 +186,9 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
     Returns
     -------
     np.ndarray
-        Numpy array with the 'WRITEABLE' flag set to False
+        Numpy array with the 'WRITEABLE' flag set to False. If
+        `array_config.no_copy` is True, this is a view onto the input buffer
+        when the input is a C-contiguous numeric array of the requested kind
     """
     np = get_module("numpy")
 
@@ -98,8 +218,13 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
         if v.dtype.kind in numeric_kinds:
             # Get the numeric numpy array so we use fast path below
             v = v.values
+        elif v.dtype.kind == "M" and isinstance(v.dtype, np.dtype):
+            # Timezone naive datetime Series/Index are kept as a numpy
+            # datetime64 array rather than converted to python datetimes
+            v = v.values
         elif v.dtype.kind == "M":
-            # Convert datetime Series/Index to numpy array of datetimes
+            # Convert timezone aware datetime Series/Index to numpy array of
+            # datetimes, which keep their UTC offset
             if isinstance(v, pd.Series):
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore", FutureWarning)
@@ -113,6 +238,8 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
         dtype = v.dtypes.tolist()[0]
         if dtype.kind in numeric_kinds:
             v = v.values
+        elif dtype.kind == "M" and isinstance(dtype, np.dtype):
+            v = v.values
         elif dtype.kind == "M":
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", FutureWarning)
@@ -144,6 +271,10 @@ def copy_to_readonly_numpy_array(v, kind=None, force_numeric=False):
             # Convert to the default dtype for the first kind
             dtype = kind_default_dtypes.get(first_kind, None)
             new_v = np.ascontiguousarray(v.astype(dtype))
+        elif array_config.no_copy and v.flags["C_CONTIGUOUS"]:
+            # Requested kind is satisfied and the caller has handed over
+            # ownership of the buffer, so wrap it in a view rather than copy
+            new_v = v.view()
         else:
             # Either no kind was requested or requested kind is satisfied
             new_v = np.ascontiguousarray(v.copy())
@@ -365,7 +496,13 @@ class BaseValidator(object):
         """
         if is_homogeneous_array(v):
             # Note: numpy array was already coerced into read-only form so
-            # we don't need to copy it here.
+            # we don't need to copy it here, unless it is a window of a ring
+            # buffer that changes when points are appended to the buffer
+            from _plotly_utils.ring_buffer import is_ring_buffer_view
+
+            if is_ring_buffer_view(v):
+                v = v.copy()
+                v.flags.writeable = False
             return v
         elif is_simple_array(v):
             return tuple(v)
@@ -1355,18 +1492,24 @@ class ColorValidator(BaseValidator):
                 # All good
                 pass
             else:
-                validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
+                factorized = self.factorize_strings(v) if v.ndim == 1 else None
+                if factorized is not None:
+                    v = self.validate_coerce_factorized(v, *factorized, should_raise)
+                else:
+                    validated_v = [
+                        self.validate_coerce(e, should_raise=False) for e in v
+                    ]
 
-                invalid_els = self.find_invalid_els(v, validated_v)
+                    invalid_els = self.find_invalid_els(v, validated_v)
 
-                if invalid_els and should_raise:
-                    self.raise_invalid_elements(invalid_els)
+                    if invalid_els and should_raise:
+                        self.raise_invalid_elements(invalid_els)
 
-                # ### Check that elements have valid colors types ###
-                elif self.numbers_allowed() or invalid_els:
-                    v = copy_to_readonly_numpy_array(validated_v, kind="O")
-                else:
-                    v = copy_to_readonly_numpy_array(validated_v, kind="U")
+                    # ### Check that elements have valid colors types ###
+                    elif self.numbers_allowed() or invalid_els:
+                        v = copy_to_readonly_numpy_array(validated_v, kind="O")
+                    else:
+                        v = copy_to_readonly_numpy_array(validated_v, kind="U")
         elif self.array_ok and is_simple_array(v):
             validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
 
@@ -1406,6 +1549,64 @@ class ColorValidator(BaseValidator):
 
         return invalid_els
 
+    @staticmethod
+    def factorize_strings(v):
+        """
+        Factorize a 1D array of strings into its distinct values and an
+        array of codes into those values
+
+        Parameters
+        ----------
+        v : np.ndarray
+            1D array
+
+        Returns
+        -------
+        tuple[list, np.ndarray] or None
+            (uniques, codes) such that uniques[codes] reproduces v, with
+            uniques in order of first occurrence. None if v contains any
+            element that is not a string.
+        """
+        np = get_module("numpy")
+        index = {}
+        try:
+            codes = [index.setdefault(e, len(index)) for e in v.tolist()]
+        except TypeError:
+            # Unhashable elements (e.g. nested lists)
+            return None
+
+        uniques = list(index)
+        if not all(isinstance(e, str) for e in uniques):
+            # Only strings can be deduplicated safely, since values like 1
+            # and True compare equal but validate differently
+            return None
+
+        return uniques, np.array(codes, dtype="intp")
+
+    def validate_coerce_factorized(self, v, uniques, codes, should_raise=True):
+        """
+        Validate/coerce an array of color strings by validating each distinct
+        value once and broadcasting the results back with the codes returned
+        by `factorize_strings`
+        """
+        np = get_module("numpy")
+        validated_uniques = [self.vc_scalar(e) for e in uniques]
+        invalid_uniques = np.array([e is None for e in validated_uniques], dtype=bool)
+
+        if invalid_uniques.any() and should_raise:
+            # Report invalid elements in their original order
+            self.raise_invalid_elements(v[invalid_uniques[codes]].tolist())
+
+        # ### Check that elements have valid colors types ###
+        if self.numbers_allowed() or invalid_uniques.any():
+            validated_uniques = np.array(validated_uniques, dtype="object")
+        else:
+            validated_uniques = np.array(validated_uniques)
+
+        new_v = validated_uniques[codes]
+        new_v.flags["WRITEABLE"] = False
+        return new_v
+
     def vc_scalar(self, v):
         """Helper to validate/coerce a scalar color"""
         return ColorValidator.perform_validate_coerce(
@@ -1437,30 +1638,50 @@ class ColorValidator(BaseValidator):
         elif not isinstance(v, str):
             # If not allow_numbers then value must be a string
             return None
+        elif ColorValidator.is_valid_color_str(v):
+            return v
         else:
-            # Remove spaces so regexes don't need to bother with them.
-            v_normalized = v.replace(" ", "").lower()
-
-            # if ColorValidator.re_hex.fullmatch(v_normalized):
-            if fullmatch(ColorValidator.re_hex, v_normalized):
-                # valid hex color (e.g. #f34ab3)
-                return v
-            elif fullmatch(ColorValidator.re_rgb_etc, v_normalized):
-                # elif ColorValidator.re_rgb_etc.fullmatch(v_normalized):
-                # Valid rgb(a), hsl(a), hsv(a) color
-                # (e.g. rgba(10, 234, 200, 50%)
-                return v
-            elif fullmatch(ColorValidator.re_ddk, v_normalized):
-                # Valid var(--*) DDK theme variable, inspired by CSS syntax
-                # (e.g. var(--accent) )
-                # DDK will crawl & eval var(-- colors for Graph theming
-                return v
-            elif v_normalized in ColorValidator.named_colors:
-                # Valid named color (e.g. 'coral')
-                return v
-            else:
-                # Not a valid color
-                return None
+            # Not a valid color
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def is_valid_color_str(v):
+        """
+        Return whether a string is a valid color. Results are cached since
+        the same color strings tend to be validated over and over again.
+
+        Parameters
+        ----------
+        v : str
+            Candidate color string
+
+        Returns
+        -------
+        bool
+        """
+        # Remove spaces so regexes don't need to bother with them.
+        v_normalized = v.replace(" ", "").lower()
+
+        # if ColorValidator.re_hex.fullmatch(v_normalized):
+        if fullmatch(ColorValidator.re_hex, v_normalized):
+            # valid hex color (e.g. #f34ab3)
+            return True
+        elif fullmatch(ColorValidator.re_rgb_etc, v_normalized):
+            # elif ColorValidator.re_rgb_etc.fullmatch(v_normalized):
+            # Valid rgb(a), hsl(a), hsv(a) color
+            # (e.g. rgba(10, 234, 200, 50%)
+            return True
+        elif fullmatch(ColorValidator.re_ddk, v_normalized):
+            # Valid var(--*) DDK theme variable, inspired by CSS syntax
+            # (e.g. var(--accent) )
+            # DDK will crawl & eval var(-- colors for Graph theming
+            return True
+        elif v_normalized in ColorValidator.named_colors:
+            # Valid named color (e.g. 'coral')
+            return True
+        else:
+            return False
 
 
 class ColorlistValidator(BaseValidator):
@@ -2233,7 +2454,7 @@ class InfoArrayValidator(BaseValidator):
                 return tuple(tuple(row) for row in v)
             else:
                 # 1D case
-                v = copy.copy(v)
+                v = list(v)
                 # Call present on each of the item validators
                 for i, (el, validator) in enumerate(zip(v, self.item_validators)):
                     # Validate coerce elements
@@ -2478,14 +2699,14 @@ class CompoundValidator(BaseValidator):
 
     def validate_coerce(self, v, skip_invalid=False, _validate=True):
         if v is None:
-            v = self.data_class()
+            v = self.data_class(_validate=_validate)
 
         elif isinstance(v, dict):
             v = self.data_class(v, skip_invalid=skip_invalid, _validate=_validate)
 
         elif isinstance(v, self.data_class):
             # Copy object
-            v = self.data_class(v)
+            v = self.data_class(v, _validate=_validate)
         else:
             if skip_invalid:
                 v = self.data_class()
@@ -2561,7 +2782,7 @@ class CompoundArrayValidator(BaseValidator):
 
         return self._data_class
 
-    def validate_coerce(self, v, skip_invalid=False):
+    def validate_coerce(self, v, skip_invalid=False, _validate=True):
 
         if v is None:
             v = []
@@ -2571,9 +2792,13 @@ class CompoundArrayValidator(BaseValidator):
             invalid_els = []
             for v_el in v:
                 if isinstance(v_el, self.data_class):
-                    res.append(self.data_class(v_el))
+                    res.append(self.data_class(v_el, _validate=_validate))
                 elif isinstance(v_el, dict):
-                    res.append(self.data_class(v_el, skip_invalid=skip_invalid))
+                    res.append(
+                        self.data_class(
+                            v_el, skip_invalid=skip_invalid, _validate=_validate
+                        )
+                    )
                 else:
                     if skip_invalid:
                         res.append(self.data_class())
@@ -1,13 +1,7 @@
 from io import BytesIO
 import base64
 from .png import Writer, from_array
-
-try:
-    from PIL import Image
-
-    pil_imported = True
-except ImportError:
-    pil_imported = False
+from .optional_imports import get_module
 
 
 def image_array_to_data_uri(img, backend="pil", compression=4, ext="png"):
@@ -38,8 +32,10 @@ def image_array_to_data_uri(img, backend="pil", compression=4, ext="png"):
         alpha = True
     else:
         raise ValueError("Invalid image shape")
+    # Pillow is imported lazily since it is slow to import
+    Image = get_module("PIL.Image")
     if backend == "auto":
-        backend = "pil" if pil_imported else "pypng"
+        backend = "pil" if Image is not None else "pypng"
     if ext != "png" and backend != "pil":
         raise ValueError("jpg binary strings are only available with PIL backend")
 
@@ -57,7 +53,7 @@ def image_array_to_data_uri(img, backend="pil", compression=4, ext="png"):
             w.write(stream, img_png.rows)
             base64_string = prefix + base64.b64encode(stream.getvalue()).decode("utf-8")
     else:  # pil
-        if not pil_imported:
+        if Image is None:
             raise ImportError(
                 "pillow needs to be installed to use `backend='pil'. Please"
                 "install pillow or use `backend='pypng'."
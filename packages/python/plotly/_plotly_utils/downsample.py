@@ -0,0 +1,215 @@
+"""
+Point-reduction algorithms for large line and scatter traces.
+
+Every algorithm takes the numeric `x` and `y` values of a trace and returns the
+sorted integer positions of the points to keep, so that all the per-point arrays of
+a trace (hover text, marker colors, custom data...) can be reduced consistently.
+This module requires numpy.
+"""
+
+import numpy as np
+
+
+def _as_float(values):
+    """
+    Returns `values` as a float64 numpy array, with datetimes as nanoseconds since
+    the epoch and NaT as NaN, or None if the values are not numeric.
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind == "M":
+        if arr.dtype != "datetime64[ns]":
+            arr = arr.astype("datetime64[ns]")
+        out = arr.view("i8").astype(np.float64)
+        out[np.isnat(arr)] = np.nan
+        return out
+    if arr.dtype.kind in "biuf":
+        return arr.astype(np.float64, copy=False)
+    try:
+        return arr.astype(np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+def _pad_buckets(values, n_buckets, fill):
+    """
+    Splits `values` into at most `n_buckets` rows of equal length, padding the last
+    one with `fill`
+    """
+    size = -(-len(values) // n_buckets)
+    n_rows = -(-len(values) // size)
+    padded = np.full(n_rows * size, fill)
+    padded[: len(values)] = values
+    return padded.reshape(n_rows, size), size
+
+
+def minmax(x, y, n_out):
+    """
+    Keeps the first and last points and, in each of `(n_out - 2) // 2` buckets of
+    consecutive points, the points with the smallest and largest `y`. This preserves
+    the visual envelope of the trace and is fully vectorized.
+
+    Parameters
+    ----------
+    x: ndarray
+        float values of the independent axis (unused, but accepted for
+        symmetry with `lttb`)
+    y: ndarray
+        float values of the dependent axis
+    n_out: int
+        maximum number of points to keep
+
+    Returns
+    -------
+    ndarray
+        sorted positions of the points to keep
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 4:
+        return np.unique(np.linspace(0, n - 1, n_out).astype(np.intp))
+    n_buckets = (n_out - 2) // 2
+    inner = y[1:-1]
+    nan = np.isnan(inner)
+    low, size = _pad_buckets(np.where(nan, np.inf, inner), n_buckets, np.inf)
+    high, _ = _pad_buckets(np.where(nan, -np.inf, inner), n_buckets, -np.inf)
+    offsets = np.arange(len(low)) * size + 1
+    keep = np.concatenate(
+        [[0], offsets + low.argmin(axis=1), offsets + high.argmax(axis=1), [n - 1]]
+    )
+    return np.unique(keep)
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: keeps the first and last points and, in each of
+    `n_out - 2` buckets of consecutive points, the point that forms the largest
+    triangle with the point kept in the previous bucket and the average of the next
+    bucket.
+
+    The selection is sequential across buckets but vectorized within each one. When
+    there are more than four points per output point, the input is first reduced
+    with `minmax` to `4 * n_out` points, which keeps the extrema LTTB would pick
+    while bounding the work per bucket (MinMaxLTTB).
+
+    Parameters
+    ----------
+    x: ndarray
+        float values of the independent axis
+    y: ndarray
+        float values of the dependent axis
+    n_out: int
+        maximum number of points to keep
+
+    Returns
+    -------
+    ndarray
+        sorted positions of the points to keep
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[:n_out]
+
+    positions = None
+    if n > 4 * n_out:
+        positions = minmax(x, y, 4 * n_out)
+        x, y, n = x[positions], y[positions], len(positions)
+        if n <= n_out:
+            return positions
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[hi : edges[i + 2]].mean()
+            next_y = y[hi : edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a])
+        )
+        a = lo + np.argmax(np.where(np.isnan(area), -1.0, area))
+        keep[i + 1] = a
+
+    return keep if positions is None else positions[keep]
+
+
+downsample_methods = dict(lttb=lttb, minmax=minmax)
+
+
+def downsample_indices(x, y, method="lttb", max_points=5000):
+    """
+    Returns the sorted positions of at most `max_points` points of the trace with
+    values `x` and `y` selected by `method`.
+
+    Values of `x` which are not numeric or dates (e.g. categories) are replaced by
+    their position. If `y` is not numeric, evenly spaced points are kept.
+
+    Parameters
+    ----------
+    x: array-like
+        values of the independent axis
+    y: array-like
+        values of the dependent axis
+    method: str
+        one of the keys of `downsample_methods`
+    max_points: int
+        maximum number of points to keep
+
+    Returns
+    -------
+    ndarray
+        sorted positions of the points to keep
+    """
+    if method not in downsample_methods:
+        raise ValueError(
+            "Invalid downsample method %r, expected one of %s"
+            % (method, sorted(downsample_methods))
+        )
+    if not isinstance(max_points, int) or max_points < 1:
+        raise ValueError(
+            "max_points must be a positive integer, received %r" % (max_points,)
+        )
+
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    y = _as_float(y)
+    if y is None:
+        return np.unique(np.linspace(0, n - 1, max_points).astype(np.intp))
+    x = _as_float(x)
+    if x is None:
+        x = np.arange(n, dtype=np.float64)
+    return downsample_methods[method](x, y, max_points)
+
+
+def window_indices(base, lo, hi, is_sorted=True):
+    """
+    Returns the positions of the values of `base` between `lo` and `hi`. If `base`
+    is sorted, the points just outside of the window are included as well, so that
+    lines run to the edges of the visible range.
+
+    Parameters
+    ----------
+    base: ndarray
+        float values of the independent axis
+    lo, hi: float
+        bounds of the window
+    is_sorted: bool
+        whether `base` is sorted in ascending order
+
+    Returns
+    -------
+    ndarray
+        sorted positions of the points in the window
+    """
+    if is_sorted:
+        start = max(np.searchsorted(base, lo, side="left") - 1, 0)
+        stop = min(np.searchsorted(base, hi, side="right") + 1, len(base))
+        return np.arange(start, stop)
+    return np.flatnonzero((base >= lo) & (base <= hi))
@@ -1,4 +1,6 @@
+import copy
 import importlib
+import sys
 
 
 def relative_import(parent_name, rel_modules=(), rel_classes=()):
@@ -48,3 +50,91 @@ def relative_import(parent_name, rel_modules=(), rel_classes=()):
         return __all__
 
     return __all__, __getattr__, __dir__
+
+
+def validator_table(parent_name, parent_path, validator_specs, rel_classes=()):
+    """
+    Helper function to construct validator classes lazily from a table of
+    validator specs, rather than importing one module per validator
+
+    Parameters
+    ----------
+    parent_name: str
+        Name of the validators package the classes belong to
+        (e.g. plotly.validators.scatter.marker)
+    parent_path: str
+        Path string of the parent of the validated properties
+        (e.g. scatter.marker)
+    validator_specs: dict
+        dict from validator class name to a tuple of the form
+        (plotly_name, base_validator_path, params) where base_validator_path
+        is the full path of the validator superclass and params are the
+        default keyword arguments to pass to its constructor
+    rel_classes: list of str
+        list of submodule classes/variables to import, of the form ._submodule.Foo
+
+    Returns
+    -------
+    tuple
+        Tuple that should be assigned to __all__, __getattr__ in the caller
+    """
+    rel_all, rel_getattr, _ = relative_import(parent_name, (), rel_classes)
+
+    def __getattr__(import_name):
+        if import_name in validator_specs:
+            plotly_name, base_validator_path, params = validator_specs[import_name]
+            validator_class = _build_validator_class(
+                parent_name,
+                import_name,
+                base_validator_path,
+                plotly_name,
+                parent_path,
+                params,
+            )
+
+            # Cache class on the module so that it's only built once
+            setattr(sys.modules[parent_name], import_name, validator_class)
+            return validator_class
+
+        return rel_getattr(import_name)
+
+    __all__ = list(validator_specs) + rel_all
+
+    def __dir__():
+        return __all__
+
+    return __all__, __getattr__, __dir__
+
+
+def _build_validator_class(
+    module_name, class_name, base_validator_path, plotly_name, parent_name, params
+):
+    """
+    Build a validator class equivalent to the per-property validator classes
+    that used to be code generated, where constructor params default to the
+    values in params but may be overridden by keyword arguments
+    """
+    base_module, base_class_name = base_validator_path.rsplit(".", 1)
+    base_class = getattr(importlib.import_module(base_module), base_class_name)
+
+    default_plotly_name = plotly_name
+    default_parent_name = parent_name
+
+    def __init__(
+        self, plotly_name=default_plotly_name, parent_name=default_parent_name, **kwargs
+    ):
+        for param, val in params.items():
+            if param not in kwargs:
+                # Copy so that instances never share mutable defaults
+                kwargs[param] = copy.deepcopy(val)
+
+        super(validator_class, self).__init__(
+            plotly_name=plotly_name, parent_name=parent_name, **kwargs
+        )
+
+    validator_class = type(
+        class_name,
+        (base_class,),
+        {"__init__": __init__, "__module__": module_name, "__qualname__": class_name},
+    )
+    return validator_class
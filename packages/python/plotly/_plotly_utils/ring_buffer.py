@@ -0,0 +1,106 @@
+"""
+Fixed-capacity numpy ring buffer used to stream points into traces.
+This module requires numpy.
+"""
+
+import numpy as np
+
+
+class RingStorage(np.ndarray):
+    """
+    Backing array of a RingBuffer
+
+    Windows of a ring buffer are views of this array, which lets
+    `is_ring_buffer_view` tell them apart from read-only arrays whose values
+    can never change.
+    """
+
+
+def is_ring_buffer_view(v):
+    """
+    Return whether v is a window of a RingBuffer, whose values change when
+    more values are appended to the buffer
+    """
+    return isinstance(getattr(v, "base", None), RingStorage)
+
+
+class RingBuffer(object):
+    """
+    Buffer of the last `capacity` values appended to it
+
+    Values are stored twice, at positions `i` and `i + capacity` of an array of
+    length `2 * capacity`, so that the buffered values are always a contiguous
+    slice of that array. Appending `k` values is O(k) and getting the buffered
+    values is O(1), at the cost of the returned arrays being views that change
+    when values are appended afterwards. Such views are recognized by
+    `is_ring_buffer_view` and copied wherever they are handed out.
+    """
+
+    def __init__(self, capacity, dtype):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError(
+                "capacity must be a positive integer, received %r" % (capacity,)
+            )
+        self.capacity = capacity
+        self._values = np.empty(2 * capacity, dtype=dtype).view(RingStorage)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    def __len__(self):
+        return self._size
+
+    def append(self, values):
+        """
+        Append values, dropping the oldest values beyond the capacity
+
+        Parameters
+        ----------
+        values: array-like
+            values to append, which must be castable to the buffer dtype
+
+        Returns
+        -------
+        ndarray
+            read-only view of the buffered values (see `window`)
+        """
+        values = np.asarray(values, dtype=self.dtype)
+        capacity = self.capacity
+        n = len(values)
+        if n >= capacity:
+            self._values[:capacity] = values[n - capacity :]
+            self._values[capacity:] = values[n - capacity :]
+            self._start, self._size = 0, capacity
+        elif n:
+            end = (self._start + self._size) % capacity
+            first = min(n, capacity - end)
+            for offset in (0, capacity):
+                self._values[offset + end : offset + end + first] = values[:first]
+                self._values[offset : offset + n - first] = values[first:]
+            dropped = max(self._size + n - capacity, 0)
+            self._start = (self._start + dropped) % capacity
+            self._size = min(self._size + n, capacity)
+        return self.window()
+
+    def window(self, size=None):
+        """
+        Return the last `size` buffered values, or all of them if `size` is
+        None, as a read-only view in insertion order
+
+        Parameters
+        ----------
+        size: int or None
+            number of trailing values to return
+
+        Returns
+        -------
+        ndarray
+        """
+        stop = self._start + self._size
+        start = self._start if size is None else max(stop - size, self._start)
+        view = self._values[start:stop].view(np.ndarray)
+        view.flags.writeable = False
+        return view
@@ -234,6 +234,47 @@ def test_rejection_aok_colorscale(val, validator_aok_colorscale):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+# Large arrays
+# ------------
+# Arrays of strings are validated once per distinct value
+@pytest.mark.parametrize("dtype", ["object", "U"])
+def test_acceptance_aok_numpy_repeated(dtype, validator_aok):
+    val = np.array(["red", "rgb(1, 2, 3)", "#123"] * 100, dtype=dtype)
+    coerce_val = validator_aok.validate_coerce(val)
+
+    assert isinstance(coerce_val, np.ndarray)
+    assert coerce_val.dtype.kind == "U"
+    assert not coerce_val.flags["WRITEABLE"]
+    assert coerce_val.tolist() == val.tolist()
+
+
+def test_acceptance_aok_colorscale_numpy_mixed(validator_aok_colorscale):
+    val = np.array(["red", 1, "red", 2.5, True], dtype="object")
+    coerce_val = validator_aok_colorscale.validate_coerce(val)
+
+    assert coerce_val.dtype.kind == "O"
+    assert coerce_val.tolist() == val.tolist()
+
+
+def test_rejection_aok_numpy_repeated(validator_aok):
+    val = np.array(["red", "redd", "blue", "bluee", "redd"], dtype="object")
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "['redd', 'bluee', 'redd']" in str(validation_failure.value)
+
+
+def test_color_str_cache():
+    ColorValidator.is_valid_color_str.cache_clear()
+    validator = ColorValidator("prop", "parent", array_ok=True)
+    validator.validate_coerce(np.array(["red", "blue"] * 10, dtype="object"))
+    validator.validate_coerce(np.array(["red", "blue"] * 10, dtype="object"))
+
+    info = ColorValidator.is_valid_color_str.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+
+
 # Description
 # -----------
 # Test dynamic description logic
@@ -1,5 +1,5 @@
 import pytest
-from _plotly_utils.basevalidators import DataArrayValidator
+from _plotly_utils.basevalidators import DataArrayValidator, array_config, no_copy
 import numpy as np
 import pandas as pd
 
@@ -41,6 +41,43 @@ def test_validator_acceptance_homogeneous(val, validator):
     assert np.array_equal(validator.present(coerce_val), val)
 
 
+# ### No-copy mode ###
+def test_copy_by_default(validator):
+    val = np.arange(10.0)
+    coerce_val = validator.validate_coerce(val)
+    assert not np.shares_memory(coerce_val, val)
+    assert not coerce_val.flags["WRITEABLE"]
+
+
+@pytest.mark.parametrize(
+    "val", [np.arange(10.0), np.arange(10), pd.Series(np.arange(10.0))]
+)
+def test_no_copy_contiguous(val, validator):
+    with no_copy():
+        coerce_val = validator.validate_coerce(val)
+
+    assert np.shares_memory(coerce_val, np.asarray(val))
+    assert not coerce_val.flags["WRITEABLE"]
+
+    # The input array itself is left writeable
+    assert np.asarray(val).flags["WRITEABLE"]
+    assert not array_config.no_copy
+
+
+def test_no_copy_non_contiguous(validator):
+    val = np.arange(20.0)[::2]
+    with no_copy():
+        coerce_val = validator.validate_coerce(val)
+
+    assert not np.shares_memory(coerce_val, val)
+    assert coerce_val.flags["C_CONTIGUOUS"]
+
+
+def test_no_copy_invalid_config():
+    with pytest.raises(ValueError):
+        array_config.no_copy = "yes"
+
+
 # ### Rejection ###
 @pytest.mark.parametrize("val", ["Hello", 23, set(), {}])
 def test_rejection(val, validator):
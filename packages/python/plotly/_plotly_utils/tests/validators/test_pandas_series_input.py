@@ -183,10 +183,26 @@ def test_data_array_validator_dates_series(
     assert isinstance(res, np.ndarray)
 
     # Check dtype
-    assert res.dtype == "object"
+    assert res.dtype == "datetime64[ns]"
 
     # Check values
-    np.testing.assert_array_equal(res, dates_array)
+    np.testing.assert_array_equal(res, dates_array.astype("datetime64[ns]"))
+
+
+def test_data_array_validator_tz_dates_series(
+    data_array_validator, datetime_pandas, dates_array
+):
+    tz_dates = pd.Series(datetime_pandas).dt.tz_localize("UTC")
+    res = data_array_validator.validate_coerce(tz_dates)
+
+    # Check type
+    assert isinstance(res, np.ndarray)
+
+    # Timezone aware values are kept as datetimes with their UTC offset
+    assert res.dtype == "object"
+    assert [d.isoformat() for d in res] == [
+        d.isoformat() + "+00:00" for d in dates_array
+    ]
 
 
 def test_data_array_validator_dates_dataframe(
@@ -200,7 +216,9 @@ def test_data_array_validator_dates_dataframe(
     assert isinstance(res, np.ndarray)
 
     # Check dtype
-    assert res.dtype == "object"
+    assert res.dtype == "datetime64[ns]"
 
     # Check values
-    np.testing.assert_array_equal(res, dates_array.reshape(len(dates_array), 1))
+    np.testing.assert_array_equal(
+        res, dates_array.astype("datetime64[ns]").reshape(len(dates_array), 1)
+    )
@@ -1,11 +1,52 @@
+import base64
 import decimal
 import json as _json
 import sys
 import re
+import threading
+from collections import OrderedDict, namedtuple
 from functools import reduce
 
 from _plotly_utils.optional_imports import get_module
-from _plotly_utils.basevalidators import ImageUriValidator
+from _plotly_utils.basevalidators import (
+    ImageUriValidator,
+    is_homogeneous_array,
+    array_config,
+    no_copy,
+    validation_config,
+    skip_validation,
+)
+
+
+# Mapping from numpy dtype names to the short type codes that plotly.js
+# accepts in base64 encoded typed array specs
+plotlyjs_short_types = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+# Inverse of plotlyjs_short_types, with the matching array module typecodes
+# used to decode typed array specs when numpy is not available
+plotlyjs_short_type_dtypes = {v: k for k, v in plotlyjs_short_types.items()}
+plotlyjs_short_type_typecodes = {
+    "i1": "b",
+    "u1": "B",
+    "i2": "h",
+    "u2": "H",
+    "i4": "i",
+    "u4": "I",
+    "f4": "f",
+    "f8": "d",
+}
+
+# Keys whose array values must never be converted to typed array specs
+typed_array_skipped_keys = ("geojson", "layer", "layers", "range")
 
 
 def cumsum(x):
@@ -189,7 +230,7 @@ class PlotlyJSONEncoder(_json.JSONEncoder):
             return float("nan")
         elif isinstance(obj, numpy.ndarray) and obj.dtype.kind == "M":
             try:
-                return numpy.datetime_as_string(obj).tolist()
+                return datetime64_to_iso_strings(obj)
             except TypeError:
                 pass
 
@@ -235,6 +276,198 @@ class NotEncodable(Exception):
     pass
 
 
+def to_typed_array_spec(v):
+    """
+    Convert a numeric homogeneous array into a plotly.js typed array spec
+
+    The returned spec is a dict of the form
+    ``{"dtype": "f8", "bdata": "<base64>", "shape": "3, 4"}`` where
+    ``shape`` is only included for multi-dimensional arrays. 64-bit integer
+    arrays are downcast to the smallest 32-bit (or smaller) type that can
+    hold their values, since plotly.js does not support BigInt arrays.
+
+    Parameters
+    ----------
+    v: array like
+        numpy array, pandas Series/Index or other numpy-convertable value
+
+    Returns
+    -------
+    dict or array like
+        Typed array spec, or the original value if it cannot be represented
+        as a typed array
+    """
+    np = get_module("numpy", should_load=False)
+    if not np or not is_homogeneous_array(v):
+        return v
+
+    arr = np.asarray(v)
+    if arr.ndim == 0 or arr.dtype.kind not in ("i", "u", "f"):
+        return v
+
+    if arr.dtype.kind in ("i", "u") and arr.dtype.itemsize == 8:
+        arr = _downcast_int64(np, arr)
+        if arr is None:
+            return v
+
+    dtype = plotlyjs_short_types.get(arr.dtype.name, None)
+    if dtype is None:
+        return v
+
+    # plotly.js reads typed arrays in little-endian byte order
+    if arr.dtype.byteorder == ">":
+        arr = arr.astype(arr.dtype.newbyteorder("<"))
+
+    spec = {
+        "dtype": dtype,
+        "bdata": base64.b64encode(np.ascontiguousarray(arr)).decode("ascii"),
+    }
+    if arr.ndim > 1:
+        spec["shape"] = ", ".join(str(d) for d in arr.shape)
+
+    return spec
+
+
+def _downcast_int64(np, arr):
+    """
+    Return arr cast to the smallest integer dtype supported by plotly.js
+    that can hold all of its values, or None if there is no such dtype
+    """
+    if arr.size == 0:
+        return arr.astype("int8" if arr.dtype.kind == "i" else "uint8")
+
+    arr_min, arr_max = arr.min(), arr.max()
+    for dtype in ("int8", "uint8", "int16", "uint16", "int32", "uint32"):
+        info = np.iinfo(dtype)
+        if arr_min >= info.min and arr_max <= info.max:
+            return arr.astype(dtype)
+    return None
+
+
+def is_typed_array_spec(v):
+    """
+    Return whether a value is a plotly.js typed array spec
+    """
+    return (
+        isinstance(v, dict)
+        and "bdata" in v
+        and v.get("dtype", None) in plotlyjs_short_type_dtypes
+    )
+
+
+def from_typed_array_spec(spec):
+    """
+    Decode a plotly.js typed array spec
+
+    Parameters
+    ----------
+    spec: dict
+        Typed array spec as produced by `to_typed_array_spec`
+
+    Returns
+    -------
+    numpy.ndarray or list
+        A numpy array if numpy is installed, otherwise a (possibly nested)
+        list of numbers
+    """
+    data = base64.b64decode(spec["bdata"])
+    shape = spec.get("shape", None)
+    if isinstance(shape, str):
+        shape = tuple(int(d) for d in shape.split(",") if d.strip())
+
+    np = get_module("numpy")
+    if np:
+        arr = np.frombuffer(data, dtype="<" + spec["dtype"]).astype(
+            plotlyjs_short_type_dtypes[spec["dtype"]]
+        )
+        return arr.reshape(shape) if shape else arr
+
+    import array
+
+    values = array.array(plotlyjs_short_type_typecodes[spec["dtype"]])
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    values = values.tolist()
+    if shape:
+        for d in reversed(shape[1:]):
+            values = [values[i : i + d] for i in range(0, len(values), d)]
+    return values
+
+
+def convert_to_base64(obj):
+    """
+    Return a copy of a JSON-like structure in which numeric homogeneous
+    arrays have been replaced by plotly.js typed array specs
+
+    Containers (dicts, lists and tuples) are rebuilt rather than modified in
+    place, array values themselves are never copied.
+    """
+    if isinstance(obj, dict):
+        result = {}
+        for k, v in obj.items():
+            if k in typed_array_skipped_keys:
+                result[k] = v
+            elif is_homogeneous_array(v):
+                result[k] = to_typed_array_spec(v)
+            else:
+                result[k] = convert_to_base64(v)
+        return result
+    elif isinstance(obj, (list, tuple)):
+        # Only recurse into nested containers so that long lists of scalars
+        # are not walked element by element
+        return [
+            convert_to_base64(v) if isinstance(v, (dict, list, tuple)) else v
+            for v in obj
+        ]
+    return obj
+
+
+def convert_from_base64(obj):
+    """
+    Return a copy of a JSON-like structure in which plotly.js typed array
+    specs have been decoded into arrays
+    """
+    if isinstance(obj, dict):
+        if is_typed_array_spec(obj):
+            return from_typed_array_spec(obj)
+        return {k: convert_from_base64(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [
+            convert_from_base64(v) if isinstance(v, (dict, list)) else v for v in obj
+        ]
+    return obj
+
+
+def datetime64_to_iso_strings(arr):
+    """
+    Convert a numpy datetime64 array into a (nested) list of ISO 8601
+    strings, with None in place of NaT values
+
+    The whole array is formatted at once with numpy.datetime_as_string.
+    Sub-second units are shortened to whole seconds or microseconds when that
+    is exact for every value, which matches datetime.isoformat for values
+    that came from python datetimes.
+    """
+    np = get_module("numpy")
+
+    unit = np.datetime_data(arr.dtype)[0]
+    nat = np.isnat(arr)
+    if unit in ("ms", "us", "ns", "ps", "fs", "as"):
+        ticks = arr.view("int64")[~nat]
+        per_second = np.timedelta64(1, "s") // np.timedelta64(1, unit)
+        if not np.any(ticks % per_second):
+            unit = "s"
+        elif unit not in ("ms", "us") and not np.any(ticks % (per_second // 10**6)):
+            unit = "us"
+
+    strings = np.datetime_as_string(arr, unit=unit)
+    if nat.any():
+        strings = strings.astype("object")
+        strings[nat] = None
+    return strings.tolist()
+
+
 def iso_to_plotly_time_string(iso_string):
     """Remove timezone info and replace 'T' delimeter with ' ' (ws)."""
     # make sure we don't send timezone info to plotly
@@ -422,6 +655,107 @@ def chomp_empty_strings(strings, c, reverse=False):
     return list(filter(len, reduce(_Chomper(c), strings, [""])))
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache(object):
+    """
+    Mapping that keeps at most `maxsize` entries (all of them if `maxsize` is
+    None) by evicting the least recently used one, and that counts lookup hits
+    and misses
+
+    The caches are shared by all graph objects, so every operation holds a
+    lock: an entry evicted by another thread between a lookup and the
+    reordering of the entries would otherwise raise a KeyError
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            if self.maxsize is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            if self.maxsize is not None:
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+# Caches of the property path lookups performed by graph objects
+#   - key_paths: key path strings (e.g. 'marker.line_color') parsed into tuples
+#   - prop_tree_paths: (class, key path string) pairs known to be valid
+#   - validators: (parent path, property name) pairs resolved to validators
+path_caches = OrderedDict(
+    [
+        ("key_paths", LRUCache(maxsize=8192)),
+        ("prop_tree_paths", LRUCache(maxsize=8192)),
+        ("validators", LRUCache()),
+    ]
+)
+
+
+def path_cache_info():
+    """
+    Return the hit and miss counters and the sizes of the property path caches
+    of graph objects, for profiling
+
+    Returns
+    -------
+    dict
+        Mapping from cache name to a CacheInfo named tuple with `hits`,
+        `misses`, `maxsize` and `currsize` fields
+
+    Examples
+    --------
+    >>> import plotly.graph_objects as go
+    >>> from plotly.utils import clear_path_caches, path_cache_info
+    >>> clear_path_caches()
+    >>> for _ in range(3):
+    ...     _ = go.Scatter(marker_line_color="red")
+    >>> info = path_cache_info()["prop_tree_paths"]
+    >>> info.misses, info.currsize
+    (1, 1)
+    """
+    return OrderedDict((name, cache.info()) for name, cache in path_caches.items())
+
+
+def clear_path_caches():
+    """
+    Empty the property path caches of graph objects and reset their counters
+    """
+    for cache in path_caches.values():
+        cache.clear()
+
+
 # taken from
 # https://en.wikibooks.org/wiki/Algorithm_Implementation/Strings/Levenshtein_distance#Python
 def levenshtein(s1, s2):
@@ -21,7 +21,7 @@ from codegen.utils import (
     build_from_imports_py,
 )
 from codegen.validators import (
-    write_validator_py,
+    write_validators_init_py,
     write_data_validator_py,
     get_data_validator_instance,
 )
@@ -169,18 +169,6 @@ def perform_codegen():
 
     # Write out validators
     # --------------------
-    # # ### Layout ###
-    for node in all_layout_nodes:
-        write_validator_py(outdir, node)
-
-    # ### Trace ###
-    for node in all_trace_nodes:
-        write_validator_py(outdir, node)
-
-    # ### Frames ###
-    for node in all_frame_nodes:
-        write_validator_py(outdir, node)
-
     # ### Data (traces) validator ###
     write_data_validator_py(outdir, base_traces_node)
 
@@ -215,24 +203,15 @@ def perform_codegen():
 
     # Write validator __init__.py files
     # ---------------------------------
-    # ### Write __init__.py files for each validator package ###
-    validator_rel_class_imports = {}
+    # ### Group validator nodes by validators package ###
+    validator_nodes = {}
     for node in all_datatype_nodes:
-        if node.is_mapped:
-            continue
-        key = node.parent_path_parts
-        validator_rel_class_imports.setdefault(key, []).append(
-            f"._{node.name_property}.{node.name_validator_class}"
-        )
-
-    # Add Data validator
-    root_validator_pairs = validator_rel_class_imports[()]
-    root_validator_pairs.append("._data.DataValidator")
+        validator_nodes.setdefault(node.parent_path_parts, []).append(node)
 
-    # Output validator __init__.py files
-    validators_pkg = opath.join(outdir, "validators")
-    for path_parts, rel_classes in validator_rel_class_imports.items():
-        write_init_py(validators_pkg, path_parts, [], rel_classes)
+    # Output validator __init__.py files, adding Data validator to the root
+    for path_parts, nodes in validator_nodes.items():
+        rel_classes = ["._data.DataValidator"] if path_parts == () else []
+        write_validators_init_py(outdir, path_parts, nodes, rel_classes)
 
     # Write datatype __init__.py files
     # --------------------------------
@@ -82,7 +82,7 @@ class {fig_classname}({base_classname}):\n"""
     buffer.write(
         f"""
     def __init__(self, data=None, layout=None,
-                 frames=None, skip_invalid=False, **kwargs):
+                 frames=None, skip_invalid=False, validate=True, **kwargs):
         \"\"\"
         Create a new :class:{fig_classname} instance
 
@@ -102,6 +102,13 @@ class {fig_classname}({base_classname}):\n"""
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
 
+        validate: bool
+            If False, property values in the figure specification, and
+            in later calls to add_traces, update_traces, update_layout, etc.,
+            are stored as-is without being validated or coerced. This is
+            faster for trusted, known-good figure specifications.
+            Not supported by FigureWidget.
+
         Raises
         ------
         ValueError
@@ -110,6 +117,7 @@ class {fig_classname}({base_classname}):\n"""
         \"\"\"
         super({fig_classname} ,self).__init__(data, layout,
                                               frames, skip_invalid,
+                                              validate=validate,
                                               **kwargs)
     """
     )
@@ -184,6 +192,29 @@ class {fig_classname}({base_classname}):\n"""
         'y0,y1,row="all",col="all",exclude_empty_subplots=True,annotation=None,**kwargs',
         "y0,y1,row,col,exclude_empty_subplots,annotation,**kwargs",
     )
+    add_wrapper(
+        "add_vlines",
+        'xs,row="all",col="all",exclude_empty_subplots=True,annotation=None,**kwargs',
+        "xs,row,col,exclude_empty_subplots,annotation,**kwargs",
+    )
+
+    add_wrapper(
+        "add_hlines",
+        'ys,row="all",col="all",exclude_empty_subplots=True,annotation=None,**kwargs',
+        "ys,row,col,exclude_empty_subplots,annotation,**kwargs",
+    )
+
+    add_wrapper(
+        "add_shapes",
+        "shapes,row=None,col=None,secondary_y=None,exclude_empty_subplots=False",
+        "shapes,row,col,secondary_y,exclude_empty_subplots",
+    )
+
+    add_wrapper(
+        "add_annotations",
+        "annotations,row=None,col=None,secondary_y=None,exclude_empty_subplots=False",
+        "annotations,row,col,secondary_y,exclude_empty_subplots",
+    )
     add_wrapper(
         "set_subplots",
         "rows=None, cols=None, **make_subplots_args",
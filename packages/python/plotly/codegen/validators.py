@@ -5,114 +5,119 @@ import _plotly_utils.basevalidators
 from codegen.utils import PlotlyNode, TraceNode, write_source_py
 
 
-def build_validator_py(node: PlotlyNode):
+def build_validator_spec_py(node: PlotlyNode):
     """
-    Build validator class source code string for a datatype PlotlyNode
+    Build the validator table entry source code string for a datatype
+    PlotlyNode
 
     Parameters
     ----------
     node : PlotlyNode
         The datatype node (node.is_datatype must evaluate to true) for which
-        to build the validator class
+        to build the validator spec
     Returns
     -------
     str
-        String containing source code for the validator class definition
+        String containing source code for a dict entry of the form
+        'ClassName': (plotly_name, base_validator_path, {param: value})
     """
 
     # Validate inputs
     # ---------------
     assert node.is_datatype
 
-    # Initialize source code buffer
-    # -----------------------------
-    buffer = StringIO()
-
-    # Imports
-    # -------
-    # ### Import package of the validator's superclass ###
-    import_str = ".".join(node.name_base_validator.split(".")[:-1])
-    buffer.write(f"import {import_str }\n")
-
-    # Build Validator
-    # ---------------
     # ### Get dict of validator's constructor params ###
     params = node.get_validator_params()
 
-    # ### Write class definition ###
-    class_name = node.name_validator_class
-    superclass_name = node.name_base_validator
-    buffer.write(
-        f"""
-
-class {class_name}({superclass_name}):
-    def __init__(self, plotly_name={params['plotly_name']},
-                       parent_name={params['parent_name']},
-                       **kwargs):"""
-    )
-
-    # ### Write constructor ###
-    buffer.write(
-        f"""
-        super({class_name}, self).__init__(plotly_name=plotly_name,
-                         parent_name=parent_name"""
-    )
-
     # Write out remaining constructor parameters
+    # plotly_name and parent_name are stored separately
+    buffer = StringIO()
+    buffer.write("{")
     for attr_name, attr_val in params.items():
         if attr_name in ["plotly_name", "parent_name"]:
-            # plotly_name and parent_name are already handled
             continue
+        buffer.write(f"\n        {repr(attr_name)}: {attr_val},")
+    buffer.write("}")
+
+    return (
+        f"{repr(node.name_validator_class)}: ("
+        f"{params['plotly_name']}, "
+        f"{repr(node.name_base_validator)}, "
+        f"{buffer.getvalue()})"
+    )
 
-        buffer.write(
-            f""",
-                 {attr_name}=kwargs.pop('{attr_name}', {attr_val})"""
-        )
 
-    buffer.write(
-        f""",
-        **kwargs"""
-    )
+def build_validators_init_py(parent_path_str, nodes, rel_classes=()):
+    """
+    Build source code for the __init__.py file of a validators package.
 
-    buffer.write(")")
+    Rather than one module per validator class, each package holds a table
+    of validator specs, and the validator classes are built on first access
 
-    # ### Return buffer's string ###
-    return buffer.getvalue()
+    Parameters
+    ----------
+    parent_path_str : str
+        Path string of the parent of the properties validated by this package
+    nodes : list of PlotlyNode
+        The datatype nodes with validators in this package
+    rel_classes: list of str
+        list of additional submodule classes to import, of the form
+        ._submodule.Foo
+    Returns
+    -------
+    str
+        Source code string for the validators package __init__.py file
+    """
+    specs_str = ",\n    ".join(build_validator_spec_py(node) for node in nodes)
+
+    return f"""\
+from _plotly_utils.importers import validator_table
+
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    {repr(parent_path_str)},
+    {{
+    {specs_str}
+    }},
+    {repr(list(rel_classes))}
+)
+"""
 
 
-def write_validator_py(outdir, node: PlotlyNode):
+def write_validators_init_py(outdir, path_parts, nodes, rel_classes=()):
     """
-    Build validator source code and write to a file
+    Build validators package __init__.py source code and write to a file
 
     Parameters
     ----------
     outdir : str
         Root outdir in which the validators package should reside
-    node : PlotlyNode
-        The datatype node (node.is_datatype must evaluate to true) for which
-        to build a validator class
+    path_parts : tuple of str
+        Tuple of sub-packages under the validators package where the
+        __init__.py file should be written
+    nodes : list of PlotlyNode
+        The datatype nodes with validators in this package. Mapped nodes
+        are skipped
+    rel_classes: list of str
+        list of additional submodule classes to import, of the form
+        ._submodule.Foo
     Returns
     -------
     None
     """
-    if node.is_mapped:
-        # No validator written for mapped nodes
-        # e.g. no validator for layout.titlefont since ths is mapped to
-        # layout.title.font
-        return
+    # No validators are written for mapped nodes
+    # e.g. no validator for layout.titlefont since ths is mapped to
+    # layout.title.font
+    nodes = [node for node in nodes if not node.is_mapped]
 
     # Generate source code
     # --------------------
-    validator_source = build_validator_py(node)
+    init_source = build_validators_init_py(".".join(path_parts), nodes, rel_classes)
 
     # Write file
     # ----------
-    # filepath = opath.join(outdir, "validators", *node.parent_path_parts, "__init__.py")
-    filepath = opath.join(
-        outdir, "validators", *node.parent_path_parts, "_" + node.name_property + ".py"
-    )
-
-    write_source_py(validator_source, filepath, leading_newlines=2)
+    filepath = opath.join(outdir, "validators", *path_parts, "__init__.py")
+    write_source_py(init_source, filepath)
 
 
 def build_data_validator_params(base_trace_node: TraceNode):
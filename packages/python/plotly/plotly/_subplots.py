@@ -1534,3 +1534,20 @@ def _get_subplot_ref_for_trace(trace):
                 pass
 
     return None
+
+
+def _subplot_ref_key(subplot_ref):
+    """
+    Return a hashable key for a SubplotRef (or None), such that two refs
+    have equal keys if and only if they compare equal
+    """
+    if subplot_ref is None:
+        return None
+
+    trace_kwargs = tuple(
+        sorted(
+            (k, tuple(sorted(v.items())) if isinstance(v, dict) else v)
+            for k, v in subplot_ref.trace_kwargs.items()
+        )
+    )
+    return subplot_ref.subplot_type, subplot_ref.layout_keys, trace_kwargs
@@ -15,6 +15,8 @@ from _plotly_utils.utils import (
     display_string_positions,
     chomp_empty_strings,
     find_closest_string,
+    validation_config,
+    path_caches,
 )
 from _plotly_utils.exceptions import PlotlyKeyError
 from .optional_imports import get_module
@@ -28,6 +30,54 @@ from . import _subplots
 Undefined = object()
 
 
+def _copy_props(props):
+    """
+    Return a copy of a (possibly nested) property dict or list that shares
+    immutable array payloads with the original.
+
+    dicts and lists are copied recursively so that the copy can be modified
+    independently of the original. Read-only numpy arrays, which is how
+    validators store all array properties, can never be modified in place and
+    so are shared rather than duplicated. Windows of the ring buffers used by
+    `extend` are read-only too, but change when points are appended, so they
+    are copied. Everything else is deep copied.
+
+    Parameters
+    ----------
+    props : dict or list
+        Property structure to copy (typically the _props of a plotly object)
+
+    Returns
+    -------
+    dict or list
+    """
+    np = get_module("numpy", should_load=False)
+    if np:
+        from _plotly_utils.ring_buffer import is_ring_buffer_view
+
+        ndarray_type = np.ndarray
+    else:
+        ndarray_type = ()
+    immutable_types = (str, int, float, bool, type(None))
+
+    def _copy(v):
+        if isinstance(v, immutable_types):
+            return v
+        elif isinstance(v, dict):
+            return {k: _copy(e) for k, e in v.items()}
+        elif isinstance(v, list):
+            return [_copy(e) for e in v]
+        elif isinstance(v, ndarray_type) and not v.flags.writeable:
+            if is_ring_buffer_view(v):
+                v = v.copy()
+                v.flags.writeable = False
+            return v
+        else:
+            return deepcopy(v)
+
+    return _copy(props)
+
+
 def _len_dict_item(item):
     """
     Because a parsed dict path is a tuple containings strings or integers, to
@@ -52,6 +102,8 @@ def _str_to_dict_path_full(key_path_str):
     return a tuple of indices marking the beginning of each element in the
     string.
 
+    Parsed key path strings are cached in `path_caches["key_paths"]`.
+
     Parameters
     ----------
     key_path_str : str
@@ -63,6 +115,21 @@ def _str_to_dict_path_full(key_path_str):
     tuple[str | int]
     tuple [int]
     """
+    if not isinstance(key_path_str, str):
+        return _parse_dict_path_full(key_path_str)
+
+    key_path_cache = path_caches["key_paths"]
+    parsed = key_path_cache.get(key_path_str)
+    if parsed is None:
+        parsed = _parse_dict_path_full(key_path_str)
+        key_path_cache[key_path_str] = parsed
+    return parsed
+
+
+def _parse_dict_path_full(key_path_str):
+    """
+    Uncached implementation of `_str_to_dict_path_full`
+    """
     # skip all the parsing if the string is empty
     if len(key_path_str):
         # split string on ".[]" and filter out empty strings
@@ -127,7 +194,7 @@ def _str_to_dict_path_full(key_path_str):
         key_path3 = []
         elem_idcs = []
 
-    return (tuple(key_path3), elem_idcs)
+    return (tuple(key_path3), tuple(elem_idcs))
 
 
 def _remake_path_from_tuple(props):
@@ -172,9 +239,21 @@ def _check_path_in_prop_tree(obj, path, error_cast=None):
     returns
           an Exception object or None. The caller can raise this
           exception to see where the lookup error occurred.
+
+    Valid paths are cached per class in `path_caches["prop_tree_paths"]`,
+    unless they contain array indices or go through a layout, whose subplot
+    properties depend on the state of the object.
     """
     if isinstance(path, tuple):
         path = _remake_path_from_tuple(path)
+
+    prop_tree_cache = path_caches["prop_tree_paths"]
+    cache_key = None
+    if isinstance(obj, BasePlotlyType) and not isinstance(obj, BaseLayoutType):
+        cache_key = (obj.__class__, path)
+    if cache_key is not None and prop_tree_cache.get(cache_key):
+        return None
+
     prop, prop_idcs = _str_to_dict_path_full(path)
     prev_objs = []
     for i, p in enumerate(prop):
@@ -244,6 +323,13 @@ Bad property path:
                 e = error_cast()
             e.args = (arg,)
             return e
+
+    if (
+        cache_key is not None
+        and not any(isinstance(p, int) for p in prop)
+        and not any(isinstance(o, BaseLayoutType) for o in prev_objs)
+    ):
+        prop_tree_cache[cache_key] = True
     return None
 
 
@@ -334,6 +420,26 @@ x0: float or int
     A number representing the x coordinate of one side of the rectangle.
 x1: float or int
     A number representing the x coordinate of the other side of the rectangle."""
+    elif shape_type == "hlines":
+        docstr = """
+Add several horizontal lines to a plot or subplot that extend infinitely in
+the x-dimension. This is equivalent to, but much faster than, calling
+add_hline for each y coordinate.
+
+Parameters
+----------
+ys: list of float or int
+    The y coordinates of the horizontal lines."""
+    elif shape_type == "vlines":
+        docstr = """
+Add several vertical lines to a plot or subplot that extend infinitely in
+the y-dimension. This is equivalent to, but much faster than, calling
+add_vline for each x coordinate.
+
+Parameters
+----------
+xs: list of float or int
+    The x coordinates of the vertical lines."""
     docstr += """
 exclude_empty_subplots: Boolean
     If True (default) do not place the shape on subplots that have no data
@@ -352,7 +458,7 @@ annotation: dict or plotly.graph_objects.layout.Annotation. If dict(),
     below) unless its x or y value has been specified for the annotation
     passed here. xref and yref are always the same as for the added
     shape and cannot be overridden."""
-    if shape_type in ["hline", "vline"]:
+    if shape_type in ["hline", "vline", "hlines", "vlines"]:
         docstr += """
 annotation_position: a string containing optionally ["top", "bottom"]
     and ["left", "right"] specifying where the text should be anchored
@@ -408,7 +514,13 @@ class BaseFigure(object):
     # Constructor
     # -----------
     def __init__(
-        self, data=None, layout_plotly=None, frames=None, skip_invalid=False, **kwargs
+        self,
+        data=None,
+        layout_plotly=None,
+        frames=None,
+        skip_invalid=False,
+        validate=True,
+        **kwargs,
     ):
         """
         Construct a BaseFigure object
@@ -448,6 +560,13 @@ class BaseFigure(object):
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
 
+        validate: bool
+            If False, property values in the figure specification, and
+            in later calls to add_traces, update_traces, update_layout, etc.,
+            are stored as-is without being validated or coerced. This is
+            faster for trusted, known-good figure specifications.
+            Not supported by FigureWidget.
+
         Raises
         ------
         ValueError
@@ -459,7 +578,13 @@ class BaseFigure(object):
         super(BaseFigure, self).__init__()
 
         # Initialize validation
-        self._validate = kwargs.pop("_validate", True)
+        self._validate = kwargs.pop("_validate", True) and validate
+        if not self._validate and not self._allow_disable_validation:
+            raise ValueError(
+                "{typ} does not support validate=False".format(
+                    typ=self.__class__.__name__
+                )
+            )
 
         # Assign layout_plotly to layout
         # ------------------------------
@@ -476,12 +601,25 @@ class BaseFigure(object):
         self._grid_str = None
         self._grid_ref = None
 
+        # Subplot occupancy index
+        # -----------------------
+        # Built on demand by _get_subplot_index and discarded when a trace or
+        # layout object may have moved to another subplot
+        self._subplot_index = None
+
+        # Downsampled traces
+        # ------------------
+        # Full-resolution per-point arrays of the traces whose points were
+        # reduced by plotly.express, keyed by trace uid
+        self._downsample_sources = {}
+
         # Handle case where data is a Figure or Figure-like dict
         # ------------------------------------------------------
         if isinstance(data, BaseFigure):
             # Bring over subplot fields
             self._grid_str = data._grid_str
             self._grid_ref = data._grid_ref
+            self._downsample_sources = dict(data._downsample_sources)
 
             # Extract data, layout, and frames
             data, layout, frames = data.data, data.layout, data.frames
@@ -509,17 +647,27 @@ class BaseFigure(object):
         self._data_validator = DataValidator(set_uid=self._set_trace_uid)
 
         # ### Import traces ###
+        input_uids = [trace.uid for trace in data] if self._downsample_sources else None
         data = self._data_validator.validate_coerce(
             data, skip_invalid=skip_invalid, _validate=self._validate
         )
 
+        # ### Follow uids given to the traces by the data validator ###
+        if input_uids is not None:
+            new_uids = dict(zip(input_uids, (trace.uid for trace in data)))
+            self._downsample_sources = {
+                new_uids[uid]: source
+                for uid, source in self._downsample_sources.items()
+                if uid in new_uids
+            }
+
         # ### Save tuple of trace objects ###
         self._data_objs = data
 
         # ### Import clone of trace properties ###
         # The _data property is a list of dicts containing the properties
         # explicitly set by the user for each trace.
-        self._data = [deepcopy(trace._props) for trace in data]
+        self._data = [_copy_props(trace._props) for trace in data]
 
         # ### Create data defaults ###
         # _data_defaults is a tuple of dicts, one for each trace. When
@@ -557,7 +705,7 @@ class BaseFigure(object):
         )
 
         # ### Import clone of layout properties ###
-        self._layout = deepcopy(self._layout_obj._props)
+        self._layout = _copy_props(self._layout_obj._props)
 
         # ### Initialize layout defaults dict ###
         self._layout_defaults = {}
@@ -588,7 +736,7 @@ class BaseFigure(object):
 
         # ### Import frames ###
         self._frame_objs = self._frames_validator.validate_coerce(
-            frames, skip_invalid=skip_invalid
+            frames, skip_invalid=skip_invalid, _validate=self._validate
         )
 
         # Note: Because frames are not currently supported in the widget
@@ -689,9 +837,10 @@ class BaseFigure(object):
         # ----------------------
         # e.g. ('foo', 1)
         else:
-            err = _check_path_in_prop_tree(self, orig_prop, error_cast=ValueError)
-            if err is not None:
-                raise err
+            if self._validate and validation_config.enabled:
+                err = _check_path_in_prop_tree(self, orig_prop, error_cast=ValueError)
+                if err is not None:
+                    raise err
             res = self
             for p in prop[:-1]:
                 res = res[p]
@@ -1006,13 +1155,12 @@ class BaseFigure(object):
         delete_inds = []
 
         # ### Unparent removed traces ###
-        for i, trace in enumerate(self.data):
-            if id(trace) in remove_uids:
+        for i, old_trace in enumerate(self.data):
+            if id(old_trace) in remove_uids:
                 delete_inds.append(i)
 
                 # Unparent trace object to be removed
-                old_trace = self.data[i]
-                old_trace._orphan_props.update(deepcopy(old_trace._props))
+                old_trace._orphan_props.update(_copy_props(old_trace._props))
                 old_trace._parent = None
                 old_trace._trace_ind = None
 
@@ -1037,9 +1185,8 @@ class BaseFigure(object):
         # -----------
 
         # ### Compute new index for each remaining trace ###
-        new_inds = []
-        for uid in uids_post_removal:
-            new_inds.append(new_uids.index(uid))
+        new_uid_inds = {uid: i for i, uid in enumerate(new_uids)}
+        new_inds = [new_uid_inds[uid] for uid in uids_post_removal]
 
         # ### Compute current index for each remaining trace ###
         current_inds = list(range(len(traces_props_post_removal)))
@@ -1083,6 +1230,7 @@ class BaseFigure(object):
 
         # Update trace objects tuple
         self._data_objs = list(new_data)
+        self._subplot_index = None
 
         # Update trace indexes
         for trace_ind, trace in enumerate(self._data_objs):
@@ -1171,18 +1319,19 @@ class BaseFigure(object):
         )
 
     def _perform_select_traces(self, filter_by_subplot, grid_subplot_refs, selector):
-        from plotly._subplots import _get_subplot_ref_for_trace
-
-        # functions for filtering
-        def _filter_by_subplot_ref(trace):
-            trace_subplot_ref = _get_subplot_ref_for_trace(trace)
-            return trace_subplot_ref in grid_subplot_refs
+        from plotly._subplots import _subplot_ref_key
 
-        funcs = []
         if filter_by_subplot:
-            funcs.append(_filter_by_subplot_ref)
+            # Look up the traces on the requested subplots in the index
+            trace_refs = self._get_subplot_index()["trace_refs"]
+            trace_inds = set()
+            for subplot_ref in grid_subplot_refs:
+                trace_inds.update(trace_refs.get(_subplot_ref_key(subplot_ref), ()))
+            traces = [self._data_objs[i] for i in sorted(trace_inds)]
+        else:
+            traces = self.data
 
-        return _generator(self._filter_by_selector(self.data, funcs, selector))
+        return _generator(self._filter_by_selector(traces, [], selector))
 
     @staticmethod
     def _selector_matches(obj, selector):
@@ -1498,6 +1647,75 @@ class BaseFigure(object):
         secondary_y=None,
         exclude_empty_subplots=False,
     ):
+        return self._add_annotations_like(
+            prop_singular,
+            prop_plural,
+            [new_obj],
+            row=row,
+            col=col,
+            secondary_y=secondary_y,
+            exclude_empty_subplots=exclude_empty_subplots,
+        )
+
+    def _add_annotations_like(
+        self,
+        prop_singular,
+        prop_plural,
+        new_objs,
+        row=None,
+        col=None,
+        secondary_y=None,
+        exclude_empty_subplots=False,
+    ):
+        """
+        Add annotation-like layout objects (annotations, shapes, images...)
+        to the subplots addressed by row and col, appending all of them to
+        the layout array at once.
+        """
+        data_class = self.layout._get_validator(prop_plural).data_class
+        placed_objs = []
+        for new_obj in new_objs:
+            placed_objs.extend(
+                self._place_annotation_like(
+                    prop_singular,
+                    data_class(new_obj),
+                    row=row,
+                    col=col,
+                    secondary_y=secondary_y,
+                    exclude_empty_subplots=exclude_empty_subplots,
+                )
+            )
+
+        self._extend_layout_array(prop_plural, placed_objs)
+        return self
+
+    def _extend_layout_array(self, prop_plural, objs):
+        """
+        Append objs to the layout's compound array property prop_plural,
+        keeping the subplot index up to date
+        """
+        # Appending discards the index (see _discard_subplot_index), but it
+        # can be updated with the appended objects instead
+        subplot_index = self._subplot_index
+        objs = self.layout._extend_array_prop(prop_plural, objs)
+        if subplot_index is not None and not self._in_batch_mode:
+            self._add_to_subplot_index(subplot_index, prop_plural, objs)
+            self._subplot_index = subplot_index
+
+    def _place_annotation_like(
+        self,
+        prop_singular,
+        new_obj,
+        row=None,
+        col=None,
+        secondary_y=None,
+        exclude_empty_subplots=False,
+    ):
+        """
+        Return the objects to add for new_obj: new_obj itself if row and col
+        are None, otherwise a copy of it referencing the axes of each
+        addressed (and, if requested, non-empty) subplot.
+        """
         # Make sure we have both row and col or neither
         if row is not None and col is None:
             raise ValueError(
@@ -1514,17 +1732,19 @@ class BaseFigure(object):
         if row is not None and _is_select_subplot_coordinates_arg(row, col):
             # TODO product argument could be added
             rows_cols = self._select_subplot_coordinates(row, col)
+            placed_objs = []
             for r, c in rows_cols:
-                self._add_annotation_like(
-                    prop_singular,
-                    prop_plural,
-                    new_obj,
-                    row=r,
-                    col=c,
-                    secondary_y=secondary_y,
-                    exclude_empty_subplots=exclude_empty_subplots,
+                placed_objs.extend(
+                    self._place_annotation_like(
+                        prop_singular,
+                        new_obj,
+                        row=r,
+                        col=c,
+                        secondary_y=secondary_y,
+                        exclude_empty_subplots=exclude_empty_subplots,
+                    )
                 )
-            return self
+            return placed_objs
 
         # Get grid_ref if specific row or column requested
         if row is not None:
@@ -1589,7 +1809,7 @@ is of type {subplot_type}.""".format(
                     xref, yref, selector=bool(exclude_empty_subplots)
                 )
             ):
-                return self
+                return []
             # in case the user specified they wanted an axis to refer to the
             # domain of that axis and not the data, append ' domain' to the
             # computed axis accordingly
@@ -1601,15 +1821,15 @@ is of type {subplot_type}.""".format(
 
             xref, yref = map(lambda t: _add_domain(*t), zip(["x", "y"], [xref, yref]))
             new_obj.update(xref=xref, yref=yref)
+            placed_obj = new_obj.__class__(new_obj)
+            # The 'new_obj.xref' and 'new_obj.yref' parameters need to be reset otherwise it
+            # will appear as if user supplied yref params when looping through subplots and
+            # will force annotation to be on the axis of the last drawn annotation
+            # i.e. they all end up on the same axis.
+            new_obj.update(xref=None, yref=None)
+            return [placed_obj]
 
-        self.layout[prop_plural] += (new_obj,)
-        # The 'new_obj.xref' and 'new_obj.yref' parameters need to be reset otherwise it
-        # will appear as if user supplied yref params when looping through subplots and
-        # will force annotation to be on the axis of the last drawn annotation
-        # i.e. they all end up on the same axis.
-        new_obj.update(xref=None, yref=None)
-
-        return self
+        return [new_obj]
 
     # Restyle
     # -------
@@ -1729,7 +1949,13 @@ is of type {subplot_type}.""".format(
                     trace_obj = self.data[trace_ind]
 
                     # Validate key_path_str
-                    if not BaseFigure._is_key_path_compatible(key_path_str, trace_obj):
+                    if (
+                        trace_obj._validate
+                        and validation_config.enabled
+                        and not BaseFigure._is_key_path_compatible(
+                            key_path_str, trace_obj
+                        )
+                    ):
 
                         trace_class = trace_obj.__class__.__name__
                         raise ValueError(
@@ -1744,6 +1970,8 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                     val_changed = BaseFigure._set_in(
                         self._data[trace_ind], key_path_str, trace_v
                     )
+                    if val_changed:
+                        trace_obj._bump_version()
 
                     # Update any_vals_changed status
                     any_vals_changed = any_vals_changed or val_changed
@@ -1797,6 +2025,197 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                 self._batch_trace_edits[trace_index] = OrderedDict()
             self._batch_trace_edits[trace_index][key_path_str] = val
 
+    def _extend_child(self, child, extend_data, max_points):
+        """
+        Process extend operation on a child trace object
+
+        Parameters
+        ----------
+        child : BaseTraceType
+            Child being extended
+        extend_data : dict[str, array]
+            Validated points to append, keyed by key path string
+            (e.g. 'marker.color')
+        max_points : int or None
+            Maximum number of points to keep in each extended property
+
+        Returns
+        -------
+        None
+        """
+        trace_index = child._trace_ind
+
+        # Not in batch mode
+        # -----------------
+        # Extend the trace data in place, send the new points to the
+        # frontend and dispatch change callbacks with the extended values
+        if not self._in_batch_mode:
+            # Check every property before extending any of them, so that an
+            # invalid one doesn't leave the others extended without a message
+            for key_path_str in extend_data:
+                BaseFigure._check_extendable(
+                    BaseFigure._get_in(self._data[trace_index], key_path_str),
+                    key_path_str,
+                )
+
+            restyle = {
+                key_path_str: [
+                    BaseFigure._extend_in(
+                        self._data[trace_index],
+                        key_path_str,
+                        points,
+                        max_points,
+                        ring_buffers=child._ring_buffers,
+                    )
+                ]
+                for key_path_str, points in extend_data.items()
+            }
+            child._bump_version()
+            self._send_extendTraces_msg(
+                {k: [v] for k, v in extend_data.items()}, [trace_index], max_points
+            )
+            self._dispatch_trace_change_callbacks(restyle, [trace_index])
+
+        # In batch mode
+        # -------------
+        # Record the extended values as batch edits, starting from the
+        # values of earlier edits of the same batch
+        else:
+            if trace_index not in self._batch_trace_edits:
+                self._batch_trace_edits[trace_index] = OrderedDict()
+            trace_edits = self._batch_trace_edits[trace_index]
+            currents = {}
+            for key_path_str in extend_data:
+                if key_path_str in trace_edits:
+                    currents[key_path_str] = trace_edits[key_path_str]
+                else:
+                    currents[key_path_str] = child[key_path_str]
+                BaseFigure._check_extendable(currents[key_path_str], key_path_str)
+
+            for key_path_str, points in extend_data.items():
+                trace_edits[key_path_str] = BaseFigure._extend_in(
+                    {"value": currents[key_path_str]}, "value", points, max_points
+                )
+
+    @staticmethod
+    def _get_in(d, key_path_str):
+        """
+        Return the value at a key path string in a nested dict, or None if
+        it is not set
+        """
+        val = d
+        for key_path_el in BaseFigure._str_to_dict_path(key_path_str):
+            if not isinstance(val, dict):
+                return None
+            val = val.get(key_path_el, None)
+        return val
+
+    @staticmethod
+    def _check_extendable(current, key_path_str):
+        """
+        Raise a ValueError if `current`, the value of the property at
+        `key_path_str`, is set but is not an array that points can be
+        appended to
+        """
+        if current is None:
+            return
+        if isinstance(current, str) or not hasattr(current, "__len__"):
+            raise ValueError(
+                "Cannot extend the scalar value {current!r} of property "
+                "{key_path_str!r}".format(current=current, key_path_str=key_path_str)
+            )
+
+    @staticmethod
+    def _extend_in(d, key_path_str, points, max_points=None, ring_buffers=None):
+        """
+        Append points to the array at a key path string in a nested dict,
+        keeping at most `max_points` trailing points
+
+        When `max_points` is specified, numeric and datetime numpy arrays are
+        streamed through a ring buffer of that capacity stored in
+        `ring_buffers`, so that appending k points costs O(k) instead of
+        copying the whole array. The extended array is then a read-only view
+        of the ring buffer, which changes when more points are appended, so
+        it is copied when handed out by property access or `_copy_props`.
+
+        Parameters
+        ----------
+        d : dict
+            Input dict to extend the array in
+        key_path_str : str
+            Key path string (e.g. 'marker.color')
+        points : list or tuple or np.ndarray
+            Points to append
+        max_points : int or None
+            Maximum number of points to keep
+        ring_buffers : dict or None
+            Ring buffers of the extended object, keyed by key path string
+
+        Returns
+        -------
+        list or np.ndarray
+            The extended array
+        """
+        key_path = BaseFigure._str_to_dict_path(key_path_str)
+        val_parent = d
+        for key_path_el in key_path[:-1]:
+            val_parent = val_parent.setdefault(key_path_el, {})
+
+        last_key = key_path[-1]
+        current = val_parent.get(last_key, None)
+        BaseFigure._check_extendable(current, key_path_str)
+        if current is None:
+            current = points[:0]
+
+        np = get_module("numpy", should_load=False)
+        if np is not None and (
+            isinstance(current, np.ndarray) or isinstance(points, np.ndarray)
+        ):
+            extended = None
+            if max_points is not None and ring_buffers is not None:
+                from _plotly_utils.ring_buffer import RingBuffer
+
+                current, points = np.asarray(current), np.asarray(points)
+                ring, window = ring_buffers.get(key_path_str, (None, None))
+                if (
+                    ring is None
+                    or window is not current
+                    or ring.capacity != max_points
+                    or not np.can_cast(points.dtype, ring.dtype)
+                ):
+                    # Start a new ring buffer from the current values
+                    dtype = np.result_type(current, points)
+                    ring = RingBuffer(max_points, dtype)
+                    if dtype.kind in "biufM":
+                        ring.append(current)
+                    else:
+                        ring = None
+
+                if ring is not None:
+                    extended = ring.append(points)
+                    ring_buffers[key_path_str] = (ring, extended)
+                else:
+                    ring_buffers.pop(key_path_str, None)
+
+            if extended is None:
+                if max_points is not None and len(points) >= max_points:
+                    extended = np.array(points[len(points) - max_points :])
+                else:
+                    keep = len(current)
+                    if max_points is not None:
+                        keep = min(keep, max_points - len(points))
+                    extended = np.concatenate(
+                        [np.asarray(current)[len(current) - keep :], np.asarray(points)]
+                    )
+                extended.flags["WRITEABLE"] = False
+        else:
+            extended = list(current) + list(points)
+            if max_points is not None and len(extended) > max_points:
+                extended = extended[len(extended) - max_points :]
+
+        val_parent[last_key] = extended
+        return extended
+
     def _normalize_trace_indexes(self, trace_indexes):
         """
         Input trace index specification and return list of the specified trace
@@ -2187,11 +2606,7 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         """
 
         # Validate traces
-        data = self._data_validator.validate_coerce(data)
-
-        # Set trace indexes
-        for ind, new_trace in enumerate(data):
-            new_trace._trace_ind = ind + len(self.data)
+        data = self._data_validator.validate_coerce(data, _validate=self._validate)
 
         # Allow integers as inputs to subplots
         int_type = _get_int_type()
@@ -2245,8 +2660,12 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                 )
             )
 
-        # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        # Set trace indexes
+        for ind, new_trace in enumerate(data):
+            new_trace._trace_ind = ind + len(self._data_objs)
+
+        # Copy trace data, sharing read-only array payloads
+        new_traces_data = [_copy_props(trace._props) for trace in data]
 
         # Update trace parent
         for trace in data:
@@ -2259,6 +2678,10 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         self._data_defaults = self._data_defaults + [{} for _ in data]
         self._data_objs = self._data_objs + data
 
+        # Update subplot index
+        if self._subplot_index is not None:
+            self._add_to_subplot_index(self._subplot_index, "traces", data)
+
         # Update messages
         self._send_addTraces_msg(new_traces_data)
 
@@ -2524,11 +2947,13 @@ Please use the add_trace method with the row and col parameters.
                     if isinstance(pio.templates.default, BasePlotlyType):
                         # Template object. Don't want to actually import `Template`
                         # here for performance so we check against `BasePlotlyType`
-                        template_object = pio.templates.default
+                        self._layout_obj.template = pio.templates.default
                     else:
-                        # Name of registered template object
-                        template_object = pio.templates[pio.templates.default]
-                    self._layout_obj.template = template_object
+                        # Name of registered template object. Its validated
+                        # properties are cached and shared between figures
+                        self._layout_obj._set_shared_template_props(
+                            pio.templates._get_template_props(pio.templates.default)
+                        )
                 finally:
                     self._layout_obj._validate = self._validate
 
@@ -2548,13 +2973,15 @@ Please use the add_trace method with the row and col parameters.
 
         # Validate new layout
         # -------------------
-        new_layout = self._layout_validator.validate_coerce(new_layout)
-        new_layout_data = deepcopy(new_layout._props)
+        new_layout = self._layout_validator.validate_coerce(
+            new_layout, _validate=self._validate
+        )
+        new_layout_data = _copy_props(new_layout._props)
 
         # Unparent current layout
         # -----------------------
         if self._layout_obj:
-            old_layout_data = deepcopy(self._layout_obj._props)
+            old_layout_data = _copy_props(self._layout_obj._props)
             self._layout_obj._orphan_props.update(old_layout_data)
             self._layout_obj._parent = None
 
@@ -2564,6 +2991,7 @@ Please use the add_trace method with the row and col parameters.
         new_layout._parent = self
         new_layout._orphan_props.clear()
         self._layout_obj = new_layout
+        self._subplot_index = None
 
         # Initialize template object
         # --------------------------
@@ -2641,7 +3069,11 @@ Please use the add_trace method with the row and col parameters.
         # ----------------
         for key_path_str, v in relayout_data.items():
 
-            if not BaseFigure._is_key_path_compatible(key_path_str, self.layout):
+            if (
+                self._layout_obj._validate
+                and validation_config.enabled
+                and not BaseFigure._is_key_path_compatible(key_path_str, self.layout)
+            ):
 
                 raise ValueError(
                     """
@@ -2652,9 +3084,12 @@ Invalid property path '{key_path_str}' for layout
                 )
 
             # Apply set operation on the layout dict
+            if BaseFigure._str_to_dict_path(key_path_str)[0] == "template":
+                self._layout_obj._unshare_template_props()
             val_changed = BaseFigure._set_in(self._layout, key_path_str, v)
 
             if val_changed:
+                self._layout_obj._bump_version()
                 relayout_changes[key_path_str] = v
 
         return relayout_changes
@@ -2799,6 +3234,7 @@ Invalid property path '{key_path_str}' for layout
         # Build dispatch plan
         # -------------------
         key_path_strs = list(relayout_data.keys())
+        self._discard_subplot_index(key_path_strs, layout=True)
         dispatch_plan = BaseFigure._build_dispatch_plan(key_path_strs)
 
         # Dispatch changes to each layout objects
@@ -2829,13 +3265,14 @@ Invalid property path '{key_path_str}' for layout
         # Build dispatch plan
         # -------------------
         key_path_strs = list(restyle_data.keys())
+        self._discard_subplot_index(key_path_strs)
         dispatch_plan = BaseFigure._build_dispatch_plan(key_path_strs)
 
         # Dispatch changes to each object in each trace
         # ---------------------------------------------
         for path_tuple, changed_paths in dispatch_plan.items():
             for trace_ind in trace_indexes:
-                trace = self.data[trace_ind]
+                trace = self._data_objs[trace_ind]
                 if path_tuple in trace:
                     dispatch_obj = trace[path_tuple]
                     if isinstance(dispatch_obj, BasePlotlyType):
@@ -2861,7 +3298,9 @@ Invalid property path '{key_path_str}' for layout
         # changes, and we don't reparent the frames.
 
         # Validate frames
-        self._frame_objs = self._frames_validator.validate_coerce(new_frames)
+        self._frame_objs = self._frames_validator.validate_coerce(
+            new_frames, _validate=self._validate
+        )
 
     # Update
     # ------
@@ -2985,6 +3424,9 @@ Invalid property path '{key_path_str}' for layout
     def _send_restyle_msg(self, style, trace_indexes=None, source_view_id=None):
         pass
 
+    def _send_extendTraces_msg(self, extend_data, trace_indexes, max_points=None):
+        pass
+
     def _send_relayout_msg(self, layout, source_view_id=None):
         pass
 
@@ -3101,9 +3543,12 @@ Invalid property path '{key_path_str}' for layout
         }
 
         # Fill in values
+        restyle_trace_indexes = {
+            trace_ind: i for i, trace_ind in enumerate(trace_indexes)
+        }
         for trace_ind, trace_style in batch_style_commands.items():
+            restyle_trace_index = restyle_trace_indexes[trace_ind]
             for trace_prop, trace_val in trace_style.items():
-                restyle_trace_index = trace_indexes.index(trace_ind)
                 restyle_data[trace_prop][restyle_trace_index] = trace_val
 
         # Handle Layout
@@ -3295,17 +3740,17 @@ Invalid property path '{key_path_str}' for layout
         """
         # Handle data
         # -----------
-        data = deepcopy(self._data)
+        data = _copy_props(self._data)
 
         # Handle layout
         # -------------
-        layout = deepcopy(self._layout)
+        layout = _copy_props(self._layout)
 
         # Handle frames
         # -------------
         # Frame key is only added if there are any frames
         res = {"data": data, "layout": layout}
-        frames = deepcopy([frame._props for frame in self._frame_objs])
+        frames = _copy_props([frame._props for frame in self._frame_objs])
 
         if frames:
             res["frames"] = frames
@@ -3876,6 +4321,7 @@ Invalid property path '{key_path_str}' for layout
             # Nothing to do
             return
         elif isinstance(plotly_obj, BasePlotlyType):
+            validate = plotly_obj._validate and validation_config.enabled
 
             # Handle initializing subplot ids
             # -------------------------------
@@ -3891,9 +4337,12 @@ Invalid property path '{key_path_str}' for layout
                         plotly_obj[key] = {}
                         continue
 
-                err = _check_path_in_prop_tree(plotly_obj, key, error_cast=ValueError)
-                if err is not None:
-                    raise err
+                if validate:
+                    err = _check_path_in_prop_tree(
+                        plotly_obj, key, error_cast=ValueError
+                    )
+                    if err is not None:
+                        raise err
 
             # Convert update_obj to dict
             # --------------------------
@@ -3905,8 +4354,9 @@ Invalid property path '{key_path_str}' for layout
             for key in update_obj:
                 val = update_obj[key]
 
-                if overwrite:
-                    # Don't recurse and assign property as-is
+                if overwrite or not (validate or key in plotly_obj):
+                    # Don't recurse and assign property as-is. Unknown
+                    # properties are only accepted when validation is disabled
                     plotly_obj[key] = val
                     continue
 
@@ -3916,11 +4366,15 @@ Invalid property path '{key_path_str}' for layout
 
                     # Update compound objects recursively
                     # plotly_obj[key].update(val)
-                    BaseFigure._perform_update(plotly_obj[key], val)
+                    child = plotly_obj[key]
+                    child._validate = plotly_obj._validate
+                    BaseFigure._perform_update(child, val)
                 elif isinstance(validator, CompoundArrayValidator):
                     if plotly_obj[key]:
                         # plotly_obj has an existing non-empty array for key
                         # In this case we merge val into the existing elements
+                        for child in plotly_obj[key]:
+                            child._validate = plotly_obj._validate
                         BaseFigure._perform_update(plotly_obj[key], val)
 
                         # If update tuple is longer that current tuple, append the
@@ -4013,7 +4467,8 @@ Invalid property path '{key_path_str}' for layout
     ):
         """
         Add a shape or multiple shapes and call _make_axis_spanning_layout_object on
-        all the new shapes.
+        all the new shapes. shape_args is a dict of the shape's coordinates, or
+        a list of such dicts to add one shape (and annotation) per dict.
         """
         if shape_type in ["vline", "vrect"]:
             direction = "vertical"
@@ -4028,66 +4483,67 @@ Invalid property path '{key_path_str}' for layout
             # this has no subplots to address, so we force row and col to be None
             row = None
             col = None
-        n_shapes_before = len(self.layout["shapes"])
-        n_annotations_before = len(self.layout["annotations"])
-        # shapes are always added at the end of the tuple of shapes, so we see
-        # how long the tuple is before the call and after the call, and adjust
-        # the new shapes that were added at the end
+        if isinstance(shape_args, dict):
+            shape_args = [shape_args]
         # extract annotation prefixed kwargs
         # annotation with extra parameters based on the annotation_position
         # argument and other annotation_ prefixed kwargs
         shape_kwargs, annotation_kwargs = shapeannotation.split_dict_by_key_prefix(
             kwargs, "annotation_"
         )
-        augmented_annotation = shapeannotation.axis_spanning_shape_annotation(
-            annotation, shape_type, shape_args, annotation_kwargs
-        )
-        self.add_shape(
-            row=row,
-            col=col,
-            exclude_empty_subplots=exclude_empty_subplots,
-            **_combine_dicts([shape_args, shape_kwargs]),
-        )
-        if augmented_annotation is not None:
-            self.add_annotation(
-                augmented_annotation,
-                row=row,
-                col=col,
-                exclude_empty_subplots=exclude_empty_subplots,
-                yref=shape_kwargs.get("yref", "y"),
+        secondary_y = shape_kwargs.pop("secondary_y", None)
+        shape_class = self.layout._get_validator("shapes").data_class
+        annotation_class = self.layout._get_validator("annotations").data_class
+        new_layout_objs = {"shapes": [], "annotations": []}
+        for args in shape_args:
+            # axis_spanning_shape_annotation fills in the annotation it is
+            # passed, so give it a copy for each shape
+            augmented_annotation = shapeannotation.axis_spanning_shape_annotation(
+                (
+                    annotation.to_plotly_json()
+                    if isinstance(annotation, BasePlotlyType)
+                    else copy(annotation)
+                ),
+                shape_type,
+                args,
+                annotation_kwargs,
             )
-        # update xref and yref for the new shapes and annotations
-        for layout_obj, n_layout_objs_before in zip(
-            ["shapes", "annotations"], [n_shapes_before, n_annotations_before]
-        ):
-            n_layout_objs_after = len(self.layout[layout_obj])
-            if (n_layout_objs_after > n_layout_objs_before) and (
-                row is None and col is None
-            ):
-                # this was called intending to add to a single plot (and
-                # self.add_{layout_obj} succeeded)
-                # however, in the case of a single plot, xref and yref MAY not be
-                # specified, IF they are not specified we specify them here so the following routines can work
-                # (they need to append " domain" to xref or yref). If they are specified, we leave them alone.
-                if self.layout[layout_obj][-1].xref is None:
-                    self.layout[layout_obj][-1].update(xref="x")
-                if self.layout[layout_obj][-1].yref is None:
-                    self.layout[layout_obj][-1].update(yref="y")
-            new_layout_objs = tuple(
-                filter(
-                    lambda x: x is not None,
-                    [
-                        self._make_axis_spanning_layout_object(
-                            direction,
-                            self.layout[layout_obj][n],
-                        )
-                        for n in range(n_layout_objs_before, n_layout_objs_after)
-                    ],
+            new_layout_objs["shapes"].extend(
+                self._place_annotation_like(
+                    "shape",
+                    shape_class(**_combine_dicts([args, shape_kwargs])),
+                    row=row,
+                    col=col,
+                    secondary_y=secondary_y,
+                    exclude_empty_subplots=exclude_empty_subplots,
                 )
             )
-            self.layout[layout_obj] = (
-                self.layout[layout_obj][:n_layout_objs_before] + new_layout_objs
-            )
+            if augmented_annotation is not None:
+                new_layout_objs["annotations"].extend(
+                    self._place_annotation_like(
+                        "annotation",
+                        annotation_class(
+                            augmented_annotation, yref=shape_kwargs.get("yref", "y")
+                        ),
+                        row=row,
+                        col=col,
+                        exclude_empty_subplots=exclude_empty_subplots,
+                    )
+                )
+        # update xref and yref for the new shapes and annotations
+        for layout_obj in ["shapes", "annotations"]:
+            for new_obj in new_layout_objs[layout_obj]:
+                if row is None and col is None:
+                    # this was called intending to add to a single plot
+                    # however, in the case of a single plot, xref and yref MAY not be
+                    # specified, IF they are not specified we specify them here so the following routines can work
+                    # (they need to append " domain" to xref or yref). If they are specified, we leave them alone.
+                    if new_obj.xref is None:
+                        new_obj.update(xref="x")
+                    if new_obj.yref is None:
+                        new_obj.update(yref="y")
+                self._make_axis_spanning_layout_object(direction, new_obj)
+            self._extend_layout_array(layout_obj, new_layout_objs[layout_obj])
 
     def add_vline(
         self,
@@ -4185,6 +4641,139 @@ Invalid property path '{key_path_str}' for layout
 
     add_hrect.__doc__ = _axis_spanning_shapes_docstr("hrect")
 
+    def add_vlines(
+        self,
+        xs,
+        row="all",
+        col="all",
+        exclude_empty_subplots=True,
+        annotation=None,
+        **kwargs,
+    ):
+        self._process_multiple_axis_spanning_shapes(
+            [dict(type="line", x0=x, x1=x, y0=0, y1=1) for x in xs],
+            row,
+            col,
+            "vline",
+            exclude_empty_subplots=exclude_empty_subplots,
+            annotation=annotation,
+            **kwargs,
+        )
+        return self
+
+    add_vlines.__doc__ = _axis_spanning_shapes_docstr("vlines")
+
+    def add_hlines(
+        self,
+        ys,
+        row="all",
+        col="all",
+        exclude_empty_subplots=True,
+        annotation=None,
+        **kwargs,
+    ):
+        self._process_multiple_axis_spanning_shapes(
+            [dict(type="line", x0=0, x1=1, y0=y, y1=y) for y in ys],
+            row,
+            col,
+            "hline",
+            exclude_empty_subplots=exclude_empty_subplots,
+            annotation=annotation,
+            **kwargs,
+        )
+        return self
+
+    add_hlines.__doc__ = _axis_spanning_shapes_docstr("hlines")
+
+    def add_shapes(
+        self,
+        shapes,
+        row=None,
+        col=None,
+        secondary_y=None,
+        exclude_empty_subplots=False,
+    ):
+        """
+        Add several shapes to the figure's layout at once
+
+        This is equivalent to, but much faster than, calling add_shape for
+        each shape.
+
+        Parameters
+        ----------
+        shapes: list of dict or plotly.graph_objects.layout.Shape
+            The shapes to add
+        row: None, int or 'all'
+            Subplot row for the shapes. If 'all', addresses all rows in the
+            specified column(s).
+        col: None, int or 'all'
+            Subplot column for the shapes. If 'all', addresses all columns in
+            the specified row(s).
+        secondary_y: boolean or None
+            Whether to add the shapes to the secondary y-axis
+        exclude_empty_subplots: boolean
+            If True, the shapes will not be added to subplots without traces.
+
+        Returns
+        -------
+        BaseFigure
+            The Figure that add_shapes was called on
+        """
+        return self._add_annotations_like(
+            "shape",
+            "shapes",
+            shapes,
+            row=row,
+            col=col,
+            secondary_y=secondary_y,
+            exclude_empty_subplots=exclude_empty_subplots,
+        )
+
+    def add_annotations(
+        self,
+        annotations,
+        row=None,
+        col=None,
+        secondary_y=None,
+        exclude_empty_subplots=False,
+    ):
+        """
+        Add several annotations to the figure's layout at once
+
+        This is equivalent to, but much faster than, calling add_annotation
+        for each annotation.
+
+        Parameters
+        ----------
+        annotations: list of dict or plotly.graph_objects.layout.Annotation
+            The annotations to add
+        row: None, int or 'all'
+            Subplot row for the annotations. If 'all', addresses all rows in
+            the specified column(s).
+        col: None, int or 'all'
+            Subplot column for the annotations. If 'all', addresses all
+            columns in the specified row(s).
+        secondary_y: boolean or None
+            Whether to add the annotations to the secondary y-axis
+        exclude_empty_subplots: boolean
+            If True, the annotations will not be added to subplots without
+            traces.
+
+        Returns
+        -------
+        BaseFigure
+            The Figure that add_annotations was called on
+        """
+        return self._add_annotations_like(
+            "annotation",
+            "annotations",
+            annotations,
+            row=row,
+            col=col,
+            secondary_y=secondary_y,
+            exclude_empty_subplots=exclude_empty_subplots,
+        )
+
     def _has_subplots(self):
         """Returns True if figure contains subplots, otherwise it contains a
         single plot and so this returns False."""
@@ -4214,32 +4803,92 @@ Invalid property path '{key_path_str}' for layout
             selector = "all"
         if selector == "all":
             selector = ["traces", "shapes", "annotations", "images"]
-        ret = False
-        for s in selector:
-            if s == "traces":
-                obj = self.data
-                xaxiskw = "xaxis"
-                yaxiskw = "yaxis"
-            elif s in ["shapes", "annotations", "images"]:
-                obj = self.layout[s]
-                xaxiskw = "xref"
-                yaxiskw = "yref"
-            else:
-                obj = None
-            if obj:
-                ret |= any(
-                    t == (xref, yref)
-                    for t in [
-                        # if a object exists but has no xaxis or yaxis keys, then it
-                        # is plotted with xaxis/xref 'x' and yaxis/yref 'y'
-                        (
-                            "x" if d[xaxiskw] is None else d[xaxiskw],
-                            "y" if d[yaxiskw] is None else d[yaxiskw],
-                        )
-                        for d in obj
-                    ]
+        subplot_index = self._get_subplot_index()
+        return any(
+            subplot_index[s][(xref, yref)] > 0
+            for s in selector
+            if s == "traces" or s in self._subplot_layout_props
+        )
+
+    def _get_subplot_index(self):
+        """
+        Return the subplot occupancy index of the figure, building it if it
+        was discarded since it was last used.
+
+        The index is a dict with the following keys:
+          - 'traces', 'shapes', 'annotations', 'images': Counters from
+            (xref, yref) tuples to the number of traces, shapes... with
+            those axis references
+          - 'trace_refs': dict from subplot reference keys (see
+            plotly._subplots._subplot_ref_key) to the sorted list of the
+            indexes of the traces on that subplot
+        """
+        if self._subplot_index is None:
+            subplot_index = {"trace_refs": {}}
+            self._add_to_subplot_index(subplot_index, "traces", self._data_objs)
+            for prop in ["shapes", "annotations", "images"]:
+                self._add_to_subplot_index(subplot_index, prop, self.layout[prop])
+            self._subplot_index = subplot_index
+
+        return self._subplot_index
+
+    @staticmethod
+    def _add_to_subplot_index(subplot_index, prop, objs):
+        """
+        Add traces (if prop is 'traces') or layout objects of the layout
+        compound array property prop to subplot_index
+        """
+        from plotly._subplots import _get_subplot_ref_for_trace, _subplot_ref_key
+
+        if prop == "traces":
+            xaxiskw, yaxiskw = "xaxis", "yaxis"
+            trace_refs = subplot_index["trace_refs"]
+            for trace in objs:
+                ref_key = _subplot_ref_key(_get_subplot_ref_for_trace(trace))
+                trace_refs.setdefault(ref_key, []).append(trace._trace_ind)
+        else:
+            xaxiskw, yaxiskw = "xref", "yref"
+
+        counts = subplot_index.setdefault(prop, collections.Counter())
+        for obj in objs:
+            if xaxiskw in obj._valid_props:
+                # if a object exists but has no xaxis or yaxis keys, then it
+                # is plotted with xaxis/xref 'x' and yaxis/yref 'y'
+                x, y = obj[xaxiskw], obj[yaxiskw]
+                counts["x" if x is None else x, "y" if y is None else y] += 1
+
+    # Properties that determine the subplot of a trace or layout object
+    _subplot_trace_props = {"xaxis", "yaxis", "domain", "geo", "scene", "subplot"}
+    _subplot_layout_props = {"shapes", "annotations", "images"}
+
+    def _discard_subplot_index(self, key_path_strs, layout=False):
+        """
+        Discard the subplot index if one of the changed properties may have
+        moved a trace or layout object to another subplot
+
+        Parameters
+        ----------
+        key_path_strs : list[str]
+            Key path strings of the changed properties, relative to the
+            traces or, if layout is True, to the layout
+        layout : bool
+        """
+        if self._subplot_index is None:
+            return
+
+        for key_path_str in key_path_strs:
+            key_path = BaseFigure._str_to_dict_path(key_path_str)
+            if not key_path:
+                continue
+            if layout:
+                moved = key_path[0] in self._subplot_layout_props and (
+                    len(key_path) <= 2 or key_path[2] in ("xref", "yref")
                 )
-        return ret
+            else:
+                moved = key_path[0] in self._subplot_trace_props
+            if moved:
+                self._subplot_index = None
+                return
 
     def set_subplots(self, rows=None, cols=None, **make_subplots_args):
         """
@@ -4291,6 +4940,16 @@ class BasePlotlyType(object):
 
         self._validate = True
 
+        # ### _version ###
+        # Counter that is incremented whenever a property of this object or
+        # of one of its descendants changes. Used to invalidate _json_cache
+        self._version = 0
+
+        # ### _json_cache ###
+        # (version, options, json) tuple holding the most recent JSON
+        # serialization of this object, see plotly.io._json
+        self._json_cache = None
+
         # Validate inputs
         # ---------------
         self._process_kwargs(**kwargs)
@@ -4321,6 +4980,11 @@ class BasePlotlyType(object):
         # be a BaseFigure (as is the case for the Layout and Trace objects)
         self._parent = None
 
+        # ### _array_ind ###
+        # The index of the object in its parent's compound array property,
+        # if it is an element of one
+        self._array_ind = None
+
         # ### _change_callbacks ###
         # A dict from tuples of child property path tuples to lists
         # of callbacks that should be executed whenever any of these
@@ -4338,6 +5002,20 @@ class BasePlotlyType(object):
     #     else:
     #         return fig._validate
 
+    def _bump_version(self):
+        """
+        Record that a property of this object has changed by incrementing the
+        _version counter of this object and of all of its ancestors
+
+        Returns
+        -------
+        None
+        """
+        obj = self
+        while isinstance(obj, BasePlotlyType):
+            obj._version += 1
+            obj = obj._parent
+
     def _get_validator(self, prop):
         from .validator_cache import ValidatorCache
 
@@ -4385,7 +5063,7 @@ class BasePlotlyType(object):
             if err is None:
                 # e.g. underscore kwargs like marker_line_color
                 self[k] = v
-            elif not self._validate:
+            elif not (self._validate and validation_config.enabled):
                 # Set extra property as-is
                 self[k] = v
             elif not self._skip_invalid:
@@ -4460,7 +5138,10 @@ class BasePlotlyType(object):
             return None
         else:
             # ### Child a compound property ###
-            if child.plotly_name in self:
+            if (
+                child.plotly_name in self._compound_array_props
+                or child.plotly_name in self
+            ):
                 from _plotly_utils.basevalidators import (
                     CompoundValidator,
                     CompoundArrayValidator,
@@ -4473,8 +5154,7 @@ class BasePlotlyType(object):
 
                 # ### Child an element of a compound array property ###
                 elif isinstance(validator, CompoundArrayValidator):
-                    children = self[child.plotly_name]
-                    child_ind = BaseFigure._index_is(children, child)
+                    child_ind = self._get_array_index(child.plotly_name, child)
                     assert child_ind is not None
 
                     children_props = self._props.get(child.plotly_name, None)
@@ -4489,6 +5169,37 @@ class BasePlotlyType(object):
             else:
                 raise ValueError("Invalid child with name: %s" % child.plotly_name)
 
+    def _get_array_index(self, prop, child):
+        """
+        Return the index of child in the compound array property prop
+
+        The index recorded on the child when it was added to the array is
+        used when it is still valid, so this is usually constant time.
+
+        Parameters
+        ----------
+        prop : str
+            Name of a compound array property
+        child : BasePlotlyType
+            An element of the compound array property
+
+        Returns
+        -------
+        int
+        """
+        children = self._compound_array_props.get(prop, None)
+        if children is None:
+            children = self[prop]
+
+        child_ind = child._array_ind
+        if (
+            child_ind is None
+            or child_ind >= len(children)
+            or children[child_ind] is not child
+        ):
+            child_ind = BaseFigure._index_is(children, child)
+        return child_ind
+
     def _init_props(self):
         """
         Ensure that this object's properties dict has been initialized. When
@@ -4530,8 +5241,7 @@ class BasePlotlyType(object):
         # Child an element of a compound array property
         # ---------------------------------------------
         elif child.plotly_name in self._compound_array_props:
-            children = self._compound_array_props[child.plotly_name]
-            child_ind = BaseFigure._index_is(children, child)
+            child_ind = self._get_array_index(child.plotly_name, child)
             assert child_ind is not None
 
             if child.plotly_name not in self._props:
@@ -4571,8 +5281,7 @@ class BasePlotlyType(object):
 
             # ### Child an element of a compound array property ###
             elif child.plotly_name in self._compound_array_props:
-                children = self._compound_array_props[child.plotly_name]
-                child_ind = BaseFigure._index_is(children, child)
+                child_ind = self._get_array_index(child.plotly_name, child)
 
                 assert child_ind is not None
 
@@ -4731,6 +5440,7 @@ class BasePlotlyType(object):
                     # Update plotly_name value in case the validator applies
                     # non-standard name (e.g. imagedefaults instead of image)
                     self._compound_props[prop]._plotly_name = prop
+                    self._compound_props[prop]._validate = self._validate
 
                 return validator.present(self._compound_props[prop])
             elif isinstance(validator, (CompoundArrayValidator, BaseDataValidator)):
@@ -4741,6 +5451,9 @@ class BasePlotlyType(object):
                             validator.data_class(_parent=self)
                             for _ in self._props.get(prop, [])
                         ]
+                        for i, child in enumerate(self._compound_array_props[prop]):
+                            child._validate = self._validate
+                            child._array_ind = i
                     else:
                         self._compound_array_props[prop] = []
 
@@ -4828,6 +5541,7 @@ class BasePlotlyType(object):
             CompoundValidator,
             CompoundArrayValidator,
             BaseDataValidator,
+            copy_to_readonly_numpy_array,
         )
 
         # Normalize prop
@@ -4854,7 +5568,7 @@ class BasePlotlyType(object):
             # ### Unwrap scalar tuple ###
             prop = prop[0]
 
-            if self._validate:
+            if self._validate and validation_config.enabled:
                 if prop not in self._valid_props:
                     self._raise_on_invalid_property_error()(prop)
 
@@ -4880,6 +5594,14 @@ class BasePlotlyType(object):
                     # Extract json from graph objects
                     value = value.to_plotly_json()
 
+                # Store pandas objects as read-only numpy arrays, as the
+                # data array validators would
+                pd = get_module("pandas", should_load=False)
+                if pd is not None and isinstance(
+                    value, (pd.Series, pd.Index, pd.DataFrame)
+                ):
+                    value = copy_to_readonly_numpy_array(value)
+
                 # Check for list/tuple of graph objects
                 if (
                     isinstance(value, (list, tuple))
@@ -4891,6 +5613,9 @@ class BasePlotlyType(object):
                         for v in value
                     ]
 
+                # Set property value. Unlike validated properties, this is
+                # not deferred in batch mode, so that graph objects for this
+                # property are reconstructed from the new value on access
                 self._props[prop] = value
 
                 # Remove any already constructed graph object so that it will be
@@ -4898,13 +5623,18 @@ class BasePlotlyType(object):
                 self._compound_props.pop(prop, None)
                 self._compound_array_props.pop(prop, None)
 
+                # Send property update message
+                self._bump_version()
+                self._send_prop_set(prop, value)
+
         # Handle non-scalar case
         # ----------------------
         # e.g. ('foo', 1), ()
         else:
-            err = _check_path_in_prop_tree(self, orig_prop, error_cast=ValueError)
-            if err is not None:
-                raise err
+            if self._validate and validation_config.enabled:
+                err = _check_path_in_prop_tree(self, orig_prop, error_cast=ValueError)
+                if err is not None:
+                    raise err
             res = self
             for p in prop[:-1]:
                 res = res[p]
@@ -5227,6 +5957,7 @@ class BasePlotlyType(object):
                     self._props.pop(prop)
 
                 # Send property update message
+                self._bump_version()
                 self._send_prop_set(prop, val)
 
         # val is valid value
@@ -5244,6 +5975,7 @@ class BasePlotlyType(object):
                     self._props[prop] = val
 
                 # Send property update message
+                self._bump_version()
                 self._send_prop_set(prop, val)
 
         return val
@@ -5276,16 +6008,16 @@ class BasePlotlyType(object):
         validator = self._get_validator(prop)
         val = validator.validate_coerce(val, skip_invalid=self._skip_invalid)
 
-        # Save deep copies of current and new states
-        # ------------------------------------------
+        # Save copies of current and new states
+        # -------------------------------------
         curr_val = self._compound_props.get(prop, None)
         if curr_val is not None:
-            curr_dict_val = deepcopy(curr_val._props)
+            curr_dict_val = _copy_props(curr_val._props)
         else:
             curr_dict_val = None
 
         if val is not None:
-            new_dict_val = deepcopy(val._props)
+            new_dict_val = _copy_props(val._props)
         else:
             new_dict_val = None
 
@@ -5302,6 +6034,7 @@ class BasePlotlyType(object):
         # Send update if there was a change in value
         # ------------------------------------------
         if not BasePlotlyType._vals_equal(curr_dict_val, new_dict_val):
+            self._bump_version()
             self._send_prop_set(prop, new_dict_val)
 
         # Reparent
@@ -5350,16 +6083,16 @@ class BasePlotlyType(object):
         validator = self._get_validator(prop)
         val = validator.validate_coerce(val, skip_invalid=self._skip_invalid)
 
-        # Save deep copies of current and new states
-        # ------------------------------------------
+        # Save copies of current and new states
+        # -------------------------------------
         curr_val = self._compound_array_props.get(prop, None)
         if curr_val is not None:
-            curr_dict_vals = [deepcopy(cv._props) for cv in curr_val]
+            curr_dict_vals = [_copy_props(cv._props) for cv in curr_val]
         else:
             curr_dict_vals = None
 
         if val is not None:
-            new_dict_vals = [deepcopy(nv._props) for nv in val]
+            new_dict_vals = [_copy_props(nv._props) for nv in val]
         else:
             new_dict_vals = None
 
@@ -5376,15 +6109,17 @@ class BasePlotlyType(object):
         # Send update if there was a change in value
         # ------------------------------------------
         if not BasePlotlyType._vals_equal(curr_dict_vals, new_dict_vals):
+            self._bump_version()
             self._send_prop_set(prop, new_dict_vals)
 
         # Reparent
         # --------
         # ### Reparent new values and clear orphan data ###
         if val is not None:
-            for v in val:
+            for i, v in enumerate(val):
                 v._orphan_props.clear()
                 v._parent = self
+                v._array_ind = i
 
         # ### Unparent old value and update orphan data ###
         if curr_val is not None:
@@ -5392,12 +6127,84 @@ class BasePlotlyType(object):
                 if cv_dict is not None:
                     cv._orphan_props.update(cv_dict)
                 cv._parent = None
+                cv._array_ind = None
 
         # Update _compound_array_props
         # ----------------------------
         self._compound_array_props[prop] = val
         return val
 
+    def _extend_array_prop(self, prop, vals):
+        """
+        Append elements to a compound array property
+
+        Unlike assigning the concatenated tuple to the property, only the new
+        elements are validated, copied and sent to the parent, so appending
+        N elements one at a time costs O(N) overall.
+
+        Parameters
+        ----------
+        prop : str
+            Name of a compound array property
+        vals : list
+            The elements to append, as dicts or compound objects
+
+        Returns
+        -------
+        list[BasePlotlyType]
+            The appended objects
+        """
+        # Import values
+        # -------------
+        validator = self._get_validator(prop)
+        vals = validator.validate_coerce(list(vals), skip_invalid=self._skip_invalid)
+        if not vals:
+            return vals
+
+        # In batch mode
+        # -------------
+        # Fall back to assigning the whole array so that the edit is recorded
+        # with the other batch edits
+        if self._in_batch_mode:
+            return self._set_array_prop(prop, self[prop] + tuple(vals))
+
+        # Make sure the current elements are initialized
+        # ------------------------------------------------
+        self[prop]
+        curr_val = self._compound_array_props[prop]
+        if not isinstance(curr_val, list):
+            curr_val = self._compound_array_props[prop] = list(curr_val)
+
+        # Update _props dict
+        # ------------------
+        self._init_props()
+        curr_dict_vals = self._props.get(prop, None)
+        if not isinstance(curr_dict_vals, list):
+            curr_dict_vals = self._props[prop] = list(curr_dict_vals or [])
+        start = len(curr_dict_vals)
+        new_dict_vals = [_copy_props(v._props) for v in vals]
+        curr_dict_vals.extend(new_dict_vals)
+
+        # Reparent and update _compound_array_props
+        # ------------------------------------------
+        for i, v in enumerate(vals, start):
+            v._orphan_props.clear()
+            v._parent = self
+            v._array_ind = i
+        curr_val.extend(vals)
+
+        # Send update
+        # -----------
+        # A single element is sent on its own (e.g. 'shapes[3]'), several
+        # elements as the whole array
+        self._bump_version()
+        if len(vals) == 1:
+            self._send_prop_set("%s[%d]" % (prop, start), new_dict_vals[0])
+        else:
+            self._send_prop_set(prop, curr_dict_vals)
+
+        return vals
+
     def _send_prop_set(self, prop_path_str, val):
         """
         Notify parent that a property has been set to a new value
@@ -5439,9 +6246,8 @@ class BasePlotlyType(object):
 
         # Child is compound array property
         # --------------------------------
-        child_prop_val = getattr(self, child.plotly_name)
-        if isinstance(child_prop_val, (list, tuple)):
-            child_ind = BaseFigure._index_is(child_prop_val, child)
+        if child.plotly_name in self._compound_array_props:
+            child_ind = self._get_array_index(child.plotly_name, child)
             obj_path = "{child_name}.{child_ind}.{prop}".format(
                 child_name=child.plotly_name, child_ind=child_ind, prop=prop_path_str
             )
@@ -5605,7 +6411,7 @@ on_change callbacks are not supported in this case.
         -------
         dict
         """
-        return deepcopy(self._props if self._props is not None else {})
+        return _copy_props(self._props if self._props is not None else {})
 
     def to_json(self, *args, **kwargs):
         """
@@ -5640,6 +6446,54 @@ on_change callbacks are not supported in this case.
 
         return pio.to_json(self, *args, **kwargs)
 
+    @staticmethod
+    def _arrays_equal(np, v1, v2):
+        """
+        Equality of two numpy arrays that avoids a full elementwise
+        comparison in the common cases: arrays with different shapes, arrays
+        that are views of the same memory, and arrays that differ at their
+        first, middle or last element.
+
+        Distinct views of the same memory are only equal if the memory is
+        read-only. Otherwise (e.g. an array ingested with `no_copy` from a
+        writeable caller array) the caller may have modified it in place
+        since it was stored, which no comparison can detect, so the new
+        value is treated as a change.
+        """
+        if v1.shape != v2.shape:
+            return False
+
+        if (
+            v1.dtype == v2.dtype
+            and v1.strides == v2.strides
+            and v1.__array_interface__["data"][0] == v2.__array_interface__["data"][0]
+        ):
+            readonly = BasePlotlyType._is_readonly_memory
+            return readonly(np, v1) and readonly(np, v2)
+
+        kind1, kind2 = v1.dtype.kind, v2.dtype.kind
+        if v1.size > 3 and (
+            (kind1 in "biufc" and kind2 in "biufc")
+            or (kind1 == kind2 and kind1 in "mM")
+        ):
+            probes = [0, v1.size // 2, v1.size - 1]
+            if np.any(v1.flat[probes] != v2.flat[probes]):
+                return False
+
+        return np.array_equal(v1, v2)
+
+    @staticmethod
+    def _is_readonly_memory(np, v):
+        """
+        Whether numpy array `v` and every array it is a view of are
+        read-only, so that the values of `v` can't be changed in place
+        """
+        while isinstance(v, np.ndarray):
+            if v.flags.writeable:
+                return False
+            v = v.base
+        return v is None or isinstance(v, bytes)
+
     @staticmethod
     def _vals_equal(v1, v2):
         """
@@ -5656,18 +6510,30 @@ on_change callbacks are not supported in this case.
         bool
             True if v1 and v2 are equal, False otherwise
         """
+        if v1 is v2:
+            return True
+
         np = get_module("numpy", should_load=False)
         if np is not None and (
             isinstance(v1, np.ndarray) or isinstance(v2, np.ndarray)
         ):
+            if isinstance(v1, np.ndarray) and isinstance(v2, np.ndarray):
+                return BasePlotlyType._arrays_equal(np, v1, v2)
             return np.array_equal(v1, v2)
         elif isinstance(v1, (list, tuple)):
             # Handle recursive equality on lists and tuples
-            return (
-                isinstance(v2, (list, tuple))
-                and len(v1) == len(v2)
-                and all(BasePlotlyType._vals_equal(e1, e2) for e1, e2 in zip(v1, v2))
-            )
+            if not isinstance(v2, (list, tuple)) or len(v1) != len(v2):
+                return False
+            if type(v1) is type(v2):
+                # Compare natively first, which is much faster than the
+                # recursive comparison for long lists of scalars. This fails
+                # if the lists contain numpy arrays, and may report lists that
+                # only differ by list/tuple nesting as different.
+                try:
+                    return bool(v1 == v2)
+                except (ValueError, TypeError):
+                    pass
+            return all(BasePlotlyType._vals_equal(e1, e2) for e1, e2 in zip(v1, v2))
         elif isinstance(v1, dict):
             # Handle recursive equality on dicts
             return (
@@ -5755,6 +6621,12 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         # properties
         self._subplotid_props = set()
 
+        # Initialize _shared_template_props
+        # ---------------------------------
+        # Template properties dict shared with other layouts, see
+        # _set_shared_template_props
+        self._shared_template_props = None
+
         # Process kwargs
         # --------------
         self._process_kwargs(**kwargs)
@@ -5857,6 +6729,57 @@ class BaseLayoutType(BaseLayoutHierarchyType):
 
         return prop
 
+    def _set_shared_template_props(self, template_props):
+        """
+        Set the template to a validated template properties dict that is
+        shared with other layouts
+
+        The dict is used as is and only copied once the template's properties
+        are accessed through the template object or modified by a relayout
+        operation, so that figures that never touch their template do not
+        pay for a copy of it.
+
+        Parameters
+        ----------
+        template_props : dict
+            Validated template properties. This dict is never modified.
+
+        Returns
+        -------
+        None
+        """
+        self._init_props()
+        self._props["template"] = template_props
+        self._shared_template_props = template_props
+        self["template"]
+
+        self._bump_version()
+        self._send_prop_set("template", template_props)
+
+    def _unshare_template_props(self):
+        """
+        Replace a shared template properties dict with a private copy
+
+        Returns
+        -------
+        None
+        """
+        shared_props = self._shared_template_props
+        if shared_props is not None:
+            self._shared_template_props = None
+            props = self._props
+            if props is not None and props.get("template", None) is shared_props:
+                props["template"] = _copy_props(shared_props)
+
+    def _get_child_props(self, child):
+        """
+        Custom _get_child_props that copies a shared template properties dict
+        before handing it to the template object
+        """
+        if self._shared_template_props is not None and child.plotly_name == "template":
+            self._unshare_template_props()
+        return super(BaseLayoutHierarchyType, self)._get_child_props(child)
+
     def _get_prop_validator(self, prop):
         """
         Custom _get_prop_validator that handles subplot properties
@@ -5983,6 +6906,9 @@ class BaseTraceType(BaseTraceHierarchyType):
         # ### Trace index in figure ###
         self._trace_ind = None
 
+        # ### Ring buffers of properties streamed with extend ###
+        self._ring_buffers = {}
+
     # uid
     # ---
     # All trace types must have a top-level UID
@@ -5994,6 +6920,104 @@ class BaseTraceType(BaseTraceHierarchyType):
     def uid(self, val):
         raise NotImplementedError
 
+    # Extend
+    # ------
+    def extend(self, max_points=None, **kwargs):
+        """
+        Append points to array properties of this trace, in the spirit
+        of Plotly.extendTraces
+
+        Only the new points are validated, and only the new points are sent
+        to the frontend when the trace belongs to a FigureWidget, which makes
+        this much cheaper than reassigning the whole array when streaming
+        data into a large trace.
+
+        Parameters
+        ----------
+        max_points: int or None
+            If specified, only the last `max_points` points of each extended
+            property are kept. Numeric and datetime numpy arrays are then
+            streamed through a ring buffer of this capacity, so that each
+            call only costs as much as the number of new points. The values
+            of these properties are read-only views of the ring buffer, which
+            change on the next call to `extend`: copy them to keep a snapshot.
+        **kwargs
+            Array properties to extend (e.g. `x`, `y` or `marker_color`)
+            and the points to append to them
+
+        Returns
+        -------
+        BaseTraceType
+            This trace (to allow chaining)
+
+        Examples
+        --------
+        >>> import plotly.graph_objects as go
+        >>> fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+        >>> fig.data[0].extend(x=[3, 4], y=[5, 6], max_points=3)  # doctest: +ELLIPSIS
+        Scatter(...)
+        >>> fig.data[0].x
+        (2, 3, 4)
+        """
+        from _plotly_utils.basevalidators import DataArrayValidator
+
+        if max_points is not None and (
+            not isinstance(max_points, int) or max_points < 1
+        ):
+            raise ValueError(
+                "max_points must be a positive integer, received {max_points!r}".format(
+                    max_points=max_points
+                )
+            )
+
+        # Validate new points
+        # -------------------
+        extend_data = {}
+        for key, points in kwargs.items():
+            key_path = BaseFigure._str_to_dict_path(key)
+            obj = self
+            for key_path_el in key_path[:-1]:
+                obj = obj[key_path_el]
+                if not isinstance(obj, BasePlotlyType):
+                    obj = None
+                    break
+
+            validator = obj._get_validator(key_path[-1]) if obj is not None else None
+            if not isinstance(validator, DataArrayValidator) and not getattr(
+                validator, "array_ok", False
+            ):
+                raise ValueError(
+                    "Invalid property {key!r} for extend on trace of type {typ}, "
+                    "only properties that accept arrays can be extended".format(
+                        key=key, typ=self.plotly_name
+                    )
+                )
+            extend_data[".".join(key_path)] = validator.validate_coerce(points)
+
+        if not extend_data:
+            return self
+
+        # Apply extension
+        # ---------------
+        if self.parent is not None:
+            self.parent._extend_child(self, extend_data, max_points)
+        else:
+            for key_path_str in extend_data:
+                BaseFigure._check_extendable(
+                    BaseFigure._get_in(self._props, key_path_str), key_path_str
+                )
+            for key_path_str, points in extend_data.items():
+                BaseFigure._extend_in(
+                    self._props,
+                    key_path_str,
+                    points,
+                    max_points,
+                    ring_buffers=self._ring_buffers,
+                )
+            self._bump_version()
+
+        return self
+
     # Hover
     # -----
     def on_hover(self, callback, append=False):
@@ -6356,7 +7380,7 @@ class BaseFrameHierarchyType(BasePlotlyType):
         # Try to find index of child as a trace
         # -------------------------------------
         try:
-            trace_index = BaseFigure._index_is(self.data, child)
+            trace_index = self._get_array_index("data", child)
         except ValueError:
             trace_index = None
 
@@ -1,3 +1,6 @@
+import asyncio
+import re
+
 import ipywidgets as widgets
 from traitlets import List, Unicode, Dict, observe, Integer
 
@@ -52,6 +55,7 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
     _py2js_restyle = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_relayout = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_update = Dict(allow_none=True).tag(sync=True, **custom_serializers)
+    _py2js_extendTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_animate = Dict(allow_none=True).tag(sync=True, **custom_serializers)
 
     _py2js_deleteTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
@@ -151,6 +155,18 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # views of this widget
         self._view_count = 0
 
+        # Resampling
+        # ----------
+        # Downsampled traces (see resample_trace) are resampled on the
+        # kernel's event loop once no axis range change was received from the
+        # frontend for their debounce time. _resample_debounce is used for
+        # sources that don't specify one (e.g. plotly.express traces).
+        # _pending_resample_ranges maps the names of the axes that changed to
+        # their new range, or to None if they were autoranged
+        self._resample_debounce = 0.1
+        self._resample_timer = None
+        self._pending_resample_ranges = {}
+
     # Python -> JavaScript Messages
     # -----------------------------
     def _send_relayout_msg(self, layout_data, source_view_id=None):
@@ -231,6 +247,41 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         self._py2js_restyle = restyle_msg
         self._py2js_restyle = None
 
+    def _send_extendTraces_msg(self, extend_data, trace_indexes, max_points=None):
+        """
+        Send Plotly.extendTraces message to the frontend
+
+        Parameters
+        ----------
+        extend_data : dict
+            Plotly.extendTraces update data, mapping key path strings to a
+            list of the points to append to each trace
+        trace_indexes : list[int]
+            List of trace indexes that the extend operation applies to
+        max_points : int or None
+            Maximum number of points to keep in each extended array
+        """
+
+        # Increment trace edit message IDs
+        # --------------------------------
+        trace_edit_id = self._last_trace_edit_id + 1
+        self._last_trace_edit_id = trace_edit_id
+        self._trace_edit_in_process = True
+
+        # Build message
+        # -------------
+        extend_msg = {
+            "extend_data": extend_data,
+            "extend_traces": trace_indexes,
+            "max_points": max_points,
+            "trace_edit_id": trace_edit_id,
+        }
+
+        # Send message
+        # ------------
+        self._py2js_extendTraces = extend_msg
+        self._py2js_extendTraces = None
+
     def _send_addTraces_msg(self, new_traces_data):
         """
         Send Plotly.addTraces message to the frontend
@@ -442,14 +493,17 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # recent trace edit operation
         if trace_edit_id == self._last_trace_edit_id:
 
+            # ### Map uids to trace indexes ###
+            trace_uid_inds = {}
+            for trace_index, trace in enumerate(self.data):
+                trace_uid_inds.setdefault(trace.uid, trace_index)
+
             # ### Loop over deltas ###
             for delta in trace_deltas:
 
                 # #### Find existing trace for uid ###
-                trace_uid = delta["uid"]
-                trace_uids = [trace.uid for trace in self.data]
-                trace_index = trace_uids.index(trace_uid)
-                uid_trace = self.data[trace_index]
+                trace_index = trace_uid_inds[delta["uid"]]
+                uid_trace = self._data_objs[trace_index]
 
                 # #### Transform defaults to delta ####
                 delta_transform = BaseFigureWidget._transform_data(
@@ -458,7 +512,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
                 # #### Remove overlapping properties ####
                 # If a property is present in both _props and _prop_defaults
-                # then we remove the copy from _props
+                # then we remove the copy from _props. The layout may share
+                # its template properties with other figures, so make sure
+                # they are private before any props are cleaned up in place
+                self.layout._unshare_template_props()
                 remove_props = self._remove_overlapping_props(
                     uid_trace._props, uid_trace._prop_defaults
                 )
@@ -514,7 +571,10 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
             # ### Remove overlapping properties ###
             # If a property is present in both _layout and _layout_defaults
-            # then we remove the copy from _layout
+            # then we remove the copy from _layout. The template properties
+            # may be shared with other figures, so copy them before removing
+            # anything in place
+            self.layout._unshare_template_props()
             removed_props = self._remove_overlapping_props(
                 self._layout, self._layout_defaults
             )
@@ -634,6 +694,22 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # ----------------
         self.plotly_relayout(relayout_data=relayout_data, source_view_id=source_view_id)
 
+        # Resample downsampled traces for the new axis ranges
+        # ---------------------------------------------------
+        if self._downsample_sources:
+            ranges = {}
+            for key, value in relayout_data.items():
+                match = self._axis_range_re.match(key)
+                if not match:
+                    continue
+                axis, prop = match.groups()
+                if prop != "autorange":
+                    ranges[axis] = tuple(self.layout[axis].range or (None, None))
+                elif value:
+                    ranges[axis] = None
+            if ranges:
+                self._schedule_resample(ranges)
+
         self._js2py_relayout = None
 
     @observe("_js2py_pointsCallback")
@@ -769,6 +845,186 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         else:
             fn()
 
+    # Resampling
+    # ----------
+    _axis_range_re = re.compile(r"^([xy]axis\d*)\.(autorange|range)(?:\[[01]\])?$")
+
+    def resample_trace(
+        self, trace_index, x, y, method="lttb", max_points=5000, debounce=0.1
+    ):
+        """
+        Display a downsampled version of full-resolution data in a scatter
+        trace, and resample it for the visible range each time the user
+        zooms or pans
+
+        The full-resolution `x` and `y` arrays are kept in Python. Whenever
+        the range of the trace's x axis changes, at most `max_points` points
+        of the visible window are selected with `method`, and only those are
+        sent to the frontend. Traces of figures created by plotly.express
+        with the `downsample` argument are resampled in the same way without
+        calling this method.
+
+        Parameters
+        ----------
+        trace_index : int
+            Index of the trace in `data`
+        x, y : array-like
+            Full-resolution coordinates of the points of the trace
+        method : str
+            One of 'lttb' or 'minmax'
+        max_points : int
+            Maximum number of points sent to the frontend
+        debounce : float
+            Number of seconds to wait after the last zoom or pan before
+            resampling. If 0, traces are resampled as soon as the new axis
+            range is received.
+
+        Returns
+        -------
+        None
+        """
+        if len(x) != len(y):
+            raise ValueError(
+                "x and y must have the same length, received %d and %d"
+                % (len(x), len(y))
+            )
+        trace = self.data[trace_index]
+        self._downsample_sources[trace.uid] = dict(
+            method=method,
+            max_points=max_points,
+            debounce=debounce,
+            base="x",
+            arrays=dict(x=x, y=y),
+        )
+        self._resample_traces({self._trace_base_axis(trace, "x"): None})
+
+    def _schedule_resample(self, ranges):
+        """
+        Resample the downsampled traces for the new axis `ranges` once no
+        axis range change was received for the smallest debounce time of the
+        traces waiting to be resampled
+
+        The resample is scheduled on the running event loop (the kernel's
+        loop in Jupyter) so that traces are only ever updated from the thread
+        that handles the widget messages. Without a running event loop,
+        traces are resampled right away.
+        """
+        self._pending_resample_ranges.update(ranges)
+        if self._resample_timer is not None:
+            self._resample_timer.cancel()
+            self._resample_timer = None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        debounce = self._pending_resample_debounce()
+        if debounce and loop is not None:
+            self._resample_timer = loop.call_later(debounce, self._flush_resample)
+        else:
+            self._flush_resample()
+
+    def _pending_resample_debounce(self):
+        """
+        Smallest debounce time of the downsampled traces whose base axis has
+        a pending range change
+        """
+        traces = {trace.uid: trace for trace in self.data}
+        debounces = [
+            source.get("debounce", self._resample_debounce)
+            for uid, source in self._downsample_sources.items()
+            if uid in traces
+            and self._trace_base_axis(traces[uid], source["base"])
+            in self._pending_resample_ranges
+        ]
+        return min(debounces, default=0)
+
+    def _flush_resample(self):
+        ranges, self._pending_resample_ranges = self._pending_resample_ranges, {}
+        self._resample_timer = None
+        self._resample_traces(ranges)
+
+    @staticmethod
+    def _trace_base_axis(trace, base):
+        """
+        Name of the layout axis (e.g. 'xaxis2') the trace uses for `base`
+        ('x' or 'y')
+        """
+        return base + "axis" + (trace[base + "axis"] or base)[1:]
+
+    def _resample_traces(self, ranges):
+        """
+        Update the points of the downsampled traces whose base axis is a key
+        of `ranges` with at most `max_points` points of the axis range (all
+        points if the range is None)
+        """
+        from _plotly_utils.downsample import (
+            _as_float,
+            downsample_indices,
+            window_indices,
+        )
+        import numpy as np
+
+        traces = {trace.uid: trace for trace in self.data}
+        with self.batch_update():
+            for uid, source in self._downsample_sources.items():
+                trace = traces.get(uid)
+                if trace is None:
+                    continue
+                axis = self._trace_base_axis(trace, source["base"])
+                if axis not in ranges:
+                    continue
+
+                # Full-resolution arrays, converted to numpy once
+                if "numpy_arrays" not in source:
+                    arrays = {k: np.asarray(v) for k, v in source["arrays"].items()}
+                    base = _as_float(arrays[source["base"]])
+                    if base is None:
+                        base = np.arange(len(arrays[source["base"]]), dtype=float)
+                    source["numpy_arrays"] = arrays
+                    source["base_values"] = base
+                    source["base_sorted"] = bool(np.all(base[1:] >= base[:-1]))
+                arrays = source["numpy_arrays"]
+                base = source["base_values"]
+                value = arrays["y" if source["base"] == "x" else "x"]
+
+                # Visible window
+                axis_range = ranges[axis]
+                if axis_range is None or None in axis_range:
+                    window = np.arange(len(base))
+                else:
+                    lo, hi = sorted(
+                        self._axis_value_to_float(axis, arrays[source["base"]], v)
+                        for v in axis_range
+                    )
+                    window = window_indices(base, lo, hi, source["base_sorted"])
+
+                positions = window[
+                    downsample_indices(
+                        base[window],
+                        value[window],
+                        source["method"],
+                        source["max_points"],
+                    )
+                ]
+                for path, values in arrays.items():
+                    trace[path] = values[positions]
+
+    def _axis_value_to_float(self, axis, base, value):
+        """
+        Convert an axis range value received from the frontend to the float
+        scale of the downsampled base values
+        """
+        import numpy as np
+
+        if self.layout[axis].type == "log":
+            return 10 ** float(value)
+        if base.dtype.kind == "M":
+            date = np.datetime64(str(value).replace(" ", "T"), "ns")
+            return float(date.astype("i8"))
+        return float(value)
+
     # Validate No Frames
     # ------------------
     @property
@@ -54,6 +54,8 @@ def scatter(
     range_x=None,
     range_y=None,
     render_mode="auto",
+    downsample=None,
+    max_points=None,
     title=None,
     template=None,
     width=None,
@@ -252,6 +254,8 @@ def line(
     range_y=None,
     line_shape=None,
     render_mode="auto",
+    downsample=None,
+    max_points=None,
     title=None,
     template=None,
     width=None,
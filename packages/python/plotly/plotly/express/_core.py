@@ -5,8 +5,11 @@ from ._special_inputs import IdentityMap, Constant, Range
 from .trendline_functions import ols, lowess, rolling, expanding, ewm
 
 from _plotly_utils.basevalidators import ColorscaleValidator
+from _plotly_utils.downsample import downsample_indices
 from plotly.colors import qualitative, sequential
+import logging
 import math
+import uuid
 from packaging import version
 import pandas as pd
 import numpy as np
@@ -17,7 +20,7 @@ from plotly._subplots import (
     _subplot_type_for_trace_type,
 )
 
-pandas_2_2_0 = version.parse(pd.__version__) >= version.parse("2.2.0")
+logger = logging.getLogger(__name__)
 
 NO_COLOR = "px_no_color_constant"
 trendline_functions = dict(
@@ -807,6 +810,79 @@ def configure_animation_controls(args, constructor, fig):
         ]
 
 
+def _take_points(values, indices):
+    if isinstance(values, (pd.DataFrame, pd.Series, pd.Index)):
+        return values.take(indices)
+    if isinstance(values, np.ndarray):
+        return values[indices]
+    return [values[i] for i in indices]
+
+
+def _take_point_arrays(obj, indices, n_points, path, arrays):
+    """
+    Returns a copy of the trace patch `obj` where every per-point array (of length
+    `n_points`) only keeps the points at `indices`. The full arrays are stored in
+    `arrays` under their dotted property path, e.g. "marker.color".
+    """
+    result = {}
+    for key, value in obj.items():
+        if isinstance(value, dict):
+            result[key] = _take_point_arrays(
+                value, indices, n_points, path + key + ".", arrays
+            )
+        elif (
+            isinstance(
+                value, (pd.DataFrame, pd.Series, pd.Index, np.ndarray, list, tuple)
+            )
+            and len(value) == n_points
+        ):
+            arrays[path + key] = value
+            result[key] = _take_points(value, indices)
+        else:
+            result[key] = value
+    return result
+
+
+def downsample_trace_patch(args, trace_patch, trace, sources):
+    """Reduces the points of a line or scatter trace patch as per `args["downsample"]`
+
+    Parameters
+    ----------
+    args : dict
+        args to be used for the trace
+    trace_patch : dict
+        output of `make_trace_kwargs`
+    trace : graph_object trace
+        the trace the patch will be applied to. It is given a `uid` if its points
+        are reduced.
+    sources : dict
+        updated with the full-resolution arrays of the trace, keyed by its `uid`
+
+    Returns
+    -------
+    trace_patch : dict
+        the patch with at most `args["max_points"]` points
+    """
+    base, value = ("y", "x") if args.get("orientation") == "h" else ("x", "y")
+    if trace_patch.get(base) is None or trace_patch.get(value) is None:
+        return trace_patch
+    n_points = len(trace_patch[base])
+    max_points = args.get("max_points") or 5000
+    indices = downsample_indices(
+        trace_patch[base], trace_patch[value], args["downsample"], max_points
+    )
+    if len(indices) == n_points:
+        return trace_patch
+
+    arrays = {}
+    trace_patch = _take_point_arrays(trace_patch, indices, n_points, "", arrays)
+    trace.uid = str(uuid.uuid4())
+    sources[trace.uid] = dict(
+        method=args["downsample"], max_points=max_points, base=base, arrays=arrays
+    )
+    return trace_patch
+
+
 def make_trace_spec(args, constructor, attrs, trace_patch):
     if constructor in [go.Scatter, go.Scatterpolar]:
         if "render_mode" in args and (
@@ -1290,6 +1366,64 @@ def process_args_into_dataframe(args, wide_mode, var_name, value_name):
     return df_output, wide_id_vars
 
 
+def _necessary_columns(args, columns):
+    """
+    Returns the list of the data frame `columns` that are referenced by `args`, or
+    all of `columns` if the whole data frame is used (e.g. by `scatter_matrix`
+    without `dimensions`).
+    """
+    if "dimensions" in args and args["dimensions"] is None:
+        return list(columns)
+
+    def is_column(i):
+        # bools hash like 0 and 1, so they would match integer column labels
+        return isinstance(i, (str, int)) and not isinstance(i, bool) and i in columns
+
+    necessary_columns = set()
+    for field in all_attrables:
+        if args.get(field) is None:
+            continue
+        if field in array_attrables:
+            necessary_columns.update(i for i in args[field] if is_column(i))
+        elif is_column(args[field]):
+            necessary_columns.add(args[field])
+    return [col for col in columns if col in necessary_columns]
+
+
+def _arrow_backed_library(df):
+    """
+    Returns "pyarrow" if `df` is a pyarrow Table, "polars" if it is a polars
+    DataFrame and None otherwise. Both can select columns and convert them to pandas
+    without going through the interchange protocol. Neither library is imported to
+    find out.
+    """
+    library = type(df).__module__.split(".")[0]
+    if (library, type(df).__name__) in [("pyarrow", "Table"), ("polars", "DataFrame")]:
+        return library
+    return None
+
+
+def _arrow_backed_to_pandas(df, columns=None):
+    """
+    Converts a pyarrow Table or polars DataFrame to pandas, keeping only `columns`
+    if given. Columns are selected before conversion, so unused columns are never
+    copied, and each column gets its own pandas block so that numeric columns
+    without nulls can wrap the Arrow buffers instead of being copied into a single
+    2D block.
+    """
+    if columns is not None:
+        df = df.select(columns)
+    if _arrow_backed_library(df) == "polars":
+        try:
+            df = df.to_arrow()
+        except ImportError:
+            # polars can interchange its frames without pyarrow
+            import pandas.api.interchange
+
+            return pd.api.interchange.from_dataframe(df)
+    return df.to_pandas(split_blocks=True)
+
+
 def build_dataframe(args, constructor):
     """
     Constructs a dataframe and modifies `args` in-place.
@@ -1321,8 +1455,18 @@ def build_dataframe(args, constructor):
     # Cast data_frame argument to DataFrame (it could be a numpy array, dict etc.)
     df_provided = args["data_frame"] is not None
     needs_interchanging = False
+    needs_native_conversion = False
     if df_provided and not isinstance(args["data_frame"], pd.DataFrame):
-        if hasattr(args["data_frame"], "__dataframe__") and version.parse(
+        arrow_library = _arrow_backed_library(args["data_frame"])
+        if arrow_library is not None:
+            # columns are selected natively once we know which ones are plotted
+            columns = pd.Index(
+                args["data_frame"].column_names
+                if arrow_library == "pyarrow"
+                else args["data_frame"].columns
+            )
+            needs_native_conversion = True
+        elif hasattr(args["data_frame"], "__dataframe__") and version.parse(
             pd.__version__
         ) >= version.parse("2.0.2"):
             import pandas.api.interchange
@@ -1417,22 +1561,35 @@ def build_dataframe(args, constructor):
         value_name = _escape_col_name(columns, "value", [])
         var_name = _escape_col_name(columns, var_name, [])
 
+    if df_provided:
+        # only the columns referenced by the call are converted and processed
+        kept_columns = _necessary_columns(args, columns)
+        prune_columns = len(kept_columns) < len(columns)
+        logger.debug(
+            "plotly.express keeps %d of the %d data_frame columns (%d pruned)",
+            len(kept_columns),
+            len(columns),
+            len(columns) - len(kept_columns),
+        )
+
+    if needs_native_conversion:
+        args["data_frame"] = _arrow_backed_to_pandas(
+            args["data_frame"], kept_columns if prune_columns else None
+        )
+        columns = args["data_frame"].columns
+
     if needs_interchanging:
         try:
-            if wide_mode or not hasattr(args["data_frame"], "select_columns_by_name"):
+            if not prune_columns or not hasattr(
+                args["data_frame"], "select_columns_by_name"
+            ):
                 args["data_frame"] = pd.api.interchange.from_dataframe(
                     args["data_frame"]
                 )
             else:
                 # Save precious resources by only interchanging columns that are
                 # actually going to be plotted.
-                necessary_columns = {
-                    i for i in args.values() if isinstance(i, str) and i in columns
-                }
-                for field in args:
-                    if args[field] is not None and field in array_attrables:
-                        necessary_columns.update(i for i in args[field] if i in columns)
-                columns = list(necessary_columns)
+                columns = kept_columns
                 args["data_frame"] = pd.api.interchange.from_dataframe(
                     args["data_frame"].select_columns_by_name(columns)
                 )
@@ -2013,6 +2170,17 @@ def infer_config(args, constructor, trace_patch, layout_patch):
     return trace_specs, grouped_mappings, sizeref, show_colorbar
 
 
+def _order_ranks(order):
+    """
+    Map each value of a category order to its position, so that sort keys are a
+    dict lookup rather than a `list.index` scan
+    """
+    ranks = {}
+    for rank, value in enumerate(order):
+        ranks.setdefault(value, rank)
+    return ranks
+
+
 def get_groups_and_orders(args, grouper):
     """
     `orders` is the user-supplied ordering with the remaining data-frame-supplied
@@ -2052,15 +2220,18 @@ def get_groups_and_orders(args, grouper):
             required_grouper, sort=False, observed=True
         )  # skip one_group groupers
         group_indices = grouped.indices
-        sorted_group_names = [
-            g if len(required_grouper) != 1 else (g,) for g in group_indices
-        ]
+        index_by_name = {
+            (g if len(required_grouper) != 1 else (g,)): idx
+            for g, idx in group_indices.items()
+        }
 
-        for i, col in reversed(list(enumerate(required_grouper))):
-            sorted_group_names = sorted(
-                sorted_group_names,
-                key=lambda g: orders[col].index(g[i]) if g[i] in orders[col] else -1,
-            )
+        # a single stable sort on the tuple of category ranks orders the groups
+        # by the first grouper, then the second and so on
+        ranks = [_order_ranks(orders[col]) for col in required_grouper]
+        sorted_group_names = sorted(
+            index_by_name,
+            key=lambda g: tuple(r.get(v, -1) for r, v in zip(ranks, g)),
+        )
 
         # calculate the full group_names by inserting "" in the tuple index for one_group groups
         full_sorted_group_names = [list(t) for t in sorted_group_names]
@@ -2070,15 +2241,18 @@ def get_groups_and_orders(args, grouper):
                     g.insert(i, "")
         full_sorted_group_names = [tuple(g) for g in full_sorted_group_names]
 
+        # gather the rows of every group with a single take, in group order, so
+        # that each group is a contiguous slice of one frame rather than a
+        # separate get_group() copy
+        sorted_indices = [index_by_name[s] for s in sorted_group_names]
+        sorted_df = (
+            df.take(np.concatenate(sorted_indices)) if sorted_indices else df.iloc[:0]
+        )
         groups = {}
-        for sf, s in zip(full_sorted_group_names, sorted_group_names):
-            if len(s) > 1:
-                groups[sf] = grouped.get_group(s)
-            else:
-                if pandas_2_2_0:
-                    groups[sf] = grouped.get_group((s[0],))
-                else:
-                    groups[sf] = grouped.get_group(s[0])
+        start = 0
+        for sf, idx in zip(full_sorted_group_names, sorted_indices):
+            groups[sf] = sorted_df.iloc[start : start + len(idx)]
+            start += len(idx)
     return groups, orders
 
 
@@ -2127,6 +2301,7 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
     trace_names_by_frame = {}
     frames = OrderedDict()
     trendline_rows = []
+    downsample_sources = {}
     trace_name_labels = None
     facet_col_wrap = args.get("facet_col_wrap", 0)
     for group_name, group in groups.items():
@@ -2267,6 +2442,13 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             patch, fit_results = make_trace_kwargs(
                 args, trace_spec, group, mapping_labels.copy(), sizeref
             )
+            if (
+                args.get("downsample")
+                and trace_spec.constructor in [go.Scatter, go.Scattergl]
+                and trace_spec.marginal is None
+                and "trendline" not in trace_spec.attrs
+            ):
+                patch = downsample_trace_patch(args, patch, trace, downsample_sources)
             trace.update(patch)
             if fit_results is not None:
                 trendline_rows.append(mapping_labels.copy())
@@ -2276,9 +2458,8 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             frames[frame_name]["data"].append(trace)
     frame_list = [f for f in frames.values()]
     if len(frame_list) > 1:
-        frame_list = sorted(
-            frame_list, key=lambda f: orders[args["animation_frame"]].index(f["name"])
-        )
+        frame_ranks = _order_ranks(orders[args["animation_frame"]])
+        frame_list = sorted(frame_list, key=lambda f: frame_ranks[f["name"]])
 
     if show_colorbar:
         colorvar = "z" if constructor in [go.Histogram2d, go.Densitymapbox] else "color"
@@ -2373,6 +2554,7 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             trendline_rows.append(dict(px_fit_results=fit_results))
 
     fig._px_trendlines = pd.DataFrame(trendline_rows)
+    fig._downsample_sources.update(downsample_sources)
 
     configure_axes(args, constructor, fig, orders)
     configure_animation_controls(args, constructor, fig)
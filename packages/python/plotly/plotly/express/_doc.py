@@ -437,6 +437,17 @@ docs = dict(
         "`'webgl'` is likely necessary for acceptable performance above 1000 points but rasterizes part of the output. ",
         "`'auto'` uses heuristics to choose the mode.",
     ],
+    downsample=[
+        "str (default `None`)",
+        "One of `'lttb'` or `'minmax'`.",
+        "If set, traces with more than `max_points` points are reduced to at most `max_points` points before being added to the figure.",
+        "`'lttb'` keeps the points selected by the Largest-Triangle-Three-Buckets algorithm, `'minmax'` keeps the smallest and largest value of each bucket of consecutive points.",
+        "The full-resolution data is kept in the figure, so that a `go.FigureWidget` built from it can resample the visible range on zoom.",
+    ],
+    max_points=[
+        "int (default `5000`)",
+        "Maximum number of points per trace when `downsample` is set.",
+    ],
     direction=[
         "str",
         "One of '`counterclockwise'` or `'clockwise'`. Default is `'clockwise'`",
@@ -599,10 +610,21 @@ docs = dict(
 )
 
 
+# Most parameter descriptions are shared by many px functions, so wrapped
+# descriptions are memoized to keep import time down
+_wrapped_desc_cache = {}
+
+
+def _wrap_desc(desc):
+    if desc not in _wrapped_desc_cache:
+        tw = TextWrapper(width=75, initial_indent="    ", subsequent_indent="    ")
+        _wrapped_desc_cache[desc] = tw.fill(desc)
+    return _wrapped_desc_cache[desc]
+
+
 def make_docstring(fn, override_dict=None, append_dict=None):
     override_dict = {} if override_dict is None else override_dict
     append_dict = {} if append_dict is None else append_dict
-    tw = TextWrapper(width=75, initial_indent="    ", subsequent_indent="    ")
     result = (fn.__doc__ or "") + "\nParameters\n----------\n"
     for param in getfullargspec(fn)[0]:
         if override_dict.get(param):
@@ -613,7 +635,7 @@ def make_docstring(fn, override_dict=None, append_dict=None):
                 param_doc += append_dict[param]
         param_desc_list = param_doc[1:]
         param_desc = (
-            tw.fill(" ".join(param_desc_list or ""))
+            _wrap_desc(" ".join(param_desc_list or ""))
             if param in docs or param in override_dict
             else "(documentation missing from map)"
         )
@@ -6,13 +6,7 @@ import pandas as pd
 import numpy as np
 import itertools
 from plotly.utils import image_array_to_data_uri
-
-try:
-    import xarray
-
-    xarray_imported = True
-except ImportError:
-    xarray_imported = False
+from _plotly_utils.optional_imports import get_module
 
 _float_types = []
 
@@ -262,7 +256,10 @@ def imshow(
     animation_label = None
     img_is_xarray = False
     # ----- Define x and y, set labels if img is an xarray -------------------
-    if xarray_imported and isinstance(img, xarray.DataArray):
+    # xarray is only checked for if it has already been imported, since img
+    # cannot be a DataArray otherwise
+    xarray = get_module("xarray", should_load=False)
+    if xarray and isinstance(img, xarray.DataArray):
         dims = list(img.dims)
         img_is_xarray = True
         pop_indexes = []
@@ -3,7 +3,13 @@ from plotly.basedatatypes import BaseFigure
 
 class Figure(BaseFigure):
     def __init__(
-        self, data=None, layout=None, frames=None, skip_invalid=False, **kwargs
+        self,
+        data=None,
+        layout=None,
+        frames=None,
+        skip_invalid=False,
+        validate=True,
+        **kwargs,
     ):
         """
         Create a new :class:Figure instance
@@ -633,13 +639,22 @@ class Figure(BaseFigure):
             skipped silently. If False (default) invalid properties in the
             figure specification will result in a ValueError
 
+        validate: bool
+            If False, property values in the figure specification, and
+            in later calls to add_traces, update_traces, update_layout, etc.,
+            are stored as-is without being validated or coerced. This is
+            faster for trusted, known-good figure specifications.
+            Not supported by FigureWidget.
+
         Raises
         ------
         ValueError
             if a property in the specification of data, layout, or frames
             is invalid AND skip_invalid is False
         """
-        super(Figure, self).__init__(data, layout, frames, skip_invalid, **kwargs)
+        super(Figure, self).__init__(
+            data, layout, frames, skip_invalid, validate=validate, **kwargs
+        )
 
     def update(self, dict1=None, overwrite=False, **kwargs) -> "Figure":
         """
@@ -1210,6 +1225,188 @@ class Figure(BaseFigure):
             y0, y1, row, col, exclude_empty_subplots, annotation, **kwargs
         )
 
+    def add_vlines(
+        self,
+        xs,
+        row="all",
+        col="all",
+        exclude_empty_subplots=True,
+        annotation=None,
+        **kwargs,
+    ) -> "Figure":
+        """
+
+        Add several vertical lines to a plot or subplot that extend infinitely in
+        the y-dimension. This is equivalent to, but much faster than, calling
+        add_vline for each x coordinate.
+
+        Parameters
+        ----------
+        xs: list of float or int
+            The x coordinates of the vertical lines.
+        exclude_empty_subplots: Boolean
+            If True (default) do not place the shape on subplots that have no data
+            plotted on them.
+        row: None, int or 'all'
+            Subplot row for shape indexed starting at 1. If 'all', addresses all rows in
+            the specified column(s). If both row and col are None, addresses the
+            first subplot if subplots exist, or the only plot. By default is "all".
+        col: None, int or 'all'
+            Subplot column for shape indexed starting at 1. If 'all', addresses all rows in
+            the specified column(s). If both row and col are None, addresses the
+            first subplot if subplots exist, or the only plot. By default is "all".
+        annotation: dict or plotly.graph_objects.layout.Annotation. If dict(),
+            it is interpreted as describing an annotation. The annotation is
+            placed relative to the shape based on annotation_position (see
+            below) unless its x or y value has been specified for the annotation
+            passed here. xref and yref are always the same as for the added
+            shape and cannot be overridden.
+        annotation_position: a string containing optionally ["top", "bottom"]
+            and ["left", "right"] specifying where the text should be anchored
+            to on the line. Example positions are "bottom left", "right top",
+            "right", "bottom". If an annotation is added but annotation_position is
+            not specified, this defaults to "top right".
+        annotation_*: any parameters to go.layout.Annotation can be passed as
+            keywords by prefixing them with "annotation_". For example, to specify the
+            annotation text "example" you can pass annotation_text="example" as a
+            keyword argument.
+        **kwargs:
+            Any named function parameters that can be passed to 'add_shape',
+            except for x0, x1, y0, y1 or type.
+        """
+        return super(Figure, self).add_vlines(
+            xs, row, col, exclude_empty_subplots, annotation, **kwargs
+        )
+
+    def add_hlines(
+        self,
+        ys,
+        row="all",
+        col="all",
+        exclude_empty_subplots=True,
+        annotation=None,
+        **kwargs,
+    ) -> "Figure":
+        """
+
+        Add several horizontal lines to a plot or subplot that extend infinitely in
+        the x-dimension. This is equivalent to, but much faster than, calling
+        add_hline for each y coordinate.
+
+        Parameters
+        ----------
+        ys: list of float or int
+            The y coordinates of the horizontal lines.
+        exclude_empty_subplots: Boolean
+            If True (default) do not place the shape on subplots that have no data
+            plotted on them.
+        row: None, int or 'all'
+            Subplot row for shape indexed starting at 1. If 'all', addresses all rows in
+            the specified column(s). If both row and col are None, addresses the
+            first subplot if subplots exist, or the only plot. By default is "all".
+        col: None, int or 'all'
+            Subplot column for shape indexed starting at 1. If 'all', addresses all rows in
+            the specified column(s). If both row and col are None, addresses the
+            first subplot if subplots exist, or the only plot. By default is "all".
+        annotation: dict or plotly.graph_objects.layout.Annotation. If dict(),
+            it is interpreted as describing an annotation. The annotation is
+            placed relative to the shape based on annotation_position (see
+            below) unless its x or y value has been specified for the annotation
+            passed here. xref and yref are always the same as for the added
+            shape and cannot be overridden.
+        annotation_position: a string containing optionally ["top", "bottom"]
+            and ["left", "right"] specifying where the text should be anchored
+            to on the line. Example positions are "bottom left", "right top",
+            "right", "bottom". If an annotation is added but annotation_position is
+            not specified, this defaults to "top right".
+        annotation_*: any parameters to go.layout.Annotation can be passed as
+            keywords by prefixing them with "annotation_". For example, to specify the
+            annotation text "example" you can pass annotation_text="example" as a
+            keyword argument.
+        **kwargs:
+            Any named function parameters that can be passed to 'add_shape',
+            except for x0, x1, y0, y1 or type.
+        """
+        return super(Figure, self).add_hlines(
+            ys, row, col, exclude_empty_subplots, annotation, **kwargs
+        )
+
+    def add_shapes(
+        self, shapes, row=None, col=None, secondary_y=None, exclude_empty_subplots=False
+    ) -> "Figure":
+        """
+
+        Add several shapes to the figure's layout at once
+
+        This is equivalent to, but much faster than, calling add_shape for
+        each shape.
+
+        Parameters
+        ----------
+        shapes: list of dict or plotly.graph_objects.layout.Shape
+            The shapes to add
+        row: None, int or 'all'
+            Subplot row for the shapes. If 'all', addresses all rows in the
+            specified column(s).
+        col: None, int or 'all'
+            Subplot column for the shapes. If 'all', addresses all columns in
+            the specified row(s).
+        secondary_y: boolean or None
+            Whether to add the shapes to the secondary y-axis
+        exclude_empty_subplots: boolean
+            If True, the shapes will not be added to subplots without traces.
+
+        Returns
+        -------
+        BaseFigure
+            The Figure that add_shapes was called on
+
+        """
+        return super(Figure, self).add_shapes(
+            shapes, row, col, secondary_y, exclude_empty_subplots
+        )
+
+    def add_annotations(
+        self,
+        annotations,
+        row=None,
+        col=None,
+        secondary_y=None,
+        exclude_empty_subplots=False,
+    ) -> "Figure":
+        """
+
+        Add several annotations to the figure's layout at once
+
+        This is equivalent to, but much faster than, calling add_annotation
+        for each annotation.
+
+        Parameters
+        ----------
+        annotations: list of dict or plotly.graph_objects.layout.Annotation
+            The annotations to add
+        row: None, int or 'all'
+            Subplot row for the annotations. If 'all', addresses all rows in
+            the specified column(s).
+        col: None, int or 'all'
+            Subplot column for the annotations. If 'all', addresses all
+            columns in the specified row(s).
+        secondary_y: boolean or None
+            Whether to add the annotations to the secondary y-axis
+        exclude_empty_subplots: boolean
+            If True, the annotations will not be added to subplots without
+            traces.
+
+        Returns
+        -------
+        BaseFigure
+            The Figure that add_annotations was called on
+
+        """
+        return super(Figure, self).add_annotations(
+            annotations, row, col, secondary_y, exclude_empty_subplots
+        )
+
     def set_subplots(self, rows=None, cols=None, **make_subplots_args) -> "Figure":
         """
 
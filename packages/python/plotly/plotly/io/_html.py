@@ -1,9 +1,14 @@
+import re
 import uuid
 from pathlib import Path
 import webbrowser
 
 from _plotly_utils.optional_imports import get_module
-from plotly.io._utils import validate_coerce_fig_to_dict, plotly_cdn_url
+from plotly.io._utils import (
+    validate_coerce_fig_to_dict,
+    plotly_cdn_url,
+    write_chunks_to_path,
+)
 from plotly.offline.offline import _get_jconfig, get_plotlyjs
 
 _json = get_module("json")
@@ -21,6 +26,11 @@ _mathjax_config = """\
 if (window.MathJax && window.MathJax.Hub && window.MathJax.Hub.Config) {window.MathJax.Hub.Config({SVG: {font: "STIX-Web"}});}\
 </script>"""
 
+# Placeholders for the figure JSON in the HTML template. These contain NUL
+# characters so that they are unlikely to clash with user supplied strings
+_json_placeholder = "\x00plotly-json-{}\x00"
+_json_placeholder_re = re.compile("\x00plotly-json-(data|layout|frames)\x00")
+
 
 def to_html(
     fig,
@@ -35,6 +45,7 @@ def to_html(
     default_height="100%",
     validate=True,
     div_id=None,
+    typed_arrays=None,
 ):
     """
     Convert a figure to an HTML string representation.
@@ -124,26 +135,74 @@ def to_html(
     div_id: str (default None)
         If provided, this is the value of the id attribute of the div tag. If None, the
         id attribute is a UUID.
+    typed_arrays: bool or None (default None)
+        True if numeric numpy arrays should be embedded as base64 typed array
+        specs rather than as lists of numbers. If not specified, defaults to
+        the current value of plotly.io.json.config.typed_arrays.
 
     Returns
     -------
     str
         Representation of figure as an HTML div string
     """
-    from plotly.io.json import to_json_plotly
+    return "".join(
+        _iter_html(
+            fig,
+            config=config,
+            auto_play=auto_play,
+            include_plotlyjs=include_plotlyjs,
+            include_mathjax=include_mathjax,
+            post_script=post_script,
+            full_html=full_html,
+            animation_opts=animation_opts,
+            default_width=default_width,
+            default_height=default_height,
+            validate=validate,
+            div_id=div_id,
+            typed_arrays=typed_arrays,
+        )
+    )
+
+
+def _iter_html(
+    fig,
+    config,
+    auto_play,
+    include_plotlyjs,
+    include_mathjax,
+    post_script,
+    full_html,
+    animation_opts,
+    default_width,
+    default_height,
+    validate,
+    div_id,
+    typed_arrays,
+):
+    """
+    Build the HTML representation of a figure as described in to_html and
+    return an iterator over its pieces. The figure JSON is produced
+    incrementally while iterating, so the whole document is never held in
+    memory as a single string.
+    """
+    from plotly.io._json import encode_typed_arrays
 
     # ## Validate figure ##
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
 
+    # ## Encode numeric arrays ##
+    fig_dict = encode_typed_arrays(fig_dict, typed_arrays)
+
     # ## Generate div id ##
     plotdivid = div_id or str(uuid.uuid4())
 
     # ## Serialize figure ##
-    jdata = to_json_plotly(fig_dict.get("data", []))
-    jlayout = to_json_plotly(fig_dict.get("layout", {}))
+    # The JSON is spliced in at these placeholders when iterating
+    jdata = _json_placeholder.format("data")
+    jlayout = _json_placeholder.format("layout")
 
     if fig_dict.get("frames", None):
-        jframes = to_json_plotly(fig_dict.get("frames", []))
+        jframes = _json_placeholder.format("frames")
     else:
         jframes = None
 
@@ -361,7 +420,7 @@ style="height:{height}; width:{width};"></div>\
     ).strip()
 
     if full_html:
-        return """\
+        html_str = """\
 <html>
 <head><meta charset="utf-8" /></head>
 <body>
@@ -371,7 +430,26 @@ style="height:{height}; width:{width};"></div>\
             div=plotly_html_div
         )
     else:
-        return plotly_html_div
+        html_str = plotly_html_div
+
+    return _iter_html_chunks(html_str, fig_dict)
+
+
+def _iter_html_chunks(html_str, fig_dict):
+    """
+    Yield html_str with each placeholder replaced by the JSON of the
+    corresponding fig_dict entry
+    """
+    from plotly.io.json import iter_json_plotly
+
+    defaults = {"data": [], "layout": {}, "frames": []}
+    for i, part in enumerate(_json_placeholder_re.split(html_str)):
+        if i % 2:
+            # Odd parts are the names captured from the placeholders
+            for chunk in iter_json_plotly(fig_dict.get(part, defaults[part])):
+                yield chunk
+        else:
+            yield part
 
 
 def write_html(
@@ -389,6 +467,7 @@ def write_html(
     default_height="100%",
     auto_open=False,
     div_id=None,
+    typed_arrays=None,
 ):
     """
     Write a figure to an HTML file representation
@@ -400,6 +479,9 @@ def write_html(
     file: str or writeable
         A string representing a local file path or a writeable object
         (e.g. a pathlib.Path object or an open file descriptor)
+        A file path is only replaced once the figure has been written in
+        full, so it is left unchanged if serialization fails. Writeable
+        objects may have received part of the output in that case.
     config: dict or None (default None)
         Plotly.js figure config options
     auto_play: bool (default=True)
@@ -494,6 +576,10 @@ def write_html(
     div_id: str (default None)
         If provided, this is the value of the id attribute of the div tag. If None, the
         id attribute is a UUID.
+    typed_arrays: bool or None (default None)
+        True if numeric numpy arrays should be embedded as base64 typed array
+        specs rather than as lists of numbers. If not specified, defaults to
+        the current value of plotly.io.json.config.typed_arrays.
 
     Returns
     -------
@@ -501,8 +587,8 @@ def write_html(
         Representation of figure as an HTML div string
     """
 
-    # Build HTML string
-    html_str = to_html(
+    # Build HTML chunks
+    html_chunks = _iter_html(
         fig,
         config=config,
         auto_play=auto_play,
@@ -515,6 +601,7 @@ def write_html(
         default_height=default_height,
         validate=validate,
         div_id=div_id,
+        typed_arrays=typed_arrays,
     )
 
     # Check if file is a string
@@ -529,12 +616,15 @@ def write_html(
         # descriptor with a `write()` method or it's an invalid object.
         path = None
 
-    # Write HTML string
+    # Write HTML incrementally
     if path is not None:
+        # Written to a temporary file that replaces path once all chunks are
+        # written, so that a failure doesn't leave a partial file behind.
         # To use a different file encoding, pass a file descriptor
-        path.write_text(html_str, "utf-8")
+        write_chunks_to_path(path, html_chunks, encoding="utf-8")
     else:
-        file.write(html_str)
+        for chunk in html_chunks:
+            file.write(chunk)
 
     # Check if we should copy plotly.min.js to output directory
     if path is not None and full_html and include_plotlyjs == "directory":
@@ -4,9 +4,14 @@ import datetime
 import warnings
 from pathlib import Path
 
-from plotly.io._utils import validate_coerce_fig_to_dict, validate_coerce_output_type
+from plotly.io._utils import (
+    validate_coerce_fig_to_dict,
+    validate_coerce_output_type,
+    write_chunks_to_path,
+)
 from _plotly_utils.optional_imports import get_module
 from _plotly_utils.basevalidators import ImageUriValidator
+from _plotly_utils.utils import datetime64_to_iso_strings
 
 
 # Orca configuration class
@@ -16,6 +21,8 @@ class JsonConfig(object):
 
     def __init__(self):
         self._default_engine = "auto"
+        self._typed_arrays = False
+        self._cache_traces = True
 
     @property
     def default_engine(self):
@@ -34,6 +41,46 @@ class JsonConfig(object):
 
         self._default_engine = val
 
+    @property
+    def typed_arrays(self):
+        """
+        Whether numeric numpy arrays are encoded as base64 typed array specs
+        (e.g. ``{"dtype": "f8", "bdata": "..."}``) rather than as lists of
+        numbers when figures are converted to JSON, HTML or images
+        """
+        return self._typed_arrays
+
+    @typed_arrays.setter
+    def typed_arrays(self, val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The typed_arrays property must be a bool\n"
+                "    Received {val}".format(val=repr(val))
+            )
+
+        self._typed_arrays = val
+
+    @property
+    def cache_traces(self):
+        """
+        Whether figure.to_json, plotly.io.to_json and
+        plotly.io.json.to_json_plotly keep the JSON of each trace and of the
+        layout of a figure, and reuse it on the next call if that trace or
+        layout has not changed. Only the most recent JSON of each trace is
+        kept.
+        """
+        return self._cache_traces
+
+    @cache_traces.setter
+    def cache_traces(self, val):
+        if not isinstance(val, bool):
+            raise ValueError(
+                "The cache_traces property must be a bool\n"
+                "    Received {val}".format(val=repr(val))
+            )
+
+        self._cache_traces = val
+
     @classmethod
     def validate_orjson(cls):
         orjson = get_module("orjson")
@@ -75,6 +122,98 @@ def _safe(json_str, _swap):
     return out
 
 
+def encode_typed_arrays(fig_dict, typed_arrays=None):
+    """
+    Return fig_dict with numeric arrays replaced by base64 typed array specs
+    if typed array encoding is enabled, otherwise return fig_dict unchanged.
+    If typed_arrays is None, fall back to plotly.io.json.config.typed_arrays
+    """
+    if typed_arrays is None:
+        typed_arrays = config.typed_arrays
+
+    if typed_arrays:
+        from _plotly_utils.utils import convert_to_base64
+
+        return convert_to_base64(fig_dict)
+    return fig_dict
+
+
+def _resolve_json_engine(engine):
+    """
+    Return the name of the JSON engine, "json" or "orjson", that is used
+    when the engine argument is engine
+    """
+    # Determine json engine
+    if engine is None:
+        engine = config.default_engine
+
+    if engine == "auto":
+        if get_module("orjson", should_load=True) is not None:
+            engine = "orjson"
+        else:
+            engine = "json"
+    elif engine not in ["orjson", "json"]:
+        raise ValueError("Invalid json engine: %s" % engine)
+
+    return engine
+
+
+def _get_json_encoder(engine=None, pretty=False):
+    """
+    Return an (encode, swap) pair for the requested JSON engine, where
+    encode(obj) returns the JSON representation of obj as a str before
+    escaping and swap is the character replacement table for _safe
+    """
+    engine = _resolve_json_engine(engine)
+
+    if engine == "json":
+        opts = {}
+        if pretty:
+            opts["indent"] = 2
+        else:
+            # Remove all whitespace
+            opts["separators"] = (",", ":")
+
+        from _plotly_utils.utils import PlotlyJSONEncoder
+
+        def encode(obj):
+            return json.dumps(obj, cls=PlotlyJSONEncoder, **opts)
+
+        return encode, _swap_json
+
+    else:
+        JsonConfig.validate_orjson()
+        orjson = get_module("orjson", should_load=True)
+        opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+        if pretty:
+            opts |= orjson.OPT_INDENT_2
+
+        modules = {
+            "sage_all": get_module("sage.all", should_load=False),
+            "np": get_module("numpy", should_load=False),
+            "pd": get_module("pandas", should_load=False),
+            "image": get_module("PIL.Image", should_load=False),
+        }
+
+        def encode(obj):
+            # Try without cleaning
+            try:
+                return orjson.dumps(obj, option=opts).decode("utf8")
+            except TypeError:
+                pass
+
+            cleaned = clean_to_json_compatible(
+                obj,
+                numpy_allowed=True,
+                datetime_allowed=True,
+                modules=modules,
+            )
+            return orjson.dumps(cleaned, option=opts).decode("utf8")
+
+        return encode, _swap_orjson
+
+
 def to_json_plotly(plotly_object, pretty=False, engine=None):
     """
     Convert a plotly/Dash object to a JSON string representation
@@ -104,74 +243,209 @@ def to_json_plotly(plotly_object, pretty=False, engine=None):
     See Also
     --------
     to_json : Convert a plotly Figure to JSON with validation
+    iter_json_plotly : Convert a plotly/Dash object to JSON incrementally
     """
-    orjson = get_module("orjson", should_load=True)
-
-    # Determine json engine
-    if engine is None:
-        engine = config.default_engine
+    from plotly.basedatatypes import BaseFigure
+
+    # Figures reuse the cached JSON of unchanged traces
+    if isinstance(plotly_object, BaseFigure) and config.cache_traces:
+        return "".join(
+            _iter_figure_json(
+                plotly_object,
+                pretty=pretty,
+                engine=engine,
+                remove_uids=False,
+                typed_arrays=False,
+            )
+        )
 
-    if engine == "auto":
-        if orjson is not None:
-            engine = "orjson"
-        else:
-            engine = "json"
-    elif engine not in ["orjson", "json"]:
-        raise ValueError("Invalid json engine: %s" % engine)
+    encode, swap = _get_json_encoder(engine, pretty)
 
-    modules = {
-        "sage_all": get_module("sage.all", should_load=False),
-        "np": get_module("numpy", should_load=False),
-        "pd": get_module("pandas", should_load=False),
-        "image": get_module("PIL.Image", should_load=False),
-    }
+    # Plotly
+    try:
+        plotly_object = plotly_object.to_plotly_json()
+    except AttributeError:
+        pass
 
     # Dump to a JSON string and return
     # --------------------------------
-    if engine == "json":
-        opts = {}
-        if pretty:
-            opts["indent"] = 2
-        else:
-            # Remove all whitespace
-            opts["separators"] = (",", ":")
+    return _safe(encode(plotly_object), swap)
 
-        from _plotly_utils.utils import PlotlyJSONEncoder
 
-        return _safe(
-            json.dumps(plotly_object, cls=PlotlyJSONEncoder, **opts), _swap_json
-        )
-    elif engine == "orjson":
-        JsonConfig.validate_orjson()
-        opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+# Number of array elements that are encoded at a time by iter_json_plotly
+_json_chunk_size = 100000
 
-        if pretty:
-            opts |= orjson.OPT_INDENT_2
 
-        # Plotly
-        try:
-            plotly_object = plotly_object.to_plotly_json()
-        except AttributeError:
-            pass
+def iter_json_plotly(plotly_object, pretty=False, engine=None):
+    """
+    Convert a plotly/Dash object to JSON incrementally
 
-        # Try without cleaning
-        try:
-            return _safe(
-                orjson.dumps(plotly_object, option=opts).decode("utf8"), _swap_orjson
-            )
-        except TypeError:
-            pass
+    The nested dicts and lists of plotly_object are walked one item at a
+    time, and arrays longer than plotly.io._json._json_chunk_size elements
+    are encoded in slices of that many elements. Only one of these pieces
+    is held in memory as a JSON string at a time.
+
+    Parameters
+    ----------
+    plotly_object:
+        A plotly/Dash object represented as a dict, graph_object, or Dash component
+
+    pretty: bool (default False)
+        True if JSON representation should be pretty-printed, False if
+        representation should be as compact as possible.
+
+    engine: str (default None)
+        The JSON encoding engine to use. See to_json_plotly.
+
+    Returns
+    -------
+    iterator of str
+        Strings that, when concatenated, are equal to
+        to_json_plotly(plotly_object, pretty=pretty, engine=engine)
+    """
+    encode, swap = _get_json_encoder(engine, pretty)
+
+    # Plotly
+    try:
+        plotly_object = plotly_object.to_plotly_json()
+    except AttributeError:
+        pass
+
+    return (
+        _safe(chunk, swap)
+        for chunk in _iter_json_chunks(plotly_object, encode, pretty, 0)
+    )
+
+
+class _JsonFragment(str):
+    """
+    JSON that has already been encoded, indented and escaped, and is
+    emitted as-is by _iter_json_chunks
+    """
+
+
+def _json_fragment(obj, props, options, encode, swap, depth):
+    """
+    Return the JSON of props, the property dict of the trace or layout obj,
+    as a _JsonFragment to be placed at the given nesting depth.
+
+    The result is cached on obj together with its _version, and reused
+    while obj is unchanged and options (the engine, pretty, remove_uids and
+    typed_arrays settings) are the same.
+    """
+    key = options + (depth,)
+    cache = obj._json_cache
+    if cache is not None and cache[0] == obj._version and cache[1] == key:
+        return cache[2]
+
+    _, pretty, remove_uids, typed_arrays = options
+    if remove_uids and "uid" in props:
+        props = {k: v for k, v in props.items() if k != "uid"}
+    props = encode_typed_arrays(props, typed_arrays)
+
+    fragment = _JsonFragment(
+        _safe("".join(_iter_json_chunks(props, encode, pretty, depth)), swap)
+    )
+    obj._json_cache = (obj._version, key, fragment)
+    return fragment
 
-        cleaned = clean_to_json_compatible(
-            plotly_object,
-            numpy_allowed=True,
-            datetime_allowed=True,
-            modules=modules,
-        )
-        return _safe(orjson.dumps(cleaned, option=opts).decode("utf8"), _swap_orjson)
 
+def _iter_figure_json(fig, pretty, engine, remove_uids, typed_arrays):
+    """
+    Return an iterator over the escaped JSON of the BaseFigure fig, in which
+    each trace and the layout are taken from their JSON cache if they have
+    not changed since they were last serialized
+    """
+    engine = _resolve_json_engine(engine)
+    encode, swap = _get_json_encoder(engine, pretty)
+    if typed_arrays is None:
+        typed_arrays = config.typed_arrays
+    options = (engine, pretty, remove_uids, typed_arrays)
+
+    fig_parts = {
+        "data": [
+            _json_fragment(trace, props, options, encode, swap, 2)
+            for trace, props in zip(fig._data_objs, fig._data)
+        ],
+        "layout": _json_fragment(
+            fig._layout_obj, fig._layout, options, encode, swap, 1
+        ),
+    }
 
-def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
+    # Frame key is only added if there are any frames, as in to_dict
+    frames = [frame._props for frame in fig._frame_objs]
+    if frames:
+        fig_parts["frames"] = encode_typed_arrays(frames, typed_arrays)
+
+    return (
+        chunk if isinstance(chunk, _JsonFragment) else _safe(chunk, swap)
+        for chunk in _iter_json_chunks(fig_parts, encode, pretty, 0)
+    )
+
+
+def _iter_json_chunks(obj, encode, pretty, depth):
+    """
+    Yield the unescaped JSON representation of obj in pieces. depth is the
+    nesting level of obj, which sets the indentation when pretty is True
+    """
+    if isinstance(obj, _JsonFragment):
+        yield obj
+        return
+
+    np = get_module("numpy", should_load=False)
+
+    if pretty:
+        indent = "\n" + "  " * depth
+        item_indent = indent + "  "
+        key_sep = ": "
+    else:
+        indent = item_indent = ""
+        key_sep = ":"
+
+    if isinstance(obj, dict) and obj and all(isinstance(key, str) for key in obj):
+        # Object, one property at a time
+        for i, (key, val) in enumerate(obj.items()):
+            yield ("," if i else "{") + item_indent + encode(key) + key_sep
+            for chunk in _iter_json_chunks(val, encode, pretty, depth + 1):
+                yield chunk
+        yield indent + "}"
+
+    elif isinstance(obj, (list, tuple)) and any(
+        isinstance(v, (dict, _JsonFragment)) for v in obj
+    ):
+        # Array of objects (e.g. traces or annotations), one element at a time
+        for i, val in enumerate(obj):
+            yield ("," if i else "[") + item_indent
+            for chunk in _iter_json_chunks(val, encode, pretty, depth + 1):
+                yield chunk
+        yield indent + "]"
+
+    elif (
+        isinstance(obj, (list, tuple))
+        or (np is not None and isinstance(obj, np.ndarray) and obj.ndim > 0)
+    ) and len(obj) > _json_chunk_size:
+        # Long array, a slice at a time. Each slice is encoded as an array
+        # and its enclosing brackets are dropped.
+        for i, start in enumerate(range(0, len(obj), _json_chunk_size)):
+            chunk = encode(obj[start : start + _json_chunk_size])
+            if pretty:
+                # Drop "[\n" and "\n]", elements are already indented once
+                chunk = chunk[2:-2].replace("\n", indent)
+                yield (",\n" if i else "[\n") + indent[1:] + chunk
+            else:
+                yield ("," if i else "[") + chunk[1:-1]
+        yield indent + "]"
+
+    else:
+        chunk = encode(obj)
+        if pretty and depth:
+            chunk = chunk.replace("\n", indent)
+        yield chunk
+
+
+def to_json(
+    fig, validate=True, pretty=False, remove_uids=True, engine=None, typed_arrays=None
+):
     """
     Convert a figure to a JSON string representation
 
@@ -199,6 +473,13 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
 
+    typed_arrays: bool or None (default None)
+        True if numeric numpy arrays should be encoded as base64 typed array
+        specs of the form {"dtype": ..., "bdata": ..., "shape": ...}, which
+        are much more compact and faster to produce than lists of numbers.
+        If not specified, defaults to the current value of
+        plotly.io.json.config.typed_arrays.
+
     Returns
     -------
     str
@@ -208,6 +489,29 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
     --------
     to_json_plotly : Convert an arbitrary plotly graph_object or Dash component to JSON
     """
+    from plotly.basedatatypes import BaseFigure
+
+    # Figures reuse the cached JSON of unchanged traces
+    if isinstance(fig, BaseFigure) and config.cache_traces:
+        return "".join(
+            _iter_figure_json(
+                fig,
+                pretty=pretty,
+                engine=engine,
+                remove_uids=remove_uids,
+                typed_arrays=typed_arrays,
+            )
+        )
+
+    fig_dict = _prepare_fig_dict(fig, validate, remove_uids, typed_arrays)
+
+    return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+
+
+def _prepare_fig_dict(fig, validate, remove_uids, typed_arrays):
+    """
+    Return the figure dict that to_json and write_json serialize
+    """
     # Validate figure
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
@@ -218,14 +522,27 @@ def to_json(fig, validate=True, pretty=False, remove_uids=True, engine=None):
         for trace in fig_dict.get("data", []):
             trace.pop("uid", None)
 
-    return to_json_plotly(fig_dict, pretty=pretty, engine=engine)
+    # Encode numeric arrays
+    # ---------------------
+    return encode_typed_arrays(fig_dict, typed_arrays)
 
 
-def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=None):
+def write_json(
+    fig,
+    file,
+    validate=True,
+    pretty=False,
+    remove_uids=True,
+    engine=None,
+    typed_arrays=None,
+):
     """
     Convert a figure to JSON and write it to a file or writeable
     object
 
+    The JSON representation is written incrementally, so the complete JSON
+    string is never held in memory.
+
     Parameters
     ----------
     fig:
@@ -234,6 +551,9 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
     file: str or writeable
         A string representing a local file path or a writeable object
         (e.g. a pathlib.Path object or an open file descriptor)
+        A file path is only replaced once the figure has been written in
+        full, so it is left unchanged if serialization fails. Writeable
+        objects may have received part of the output in that case.
 
     pretty: bool (default False)
         True if JSON representation should be pretty-printed, False if
@@ -249,17 +569,25 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
           - "auto" for the "orjson" engine if available, otherwise "json"
         If not specified, the default engine is set to the current value of
         plotly.io.json.config.default_engine.
+
+    typed_arrays: bool or None (default None)
+        True if numeric numpy arrays should be encoded as base64 typed array
+        specs of the form {"dtype": ..., "bdata": ..., "shape": ...}, which
+        are much more compact and faster to produce than lists of numbers.
+        If not specified, defaults to the current value of
+        plotly.io.json.config.typed_arrays.
+
     Returns
     -------
     None
     """
 
-    # Get JSON string
+    # Get JSON chunks
     # ---------------
-    # Pass through validate argument and let to_json handle validation logic
-    json_str = to_json(
-        fig, validate=validate, pretty=pretty, remove_uids=remove_uids, engine=engine
-    )
+    # The figure is serialized incrementally so that the full JSON string
+    # is never held in memory
+    fig_dict = _prepare_fig_dict(fig, validate, remove_uids, typed_arrays)
+    json_chunks = iter_json_plotly(fig_dict, pretty=pretty, engine=engine)
 
     # Try to cast `file` as a pathlib object `path`.
     # ----------------------------------------------
@@ -279,22 +607,21 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True, engine=
     if path is None:
         # We previously failed to make sense of `file` as a pathlib object.
         # Attempt to write to `file` as an open file descriptor.
-        try:
-            file.write(json_str)
-            return
-        except AttributeError:
-            pass
-        raise ValueError(
-            """
+        if not hasattr(file, "write"):
+            raise ValueError(
+                """
 The 'file' argument '{file}' is not a string, pathlib.Path object, or file descriptor.
 """.format(
-                file=file
+                    file=file
+                )
             )
-        )
+        for chunk in json_chunks:
+            file.write(chunk)
     else:
         # We previously succeeded in interpreting `file` as a pathlib object.
-        # Now we can use `write_bytes()`.
-        path.write_text(json_str)
+        # Write to a temporary file that replaces it once serialization has
+        # succeeded, so that a failure doesn't leave a partial file behind.
+        write_chunks_to_path(path, json_chunks)
 
 
 def from_json_plotly(value, engine=None):
@@ -404,6 +731,12 @@ def from_json(value, output_type="Figure", skip_invalid=False, engine=None):
     # -----------
     fig_dict = from_json_plotly(value, engine=engine)
 
+    # Decode typed array specs back into arrays
+    # -----------------------------------------
+    from _plotly_utils.utils import convert_from_base64
+
+    fig_dict = convert_from_base64(fig_dict)
+
     # Validate coerce output type
     # ---------------------------
     cls = validate_coerce_output_type(output_type)
@@ -518,7 +851,7 @@ def clean_to_json_compatible(obj, **kwargs):
                 return np.ascontiguousarray(obj)
             elif obj.dtype.kind == "M":
                 # datetime64 array
-                return np.datetime_as_string(obj).tolist()
+                return datetime64_to_iso_strings(obj)
             elif obj.dtype.kind == "U":
                 return obj.tolist()
             elif obj.dtype.kind == "O":
@@ -534,6 +867,10 @@ def clean_to_json_compatible(obj, **kwargs):
         elif isinstance(obj, (pd.Series, pd.DatetimeIndex)):
             if numpy_allowed and obj.dtype.kind in ("b", "i", "u", "f"):
                 return np.ascontiguousarray(obj.values)
+            elif obj.dtype.kind == "M" and isinstance(obj.dtype, np.dtype):
+                # Timezone naive datetimes are formatted without going through
+                # python datetime objects
+                return datetime64_to_iso_strings(obj.values)
             elif obj.dtype.kind == "M":
                 if isinstance(obj, pd.Series):
                     with warnings.catch_warnings():
@@ -1,8 +1,10 @@
 import os
 import json
+from itertools import zip_longest
 from pathlib import Path
 import plotly
 from plotly.io._utils import validate_coerce_fig_to_dict
+from plotly.io._json import encode_typed_arrays
 
 try:
     from kaleido.scopes.plotly import PlotlyScope
@@ -140,6 +142,13 @@ which can be installed using pip:
     # Validate figure
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
+
+    # Encode numeric arrays
+    # ---------------------
+    # Kaleido renders with the bundled plotly.js, which understands typed
+    # array specs
+    fig_dict = encode_typed_arrays(fig_dict)
+
     img_bytes = scope.transform(
         fig_dict, format=format, width=width, height=height, scale=scale
     )
@@ -227,6 +236,29 @@ def write_image(
     -------
     None
     """
+    path, format = _infer_path_and_format(file, format)
+
+    # Request image
+    # -------------
+    # Do this first so we don't create a file if image conversion fails
+    img_data = to_image(
+        fig,
+        format=format,
+        scale=scale,
+        width=width,
+        height=height,
+        validate=validate,
+        engine=engine,
+    )
+
+    _write_image_data(file, path, img_data)
+
+
+def _infer_path_and_format(file, format):
+    """
+    Return file as a pathlib.Path object (or None if it is not a path) and
+    the image format, inferred from the path extension if format is None
+    """
     # Try to cast `file` as a pathlib object `path`.
     # ----------------------------------------------
     if isinstance(file, str):
@@ -260,19 +292,13 @@ For example:
                 )
             )
 
-    # Request image
-    # -------------
-    # Do this first so we don't create a file if image conversion fails
-    img_data = to_image(
-        fig,
-        format=format,
-        scale=scale,
-        width=width,
-        height=height,
-        validate=validate,
-        engine=engine,
-    )
+    return path, format
+
 
+def _write_image_data(file, path, img_data):
+    """
+    Write img_data to path, or to the writeable object file if path is None
+    """
     # Open file
     # ---------
     if path is None:
@@ -296,6 +322,264 @@ The 'file' argument '{file}' is not a string, pathlib.Path object, or file descr
         path.write_bytes(img_data)
 
 
+# Scope properties that are copied from `scope` to the scopes of
+# write_images worker processes
+_worker_scope_props = (
+    "plotlyjs",
+    "mathjax",
+    "topojson",
+    "mapbox_access_token",
+    "default_format",
+    "default_width",
+    "default_height",
+    "default_scale",
+)
+
+# Number of times that write_images replaces its worker processes after one
+# of them exits unexpectedly, before giving up
+_max_worker_restarts = 3
+
+# PlotlyScope of the current write_images worker process
+_worker_scope = None
+
+
+def _init_image_worker(scope_props):
+    """
+    Initialize a write_images worker process with its own PlotlyScope, and
+    render an empty figure so that Chromium and plotly.js are loaded before
+    the first real figure arrives
+    """
+    global _worker_scope
+
+    _worker_scope = PlotlyScope()
+    for prop, val in scope_props.items():
+        setattr(_worker_scope, prop, val)
+
+    _worker_scope.transform({"data": [], "layout": {}}, format="svg")
+
+
+def _render_image(fig_dict, format, width, height, scale):
+    """
+    Render a figure dict in a write_images worker process
+    """
+    try:
+        return _worker_scope.transform(
+            fig_dict, format=format, width=width, height=height, scale=scale
+        )
+    except Exception:
+        # If Chromium is still running, the figure itself failed to render
+        proc = getattr(_worker_scope, "_proc", None)
+        if proc is None or proc.poll() is None:
+            raise
+
+    # Chromium exited while rendering. The scope starts a new Chromium
+    # process on the next request, so try once more.
+    return _worker_scope.transform(
+        fig_dict, format=format, width=width, height=height, scale=scale
+    )
+
+
+def write_images(
+    figs,
+    files,
+    format=None,
+    scale=None,
+    width=None,
+    height=None,
+    validate=True,
+    workers=None,
+):
+    """
+    Convert many figures to static images with a pool of Kaleido processes
+    and write them to files or writeable objects
+
+    Each worker process starts its own Kaleido scope when the pool is
+    created, so the cost of launching Chromium and loading plotly.js is
+    paid once per worker rather than once per image. The worker scopes use
+    the current settings of `plotly.io.kaleido.scope`.
+
+    At most two figures per worker are queued at any time, so figs may be
+    a generator that builds figures on demand. If a worker process exits
+    unexpectedly, the pool is restarted and the figures it was rendering
+    are submitted again. Images are written as soon as they are ready, which
+    may not be in the order of figs.
+
+    On platforms that start worker processes with the "spawn" or
+    "forkserver" methods, calls to write_images in a script must be guarded
+    by `if __name__ == "__main__":`.
+
+    Parameters
+    ----------
+    figs: iterable
+        Figure objects or dicts representing figures
+
+    files: iterable
+        For each figure in figs, a string representing a local file path or
+        a writeable object (e.g. a pathlib.Path object or an open file
+        descriptor). Must yield as many items as figs, otherwise a
+        ValueError is raised
+
+    format: str or None
+        The desired image format. One of
+          - 'png'
+          - 'jpg' or 'jpeg'
+          - 'webp'
+          - 'svg'
+          - 'pdf'
+          - 'eps' (Requires the poppler library to be installed and on the PATH)
+
+        If not specified and a file is a string or pathlib.Path then this
+        will default to the file extension. Otherwise this will default to
+        `plotly.io.kaleido.scope.default_format`.
+
+    scale: int or float or None
+        The scale factor to use when exporting the figures. See write_image.
+
+    width: int or None
+        The width of the exported images in layout pixels. See write_image.
+
+    height: int or None
+        The height of the exported images in layout pixels. See write_image.
+
+    validate: bool
+        True if the figures should be validated before being converted to
+        images, False otherwise.
+
+    workers: int or None
+        The number of worker processes. If not specified, defaults to the
+        number of CPUs.
+
+    Returns
+    -------
+    None
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from concurrent.futures.process import BrokenProcessPool
+
+    # Raise informative error message if Kaleido is not installed
+    if scope is None:
+        raise ValueError(
+            """
+Image export using the "kaleido" engine requires the kaleido package,
+which can be installed using pip:
+    $ pip install -U kaleido
+"""
+        )
+
+    # Check lengths up front when they are known. Otherwise, a length mismatch
+    # is only detected once the shorter iterable is exhausted
+    if hasattr(figs, "__len__") and hasattr(files, "__len__"):
+        if len(figs) != len(files):
+            raise ValueError(
+                "figs and files must have the same length\n"
+                "    Received {n_figs} figures and {n_files} files".format(
+                    n_figs=len(figs), n_files=len(files)
+                )
+            )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif not isinstance(workers, int) or workers < 1:
+        raise ValueError(
+            "The workers argument must be a positive integer\n"
+            "    Received {val}".format(val=repr(workers))
+        )
+
+    scope_props = {
+        prop: getattr(scope, prop)
+        for prop in _worker_scope_props
+        if getattr(scope, prop, None) is not None
+    }
+
+    def make_pool():
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_image_worker,
+            initargs=(scope_props,),
+        )
+
+    # Futures of the jobs that are queued or running, mapped to their
+    # (file, path, fig_dict, format) tuples
+    pending = {}
+    restarts = 0
+    pool = make_pool()
+
+    def submit(job):
+        _, _, fig_dict, fmt = job
+        future = pool.submit(_render_image, fig_dict, fmt, width, height, scale)
+        pending[future] = job
+
+    def write_completed():
+        nonlocal pool, restarts
+
+        done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+        crashed = []
+        for future in done:
+            job = pending.pop(future)
+            try:
+                img_data = future.result()
+            except BrokenProcessPool as err:
+                crashed.append(job)
+                pool_error = err
+                continue
+            file, path, _, _ = job
+            _write_image_data(file, path, img_data)
+
+        if crashed:
+            # A worker process exited, which breaks the whole pool. Start a
+            # new pool and submit every job that was in flight again.
+            restarts += 1
+            if restarts > _max_worker_restarts:
+                raise pool_error
+
+            retry = crashed + list(pending.values())
+            pending.clear()
+            pool.shutdown(wait=False)
+            pool = make_pool()
+            for job in retry:
+                submit(job)
+
+    try:
+        for fig, file in _zip_figs_and_files(figs, files):
+            path, fmt = _infer_path_and_format(file, format)
+
+            # Validate figure and encode numeric arrays as in to_image
+            fig_dict = validate_coerce_fig_to_dict(fig, validate)
+            fig_dict = encode_typed_arrays(fig_dict)
+
+            # Wait for a free slot, so that at most two figures per worker
+            # are held in the queue
+            while len(pending) >= 2 * workers:
+                write_completed()
+
+            submit((file, path, fig_dict, fmt))
+
+        while pending:
+            write_completed()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
+
+
+def _zip_figs_and_files(figs, files):
+    """
+    Like zip(figs, files), but raise a ValueError instead of silently
+    dropping the remaining items when one of the iterables is shorter
+    """
+    missing = object()
+    for fig, file in zip_longest(figs, files, fillvalue=missing):
+        if fig is missing or file is missing:
+            raise ValueError(
+                "figs and files must have the same length\n"
+                "    Received more {more} than {fewer}".format(
+                    more="files" if fig is missing else "figures",
+                    fewer="figures" if fig is missing else "files",
+                )
+            )
+        yield fig, file
+
+
 def full_figure_for_development(fig, warn=True, as_dict=False):
     """
     Compute default values for all attributes not specified in the input figure and
@@ -350,4 +634,10 @@ which can be installed using pip:
         return go.Figure(fig, skip_invalid=True)
 
 
-__all__ = ["to_image", "write_image", "scope", "full_figure_for_development"]
+__all__ = [
+    "to_image",
+    "write_image",
+    "write_images",
+    "scope",
+    "full_figure_for_development",
+]
@@ -50,6 +50,9 @@ class TemplatesConfig(object):
         self._validator = None
         self._default = None
 
+        # Cache of validated template properties, see _get_template_props
+        self._template_props = {}
+
     # ### Magic methods ###
     # Make this act as a dict of templates
     def __len__(self):
@@ -62,46 +65,96 @@ class TemplatesConfig(object):
         return iter(self._templates)
 
     def __getitem__(self, item):
-        if isinstance(item, str):
-            template_names = item.split("+")
-        else:
-            template_names = [item]
-
-        templates = []
-        for template_name in template_names:
-            template = self._templates[template_name]
-            if template is Lazy:
-                from plotly.graph_objs.layout import Template
-
-                if template_name == "none":
-                    # "none" is a special built-in named template that applied no defaults
-                    template = Template(data_scatter=[{}])
-                    self._templates[template_name] = template
-                else:
-                    # Load template from package data
-                    path = os.path.join(
-                        "package_data", "templates", template_name + ".json"
-                    )
-                    template_str = pkgutil.get_data("plotly", path).decode("utf-8")
-                    template_dict = json.loads(template_str)
-                    template = Template(template_dict, _validate=False)
-
-                    self._templates[template_name] = template
-            templates.append(self._templates[template_name])
-
+        templates = [
+            self._get_template(template_name)
+            for template_name in self._template_names(item)
+        ]
         return self.merge_templates(*templates)
 
     def __setitem__(self, key, value):
         self._templates[key] = self._validate(value)
+        self._template_props.clear()
 
     def __delitem__(self, key):
         # Remove template
         del self._templates[key]
+        self._template_props.clear()
 
         # Check if we need to remove it as the default
         if self._default == key:
             self._default = None
 
+    def _template_names(self, item):
+        if isinstance(item, str):
+            return item.split("+")
+        else:
+            return [item]
+
+    def _get_template(self, template_name):
+        template = self._templates[template_name]
+        if template is Lazy:
+            from plotly.graph_objs.layout import Template
+
+            if template_name == "none":
+                # "none" is a special built-in named template that applied no defaults
+                template = Template(data_scatter=[{}])
+                self._templates[template_name] = template
+            else:
+                # Load template from package data
+                path = os.path.join(
+                    "package_data", "templates", template_name + ".json"
+                )
+                template_str = pkgutil.get_data("plotly", path).decode("utf-8")
+                template_dict = json.loads(template_str)
+                template = Template(template_dict, _validate=False)
+
+                # Package templates are trusted, but validate later edits
+                template._validate = True
+
+                self._templates[template_name] = template
+        return template
+
+    def _get_template_props(self, item):
+        """
+        Return the validated properties dict of a registered template, or of
+        the merge of several registered templates joined on '+' characters
+
+        The dict is cached per template identifier and reused for as long as
+        the registered templates it was built from are neither replaced nor
+        modified. It is shared by every caller and must not be modified.
+
+        Parameters
+        ----------
+        item: str
+            Template identifier (e.g. 'plotly' or 'plotly+presentation')
+
+        Returns
+        -------
+        dict
+        """
+        templates = tuple(
+            self._get_template(template_name)
+            for template_name in self._template_names(item)
+        )
+        state = tuple((id(template), template._version) for template in templates)
+
+        cached = self._template_props.get(item, None)
+        if cached is not None and cached[0] == state:
+            return cached[2]
+
+        # Registered templates are validated when they are added, so copy the
+        # merged properties rather than validating them again. Validating would
+        # construct (and import) the graph object class of every nested template
+        # property
+        props = self.merge_templates(*templates).to_plotly_json()
+        if not props:
+            # Same stand-in for an empty template as the template validator
+            props = {"data": {"scatter": [{}]}}
+
+        # Hold on to the templates so that their ids identify them
+        self._template_props[item] = (state, templates, props)
+        return props
+
     def _validate(self, value):
         if not self._validator:
             from plotly.validators.layout import TemplateValidator
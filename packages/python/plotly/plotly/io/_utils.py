@@ -1,3 +1,7 @@
+import os
+import uuid
+from pathlib import Path
+
 import plotly
 import plotly.graph_objs as go
 from plotly.offline import get_plotlyjs_version
@@ -43,6 +47,50 @@ Invalid output type: {output_type}
     return cls
 
 
+def write_chunks_to_path(path, chunks, encoding=None):
+    """
+    Write an iterable of strings to a file path atomically
+
+    The chunks are written to a temporary file in the same directory that
+    replaces the file at path once all chunks are written. If producing a
+    chunk fails, the temporary file is removed and an existing file at path
+    is left untouched.
+
+    Parameters
+    ----------
+    path: pathlib.Path
+        Path of the file to write
+    chunks: iterable of str
+        Strings to write, in order
+    encoding: str or None (default None)
+        Encoding of the file. If None, the platform default is used as in
+        open()
+
+    Returns
+    -------
+    None
+    """
+    # Replace the target of a symbolic link, not the link itself
+    path = Path(os.path.realpath(path))
+    tmp_path = path.with_name(
+        ".{name}.{id}.tmp".format(name=path.name, id=uuid.uuid4().hex)
+    )
+
+    # Unlike tempfile.mkstemp, open() creates the file with the permissions
+    # given by the umask, which the written file keeps
+    try:
+        with tmp_path.open("x", encoding=encoding) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
 def plotly_cdn_url(cdn_ver=get_plotlyjs_version()):
     """Return a valid plotly CDN url."""
     return "https://cdn.plot.ly/plotly-{cdn_ver}.min.js".format(
@@ -1 +1 @@
-from ._kaleido import to_image, write_image, scope
+from ._kaleido import to_image, write_image, write_images, scope
@@ -3,6 +3,128 @@ from .optional_imports import get_module
 
 np = get_module("numpy")
 
+# numpy dtypes with a matching JavaScript typed array
+_typed_array_dtypes = {
+    "int8",
+    "int16",
+    "int32",
+    "uint8",
+    "uint16",
+    "uint32",
+    "float32",
+    "float64",
+}
+
+# dtype of the buffers of datetime64 arrays, which are sent as float64
+# milliseconds since the epoch
+_datetime_buffer_dtype = "datetime64[ms]"
+
+
+def _array_to_buffer_spec(v):
+    """
+    Convert a numpy array into a buffer/dtype/shape dict that the JavaScript
+    side maps to a typed array, or return None if the array has no binary
+    representation (e.g. object, string or boolean arrays)
+
+    int64 and uint64 arrays are downcast to int32 and uint32 when all of
+    their values fit, and to float64 otherwise, which is the precision
+    JavaScript numbers have anyway. datetime64 arrays are sent as float64
+    milliseconds since the epoch, with NaT as NaN. Multi-dimensional arrays
+    are sent as a single flat buffer along with their shape.
+
+    Parameters
+    ----------
+    v: np.ndarray
+
+    Returns
+    -------
+    dict or None
+    """
+    kind = v.dtype.kind
+    dtype = None
+    if kind == "M":
+        values = v.astype("datetime64[ms]")
+        buffer = values.view("int64").astype("float64")
+        buffer[np.isnat(values)] = np.nan
+        dtype = _datetime_buffer_dtype
+    elif kind in ("i", "u"):
+        buffer = v
+        if v.dtype.itemsize == 8:
+            small = np.dtype("int32" if kind == "i" else "uint32")
+            info = np.iinfo(small)
+            if v.size == 0 or (v.min() >= info.min and v.max() <= info.max):
+                buffer = v.astype(small)
+            else:
+                buffer = v.astype("float64")
+    elif kind == "f":
+        if v.dtype.itemsize < 4:
+            buffer = v.astype("float32")
+        elif v.dtype.itemsize > 8:
+            buffer = v.astype("float64")
+        else:
+            buffer = v
+    else:
+        return None
+
+    # Typed arrays are little-endian on every platform that runs the
+    # JavaScript side, and buffers must be contiguous to be sent as is
+    buffer = np.ascontiguousarray(buffer, dtype=buffer.dtype.newbyteorder("<"))
+    if dtype is None:
+        dtype = buffer.dtype.name
+    if dtype not in _typed_array_dtypes and dtype != _datetime_buffer_dtype:
+        return None
+    return {
+        "buffer": memoryview(buffer.reshape(-1)),
+        "dtype": dtype,
+        "shape": v.shape,
+    }
+
+
+def _buffer_spec_to_array(v):
+    """
+    Convert a buffer/dtype/shape dict received from the JavaScript side into
+    a numpy array. This is the inverse of `_array_to_buffer_spec`.
+    """
+    buffer = v["value"] if "value" in v else v["buffer"]
+    shape = tuple(v["shape"])
+    is_datetime = v["dtype"] == _datetime_buffer_dtype
+    dtype = np.dtype("<f8" if is_datetime else v["dtype"]).newbyteorder("<")
+
+    # Only read as many elements as the shape calls for, the buffer is not
+    # guaranteed to be an exact fit
+    count = int(np.prod(shape, dtype="int64"))
+    nbytes = memoryview(buffer).nbytes
+    if nbytes < count * dtype.itemsize:
+        raise ValueError(
+            "Buffer of {nbytes} bytes is too small for an array of dtype {dtype} "
+            "and shape {shape}".format(
+                nbytes=nbytes,
+                dtype=v["dtype"],
+                shape=shape,
+            )
+        )
+    values = np.frombuffer(buffer, dtype=dtype, count=count)
+
+    if is_datetime:
+        array = np.full(values.shape, np.datetime64("NaT"), dtype="datetime64[ms]")
+        finite = np.isfinite(values)
+        array[finite] = values[finite].astype("int64").view("datetime64[ms]")
+    else:
+        array = values
+    return array.reshape(shape)
+
+
+def _is_buffer_spec(v):
+    """
+    Return whether `v` is a buffer/dtype/shape dict with binary content
+    """
+    return (
+        ("value" in v or "buffer" in v)
+        and "dtype" in v
+        and "shape" in v
+        and isinstance(v.get("value", v.get("buffer")), (bytes, memoryview))
+    )
+
 
 def _py_to_js(v, widget_manager):
     """
@@ -38,18 +160,11 @@ def _py_to_js(v, widget_manager):
     # Handle numpy array
     # ------------------
     elif np is not None and isinstance(v, np.ndarray):
-        # Convert 1D numpy arrays with numeric types to memoryviews with
-        # datatype and shape metadata.
-        if (
-            v.ndim == 1
-            and v.dtype.kind in ["u", "i", "f"]
-            and v.dtype != "int64"
-            and v.dtype != "uint64"
-        ):
-
-            # We have a numpy array the we can directly map to a JavaScript
-            # Typed array
-            return {"buffer": memoryview(v), "dtype": str(v.dtype), "shape": v.shape}
+        # Convert numpy arrays with numeric or datetime types to memoryviews
+        # with datatype and shape metadata.
+        buffer_spec = _array_to_buffer_spec(v)
+        if buffer_spec is not None:
+            return buffer_spec
         else:
             # Convert all other numpy arrays to lists
             return v.tolist()
@@ -84,6 +199,8 @@ def _js_to_py(v, widget_manager):
     # Handle dict
     # -----------
     if isinstance(v, dict):
+        if np is not None and _is_buffer_spec(v):
+            return _buffer_spec_to_array(v)
         return {k: _js_to_py(v, widget_manager) for k, v in v.items()}
 
     # Handle list/tuple
@@ -0,0 +1,112 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+import plotly.graph_objs as go
+
+
+class TestExtendTracesMessage(TestCase):
+    def setUp(self):
+        # Construct with mocked _send_extendTraces_msg method
+        self.figure = go.Figure(
+            data=[go.Scatter(x=[1, 2], y=[3, 4]), go.Scatter(y=[5], name="b")]
+        )
+
+        # Mock out the message methods
+        self.figure._send_extendTraces_msg = MagicMock()
+        self.figure._send_restyle_msg = MagicMock()
+
+    def test_extend_sends_only_new_points(self):
+        self.figure.data[0].extend(x=[3, 4], y=[5, 6])
+
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"x": [[3, 4]], "y": [[5, 6]]}, [0], None
+        )
+        self.assertFalse(self.figure._send_restyle_msg.called)
+        self.assertEqual(self.figure.data[0].x, (1, 2, 3, 4))
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5, 6))
+        self.assertEqual(self.figure.data[1].y, (5,))
+
+    def test_extend_max_points(self):
+        self.figure.data[1].extend(y=[6, 7, 8], max_points=2)
+
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"y": [[6, 7, 8]]}, [1], 2
+        )
+        self.assertEqual(self.figure.data[1].y, (7, 8))
+
+    def test_extend_nested_property(self):
+        self.figure.data[1].extend(marker_color=["red"])
+
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"marker.color": [["red"]]}, [1], None
+        )
+        self.assertEqual(self.figure.data[1].marker.color, ("red",))
+
+    def test_extend_dispatches_change_callbacks(self):
+        callback = MagicMock()
+        self.figure.data[0].on_change(callback, "y")
+        self.figure.data[0].extend(y=[5])
+        callback.assert_called_once_with(self.figure.data[0], (3, 4, 5))
+
+    def test_extend_in_batch_mode(self):
+        self.figure._send_update_msg = MagicMock()
+        with self.figure.batch_update():
+            self.figure.data[0].extend(y=[5])
+            self.figure.data[0].extend(y=[6], max_points=3)
+            self.assertEqual(self.figure.data[0].y, (3, 4))
+
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+        self.figure._send_update_msg.assert_called_once_with(
+            restyle_data={"y": [[4, 5, 6]]}, relayout_data={}, trace_indexes=[0]
+        )
+        self.assertEqual(self.figure.data[0].y, (4, 5, 6))
+
+    def test_extend_unassigned_property(self):
+        self.figure.data[1].extend(x=[0])
+        self.assertEqual(self.figure.data[1].x, (0,))
+
+    def test_extend_invalid(self):
+        with pytest.raises(ValueError, match="only properties that accept arrays"):
+            self.figure.data[0].extend(name=["a"])
+
+        self.figure.data[1].marker.color = "red"
+        with pytest.raises(ValueError, match="Cannot extend the scalar"):
+            self.figure.data[1].extend(marker_color=["blue"])
+
+        with pytest.raises(ValueError, match="max_points"):
+            self.figure.data[0].extend(y=[1], max_points=0)
+
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+    def test_extend_invalid_leaves_other_properties_unchanged(self):
+        self.figure.data[1].marker.color = "red"
+        with pytest.raises(ValueError, match="Cannot extend the scalar"):
+            self.figure.data[1].extend(y=[6], marker_color=["blue"])
+        self.assertEqual(self.figure.data[1].y, (5,))
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+        self.figure._send_update_msg = MagicMock()
+        with self.figure.batch_update():
+            with pytest.raises(ValueError, match="marker.color"):
+                self.figure.data[1].extend(y=[6], marker_color=["blue"])
+        self.assertFalse(self.figure._send_update_msg.called)
+        self.assertEqual(self.figure.data[1].y, (5,))
+
+        trace = go.Scatter(y=[5], marker_color="red")
+        with pytest.raises(ValueError, match="Cannot extend the scalar"):
+            trace.extend(y=[6], marker_color=["blue"])
+        self.assertEqual(trace.y, (5,))
+
+
+def test_extend_numpy():
+    np = pytest.importorskip("numpy")
+
+    trace = go.Scatter(y=np.arange(3))
+    trace.extend(y=np.arange(3, 6), max_points=4)
+    assert np.array_equal(trace.y, [2, 3, 4, 5])
+    assert not trace.y.flags.writeable
+
+    trace.extend(y=np.arange(10), max_points=4)
+    assert np.array_equal(trace.y, [6, 7, 8, 9])
@@ -0,0 +1,32 @@
+import pytest
+import plotly.graph_objs as go
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+pytestmark = pytest.mark.skipif(
+    not figure_widget_available, reason="ipywidgets is not installed"
+)
+
+
+def test_layout_delta_does_not_modify_shared_template():
+    font_color = go.Figure().layout.template.layout.font.color
+    assert font_color is not None
+
+    fig = go.FigureWidget()
+    fig._js2py_layoutDelta = {
+        "layout_delta": {"template": {"layout": {"font": {"color": font_color}}}},
+        "layout_edit_id": fig._last_layout_edit_id,
+    }
+
+    # The widget dropped its own copy of the default value...
+    assert "font" not in fig._layout["template"]["layout"]
+
+    # ...but not the one of the template shared with other figures
+    assert go.Figure().layout.template.layout.font.color == font_color
+    assert go.Figure().to_dict()["layout"]["template"]["layout"]["font"] == {
+        "color": font_color
+    }
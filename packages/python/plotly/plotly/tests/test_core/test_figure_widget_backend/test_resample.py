@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+import plotly.graph_objs as go
+
+np = pytest.importorskip("numpy")
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+pytestmark = pytest.mark.skipif(
+    not figure_widget_available, reason="ipywidgets is not installed"
+)
+
+
+def relayout(fig, relayout_data):
+    fig._js2py_relayout = {"relayout_data": relayout_data, "source_view_id": "view"}
+
+
+@pytest.fixture
+def resampled():
+    n = 100000
+    x = np.arange(n, dtype="float64")
+    y = np.sin(x / 1000.0) + np.random.random(n)
+    fig = go.FigureWidget(data=[go.Scatter()])
+    fig.resample_trace(0, x, y, max_points=500, debounce=0)
+    return fig, x, y
+
+
+def test_resample_trace_initial_view(resampled):
+    fig, x, y = resampled
+    trace = fig.data[0]
+    assert len(trace.x) <= 500
+    assert trace.x[0] == x[0] and trace.x[-1] == x[-1]
+    assert np.array_equal(trace.y, y[trace.x.astype(int)])
+
+
+def test_resample_on_zoom_and_autorange(resampled):
+    fig, x, y = resampled
+    relayout(fig, {"xaxis.range[0]": 1000.5, "xaxis.range[1]": 3000.5})
+    trace = fig.data[0]
+    assert len(trace.x) <= 500
+    assert trace.x[0] == 1000 and trace.x[-1] == 3001
+    assert np.array_equal(trace.y, y[trace.x.astype(int)])
+
+    relayout(fig, {"xaxis.autorange": True})
+    assert fig.data[0].x[-1] == x[-1]
+
+
+def test_resample_is_debounced(resampled):
+    fig, x, y = resampled
+    fig._downsample_sources[fig.data[0].uid]["debounce"] = 0.05
+
+    async def zoom():
+        for i in range(5):
+            relayout(fig, {"xaxis.range": [100 * i, 2000 + 100 * i]})
+        assert fig._resample_timer is not None
+        assert fig.data[0].x[-1] == x[-1]
+        await asyncio.sleep(0.2)
+
+    asyncio.run(zoom())
+    assert fig._resample_timer is None
+    assert fig.data[0].x[0] == 399 and fig.data[0].x[-1] == 2401
+
+
+def test_resample_without_event_loop_is_immediate(resampled):
+    fig, x, y = resampled
+    fig._downsample_sources[fig.data[0].uid]["debounce"] = 10
+    relayout(fig, {"xaxis.range": [100, 2000]})
+    assert fig._resample_timer is None
+    assert fig.data[0].x[0] == 99 and fig.data[0].x[-1] == 2001
+
+
+def test_resample_debounce_is_per_trace():
+    n = 10000
+    x = np.arange(n, dtype="float64")
+    y = np.random.random(n)
+    fig = go.FigureWidget(
+        data=[go.Scatter(), go.Scatter(xaxis="x2")], layout=dict(xaxis2={})
+    )
+    fig.resample_trace(0, x, y, max_points=500, debounce=10)
+    fig.resample_trace(1, x, y, max_points=500, debounce=0.01)
+    uids = [trace.uid for trace in fig.data]
+    assert [fig._downsample_sources[uid]["debounce"] for uid in uids] == [10, 0.01]
+
+    async def zoom():
+        # Only the second trace is waiting, so its own debounce is used
+        relayout(fig, {"xaxis2.range": [100, 2000]})
+        await asyncio.sleep(0.2)
+        assert fig.data[1].x[0] == 99
+
+        # With both traces waiting, the smallest debounce is used
+        relayout(fig, {"xaxis.range": [100, 2000], "xaxis2.range": [200, 2000]})
+        await asyncio.sleep(0.2)
+
+    asyncio.run(zoom())
+    assert fig.data[0].x[0] == 99
+    assert fig.data[1].x[0] == 199
+
+
+def test_resample_other_axis_is_ignored(resampled):
+    fig, x, y = resampled
+    relayout(fig, {"yaxis.range": [0, 1]})
+    assert fig.data[0].x[-1] == x[-1]
+
+
+def test_resample_trace_length_mismatch():
+    fig = go.FigureWidget(data=[go.Scatter()])
+    with pytest.raises(ValueError, match="same length"):
+        fig.resample_trace(0, [1, 2, 3], [1, 2])
+
+
+def test_resample_px_downsampled_figure():
+    pytest.importorskip("pandas")
+    import plotly.express as px
+
+    n = 20000
+    x = np.arange(n)
+    y = np.random.random(n)
+    extra = np.random.random(n)
+    fig = go.FigureWidget(
+        px.line(x=x, y=y, hover_data=dict(extra=extra), downsample="lttb")
+    )
+    fig._resample_debounce = 0
+    assert list(fig._downsample_sources) == [fig.data[0].uid]
+
+    relayout(fig, {"xaxis.range": [100, 200]})
+    trace = fig.data[0]
+    assert trace.x[0] == 99 and trace.x[-1] == 201
+    assert np.array_equal(trace.customdata[:, 0], extra[trace.x])
@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+import plotly.graph_objs as go
+
+
+class TestCompoundArrayIndex(TestCase):
+    def setUp(self):
+        self.layout = go.Layout(
+            shapes=[{"type": "line", "x0": i} for i in range(4)],
+        )
+
+    def assert_indexes(self, shapes):
+        for i, shape in enumerate(shapes):
+            self.assertEqual(shape._array_ind, i)
+            self.assertEqual(self.layout._get_array_index("shapes", shape), i)
+
+    def test_index_of_initial_elements(self):
+        shapes = self.layout.shapes
+        self.assert_indexes(shapes)
+        self.assertEqual([s.x0 for s in shapes], [0, 1, 2, 3])
+
+    def test_index_after_assignment(self):
+        old_shapes = self.layout.shapes
+        self.layout.shapes = old_shapes[::-1][:3]
+        self.assert_indexes(self.layout.shapes)
+        self.assertEqual([s.x0 for s in self.layout.shapes], [3, 2, 1])
+        self.assertTrue(all(s._array_ind is None for s in old_shapes))
+
+        self.layout.shapes[1].x0 = 10
+        self.assertEqual(self.layout.to_plotly_json()["shapes"][1]["x0"], 10)
+
+    def test_index_after_append(self):
+        self.layout._extend_array_prop("shapes", [{"type": "rect"}, {"type": "path"}])
+        self.assert_indexes(self.layout.shapes)
+        self.layout.shapes[5].x0 = 5
+        self.assertEqual(self.layout.to_plotly_json()["shapes"][5]["x0"], 5)
+
+    def test_stale_index_falls_back_to_scan(self):
+        shape = self.layout.shapes[2]
+        shape._array_ind = 0
+        self.assertEqual(self.layout._get_array_index("shapes", shape), 2)
+        self.assertEqual(shape.x0, 2)
+
+
+def test_frame_trace_index():
+    frame = go.Frame(data=[go.Scatter(y=[1]), go.Bar(y=[2])])
+    frame.data = frame.data[::-1]
+    assert [t._array_ind for t in frame.data] == [0, 1]
+    assert frame.data[0].y == (2,)
+    frame.data[1].y = [3]
+    assert frame.to_plotly_json()["data"][1]["y"] == [3]
+
+
+def test_figure_trace_index_after_move():
+    fig = go.Figure([go.Scatter(name=str(i)) for i in range(4)])
+    fig.data = [fig.data[i] for i in (3, 1, 0)]
+    assert [t._trace_ind for t in fig.data] == [0, 1, 2]
+    fig.data[2].name = "first"
+    assert [t["name"] for t in fig.to_dict()["data"]] == ["3", "1", "first"]
@@ -2,6 +2,7 @@ from unittest import TestCase
 import os
 import importlib
 
+from _plotly_utils.basevalidators import BaseValidator
 from plotly.basedatatypes import BasePlotlyType, BaseFigure
 
 datatypes_root = "plotly/graph_objs"
@@ -11,6 +12,13 @@ datatype_modules = [
     if not dirpath.endswith("__pycache__")
 ]
 
+validators_root = "plotly/validators"
+validator_modules = [
+    dirpath.replace("/", ".")
+    for dirpath, _, _ in os.walk(validators_root)
+    if not dirpath.endswith("__pycache__")
+]
+
 
 class HierarchyTest(TestCase):
     def test_construct_datatypes(self):
@@ -37,3 +45,20 @@ class HierarchyTest(TestCase):
                     self.assertIsInstance(v, BaseFigure)
                 else:
                     self.assertIsInstance(v, BasePlotlyType)
+
+    def test_construct_validators(self):
+        for validators_module in validator_modules:
+            module = importlib.import_module(validators_module)
+            for name in module.__all__:
+                validator_class = getattr(module, name)
+                self.assertEqual(validator_class.__name__, name)
+                self.assertTrue(
+                    validator_class.__module__.startswith(validators_module)
+                )
+
+                # Validator classes are built once and then cached on the module
+                self.assertIs(getattr(module, name), validator_class)
+
+                v = validator_class()
+                self.assertIsInstance(v, BaseValidator)
+                self.assertEqual(v.parent_name, validators_module[18:])
@@ -179,6 +179,40 @@ class TemplateTest(TestCase):
         fig = go.Figure()
         self.assertEqual(fig.layout.template, template)
 
+    def test_template_default_props_shared(self):
+        pio.templates.default = "test_template"
+        fig1 = go.Figure()
+        fig2 = go.Figure()
+        self.assertIs(fig1.layout._props["template"], fig2.layout._props["template"])
+        self.assertEqual(
+            fig1.to_dict()["layout"]["template"],
+            {"layout": {"font": {"family": "Rockwell"}}},
+        )
+
+        # Modifying the template of one figure leaves the others untouched
+        fig1.layout.template.layout.font.size = 20
+        fig2.plotly_relayout({"template.layout.font.color": "red"})
+        self.assertEqual(fig1.layout.template.layout.font.size, 20)
+        self.assertIsNone(fig1.layout.template.layout.font.color)
+        self.assertIsNone(fig2.layout.template.layout.font.size)
+        self.assertEqual(fig2.layout.template.layout.font.color, "red")
+        self.assertEqual(go.Figure().layout.template, pio.templates["test_template"])
+
+    def test_template_default_props_follow_registered_templates(self):
+        pio.templates.default = "test_template"
+        go.Figure()
+
+        pio.templates["test_template"].layout.font.size = 20
+        self.assertEqual(go.Figure().layout.template.layout.font.size, 20)
+
+        pio.templates["test_template"] = {"layout": {"font": {"size": 30}}}
+        self.assertEqual(go.Figure().layout.template.layout.font.size, 30)
+
+        pio.templates.default = "test_template+plotly"
+        fig = go.Figure()
+        self.assertEqual(fig.layout.template, pio.templates["test_template+plotly"])
+        self.assertEqual(fig.layout.template.layout.font.size, 30)
+
 
 class TestToTemplated(TestCaseNoTemplate):
     def test_move_layout_nested_properties(self):
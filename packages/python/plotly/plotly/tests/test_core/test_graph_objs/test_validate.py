@@ -34,3 +34,103 @@ def test_validate_false():
 
     finally:
         pio.templates.default = template
+
+
+def test_validate_false_public_arg():
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        fig = go.Figure(validate=False, **build_invalid_fig())
+        assert json.loads(fig.to_json()) == expected_invalid_dict
+
+        # Later updates to the figure are not validated either
+        fig.add_traces([{"type": "scatter", "x": "not_a_list"}])
+        fig.update_traces(marker_color="bogus", selector={"type": "bar"})
+        fig.update_layout(width="wide", xaxis_range="bogus")
+        fig.layout.title.font.size = "big"
+
+        fig_dict = json.loads(fig.to_json())
+        assert fig_dict["data"][0]["marker"] == {"color": "bogus"}
+        assert fig_dict["data"][1] == {"type": "scatter", "x": "not_a_list"}
+        assert fig_dict["layout"]["width"] == "wide"
+        assert fig_dict["layout"]["xaxis"] == {"range": "bogus"}
+        assert fig_dict["layout"]["title"]["font"] == {"size": "big"}
+    finally:
+        pio.templates.default = template
+
+
+def test_skip_validation_context_manager():
+    from plotly.utils import skip_validation, validation_config
+
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        with skip_validation():
+            assert not validation_config.enabled
+            fig = go.Figure(**build_invalid_fig())
+            fig.update_layout(width="wide")
+            trace = go.Scatter(marker_color="bogus")
+
+        assert validation_config.enabled
+        assert json.loads(fig.to_json()) == dict(
+            expected_invalid_dict,
+            layout=dict(expected_invalid_dict["layout"], width="wide"),
+        )
+        assert trace.marker.color == "bogus"
+
+        # Validation is restored on exit
+        with pytest.raises(ValueError):
+            go.Figure(**build_invalid_fig())
+    finally:
+        pio.templates.default = template
+
+
+def check_unknown_update_keys(fig):
+    fig.update_layout(bogus=1, xaxis_bogus=2)
+    fig.update_traces(bogus=3, marker_bogus=4)
+
+    fig_dict = json.loads(fig.to_json())
+    assert fig_dict["layout"]["bogus"] == 1
+    assert fig_dict["layout"]["xaxis"] == {"bogus": 2}
+    assert fig_dict["data"][0]["bogus"] == 3
+    assert fig_dict["data"][0]["marker"] == {"bogus": 4}
+
+
+def test_validate_false_unknown_update_keys():
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        check_unknown_update_keys(go.Figure(go.Scatter(y=[1]), validate=False))
+
+        # Unknown keys are still rejected on validated figures
+        fig = go.Figure(go.Scatter(y=[1]))
+        with pytest.raises(ValueError):
+            fig.update_layout(bogus=1)
+        with pytest.raises(ValueError):
+            fig.update_layout(xaxis_bogus=2)
+        with pytest.raises(ValueError):
+            fig.update_traces(bogus=3)
+        with pytest.raises(ValueError):
+            fig.update_traces(marker_bogus=4)
+    finally:
+        pio.templates.default = template
+
+
+def test_skip_validation_unknown_update_keys():
+    from plotly.utils import skip_validation
+
+    template = pio.templates.default
+    try:
+        pio.templates.default = None
+
+        fig = go.Figure(go.Scatter(y=[1]))
+        with skip_validation():
+            check_unknown_update_keys(fig)
+
+        with pytest.raises(ValueError):
+            fig.update_layout(bogus=5)
+    finally:
+        pio.templates.default = template
@@ -0,0 +1,102 @@
+import pytest
+
+import plotly.graph_objects as go
+from plotly._subplots import _get_subplot_ref_for_trace
+from plotly.subplots import make_subplots
+
+
+def scan_not_empty(fig, xref, yref):
+    # Reference implementation scanning every object of the figure
+    objs = [(t.xaxis, t.yaxis) for t in fig.data if "xaxis" in t]
+    for prop in ["shapes", "annotations", "images"]:
+        objs += [(o.xref, o.yref) for o in fig.layout[prop]]
+    return any((x or "x", y or "y") == (xref, yref) for x, y in objs)
+
+
+def scan_select_traces(fig, row, col):
+    refs = fig._validate_get_grid_ref()[row - 1][col - 1]
+    return [t for t in fig.data if _get_subplot_ref_for_trace(t) in refs]
+
+
+def assert_index_consistent(fig):
+    for row, refs_row in enumerate(fig._validate_get_grid_ref(), 1):
+        for col, refs in enumerate(refs_row, 1):
+            xaxis, yaxis = refs[0].layout_keys
+            xref, yref = xaxis.replace("axis", ""), yaxis.replace("axis", "")
+            assert fig._subplot_not_empty(xref, yref) == scan_not_empty(fig, xref, yref)
+            selected = list(fig.select_traces(row=row, col=col))
+            assert selected == scan_select_traces(fig, row, col)
+
+
+@pytest.fixture
+def fig():
+    fig = make_subplots(3, 3)
+    fig.add_scatter(y=[1], row=1, col=1)
+    fig.add_scatter(y=[2], row=2, col=2)
+    fig.add_bar(y=[3], row=2, col=2)
+    fig.add_pie(values=[1])
+    assert_index_consistent(fig)
+    return fig
+
+
+def test_index_is_reused(fig):
+    index = fig._get_subplot_index()
+    fig.data[0].marker.color = "red"
+    fig.update_shapes(opacity=0.5)
+    assert fig._get_subplot_index() is index
+    assert index["traces"][("x5", "y5")] == 2
+
+
+def test_added_objects_update_the_index(fig):
+    index = fig._get_subplot_index()
+    fig.add_scatter(y=[4], row=3, col=3)
+    fig.add_shape(type="line", row=1, col=2)
+    fig.add_vline(1, row="all", col="all")
+    assert fig._get_subplot_index() is index
+    assert_index_consistent(fig)
+    assert index["shapes"][("x2", "y2")] == 1
+
+
+@pytest.mark.parametrize(
+    "move",
+    [
+        lambda fig: setattr(fig.data[0], "xaxis", "x3"),
+        lambda fig: fig.update_traces(xaxis="x9", yaxis="y9", row=2, col=2),
+        lambda fig: fig.plotly_restyle({"yaxis": "y4", "xaxis": "x4"}, [1]),
+        lambda fig: setattr(fig, "data", fig.data[:0:-1]),
+        lambda fig: fig.layout.shapes[0].update(xref="x6", yref="y6"),
+        lambda fig: fig.plotly_relayout({"shapes[0].xref": "x7"}),
+        lambda fig: fig.update_layout(annotations=[dict(xref="x8", yref="y8")]),
+        lambda fig: setattr(fig, "layout", {}),
+    ],
+)
+def test_moved_objects_discard_the_index(fig, move):
+    fig.add_shape(type="rect", row=3, col=1)
+    fig._get_subplot_index()
+    move(fig)
+    assert_index_consistent(fig)
+
+
+def test_batch_update(fig):
+    fig._get_subplot_index()
+    with fig.batch_update():
+        fig.data[0].xaxis = "x2"
+        fig.data[0].yaxis = "y2"
+        fig.add_shape(type="rect", row=3, col=1)
+    assert_index_consistent(fig)
+
+
+def test_add_traces_excluding_empty_subplots():
+    fig = make_subplots(1, 2)
+    fig.add_scatter(y=[1], row=1, col=2)
+    fig.add_traces(
+        [go.Scatter(y=[2]), go.Scatter(y=[3])],
+        rows=[1, 1],
+        cols=[1, 2],
+        exclude_empty_subplots=True,
+    )
+    assert [t.y for t in fig.data] == [(1,), (3,)]
+    assert [t._trace_ind for t in fig.data] == [0, 1]
+    fig.data[1].name = "kept"
+    assert fig.to_dict()["data"][1]["name"] == "kept"
+    assert_index_consistent(fig)
@@ -1,5 +1,6 @@
 import types
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
@@ -429,3 +430,76 @@ def test_select_annotations_integer(select_annotations_integer):
     assert (len(anns) == 1) and anns[0]["text"] == "B"
     with pytest.raises(IndexError):
         fig.select_annotations(row=2, col=2, selector=3)
+
+
+def make_bulk_figure():
+    fig = make_subplots(2, 2)
+    fig.add_scatter(y=[1, 2], row=1, col=1)
+    fig.add_scatter(y=[1, 2], row=2, col=2)
+    fig.add_shape(type="circle", x0=0, x1=1, y0=0, y1=1)
+    return fig
+
+
+@pytest.mark.parametrize("row,col", [(None, None), (2, 2), ("all", "all")])
+def test_bulk_add_matches_single_adds(row, col):
+    shapes = [dict(type="line", x0=i, x1=i, y0=0, y1=1) for i in range(3)]
+    annotations = [go.layout.Annotation(text=str(i)) for i in range(3)]
+    expected = make_bulk_figure()
+    for shape in shapes:
+        expected.add_shape(shape, row=row, col=col, exclude_empty_subplots=True)
+    for annotation in annotations:
+        expected.add_annotation(annotation, row=row, col=col)
+
+    fig = make_bulk_figure()
+    fig.add_shapes(shapes, row=row, col=col, exclude_empty_subplots=True)
+    fig.add_annotations(annotations, row=row, col=col)
+    assert fig.to_dict() == expected.to_dict()
+
+
+def test_add_vlines_matches_add_vline():
+    annotation = dict(text="event")
+    expected = make_bulk_figure()
+    for x in [1, 2, 3]:
+        expected.add_vline(x, line_dash="dot", annotation=dict(annotation))
+
+    fig = make_bulk_figure()
+    fig.add_vlines([1, 2, 3], line_dash="dot", annotation=annotation)
+    assert fig.to_dict() == expected.to_dict()
+    assert len(fig.layout.shapes) == 7 and len(fig.layout.annotations) == 6
+    assert annotation == dict(text="event")
+
+    fig = go.Figure().add_hlines([1, 2], annotation_text="level")
+    assert [s.y0 for s in fig.layout.shapes] == [1, 2]
+    assert [a.text for a in fig.layout.annotations] == ["level", "level"]
+
+
+def test_add_shapes_messages():
+    fig = go.Figure()
+    fig._send_relayout_msg = MagicMock()
+    fig.add_shape(type="line", x0=0, x1=1)
+    fig.add_shape(type="line", x0=1, x1=2)
+    fig._send_relayout_msg.assert_called_with(
+        {"shapes[1]": {"type": "line", "x0": 1, "x1": 2}}
+    )
+
+    fig.add_shapes([dict(type="rect"), dict(type="circle")])
+    fig._send_relayout_msg.assert_called_with(
+        {
+            "shapes": [
+                {"type": "line", "x0": 0, "x1": 1},
+                {"type": "line", "x0": 1, "x1": 2},
+                {"type": "rect"},
+                {"type": "circle"},
+            ]
+        }
+    )
+    assert [s.type for s in fig.layout.shapes] == ["line", "line", "rect", "circle"]
+    assert all(s.parent is fig.layout for s in fig.layout.shapes)
+
+
+def test_add_shapes_in_batch_mode():
+    fig = go.Figure()
+    fig.add_shape(type="line")
+    with fig.batch_update():
+        fig.add_shapes([dict(type="rect"), dict(type="circle")])
+    assert [s.type for s in fig.layout.shapes] == ["line", "rect", "circle"]
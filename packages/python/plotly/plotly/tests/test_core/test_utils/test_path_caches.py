@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+import plotly.graph_objects as go
+from plotly.basedatatypes import _check_path_in_prop_tree, _str_to_dict_path_full
+from plotly.utils import LRUCache, clear_path_caches, path_cache_info
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_path_caches()
+    yield
+    clear_path_caches()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.info() == (3, 1, 2, 2)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 2, 0)
+
+
+def test_lru_cache_is_thread_safe():
+    class Key(object):
+        # Hashing releases the GIL, so that other threads can evict the entry
+        # between the lookup and the reordering of the entries
+        def __init__(self, value):
+            self.value = value
+
+        def __hash__(self):
+            time.sleep(0)
+            return hash(self.value)
+
+        def __eq__(self, other):
+            return self.value == other.value
+
+    cache = LRUCache(maxsize=2)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(500):
+                key = Key((i + offset) % 3)
+                if cache.get(key) is None:
+                    cache[key] = key
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 500
+    assert info.currsize == 2
+
+
+def test_key_paths_are_cached():
+    parsed = _str_to_dict_path_full("marker.line_color")
+    assert parsed == (("marker", "line", "color"), (0, 7, 12))
+    assert _str_to_dict_path_full("marker.line_color") is parsed
+    info = path_cache_info()["key_paths"]
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_valid_prop_tree_paths_are_cached():
+    scatter = go.Scatter()
+    assert _check_path_in_prop_tree(scatter, "marker.line.color") is None
+    assert _check_path_in_prop_tree(go.Scatter(), "marker.line.color") is None
+    info = path_cache_info()["prop_tree_paths"]
+    assert (info.hits, info.currsize) == (1, 1)
+
+    # Invalid paths are reported each time
+    for _ in range(2):
+        err = _check_path_in_prop_tree(scatter, "marker.bogus", error_cast=ValueError)
+        assert isinstance(err, ValueError)
+        assert "bogus" in err.args[0]
+    assert path_cache_info()["prop_tree_paths"].currsize == 1
+
+
+def test_paths_with_indices_or_layouts_are_not_cached():
+    parcoords = go.Parcoords(dimensions=[{}])
+    assert _check_path_in_prop_tree(parcoords, "dimensions[0].label") is None
+    assert _check_path_in_prop_tree(go.Parcoords(), "dimensions[0].label")
+
+    layout = go.Layout(xaxis2={})
+    assert _check_path_in_prop_tree(layout, "xaxis2.title") is None
+    assert _check_path_in_prop_tree(go.Layout(), "xaxis2.title")
+
+    fig = go.Figure()
+    assert _check_path_in_prop_tree(fig.layout.template, "layout.font") is None
+    assert path_cache_info()["prop_tree_paths"].currsize == 0
+
+
+def test_validators_are_cached():
+    go.Scatter(marker_color="red")
+    go.Scatter(marker_color="blue")
+    info = path_cache_info()["validators"]
+    assert info.hits > 0 and info.misses == info.currsize
@@ -5,6 +5,7 @@ See also relevant tests in
 """
 
 from unittest import mock
+import pytest
 import plotly.io as pio
 from io import StringIO
 from pathlib import Path
@@ -14,7 +15,7 @@ from unittest.mock import Mock
 fig = {"layout": {"title": {"text": "figure title"}}}
 
 
-def test_write_html():
+def test_write_html(tmp_path):
     """Verify that various methods for producing HTML have equivalent results.
 
     The results will not be identical because the div id is pseudorandom. Thus
@@ -23,7 +24,7 @@ def test_write_html():
     We test the results of
     - pio.to_html
     - pio.write_html with a StringIO buffer
-    - pio.write_html with a mock pathlib Path
+    - pio.write_html with a pathlib Path
     - pio.write_html with a mock file descriptor
     """
     # Test pio.to_html
@@ -36,22 +37,35 @@ def test_write_html():
     sio_html = sio.read()
     assert replace_div_id(html) == replace_div_id(sio_html)
 
-    # Test pio.write_html with a mock pathlib Path
-    mock_pathlib_path = Mock(spec=Path)
-    pio.write_html(fig, mock_pathlib_path)
-    mock_pathlib_path.write_text.assert_called_once()
-    pl_html = mock_pathlib_path.write_text.call_args[0][0]
+    # Test pio.write_html with a pathlib Path
+    pathlib_path = tmp_path / "fig.html"
+    pio.write_html(fig, pathlib_path)
+    pl_html = pathlib_path.read_text(encoding="utf-8")
     assert replace_div_id(html) == replace_div_id(pl_html)
 
     # Test pio.write_html with a mock file descriptor
     mock_file_descriptor = Mock()
     del mock_file_descriptor.write_bytes
     pio.write_html(fig, mock_file_descriptor)
-    mock_file_descriptor.write.assert_called_once()
-    (fd_html,) = mock_file_descriptor.write.call_args[0]
+    fd_html = "".join(
+        call.args[0] for call in mock_file_descriptor.write.call_args_list
+    )
     assert replace_div_id(html) == replace_div_id(fd_html)
 
 
+def test_write_html_failure_keeps_existing_file(tmp_path):
+    path = tmp_path / "fig.html"
+    path.write_text("previous")
+
+    # The figure can only be found to be unserializable after the start of
+    # the HTML document has been written
+    with pytest.raises(TypeError):
+        pio.write_html({"data": [{"x": object()}]}, path, validate=False)
+
+    assert path.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
 def replace_div_id(s):
     uuid = re.search(r'<div id="([^"]*)"', s).groups()[0]
     return s.replace(uuid, "XXXX")
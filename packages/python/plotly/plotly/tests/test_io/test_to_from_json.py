@@ -226,21 +226,41 @@ def test_write_json_filelike(fig1, pretty, remove_uids):
 
     # check write contents
     expected = pio.to_json(fig1, pretty=pretty, remove_uids=remove_uids)
-    filemock.write.assert_called_once_with(expected)
+    written = "".join(call.args[0] for call in filemock.write.call_args_list)
+    assert written == expected
 
 
 @pytest.mark.parametrize("pretty", [True, False])
 @pytest.mark.parametrize("remove_uids", [True, False])
-def test_write_json_pathlib(fig1, pretty, remove_uids):
-    # Configure file-like mock
-    filemock = MagicMock(spec=Path)
-
-    # write_json to mock file
-    pio.write_json(fig1, filemock, pretty=pretty, remove_uids=remove_uids)
+def test_write_json_pathlib(fig1, pretty, remove_uids, tmp_path):
+    # write_json to pathlib.Path
+    path = tmp_path / "fig1.json"
+    pio.write_json(fig1, path, pretty=pretty, remove_uids=remove_uids)
 
     # check write contents
     expected = pio.to_json(fig1, pretty=pretty, remove_uids=remove_uids)
-    filemock.write_text.assert_called_once_with(expected)
+    assert path.read_text() == expected
+
+    # No temporary file is left behind
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_write_json_failure_keeps_existing_file(engine, tmp_path):
+    if engine == "orjson":
+        pytest.importorskip("orjson")
+
+    path = tmp_path / "fig.json"
+    path.write_text("previous")
+
+    # The data can only be found to be unserializable after the layout has
+    # been written
+    fig = {"layout": {"title": {"text": "title"}}, "data": [{"x": object()}]}
+    with pytest.raises(TypeError):
+        pio.write_json(fig, path, validate=False, engine=engine)
+
+    assert path.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [path]
 
 
 @pytest.mark.parametrize("pretty", [True, False])
@@ -259,3 +279,43 @@ def test_write_json_from_file_string(fig1, pretty, remove_uids):
         # Check contents that were written
         expected = pio.to_json(fig1, pretty=pretty, remove_uids=remove_uids)
         assert result == expected
+
+
+# trace JSON cache
+# ----------------
+def to_json_uncached(fig, **kwargs):
+    pio.json.config.cache_traces = False
+    try:
+        return pio.to_json(fig, **kwargs)
+    finally:
+        pio.json.config.cache_traces = True
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_to_json_trace_cache(fig1, pretty):
+    fig1.add_scatter(y=[1, 2], name="</script>")
+    fig1.frames = [go.Frame(data=[go.Scatter(y=[3])])]
+
+    assert pio.to_json(fig1, pretty=pretty) == to_json_uncached(fig1, pretty=pretty)
+    cached = fig1.data[0]._json_cache
+
+    # Unchanged traces reuse their JSON
+    fig1.update_layout(title_text="New title")
+    assert pio.to_json(fig1, pretty=pretty) == to_json_uncached(fig1, pretty=pretty)
+    assert fig1.data[0]._json_cache is cached
+
+    # Changed traces are serialized again, whichever way they were changed
+    edits = [
+        lambda: setattr(fig1.data[0].marker, "color", "red"),
+        lambda: fig1.update_traces(opacity=0.5, selector={"type": "scatter"}),
+        lambda: fig1.plotly_restyle({"name": "restyled"}, [2]),
+        lambda: fig1.plotly_relayout({"xaxis.range": [0, 1]}),
+        lambda: fig1.add_annotation(text="first"),
+        lambda: fig1.layout.annotations[0].update(text="annotation"),
+    ]
+    for edit in edits:
+        edit()
+        assert pio.to_json(fig1, pretty=pretty) == to_json_uncached(fig1, pretty=pretty)
+        assert pio.json.to_json_plotly(fig1) == pio.json.to_json_plotly(fig1.to_dict())
+
+    assert fig1.data[0]._json_cache is not cached
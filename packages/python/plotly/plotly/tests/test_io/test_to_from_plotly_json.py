@@ -221,6 +221,24 @@ def test_datetime_arrays(datetime_array, engine, pretty):
     check_roundtrip(result, engine=engine, pretty=pretty)
 
 
+def test_validated_datetime_series(engine, pretty):
+    dates = pd.Series(
+        pd.to_datetime(
+            ["2020-01-01 00:00:00", "2020-01-01 12:30:00.25", None], format="ISO8601"
+        )
+    )
+    fig = go.Figure(go.Scatter(x=dates, y=[1, 2, 3]))
+    assert fig.data[0].x.dtype == "datetime64[ns]"
+
+    result = pio.to_json_plotly(fig, engine=engine, pretty=pretty)
+    assert json.loads(result)["data"][0]["x"] == [
+        "2020-01-01T00:00:00.000000",
+        "2020-01-01T12:30:00.250000",
+        None,
+    ]
+    check_roundtrip(result, engine=engine, pretty=pretty)
+
+
 def test_object_array(engine, pretty):
     fig = px.scatter(px.data.tips(), x="total_bill", y="tip", custom_data=["sex"])
     result = fig.to_plotly_json()
@@ -259,3 +277,105 @@ def test_sanitize_json(engine):
     for bad, good in replacements.items():
         assert bad not in fig_json
         assert good in fig_json
+
+
+# Typed array tests
+@pytest.mark.parametrize(
+    "dtype",
+    ["int8", "uint8", "int16", "uint16", "int32", "uint32", "float32", "float64"],
+)
+def test_typed_array_roundtrip(dtype, engine):
+    fig = go.Figure(
+        [
+            go.Scatter(x=np.arange(6, dtype=dtype), y=np.arange(6, dtype=dtype)[::-1]),
+            go.Heatmap(z=np.arange(6, dtype=dtype).reshape(2, 3)),
+        ]
+    )
+    result = pio.to_json(fig, engine=engine, typed_arrays=True)
+    fig_dict = json.loads(result)
+
+    x = fig_dict["data"][0]["x"]
+    assert set(x) == {"dtype", "bdata"}
+    assert fig_dict["data"][1]["z"]["shape"] == "2, 3"
+
+    fig2 = pio.from_json(result, engine=engine)
+    np.testing.assert_array_equal(fig2.data[0].x, fig.data[0].x)
+    np.testing.assert_array_equal(fig2.data[0].y, fig.data[0].y)
+    np.testing.assert_array_equal(fig2.data[1].z, fig.data[1].z)
+
+
+def test_typed_array_int64_downcast():
+    from _plotly_utils.utils import to_typed_array_spec
+
+    assert to_typed_array_spec(np.array([1, 2, 3], dtype="int64"))["dtype"] == "i1"
+    assert to_typed_array_spec(np.array([0, 300], dtype="int64"))["dtype"] == "i2"
+    assert to_typed_array_spec(np.array([0, 2**31], dtype="int64"))["dtype"] == "u4"
+
+    # Values that do not fit in 32 bits are left untouched
+    big = np.array([-1, 2**40], dtype="int64")
+    assert to_typed_array_spec(big) is big
+
+
+def test_typed_array_skipped_values(engine):
+    fig = go.Figure(
+        go.Scatter(x=np.array([1.0, 2.0]), text=np.array(["a", "b"])),
+        layout=dict(xaxis_range=np.array([0.0, 3.0])),
+    )
+    fig_dict = json.loads(pio.to_json(fig, engine=engine, typed_arrays=True))
+    assert "bdata" in fig_dict["data"][0]["x"]
+    assert fig_dict["data"][0]["text"] == ["a", "b"]
+    assert fig_dict["layout"]["xaxis"]["range"] == [0.0, 3.0]
+
+
+def test_typed_array_config_default(engine):
+    fig = go.Figure(go.Scatter(y=np.array([1.0, 2.0])))
+    assert not pio.config.typed_arrays
+    assert json.loads(pio.to_json(fig, engine=engine))["data"][0]["y"] == [1.0, 2.0]
+
+    pio.config.typed_arrays = True
+    try:
+        assert "bdata" in json.loads(pio.to_json(fig, engine=engine))["data"][0]["y"]
+        assert pio.to_json(fig, engine=engine, typed_arrays=False).count("bdata") == 0
+    finally:
+        pio.config.typed_arrays = False
+
+    with pytest.raises(ValueError):
+        pio.config.typed_arrays = "yes"
+
+
+def test_typed_array_does_not_modify_input():
+    y = np.array([1.0, 2.0])
+    fig_dict = {"data": [{"type": "scatter", "y": y}], "layout": {}}
+    pio.to_json(fig_dict, validate=False, typed_arrays=True)
+    assert fig_dict["data"][0]["y"] is y
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_iter_json_plotly_matches_to_json_plotly(engine, pretty, monkeypatch):
+    import plotly.io._json
+
+    # Use a small chunk size so that arrays are encoded in several slices
+    monkeypatch.setattr(plotly.io._json, "_json_chunk_size", 3)
+
+    fig_dict = {
+        "data": [
+            {
+                "type": "heatmap",
+                "z": np.arange(20, dtype="float64").reshape(5, 4),
+                "x": list(range(7)),
+                "text": np.array(["a</b>", "<b>", "c/d", "e", " "]),
+                "customdata": [[1, "a"], [2, "b"]],
+            },
+            {"type": "scatter", "y": np.array([1.0, np.nan, np.inf, 4.0, 5.0])},
+        ],
+        "layout": {
+            "title": {"text": "</script>"},
+            "xaxis": {},
+            "annotations": [{"text": "one"}, {"text": "two"}],
+        },
+        "frames": [],
+    }
+
+    chunks = list(pio.iter_json_plotly(fig_dict, pretty=pretty, engine=engine))
+    assert len(chunks) > 1
+    assert "".join(chunks) == pio.to_json_plotly(fig_dict, pretty=pretty, engine=engine)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import plotly.graph_objects as go
+from plotly.basedatatypes import _copy_props
+
+
+def test_copy_props_shares_readonly_arrays():
+    arr = np.arange(5.0)
+    arr.flags["WRITEABLE"] = False
+    props = {"x": arr, "marker": {"size": [1, 2]}, "text": ["a", "b"]}
+
+    copied = _copy_props(props)
+    assert copied["x"] is arr
+    assert copied["marker"] is not props["marker"]
+    assert copied["marker"]["size"] is not props["marker"]["size"]
+    assert copied["text"] is not props["text"]
+
+
+def test_copy_props_copies_writeable_arrays():
+    arr = np.arange(5.0)
+    copied = _copy_props({"x": arr})
+    assert copied["x"] is not arr
+    np.testing.assert_array_equal(copied["x"], arr)
+
+
+def test_figure_shares_array_payloads():
+    x = np.arange(10.0)
+    scatter = go.Scatter(x=x, y=x)
+    fig = go.Figure(data=[scatter])
+    fig.add_trace(go.Scatter(x=x))
+
+    # Trace objects, figure data and exported dicts all share the buffer that
+    # was produced when the value was validated
+    stored = fig.data[0].x
+    assert not np.shares_memory(stored, x)
+    assert fig._data[0]["x"] is stored
+    assert fig.to_dict()["data"][0]["x"] is stored
+    assert fig.data[0].to_plotly_json()["x"] is stored
+    assert fig._data[1]["x"] is fig.data[1].x
+
+
+def test_exported_dicts_are_independent():
+    fig = go.Figure(go.Scatter(x=np.arange(3.0), marker={"color": "red"}))
+    fig_dict = fig.to_dict()
+    fig_dict["data"][0]["marker"]["color"] = "blue"
+    fig_dict["data"][0].pop("x")
+
+    assert fig.data[0].marker.color == "red"
+    assert fig.data[0].x is not None
+
+    with pytest.raises(ValueError):
+        fig_dict = fig.to_dict()
+        fig_dict["data"][0]["x"][0] = 10
@@ -0,0 +1,93 @@
+import json
+
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+from plotly.basedatatypes import BasePlotlyType
+
+vals_equal = BasePlotlyType._vals_equal
+
+
+@pytest.mark.parametrize(
+    "v1,v2,expected",
+    [
+        (np.arange(5), np.arange(5), True),
+        (np.arange(5), np.arange(5.0), True),
+        (np.arange(5), np.arange(6), False),
+        (np.arange(5), np.arange(1, 6), False),
+        (np.array([0, 1, 2, 3, 4]), np.array([0, 1, 7, 3, 4]), False),
+        (np.array([0, 1, 7, 3, 4]), np.array([0, 9, 7, 3, 4]), False),
+        (np.arange(6).reshape(2, 3), np.arange(6).reshape(3, 2), False),
+        (np.array(["a", "b", "c", "d"]), np.array(["a", "b", "c", "d"]), True),
+        (np.array(["a", "b", "c", "d"]), np.arange(4), False),
+        (np.arange(4).astype("datetime64[D]"), np.arange(4).astype("m8[D]"), False),
+        (np.array([1.0, np.nan, 2.0, 3.0]), np.array([1.0, np.nan, 2.0, 3.0]), False),
+        (np.arange(4), [0, 1, 2, 3], True),
+        ([0, 1, 2, 3], np.arange(4), True),
+        ([1, 2, 3], [1, 2, 3], True),
+        ([1, 2, 3], (1, 2, 3), True),
+        ([1, 2, 3], [1, 2, 4], False),
+        (
+            [np.arange(3), {"a": np.arange(2)}],
+            [np.arange(3), {"a": np.arange(2)}],
+            True,
+        ),
+        (
+            [np.arange(3), {"a": np.arange(2)}],
+            [np.arange(3), {"a": np.arange(3)}],
+            False,
+        ),
+        ({"a": [1, 2]}, {"a": (1, 2)}, True),
+    ],
+)
+def test_vals_equal(v1, v2, expected):
+    assert vals_equal(v1, v2) is expected
+
+
+def test_vals_equal_same_memory():
+    values = np.array([1.0, np.nan, 3.0, 4.0])
+    assert vals_equal(values, values)
+
+    # Distinct views of writeable memory may have been modified in place
+    writeable = np.arange(4.0)
+    assert not vals_equal(writeable, writeable.view())
+    assert not vals_equal(writeable, writeable[:])
+
+    # Views of read-only memory are equal without an elementwise comparison
+    values.flags.writeable = False
+    assert vals_equal(values, values.view())
+    assert not vals_equal(values[::2], values[:2])
+
+
+def test_assigning_same_array_is_not_a_change():
+    values = np.random.random(1000)
+    fig = go.Figure(go.Scatter(y=values))
+    version = fig.data[0]._version
+    fig.data[0].y = fig.data[0].y
+    assert fig.data[0]._version == version
+
+    values[500] = -1
+    fig.data[0].y = values
+    assert fig.data[0]._version == version + 1
+
+
+def test_assigning_modified_no_copy_array_is_a_change():
+    from plotly.utils import no_copy
+
+    values = np.random.random(1000)
+    with no_copy():
+        fig = go.Figure(go.Scatter(y=values))
+        version = fig.data[0]._version
+        callback_values = []
+        fig.data[0].on_change(lambda trace, y: callback_values.append(y), "y")
+        fig.to_json()
+
+        # The caller modifies the array in place and assigns it again
+        values[500] = -1
+        fig.data[0].y = values
+
+    assert fig.data[0]._version == version + 1
+    assert len(callback_values) == 1
+    assert fig.data[0].y[500] == -1
+    assert json.loads(fig.to_json())["data"][0]["y"][500] == -1
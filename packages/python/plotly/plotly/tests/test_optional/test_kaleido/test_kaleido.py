@@ -1,4 +1,5 @@
 import plotly.io as pio
+import pytest
 import plotly.io.kaleido
 from contextlib import contextmanager
 from io import BytesIO
@@ -163,3 +164,40 @@ def test_bytesio():
     bio_bytes = bio.read()
     to_image_bytes = pio.to_image(fig, format="jpg", engine="kaleido", validate=False)
     assert bio_bytes == to_image_bytes
+
+
+def test_write_images(tmp_path):
+    figs = [
+        {"layout": {"title": {"text": "figure %d" % i}}, "data": []} for i in range(5)
+    ]
+    paths = [tmp_path / ("fig%d.svg" % i) for i in range(4)]
+    bio = BytesIO()
+
+    pio.write_images(
+        (f for f in figs), paths + [bio], format=None, validate=False, workers=2
+    )
+
+    for i, path in enumerate(paths):
+        svg = path.read_bytes()
+        assert svg.startswith(b"<svg")
+        assert b"figure %d" % i in svg
+
+    # Writeable objects use the default format of the scope, which is png
+    assert bio.getvalue().startswith(b"\x89PNG")
+
+
+def test_write_images_errors(tmp_path):
+    with pytest.raises(ValueError, match="same length"):
+        pio.write_images([fig, fig], [tmp_path / "fig.png"])
+
+    # Lengths of iterators are only known once one of them is exhausted
+    with pytest.raises(ValueError, match="more figures than files"):
+        pio.write_images((f for f in [fig, fig]), iter([tmp_path / "fig.png"]))
+
+    with pytest.raises(ValueError, match="more files than figures"):
+        pio.write_images(
+            (f for f in [fig]), iter([tmp_path / "a.png", tmp_path / "b.png"])
+        )
+
+    with pytest.raises(ValueError, match="workers"):
+        pio.write_images([fig], [tmp_path / "fig.png"], workers=0)
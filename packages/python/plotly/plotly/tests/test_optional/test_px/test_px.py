@@ -275,6 +275,20 @@ def test_orthogonal_orderings(days, times):
     assert_orderings(days, days, times, times)
 
 
+def test_groups_keep_row_order():
+    df = px.data.tips()
+    original = df.copy()
+    fig = px.scatter(df, x="total_bill", y="tip", color="day", symbol="time")
+    for trace in fig.data:
+        day, time = trace.name.split(", ")
+        group = df[(df["day"] == day) & (df["time"] == time)]
+        assert list(trace.x) == list(group["total_bill"])
+        assert list(trace.y) == list(group["tip"])
+
+    px.ecdf(df, x="total_bill", color="day")
+    assert df.equals(original)
+
+
 def test_permissive_defaults():
     msg = "'PxDefaults' object has no attribute 'should_not_work'"
     with pytest.raises(AttributeError, match=msg):
@@ -316,3 +330,35 @@ def test_render_mode():
     fig = px.density_contour(df, x="gdpPercap", y="lifeExp", trendline="ols")
     assert fig.data[0].type == "histogram2dcontour"
     assert fig.data[1].type == "scatter"
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample(method):
+    n = 20000
+    x = np.arange(n)
+    y = np.sin(x / 100.0) + np.random.random(n)
+    extra = np.random.random(n)
+    fig = px.line(
+        x=x, y=y, hover_data=dict(extra=extra), downsample=method, max_points=500
+    )
+    trace = fig.data[0]
+    assert 3 <= len(trace.x) <= 500
+    assert trace.x[0] == 0 and trace.x[-1] == n - 1
+    assert np.all(np.diff(trace.x) > 0)
+    # per-point arrays are reduced consistently
+    assert np.array_equal(trace.y, y[trace.x])
+    assert np.array_equal(trace.customdata[:, 0], extra[trace.x])
+    if method == "minmax":
+        assert y.argmax() in trace.x and y.argmin() in trace.x
+
+    source = fig._downsample_sources[trace.uid]
+    assert source["method"] == method and source["max_points"] == 500
+    assert len(source["arrays"]["y"]) == n
+
+    # small traces are left alone
+    fig = px.scatter(x=x[:100], y=y[:100], downsample=method, max_points=500)
+    assert len(fig.data[0].x) == 100
+    assert fig.data[0].uid is None
+
+    with pytest.raises(ValueError, match="Invalid downsample method"):
+        px.scatter(x=x, y=y, downsample="mean")
@@ -371,6 +371,52 @@ def test_build_df_with_hover_data_from_vaex_and_polars(test_lib, hover_data):
     )
 
 
+@pytest.mark.parametrize("test_lib", ["pyarrow", "polars"])
+def test_build_df_from_arrow_backed_frames(test_lib):
+    lib = pytest.importorskip(test_lib)
+    pytest.importorskip("pyarrow")
+
+    iris_pandas = px.data.iris()
+    if test_lib == "pyarrow":
+        iris_native = lib.Table.from_pandas(iris_pandas, preserve_index=False)
+    else:
+        iris_native = lib.from_pandas(iris_pandas)
+    args = dict(
+        data_frame=iris_native, x="petal_width", y="sepal_length", color="species"
+    )
+    out = build_dataframe(args, go.Scatter)
+    assert set(out["data_frame"].columns) == {"petal_width", "sepal_length", "species"}
+    assert_frame_equal(
+        iris_pandas[out["data_frame"].columns], out["data_frame"], check_dtype=False
+    )
+
+    fig = px.scatter_matrix(iris_native)
+    assert len(fig.data[0].dimensions) == len(iris_pandas.columns)
+
+
+def test_build_df_column_pruning_is_logged(caplog):
+    df = px.data.iris()
+    args = dict(
+        data_frame=df, x="petal_width", y="sepal_length", hover_data=["species"]
+    )
+    with caplog.at_level("DEBUG", logger="plotly.express._core"):
+        out = build_dataframe(args, go.Scatter)
+    assert set(out["data_frame"].columns) == {"petal_width", "sepal_length", "species"}
+    assert "keeps 3 of the 6 data_frame columns (3 pruned)" in caplog.text
+
+
+def test_necessary_columns_only_match_column_args():
+    from plotly.express._core import _necessary_columns
+
+    columns = [0, 1, 2, 3, "a"]
+    # Non-column arguments such as bools and ints must not match integer labels
+    args = dict(data_frame=None, x=2, y="a", log_x=True, nbins=3, hover_data=[3, False])
+    assert _necessary_columns(args, columns) == [2, 3, "a"]
+
+    args = dict(data_frame=None, x=0, markers=True, facet_col_wrap=1, color=None)
+    assert _necessary_columns(args, columns) == [0]
+
+
 def test_timezones():
     df = pd.DataFrame({"date": ["2015-04-04 19:31:30+1:00"], "value": [3]})
     df["date"] = pd.to_datetime(df["date"])
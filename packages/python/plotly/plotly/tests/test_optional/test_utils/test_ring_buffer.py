@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import plotly.graph_objs as go
+from _plotly_utils.ring_buffer import RingBuffer
+
+
+def test_ring_buffer_append_and_window():
+    ring = RingBuffer(5, "float64")
+    assert len(ring.append([])) == 0
+    assert np.array_equal(ring.append([1, 2, 3]), [1, 2, 3])
+    assert np.array_equal(ring.append([4, 5, 6]), [2, 3, 4, 5, 6])
+
+    expected = list(range(2, 7))
+    for i in range(7, 20):
+        window = ring.append([i] * (i % 4))
+        expected = (expected + [i] * (i % 4))[-5:]
+        assert np.array_equal(window, expected)
+        assert np.array_equal(ring.window(2), expected[-2:])
+
+    assert np.array_equal(ring.append(np.arange(12)), np.arange(7, 12))
+    assert len(ring) == 5
+    assert not ring.window().flags.writeable
+
+
+def test_ring_buffer_invalid_capacity():
+    with pytest.raises(ValueError, match="capacity"):
+        RingBuffer(0, "float64")
+
+
+def test_streamed_trace_uses_ring_buffer():
+    fig = go.Figure(go.Scatter(x=np.arange(3), y=np.zeros(3)))
+    trace = fig.data[0]
+
+    trace.extend(x=[3, 4], y=np.ones(2), max_points=4)
+    ring, window = trace._ring_buffers["y"]
+    assert ring.capacity == 4
+    assert fig._data[0]["y"] is window
+    assert np.array_equal(trace.x, [1, 2, 3, 4])
+    assert np.array_equal(trace.y, [0, 0, 1, 1])
+
+    for i in range(5, 12):
+        trace.extend(x=[i], y=[i], max_points=4)
+    assert trace._ring_buffers["y"][0] is ring
+    assert np.array_equal(trace.x, [8, 9, 10, 11])
+    assert np.array_equal(trace.y, [8, 9, 10, 11])
+
+    # Assigning the property starts a new ring buffer on the next extend
+    trace.y = [0.5, 0.5]
+    trace.extend(y=np.ones(1), max_points=4)
+    assert trace._ring_buffers["y"][0] is not ring
+    assert np.array_equal(trace.y, [0.5, 0.5, 1])
+
+    # Strings are not streamed through ring buffers
+    trace.text = np.array(["a"])
+    trace.extend(text=np.array(["b"]), max_points=4)
+    assert "text" not in trace._ring_buffers
+    assert list(trace.text) == ["a", "b"]
+
+
+def test_streamed_dates_are_promoted():
+    trace = go.Scatter(x=np.array(["2020-01-01"], dtype="datetime64[D]"))
+    trace.extend(x=np.array(["2020-01-02T12:00"], dtype="datetime64[m]"), max_points=3)
+    assert trace.x.dtype == "datetime64[m]"
+    assert trace.x[-1] == np.datetime64("2020-01-02T12:00")
+
+
+def test_streamed_values_handed_out_are_snapshots():
+    fig = go.Figure(go.Scatter(y=np.zeros(3)))
+    trace = fig.data[0]
+    trace.extend(y=[1], max_points=4)
+
+    fig_dict = fig.to_dict()
+    fig_copy = go.Figure(fig)
+    y = trace.y
+    trace.extend(y=[2], max_points=4)
+
+    assert fig_dict["data"][0]["y"].tolist() == [0, 0, 0, 1]
+    assert fig_copy.data[0].y.tolist() == [0, 0, 0, 1]
+    assert y.tolist() == [0, 0, 0, 1]
+    assert not y.flags.writeable
+    assert trace.y.tolist() == [0, 0, 1, 2]
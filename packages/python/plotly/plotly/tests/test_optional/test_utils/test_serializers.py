@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from plotly.serializers import _js_to_py, _py_to_js
+
+
+def roundtrip(v):
+    # Buffers reach the JavaScript side (and come back) as bytes
+    spec = _py_to_js(v, None)
+    received = dict(spec, buffer=spec["buffer"].tobytes())
+    return spec, _js_to_py(received, None)
+
+
+@pytest.mark.parametrize(
+    "array,dtype",
+    [
+        (np.arange(5, dtype="int16"), "int16"),
+        (np.arange(5, dtype="float32"), "float32"),
+        (np.arange(12, dtype="float64").reshape(3, 4), "float64"),
+        (np.arange(24, dtype="uint8").reshape(2, 3, 4), "uint8"),
+        (np.arange(6, dtype="int64").reshape(2, 3), "int32"),
+        (np.arange(6, dtype="uint64"), "uint32"),
+        (np.array([-(2**40), 1], dtype="int64"), "float64"),
+        (np.arange(4, dtype="float16"), "float32"),
+        (np.arange(8, dtype=">f8")[::2], "float64"),
+        (np.arange(12, dtype="int32").reshape(3, 4).T, "int32"),
+    ],
+)
+def test_numeric_arrays_are_sent_as_buffers(array, dtype):
+    spec, result = roundtrip(array)
+    assert spec["dtype"] == dtype
+    assert spec["shape"] == array.shape
+    assert isinstance(spec["buffer"], memoryview)
+    assert spec["buffer"].c_contiguous
+    assert result.shape == array.shape
+    np.testing.assert_array_equal(result, array)
+
+
+def test_datetime_arrays_are_sent_as_epoch_ms():
+    array = np.array(
+        ["2020-01-01T12:30:00.123456", "NaT", "1969-12-31"], dtype="datetime64[us]"
+    )
+    spec, result = roundtrip(array)
+    assert spec["dtype"] == "datetime64[ms]"
+    values = np.frombuffer(spec["buffer"], dtype="float64")
+    assert values[0] == 1577881800123.0
+    assert np.isnan(values[1])
+    assert values[2] == -86400000.0
+    np.testing.assert_array_equal(result, array.astype("datetime64[ms]"))
+
+
+@pytest.mark.parametrize(
+    "array",
+    [np.array([True, False]), np.array(["a", "b"]), np.array([1, "a"], dtype=object)],
+)
+def test_other_arrays_are_sent_as_lists(array):
+    assert _py_to_js(array, None) == array.tolist()
+
+
+def test_nested_arrays():
+    msg = {"z": [np.ones((2, 2))], "x": (np.arange(2),), "name": "a"}
+    result = _py_to_js(msg, None)
+    assert result["name"] == "a"
+    assert result["z"][0]["shape"] == (2, 2)
+    assert result["x"][0]["dtype"] == "int32"
+
+
+def test_js_typed_array_is_decoded():
+    msg = {
+        "data": [{"y": {"value": memoryview(b"\x01\x00\x02\x00"), "dtype": "int16"}}],
+        "selected": {"dtype": "int16", "shape": [2], "value": b"\x01\x00\x02\x00"},
+        "not_a_buffer": {"dtype": "int16", "shape": [2], "value": "text"},
+    }
+    result = _js_to_py(msg, None)
+    assert result["data"][0]["y"]["dtype"] == "int16"
+    np.testing.assert_array_equal(result["selected"], [1, 2])
+    assert result["not_a_buffer"]["value"] == "text"
+
+
+def test_js_buffer_is_checked_against_shape():
+    # Extra trailing bytes (e.g. a buffer shared with other rows) are ignored
+    buffer = np.arange(6, dtype="<f4").tobytes()
+    spec = {"dtype": "float32", "shape": [2, 2], "value": buffer}
+    np.testing.assert_array_equal(_js_to_py(spec, None), [[0, 1], [2, 3]])
+
+    spec = {"dtype": "datetime64[ms]", "shape": [1], "value": buffer[:16]}
+    assert _js_to_py(spec, None).shape == (1,)
+
+    # A buffer that is too small for the shape is an error, not a misread
+    with pytest.raises(ValueError, match="too small"):
+        _js_to_py({"dtype": "float32", "shape": [3, 3], "value": buffer}, None)
@@ -342,11 +342,22 @@ class TestJSONEncoder(TestCase):
         a = pd.date_range("2011-07-11", "2011-07-13", freq="D").values
         j1 = _json.dumps(a, cls=utils.PlotlyJSONEncoder)
         assert (
-            j1 == '["2011-07-11T00:00:00.000000000", '
-            '"2011-07-12T00:00:00.000000000", '
-            '"2011-07-13T00:00:00.000000000"]'
+            j1 == '["2011-07-11T00:00:00", '
+            '"2011-07-12T00:00:00", '
+            '"2011-07-13T00:00:00"]'
         )
 
+    def test_numpy_datetime64_fractional_seconds_and_nat(self):
+        a = pd.to_datetime(["2011-07-11 00:00:00.5", None, "2011-07-11 00:00:01.0"])
+        j1 = _json.dumps(a.values, cls=utils.PlotlyJSONEncoder)
+        assert (
+            j1 == '["2011-07-11T00:00:00.500000", null, "2011-07-11T00:00:01.000000"]'
+        )
+
+        a = np.array(["2011-07-11T00:00:00.000000001"], dtype="datetime64[ns]")
+        j1 = _json.dumps(a, cls=utils.PlotlyJSONEncoder)
+        assert j1 == '["2011-07-11T00:00:00.000000001"]'
+
     def test_pil_image_encoding(self):
         import _plotly_utils
 
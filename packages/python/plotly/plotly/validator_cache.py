@@ -1,15 +1,17 @@
 import importlib
 from _plotly_utils.basevalidators import LiteralValidator
+from _plotly_utils.utils import path_caches
 
 
 class ValidatorCache(object):
-    _cache = {}
+    _cache = path_caches["validators"]
 
     @staticmethod
     def get_validator(parent_path, prop_name):
 
         key = (parent_path, prop_name)
-        if key not in ValidatorCache._cache:
+        validator = ValidatorCache._cache.get(key)
+        if validator is None:
 
             if "." not in parent_path and prop_name == "type":
                 # Special case for .type property of traces
@@ -31,4 +33,4 @@ class ValidatorCache(object):
                 )(plotly_name=prop_name)
             ValidatorCache._cache[key] = validator
 
-        return ValidatorCache._cache[key]
+        return validator
@@ -1,321 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ScattergeoValidator(_plotly_utils.basevalidators.CompoundValidator):
-    def __init__(self, plotly_name="scattergeo", parent_name="", **kwargs):
-        super(ScattergeoValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            data_class_str=kwargs.pop("data_class_str", "Scattergeo"),
-            data_docs=kwargs.pop(
-                "data_docs",
-                """
-            connectgaps
-                Determines whether or not gaps (i.e. {nan} or
-                missing values) in the provided data arrays are
-                connected.
-            customdata
-                Assigns extra data each datum. This may be
-                useful when listening to hover, click and
-                selection events. Note that, "scatter" traces
-                also appends customdata items in the markers
-                DOM elements
-            customdatasrc
-                Sets the source reference on Chart Studio Cloud
-                for `customdata`.
-            featureidkey
-                Sets the key in GeoJSON features which is used
-                as id to match the items included in the
-                `locations` array. Only has an effect when
-                `geojson` is set. Support nested property, for
-                example "properties.name".
-            fill
-                Sets the area to fill with a solid color. Use
-                with `fillcolor` if not "none". "toself"
-                connects the endpoints of the trace (or each
-                segment of the trace if it has gaps) into a
-                closed shape.
-            fillcolor
-                Sets the fill color. Defaults to a half-
-                transparent variant of the line color, marker
-                color, or marker line color, whichever is
-                available.
-            geo
-                Sets a reference between this trace's
-                geospatial coordinates and a geographic map. If
-                "geo" (the default value), the geospatial
-                coordinates refer to `layout.geo`. If "geo2",
-                the geospatial coordinates refer to
-                `layout.geo2`, and so on.
-            geojson
-                Sets optional GeoJSON data associated with this
-                trace. If not given, the features on the base
-                map are used when `locations` is set. It can be
-                set as a valid GeoJSON object or as a URL
-                string. Note that we only accept GeoJSONs of
-                type "FeatureCollection" or "Feature" with
-                geometries of type "Polygon" or "MultiPolygon".
-            hoverinfo
-                Determines which trace information appear on
-                hover. If `none` or `skip` are set, no
-                information is displayed upon hovering. But, if
-                `none` is set, click and hover events are still
-                fired.
-            hoverinfosrc
-                Sets the source reference on Chart Studio Cloud
-                for `hoverinfo`.
-            hoverlabel
-                :class:`plotly.graph_objects.scattergeo.Hoverla
-                bel` instance or dict with compatible
-                properties
-            hovertemplate
-                Template string used for rendering the
-                information that appear on hover box. Note that
-                this will override `hoverinfo`. Variables are
-                inserted using %{variable}, for example "y:
-                %{y}" as well as %{xother}, {%_xother},
-                {%_xother_}, {%xother_}. When showing info for
-                several points, "xother" will be added to those
-                with different x positions from the first
-                point. An underscore before or after
-                "(x|y)other" will add a space on that side,
-                only when this field is shown. Numbers are
-                formatted using d3-format's syntax
-                %{variable:d3-format}, for example "Price:
-                %{y:$.2f}". https://github.com/d3/d3-
-                format/tree/v1.4.5#d3-format for details on the
-                formatting syntax. Dates are formatted using
-                d3-time-format's syntax %{variable|d3-time-
-                format}, for example "Day: %{2019-01-01|%A}".
-                https://github.com/d3/d3-time-
-                format/tree/v2.2.3#locale_format for details on
-                the date formatting syntax. The variables
-                available in `hovertemplate` are the ones
-                emitted as event data described at this link
-                https://plotly.com/javascript/plotlyjs-
-                events/#event-data. Additionally, every
-                attributes that can be specified per-point (the
-                ones that are `arrayOk: true`) are available.
-                Anything contained in tag `<extra>` is
-                displayed in the secondary box, for example
-                "<extra>{fullData.name}</extra>". To hide the
-                secondary box completely, use an empty tag
-                `<extra></extra>`.
-            hovertemplatesrc
-                Sets the source reference on Chart Studio Cloud
-                for `hovertemplate`.
-            hovertext
-                Sets hover text elements associated with each
-                (lon,lat) pair or item in `locations`. If a
-                single string, the same string appears over all
-                the data points. If an array of string, the
-                items are mapped in order to the this trace's
-                (lon,lat) or `locations` coordinates. To be
-                seen, trace `hoverinfo` must contain a "text"
-                flag.
-            hovertextsrc
-                Sets the source reference on Chart Studio Cloud
-                for `hovertext`.
-            ids
-                Assigns id labels to each datum. These ids for
-                object constancy of data points during
-                animation. Should be an array of strings, not
-                numbers or any other type.
-            idssrc
-                Sets the source reference on Chart Studio Cloud
-                for `ids`.
-            lat
-                Sets the latitude coordinates (in degrees
-                North).
-            latsrc
-                Sets the source reference on Chart Studio Cloud
-                for `lat`.
-            legend
-                Sets the reference to a legend to show this
-                trace in. References to these legends are
-                "legend", "legend2", "legend3", etc. Settings
-                for these legends are set in the layout, under
-                `layout.legend`, `layout.legend2`, etc.
-            legendgroup
-                Sets the legend group for this trace. Traces
-                and shapes part of the same legend group
-                hide/show at the same time when toggling legend
-                items.
-            legendgrouptitle
-                :class:`plotly.graph_objects.scattergeo.Legendg
-                rouptitle` instance or dict with compatible
-                properties
-            legendrank
-                Sets the legend rank for this trace. Items and
-                groups with smaller ranks are presented on
-                top/left side while with "reversed"
-                `legend.traceorder` they are on bottom/right
-                side. The default legendrank is 1000, so that
-                you can use ranks less than 1000 to place
-                certain items before all unranked items, and
-                ranks greater than 1000 to go after all
-                unranked items. When having unranked or equal
-                rank items shapes would be displayed after
-                traces i.e. according to their order in data
-                and layout.
-            legendwidth
-                Sets the width (in px or fraction) of the
-                legend for this trace.
-            line
-                :class:`plotly.graph_objects.scattergeo.Line`
-                instance or dict with compatible properties
-            locationmode
-                Determines the set of locations used to match
-                entries in `locations` to regions on the map.
-                Values "ISO-3", "USA-states", *country names*
-                correspond to features on the base map and
-                value "geojson-id" corresponds to features from
-                a custom GeoJSON linked to the `geojson`
-                attribute.
-            locations
-                Sets the coordinates via location IDs or names.
-                Coordinates correspond to the centroid of each
-                location given. See `locationmode` for more
-                info.
-            locationssrc
-                Sets the source reference on Chart Studio Cloud
-                for `locations`.
-            lon
-                Sets the longitude coordinates (in degrees
-                East).
-            lonsrc
-                Sets the source reference on Chart Studio Cloud
-                for `lon`.
-            marker
-                :class:`plotly.graph_objects.scattergeo.Marker`
-                instance or dict with compatible properties
-            meta
-                Assigns extra meta information associated with
-                this trace that can be used in various text
-                attributes. Attributes such as trace `name`,
-                graph, axis and colorbar `title.text`,
-                annotation `text` `rangeselector`,
-                `updatemenues` and `sliders` `label` text all
-                support `meta`. To access the trace `meta`
-                values in an attribute in the same trace,
-                simply use `%{meta[i]}` where `i` is the index
-                or key of the `meta` item in question. To
-                access trace `meta` in layout attributes, use
-                `%{data[n[.meta[i]}` where `i` is the index or
-                key of the `meta` and `n` is the trace index.
-            metasrc
-                Sets the source reference on Chart Studio Cloud
-                for `meta`.
-            mode
-                Determines the drawing mode for this scatter
-                trace. If the provided `mode` includes "text"
-                then the `text` elements appear at the
-                coordinates. Otherwise, the `text` elements
-                appear on hover. If there are less than 20
-                points and the trace is not stacked then the
-                default is "lines+markers". Otherwise, "lines".
-            name
-                Sets the trace name. The trace name appears as
-                the legend item and on hover.
-            opacity
-                Sets the opacity of the trace.
-            selected
-                :class:`plotly.graph_objects.scattergeo.Selecte
-                d` instance or dict with compatible properties
-            selectedpoints
-                Array containing integer indices of selected
-                points. Has an effect only for traces that
-                support selections. Note that an empty array
-                means an empty selection where the `unselected`
-                are turned on for all points, whereas, any
-                other non-array values means no selection all
-                where the `selected` and `unselected` styles
-                have no effect.
-            showlegend
-                Determines whether or not an item corresponding
-                to this trace is shown in the legend.
-            stream
-                :class:`plotly.graph_objects.scattergeo.Stream`
-                instance or dict with compatible properties
-            text
-                Sets text elements associated with each
-                (lon,lat) pair or item in `locations`. If a
-                single string, the same string appears over all
-                the data points. If an array of string, the
-                items are mapped in order to the this trace's
-                (lon,lat) or `locations` coordinates. If trace
-                `hoverinfo` contains a "text" flag and
-                "hovertext" is not set, these elements will be
-                seen in the hover labels.
-            textfont
-                Sets the text font.
-            textposition
-                Sets the positions of the `text` elements with
-                respects to the (x,y) coordinates.
-            textpositionsrc
-                Sets the source reference on Chart Studio Cloud
-                for `textposition`.
-            textsrc
-                Sets the source reference on Chart Studio Cloud
-                for `text`.
-            texttemplate
-                Template string used for rendering the
-                information text that appear on points. Note
-                that this will override `textinfo`. Variables
-                are inserted using %{variable}, for example "y:
-                %{y}". Numbers are formatted using d3-format's
-                syntax %{variable:d3-format}, for example
-                "Price: %{y:$.2f}". https://github.com/d3/d3-
-                format/tree/v1.4.5#d3-format for details on the
-                formatting syntax. Dates are formatted using
-                d3-time-format's syntax %{variable|d3-time-
-                format}, for example "Day: %{2019-01-01|%A}".
-                https://github.com/d3/d3-time-
-                format/tree/v2.2.3#locale_format for details on
-                the date formatting syntax. Every attributes
-                that can be specified per-point (the ones that
-                are `arrayOk: true`) are available. Finally,
-                the template string has access to variables
-                `lat`, `lon`, `location` and `text`.
-            texttemplatesrc
-                Sets the source reference on Chart Studio Cloud
-                for `texttemplate`.
-            uid
-                Assign an id to this trace, Use this to provide
-                object constancy between traces during
-                animations and transitions.
-            uirevision
-                Controls persistence of some user-driven
-                changes to the trace: `constraintrange` in
-                `parcoords` traces, as well as some `editable:
-                true` modifications such as `name` and
-                `colorbar.title`. Defaults to
-                `layout.uirevision`. Note that other user-
-                driven trace attribute changes are controlled
-                by `layout` attributes: `trace.visible` is
-                controlled by `layout.legend.uirevision`,
-                `selectedpoints` is controlled by
-                `layout.selectionrevision`, and
-                `colorbar.(x|y)` (accessible with `config:
-                {editable: true}`) is controlled by
-                `layout.editrevision`. Trace changes are
-                tracked by `uid`, which only falls back on
-                trace index if no `uid` is provided. So if your
-                app can add/remove traces before the end of the
-                `data` array, such that the same trace has a
-                different index, you can still preserve user-
-                driven changes if you give each trace a `uid`
-                that stays with it as it moves.
-            unselected
-                :class:`plotly.graph_objects.scattergeo.Unselec
-                ted` instance or dict with compatible
-                properties
-            visible
-                Determines whether or not this trace is
-                visible. If "legendonly", the trace is not
-                drawn, but can appear as a legend item
-                (provided that the legend itself is visible).
-""",
-            ),
-            **kwargs,
-        )
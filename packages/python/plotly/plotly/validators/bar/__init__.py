@@ -1,161 +1,1035 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._zorder import ZorderValidator
-    from ._ysrc import YsrcValidator
-    from ._yperiodalignment import YperiodalignmentValidator
-    from ._yperiod0 import Yperiod0Validator
-    from ._yperiod import YperiodValidator
-    from ._yhoverformat import YhoverformatValidator
-    from ._ycalendar import YcalendarValidator
-    from ._yaxis import YaxisValidator
-    from ._y0 import Y0Validator
-    from ._y import YValidator
-    from ._xsrc import XsrcValidator
-    from ._xperiodalignment import XperiodalignmentValidator
-    from ._xperiod0 import Xperiod0Validator
-    from ._xperiod import XperiodValidator
-    from ._xhoverformat import XhoverformatValidator
-    from ._xcalendar import XcalendarValidator
-    from ._xaxis import XaxisValidator
-    from ._x0 import X0Validator
-    from ._x import XValidator
-    from ._widthsrc import WidthsrcValidator
-    from ._width import WidthValidator
-    from ._visible import VisibleValidator
-    from ._unselected import UnselectedValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._texttemplatesrc import TexttemplatesrcValidator
-    from ._texttemplate import TexttemplateValidator
-    from ._textsrc import TextsrcValidator
-    from ._textpositionsrc import TextpositionsrcValidator
-    from ._textposition import TextpositionValidator
-    from ._textfont import TextfontValidator
-    from ._textangle import TextangleValidator
-    from ._text import TextValidator
-    from ._stream import StreamValidator
-    from ._showlegend import ShowlegendValidator
-    from ._selectedpoints import SelectedpointsValidator
-    from ._selected import SelectedValidator
-    from ._outsidetextfont import OutsidetextfontValidator
-    from ._orientation import OrientationValidator
-    from ._opacity import OpacityValidator
-    from ._offsetsrc import OffsetsrcValidator
-    from ._offsetgroup import OffsetgroupValidator
-    from ._offset import OffsetValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._marker import MarkerValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._insidetextfont import InsidetextfontValidator
-    from ._insidetextanchor import InsidetextanchorValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hovertemplatesrc import HovertemplatesrcValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._error_y import Error_YValidator
-    from ._error_x import Error_XValidator
-    from ._dy import DyValidator
-    from ._dx import DxValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._constraintext import ConstraintextValidator
-    from ._cliponaxis import CliponaxisValidator
-    from ._basesrc import BasesrcValidator
-    from ._base import BaseValidator
-    from ._alignmentgroup import AlignmentgroupValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar",
+    {
+        "ZorderValidator": (
+            "zorder",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "YsrcValidator": (
+            "ysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YperiodalignmentValidator": (
+            "yperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Yperiod0Validator": (
+            "yperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "YperiodValidator": (
+            "yperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "YhoverformatValidator": (
+            "yhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YcalendarValidator": (
+            "ycalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "YaxisValidator": (
+            "yaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "y",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "Y0Validator": (
+            "y0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "anim": True,
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "anim": True,
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XsrcValidator": (
+            "xsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XperiodalignmentValidator": (
+            "xperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Xperiod0Validator": (
+            "xperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XperiodValidator": (
+            "xperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XhoverformatValidator": (
+            "xhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XcalendarValidator": (
+            "xcalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "XaxisValidator": (
+            "xaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "x",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "X0Validator": (
+            "x0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "anim": True,
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "anim": True,
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "WidthsrcValidator": (
+            "widthsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UnselectedValidator": (
+            "unselected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Unselected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.bar.unselected.Mar
+                ker` instance or dict with compatible
+                properties
+            textfont
+                :class:`plotly.graph_objects.bar.unselected.Tex
+                tfont` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "anim": True,
+                "edit_type": "plot",
+            },
+        ),
+        "TexttemplatesrcValidator": (
+            "texttemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TexttemplateValidator": (
+            "texttemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextpositionsrcValidator": (
+            "textpositionsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextpositionValidator": (
+            "textposition",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "values": ["inside", "outside", "auto", "none"],
+            },
+        ),
+        "TextfontValidator": (
+            "textfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Textfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._zorder.ZorderValidator",
-            "._ysrc.YsrcValidator",
-            "._yperiodalignment.YperiodalignmentValidator",
-            "._yperiod0.Yperiod0Validator",
-            "._yperiod.YperiodValidator",
-            "._yhoverformat.YhoverformatValidator",
-            "._ycalendar.YcalendarValidator",
-            "._yaxis.YaxisValidator",
-            "._y0.Y0Validator",
-            "._y.YValidator",
-            "._xsrc.XsrcValidator",
-            "._xperiodalignment.XperiodalignmentValidator",
-            "._xperiod0.Xperiod0Validator",
-            "._xperiod.XperiodValidator",
-            "._xhoverformat.XhoverformatValidator",
-            "._xcalendar.XcalendarValidator",
-            "._xaxis.XaxisValidator",
-            "._x0.X0Validator",
-            "._x.XValidator",
-            "._widthsrc.WidthsrcValidator",
-            "._width.WidthValidator",
-            "._visible.VisibleValidator",
-            "._unselected.UnselectedValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._texttemplatesrc.TexttemplatesrcValidator",
-            "._texttemplate.TexttemplateValidator",
-            "._textsrc.TextsrcValidator",
-            "._textpositionsrc.TextpositionsrcValidator",
-            "._textposition.TextpositionValidator",
-            "._textfont.TextfontValidator",
-            "._textangle.TextangleValidator",
-            "._text.TextValidator",
-            "._stream.StreamValidator",
-            "._showlegend.ShowlegendValidator",
-            "._selectedpoints.SelectedpointsValidator",
-            "._selected.SelectedValidator",
-            "._outsidetextfont.OutsidetextfontValidator",
-            "._orientation.OrientationValidator",
-            "._opacity.OpacityValidator",
-            "._offsetsrc.OffsetsrcValidator",
-            "._offsetgroup.OffsetgroupValidator",
-            "._offset.OffsetValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._marker.MarkerValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._insidetextfont.InsidetextfontValidator",
-            "._insidetextanchor.InsidetextanchorValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hovertemplatesrc.HovertemplatesrcValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._error_y.Error_YValidator",
-            "._error_x.Error_XValidator",
-            "._dy.DyValidator",
-            "._dx.DxValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._constraintext.ConstraintextValidator",
-            "._cliponaxis.CliponaxisValidator",
-            "._basesrc.BasesrcValidator",
-            "._base.BaseValidator",
-            "._alignmentgroup.AlignmentgroupValidator",
-        ],
-    )
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "TextangleValidator": (
+            "textangle",
+            "_plotly_utils.basevalidators.AngleValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "SelectedpointsValidator": (
+            "selectedpoints",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SelectedValidator": (
+            "selected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Selected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.bar.selected.Marke
+                r` instance or dict with compatible properties
+            textfont
+                :class:`plotly.graph_objects.bar.selected.Textf
+                ont` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "OutsidetextfontValidator": (
+            "outsidetextfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Outsidetextfont",
+                "data_docs": """
+            color
+
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "values": ["v", "h"],
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "OffsetsrcValidator": (
+            "offsetsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "OffsetgroupValidator": (
+            "offsetgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "OffsetValidator": (
+            "offset",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `marker.colorscale`. Has an
+                effect only if in `marker.color` is set to a
+                numerical array. In case `colorscale` is
+                unspecified or `autocolorscale` is true, the
+                default palette will be chosen according to
+                whether numbers in the `color` array are all
+                positive, all negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                in `marker.color`) or the bounds set in
+                `marker.cmin` and `marker.cmax` Has an effect
+                only if in `marker.color` is set to a numerical
+                array. Defaults to `false` when `marker.cmin`
+                and `marker.cmax` are set by the user.
+            cmax
+                Sets the upper bound of the color domain. Has
+                an effect only if in `marker.color` is set to a
+                numerical array. Value should have the same
+                units as in `marker.color` and if set,
+                `marker.cmin` must be set as well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `marker.cmin` and/or `marker.cmax` to
+                be equidistant to this point. Has an effect
+                only if in `marker.color` is set to a numerical
+                array. Value should have the same units as in
+                `marker.color`. Has no effect when
+                `marker.cauto` is `false`.
+            cmin
+                Sets the lower bound of the color domain. Has
+                an effect only if in `marker.color` is set to a
+                numerical array. Value should have the same
+                units as in `marker.color` and if set,
+                `marker.cmax` must be set as well.
+            color
+                Sets the marker color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `marker.cmin` and `marker.cmax` if set.
+            coloraxis
+                Sets a reference to a shared color axis.
+                References to these shared color axes are
+                "coloraxis", "coloraxis2", "coloraxis3", etc.
+                Settings for these shared color axes are set in
+                the layout, under `layout.coloraxis`,
+                `layout.coloraxis2`, etc. Note that multiple
+                color scales can be linked to the same color
+                axis.
+            colorbar
+                :class:`plotly.graph_objects.bar.marker.ColorBa
+                r` instance or dict with compatible properties
+            colorscale
+                Sets the colorscale. Has an effect only if in
+                `marker.color` is set to a numerical array. The
+                colorscale must be an array containing arrays
+                mapping a normalized value to an rgb, rgba,
+                hex, hsl, hsv, or named color string. At
+                minimum, a mapping for the lowest (0) and
+                highest (1) values are required. For example,
+                `[[0, 'rgb(0,0,255)'], [1, 'rgb(255,0,0)']]`.
+                To control the bounds of the colorscale in
+                color space, use `marker.cmin` and
+                `marker.cmax`. Alternatively, `colorscale` may
+                be a palette name string of the following list:
+                Blackbody,Bluered,Blues,Cividis,Earth,Electric,
+                Greens,Greys,Hot,Jet,Picnic,Portland,Rainbow,Rd
+                Bu,Reds,Viridis,YlGnBu,YlOrRd.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            cornerradius
+                Sets the rounding of corners. May be an integer
+                number of pixels, or a percentage of bar width
+                (as a string ending in %). Defaults to
+                `layout.barcornerradius`. In stack or relative
+                barmode, the first trace to set cornerradius is
+                used for the whole stack.
+            line
+                :class:`plotly.graph_objects.bar.marker.Line`
+                instance or dict with compatible properties
+            opacity
+                Sets the opacity of the bars.
+            opacitysrc
+                Sets the source reference on Chart Studio Cloud
+                for `opacity`.
+            pattern
+                Sets the pattern within the marker.
+            reversescale
+                Reverses the color mapping if true. Has an
+                effect only if in `marker.color` is set to a
+                numerical array. If true, `marker.cmin` will
+                correspond to the last color in the array and
+                `marker.cmax` will correspond to the first
+                color.
+            showscale
+                Determines whether or not a colorbar is
+                displayed for this trace. Has an effect only if
+                in `marker.color` is set to a numerical array.
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "InsidetextfontValidator": (
+            "insidetextfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Insidetextfont",
+                "data_docs": """
+            color
+
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "InsidetextanchorValidator": (
+            "insidetextanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["end", "middle", "start"],
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "anim": True,
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+        "HovertemplatesrcValidator": (
+            "hovertemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["x", "y", "z", "text", "name"],
+            },
+        ),
+        "Error_YValidator": (
+            "error_y",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "ErrorY",
+                "data_docs": """
+            array
+                Sets the data corresponding the length of each
+                error bar. Values are plotted relative to the
+                underlying data.
+            arrayminus
+                Sets the data corresponding the length of each
+                error bar in the bottom (left) direction for
+                vertical (horizontal) bars Values are plotted
+                relative to the underlying data.
+            arrayminussrc
+                Sets the source reference on Chart Studio Cloud
+                for `arrayminus`.
+            arraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `array`.
+            color
+                Sets the stoke color of the error bars.
+            symmetric
+                Determines whether or not the error bars have
+                the same length in both direction (top/bottom
+                for vertical bars, left/right for horizontal
+                bars.
+            thickness
+                Sets the thickness (in px) of the error bars.
+            traceref
+
+            tracerefminus
+
+            type
+                Determines the rule used to generate the error
+                bars. If *constant`, the bar lengths are of a
+                constant value. Set this constant in `value`.
+                If "percent", the bar lengths correspond to a
+                percentage of underlying data. Set this
+                percentage in `value`. If "sqrt", the bar
+                lengths correspond to the square of the
+                underlying data. If "data", the bar lengths are
+                set with data set `array`.
+            value
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars.
+            valueminus
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars in the bottom
+                (left) direction for vertical (horizontal) bars
+            visible
+                Determines whether or not this set of error
+                bars is visible.
+            width
+                Sets the width (in px) of the cross-bar at both
+                ends of the error bars.
+""",
+            },
+        ),
+        "Error_XValidator": (
+            "error_x",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "ErrorX",
+                "data_docs": """
+            array
+                Sets the data corresponding the length of each
+                error bar. Values are plotted relative to the
+                underlying data.
+            arrayminus
+                Sets the data corresponding the length of each
+                error bar in the bottom (left) direction for
+                vertical (horizontal) bars Values are plotted
+                relative to the underlying data.
+            arrayminussrc
+                Sets the source reference on Chart Studio Cloud
+                for `arrayminus`.
+            arraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `array`.
+            color
+                Sets the stoke color of the error bars.
+            copy_ystyle
+
+            symmetric
+                Determines whether or not the error bars have
+                the same length in both direction (top/bottom
+                for vertical bars, left/right for horizontal
+                bars.
+            thickness
+                Sets the thickness (in px) of the error bars.
+            traceref
+
+            tracerefminus
+
+            type
+                Determines the rule used to generate the error
+                bars. If *constant`, the bar lengths are of a
+                constant value. Set this constant in `value`.
+                If "percent", the bar lengths correspond to a
+                percentage of underlying data. Set this
+                percentage in `value`. If "sqrt", the bar
+                lengths correspond to the square of the
+                underlying data. If "data", the bar lengths are
+                set with data set `array`.
+            value
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars.
+            valueminus
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars in the bottom
+                (left) direction for vertical (horizontal) bars
+            visible
+                Determines whether or not this set of error
+                bars is visible.
+            width
+                Sets the width (in px) of the cross-bar at both
+                ends of the error bars.
+""",
+            },
+        ),
+        "DyValidator": (
+            "dy",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "anim": True,
+                "edit_type": "calc",
+            },
+        ),
+        "DxValidator": (
+            "dx",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "anim": True,
+                "edit_type": "calc",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ConstraintextValidator": (
+            "constraintext",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["inside", "outside", "both", "none"],
+            },
+        ),
+        "CliponaxisValidator": (
+            "cliponaxis",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "BasesrcValidator": (
+            "basesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "BaseValidator": (
+            "base",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "AlignmentgroupValidator": (
+            "alignmentgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ShowlegendValidator(_plotly_utils.basevalidators.BooleanValidator):
-    def __init__(self, plotly_name="showlegend", parent_name="bar", **kwargs):
-        super(ShowlegendValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "style"),
-            **kwargs,
-        )
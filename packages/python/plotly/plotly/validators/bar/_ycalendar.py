@@ -1,32 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class YcalendarValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(self, plotly_name="ycalendar", parent_name="bar", **kwargs):
-        super(YcalendarValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            values=kwargs.pop(
-                "values",
-                [
-                    "chinese",
-                    "coptic",
-                    "discworld",
-                    "ethiopian",
-                    "gregorian",
-                    "hebrew",
-                    "islamic",
-                    "jalali",
-                    "julian",
-                    "mayan",
-                    "nanakshahi",
-                    "nepali",
-                    "persian",
-                    "taiwan",
-                    "thai",
-                    "ummalqura",
-                ],
-            ),
-            **kwargs,
-        )
@@ -1,43 +1,121 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._width import WidthValidator
-    from ._visible import VisibleValidator
-    from ._valueminus import ValueminusValidator
-    from ._value import ValueValidator
-    from ._type import TypeValidator
-    from ._tracerefminus import TracerefminusValidator
-    from ._traceref import TracerefValidator
-    from ._thickness import ThicknessValidator
-    from ._symmetric import SymmetricValidator
-    from ._copy_ystyle import Copy_YstyleValidator
-    from ._color import ColorValidator
-    from ._arraysrc import ArraysrcValidator
-    from ._arrayminussrc import ArrayminussrcValidator
-    from ._arrayminus import ArrayminusValidator
-    from ._array import ArrayValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._width.WidthValidator",
-            "._visible.VisibleValidator",
-            "._valueminus.ValueminusValidator",
-            "._value.ValueValidator",
-            "._type.TypeValidator",
-            "._tracerefminus.TracerefminusValidator",
-            "._traceref.TracerefValidator",
-            "._thickness.ThicknessValidator",
-            "._symmetric.SymmetricValidator",
-            "._copy_ystyle.Copy_YstyleValidator",
-            "._color.ColorValidator",
-            "._arraysrc.ArraysrcValidator",
-            "._arrayminussrc.ArrayminussrcValidator",
-            "._arrayminus.ArrayminusValidator",
-            "._array.ArrayValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.error_x",
+    {
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ValueminusValidator": (
+            "valueminus",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "ValueValidator": (
+            "value",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["percent", "constant", "sqrt", "data"],
+            },
+        ),
+        "TracerefminusValidator": (
+            "tracerefminus",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "TracerefValidator": (
+            "traceref",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "ThicknessValidator": (
+            "thickness",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "SymmetricValidator": (
+            "symmetric",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "Copy_YstyleValidator": (
+            "copy_ystyle",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "ArraysrcValidator": (
+            "arraysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ArrayminussrcValidator": (
+            "arrayminussrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ArrayminusValidator": (
+            "arrayminus",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ArrayValidator": (
+            "array",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
@@ -1,31 +1,126 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._namelengthsrc import NamelengthsrcValidator
-    from ._namelength import NamelengthValidator
-    from ._font import FontValidator
-    from ._bordercolorsrc import BordercolorsrcValidator
-    from ._bordercolor import BordercolorValidator
-    from ._bgcolorsrc import BgcolorsrcValidator
-    from ._bgcolor import BgcolorValidator
-    from ._alignsrc import AlignsrcValidator
-    from ._align import AlignValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.hoverlabel",
+    {
+        "NamelengthsrcValidator": (
+            "namelengthsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "NamelengthValidator": (
+            "namelength",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "min": -1,
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._namelengthsrc.NamelengthsrcValidator",
-            "._namelength.NamelengthValidator",
-            "._font.FontValidator",
-            "._bordercolorsrc.BordercolorsrcValidator",
-            "._bordercolor.BordercolorValidator",
-            "._bgcolorsrc.BgcolorsrcValidator",
-            "._bgcolor.BgcolorValidator",
-            "._alignsrc.AlignsrcValidator",
-            "._align.AlignValidator",
-        ],
-    )
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "BordercolorsrcValidator": (
+            "bordercolorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "BordercolorValidator": (
+            "bordercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "BgcolorsrcValidator": (
+            "bgcolorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "AlignsrcValidator": (
+            "alignsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "AlignValidator": (
+            "align",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "values": ["left", "right", "auto"],
+            },
+        ),
+    },
+    [],
+)
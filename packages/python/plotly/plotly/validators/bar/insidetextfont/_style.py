@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class StyleValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(self, plotly_name="style", parent_name="bar.insidetextfont", **kwargs):
-        super(StyleValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            array_ok=kwargs.pop("array_ok", True),
-            edit_type=kwargs.pop("edit_type", "calc"),
-            values=kwargs.pop("values", ["normal", "italic"]),
-            **kwargs,
-        )
@@ -1,15 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class FamilyValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(
-        self, plotly_name="family", parent_name="bar.legendgrouptitle.font", **kwargs
-    ):
-        super(FamilyValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "style"),
-            no_blank=kwargs.pop("no_blank", True),
-            strict=kwargs.pop("strict", True),
-            **kwargs,
-        )
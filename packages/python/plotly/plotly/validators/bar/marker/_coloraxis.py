@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ColoraxisValidator(_plotly_utils.basevalidators.SubplotidValidator):
-    def __init__(self, plotly_name="coloraxis", parent_name="bar.marker", **kwargs):
-        super(ColoraxisValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            dflt=kwargs.pop("dflt", None),
-            edit_type=kwargs.pop("edit_type", "calc"),
-            regex=kwargs.pop("regex", "/^coloraxis([2-9]|[1-9][0-9]+)?$/"),
-            **kwargs,
-        )
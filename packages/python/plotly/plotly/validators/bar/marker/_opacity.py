@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class OpacityValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(self, plotly_name="opacity", parent_name="bar.marker", **kwargs):
-        super(OpacityValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            array_ok=kwargs.pop("array_ok", True),
-            edit_type=kwargs.pop("edit_type", "style"),
-            max=kwargs.pop("max", 1),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ShowscaleValidator(_plotly_utils.basevalidators.BooleanValidator):
-    def __init__(self, plotly_name="showscale", parent_name="bar.marker", **kwargs):
-        super(ShowscaleValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            **kwargs,
-        )
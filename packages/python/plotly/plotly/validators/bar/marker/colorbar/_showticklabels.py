@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ShowticklabelsValidator(_plotly_utils.basevalidators.BooleanValidator):
-    def __init__(
-        self, plotly_name="showticklabels", parent_name="bar.marker.colorbar", **kwargs
-    ):
-        super(ShowticklabelsValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            **kwargs,
-        )
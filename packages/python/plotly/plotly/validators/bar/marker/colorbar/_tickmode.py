@@ -1,15 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TickmodeValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self, plotly_name="tickmode", parent_name="bar.marker.colorbar", **kwargs
-    ):
-        super(TickmodeValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            implied_edits=kwargs.pop("implied_edits", {}),
-            values=kwargs.pop("values", ["auto", "linear", "array"]),
-            **kwargs,
-        )
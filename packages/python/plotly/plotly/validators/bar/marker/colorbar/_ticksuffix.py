@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TicksuffixValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(
-        self, plotly_name="ticksuffix", parent_name="bar.marker.colorbar", **kwargs
-    ):
-        super(TicksuffixValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            **kwargs,
-        )
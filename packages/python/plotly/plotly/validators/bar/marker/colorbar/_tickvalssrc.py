@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TickvalssrcValidator(_plotly_utils.basevalidators.SrcValidator):
-    def __init__(
-        self, plotly_name="tickvalssrc", parent_name="bar.marker.colorbar", **kwargs
-    ):
-        super(TickvalssrcValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "none"),
-            **kwargs,
-        )
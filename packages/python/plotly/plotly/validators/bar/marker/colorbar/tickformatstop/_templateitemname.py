@@ -1,16 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TemplateitemnameValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(
-        self,
-        plotly_name="templateitemname",
-        parent_name="bar.marker.colorbar.tickformatstop",
-        **kwargs,
-    ):
-        super(TemplateitemnameValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            **kwargs,
-        )
@@ -1,15 +1,61 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._text import TextValidator
-    from ._side import SideValidator
-    from ._font import FontValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.marker.colorbar.title",
+    {
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "SideValidator": (
+            "side",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["right", "top", "bottom"],
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        ["._text.TextValidator", "._side.SideValidator", "._font.FontValidator"],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class SideValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self, plotly_name="side", parent_name="bar.marker.colorbar.title", **kwargs
-    ):
-        super(SideValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            values=kwargs.pop("values", ["right", "top", "bottom"]),
-            **kwargs,
-        )
@@ -1,25 +1,64 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._weight import WeightValidator
-    from ._variant import VariantValidator
-    from ._style import StyleValidator
-    from ._size import SizeValidator
-    from ._family import FamilyValidator
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._weight.WeightValidator",
-            "._variant.VariantValidator",
-            "._style.StyleValidator",
-            "._size.SizeValidator",
-            "._family.FamilyValidator",
-            "._color.ColorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.marker.colorbar.title.font",
+    {
+        "WeightValidator": (
+            "weight",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["normal", "bold"],
+            },
+        ),
+        "VariantValidator": (
+            "variant",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": [
+                    "normal",
+                    "small-caps",
+                    "all-small-caps",
+                    "all-petite-caps",
+                    "petite-caps",
+                    "unicase",
+                ],
+            },
+        ),
+        "StyleValidator": (
+            "style",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["normal", "italic"],
+            },
+        ),
+        "SizeValidator": (
+            "size",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 1,
+            },
+        ),
+        "FamilyValidator": (
+            "family",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "colorbars",
+                "no_blank": True,
+                "strict": True,
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+    },
+    [],
+)
@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class BgcolorValidator(_plotly_utils.basevalidators.ColorValidator):
-    def __init__(
-        self, plotly_name="bgcolor", parent_name="bar.marker.pattern", **kwargs
-    ):
-        super(BgcolorValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            array_ok=kwargs.pop("array_ok", True),
-            edit_type=kwargs.pop("edit_type", "style"),
-            **kwargs,
-        )
@@ -1,37 +1,112 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._weightsrc import WeightsrcValidator
-    from ._weight import WeightValidator
-    from ._variantsrc import VariantsrcValidator
-    from ._variant import VariantValidator
-    from ._stylesrc import StylesrcValidator
-    from ._style import StyleValidator
-    from ._sizesrc import SizesrcValidator
-    from ._size import SizeValidator
-    from ._familysrc import FamilysrcValidator
-    from ._family import FamilyValidator
-    from ._colorsrc import ColorsrcValidator
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._weightsrc.WeightsrcValidator",
-            "._weight.WeightValidator",
-            "._variantsrc.VariantsrcValidator",
-            "._variant.VariantValidator",
-            "._stylesrc.StylesrcValidator",
-            "._style.StyleValidator",
-            "._sizesrc.SizesrcValidator",
-            "._size.SizeValidator",
-            "._familysrc.FamilysrcValidator",
-            "._family.FamilyValidator",
-            "._colorsrc.ColorsrcValidator",
-            "._color.ColorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.outsidetextfont",
+    {
+        "WeightsrcValidator": (
+            "weightsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "WeightValidator": (
+            "weight",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "values": ["normal", "bold"],
+            },
+        ),
+        "VariantsrcValidator": (
+            "variantsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "VariantValidator": (
+            "variant",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "values": [
+                    "normal",
+                    "small-caps",
+                    "all-small-caps",
+                    "all-petite-caps",
+                    "petite-caps",
+                    "unicase",
+                ],
+            },
+        ),
+        "StylesrcValidator": (
+            "stylesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "StyleValidator": (
+            "style",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "values": ["normal", "italic"],
+            },
+        ),
+        "SizesrcValidator": (
+            "sizesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SizeValidator": (
+            "size",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "min": 1,
+            },
+        ),
+        "FamilysrcValidator": (
+            "familysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "FamilyValidator": (
+            "family",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "no_blank": True,
+                "strict": True,
+            },
+        ),
+        "ColorsrcValidator": (
+            "colorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+    },
+    [],
+)
@@ -1,11 +1,16 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._color.ColorValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.selected.textfont",
+    {
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "style",
+            },
+        )
+    },
+    [],
+)
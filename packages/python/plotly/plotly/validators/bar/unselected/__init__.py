@@ -1,12 +1,36 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._textfont import TextfontValidator
-    from ._marker import MarkerValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._textfont.TextfontValidator", "._marker.MarkerValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "bar.unselected",
+    {
+        "TextfontValidator": (
+            "textfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Textfont",
+                "data_docs": """
+            color
+                Sets the text font color of unselected points,
+                applied only when a selection exists.
+""",
+            },
+        ),
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            color
+                Sets the marker color of unselected points,
+                applied only when a selection exists.
+            opacity
+                Sets the marker opacity of unselected points,
+                applied only when a selection exists.
+""",
+            },
+        ),
+    },
+    [],
+)
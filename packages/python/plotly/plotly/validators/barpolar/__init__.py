@@ -1,107 +1,529 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._widthsrc import WidthsrcValidator
-    from ._width import WidthValidator
-    from ._visible import VisibleValidator
-    from ._unselected import UnselectedValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._thetaunit import ThetaunitValidator
-    from ._thetasrc import ThetasrcValidator
-    from ._theta0 import Theta0Validator
-    from ._theta import ThetaValidator
-    from ._textsrc import TextsrcValidator
-    from ._text import TextValidator
-    from ._subplot import SubplotValidator
-    from ._stream import StreamValidator
-    from ._showlegend import ShowlegendValidator
-    from ._selectedpoints import SelectedpointsValidator
-    from ._selected import SelectedValidator
-    from ._rsrc import RsrcValidator
-    from ._r0 import R0Validator
-    from ._r import RValidator
-    from ._opacity import OpacityValidator
-    from ._offsetsrc import OffsetsrcValidator
-    from ._offset import OffsetValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._marker import MarkerValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hovertemplatesrc import HovertemplatesrcValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._dtheta import DthetaValidator
-    from ._dr import DrValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._basesrc import BasesrcValidator
-    from ._base import BaseValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._widthsrc.WidthsrcValidator",
-            "._width.WidthValidator",
-            "._visible.VisibleValidator",
-            "._unselected.UnselectedValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._thetaunit.ThetaunitValidator",
-            "._thetasrc.ThetasrcValidator",
-            "._theta0.Theta0Validator",
-            "._theta.ThetaValidator",
-            "._textsrc.TextsrcValidator",
-            "._text.TextValidator",
-            "._subplot.SubplotValidator",
-            "._stream.StreamValidator",
-            "._showlegend.ShowlegendValidator",
-            "._selectedpoints.SelectedpointsValidator",
-            "._selected.SelectedValidator",
-            "._rsrc.RsrcValidator",
-            "._r0.R0Validator",
-            "._r.RValidator",
-            "._opacity.OpacityValidator",
-            "._offsetsrc.OffsetsrcValidator",
-            "._offset.OffsetValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._marker.MarkerValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hovertemplatesrc.HovertemplatesrcValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._dtheta.DthetaValidator",
-            "._dr.DrValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._basesrc.BasesrcValidator",
-            "._base.BaseValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "barpolar",
+    {
+        "WidthsrcValidator": (
+            "widthsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UnselectedValidator": (
+            "unselected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Unselected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.barpolar.unselecte
+                d.Marker` instance or dict with compatible
+                properties
+            textfont
+                :class:`plotly.graph_objects.barpolar.unselecte
+                d.Textfont` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ThetaunitValidator": (
+            "thetaunit",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "values": ["radians", "degrees", "gradians"],
+            },
+        ),
+        "ThetasrcValidator": (
+            "thetasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "Theta0Validator": (
+            "theta0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "ThetaValidator": (
+            "theta",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "SubplotValidator": (
+            "subplot",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "polar",
+                "edit_type": "calc",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "SelectedpointsValidator": (
+            "selectedpoints",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SelectedValidator": (
+            "selected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Selected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.barpolar.selected.
+                Marker` instance or dict with compatible
+                properties
+            textfont
+                :class:`plotly.graph_objects.barpolar.selected.
+                Textfont` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "RsrcValidator": (
+            "rsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "R0Validator": (
+            "r0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "RValidator": (
+            "r",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "OffsetsrcValidator": (
+            "offsetsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "OffsetValidator": (
+            "offset",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `marker.colorscale`. Has an
+                effect only if in `marker.color` is set to a
+                numerical array. In case `colorscale` is
+                unspecified or `autocolorscale` is true, the
+                default palette will be chosen according to
+                whether numbers in the `color` array are all
+                positive, all negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                in `marker.color`) or the bounds set in
+                `marker.cmin` and `marker.cmax` Has an effect
+                only if in `marker.color` is set to a numerical
+                array. Defaults to `false` when `marker.cmin`
+                and `marker.cmax` are set by the user.
+            cmax
+                Sets the upper bound of the color domain. Has
+                an effect only if in `marker.color` is set to a
+                numerical array. Value should have the same
+                units as in `marker.color` and if set,
+                `marker.cmin` must be set as well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `marker.cmin` and/or `marker.cmax` to
+                be equidistant to this point. Has an effect
+                only if in `marker.color` is set to a numerical
+                array. Value should have the same units as in
+                `marker.color`. Has no effect when
+                `marker.cauto` is `false`.
+            cmin
+                Sets the lower bound of the color domain. Has
+                an effect only if in `marker.color` is set to a
+                numerical array. Value should have the same
+                units as in `marker.color` and if set,
+                `marker.cmax` must be set as well.
+            color
+                Sets the marker color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `marker.cmin` and `marker.cmax` if set.
+            coloraxis
+                Sets a reference to a shared color axis.
+                References to these shared color axes are
+                "coloraxis", "coloraxis2", "coloraxis3", etc.
+                Settings for these shared color axes are set in
+                the layout, under `layout.coloraxis`,
+                `layout.coloraxis2`, etc. Note that multiple
+                color scales can be linked to the same color
+                axis.
+            colorbar
+                :class:`plotly.graph_objects.barpolar.marker.Co
+                lorBar` instance or dict with compatible
+                properties
+            colorscale
+                Sets the colorscale. Has an effect only if in
+                `marker.color` is set to a numerical array. The
+                colorscale must be an array containing arrays
+                mapping a normalized value to an rgb, rgba,
+                hex, hsl, hsv, or named color string. At
+                minimum, a mapping for the lowest (0) and
+                highest (1) values are required. For example,
+                `[[0, 'rgb(0,0,255)'], [1, 'rgb(255,0,0)']]`.
+                To control the bounds of the colorscale in
+                color space, use `marker.cmin` and
+                `marker.cmax`. Alternatively, `colorscale` may
+                be a palette name string of the following list:
+                Blackbody,Bluered,Blues,Cividis,Earth,Electric,
+                Greens,Greys,Hot,Jet,Picnic,Portland,Rainbow,Rd
+                Bu,Reds,Viridis,YlGnBu,YlOrRd.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            line
+                :class:`plotly.graph_objects.barpolar.marker.Li
+                ne` instance or dict with compatible properties
+            opacity
+                Sets the opacity of the bars.
+            opacitysrc
+                Sets the source reference on Chart Studio Cloud
+                for `opacity`.
+            pattern
+                Sets the pattern within the marker.
+            reversescale
+                Reverses the color mapping if true. Has an
+                effect only if in `marker.color` is set to a
+                numerical array. If true, `marker.cmin` will
+                correspond to the last color in the array and
+                `marker.cmax` will correspond to the first
+                color.
+            showscale
+                Determines whether or not a colorbar is
+                displayed for this trace. Has an effect only if
+                in `marker.color` is set to a numerical array.
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+        "HovertemplatesrcValidator": (
+            "hovertemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["r", "theta", "text", "name"],
+            },
+        ),
+        "DthetaValidator": (
+            "dtheta",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DrValidator": (
+            "dr",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "BasesrcValidator": (
+            "basesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "BaseValidator": (
+            "base",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
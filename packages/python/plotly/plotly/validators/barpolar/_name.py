@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class NameValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(self, plotly_name="name", parent_name="barpolar", **kwargs):
-        super(NameValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "style"),
-            **kwargs,
-        )
@@ -1,12 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class VisibleValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(self, plotly_name="visible", parent_name="barpolar", **kwargs):
-        super(VisibleValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            values=kwargs.pop("values", [True, False, "legendonly"]),
-            **kwargs,
-        )
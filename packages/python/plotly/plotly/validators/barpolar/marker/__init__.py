@@ -1,45 +1,556 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._showscale import ShowscaleValidator
-    from ._reversescale import ReversescaleValidator
-    from ._pattern import PatternValidator
-    from ._opacitysrc import OpacitysrcValidator
-    from ._opacity import OpacityValidator
-    from ._line import LineValidator
-    from ._colorsrc import ColorsrcValidator
-    from ._colorscale import ColorscaleValidator
-    from ._colorbar import ColorbarValidator
-    from ._coloraxis import ColoraxisValidator
-    from ._color import ColorValidator
-    from ._cmin import CminValidator
-    from ._cmid import CmidValidator
-    from ._cmax import CmaxValidator
-    from ._cauto import CautoValidator
-    from ._autocolorscale import AutocolorscaleValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._showscale.ShowscaleValidator",
-            "._reversescale.ReversescaleValidator",
-            "._pattern.PatternValidator",
-            "._opacitysrc.OpacitysrcValidator",
-            "._opacity.OpacityValidator",
-            "._line.LineValidator",
-            "._colorsrc.ColorsrcValidator",
-            "._colorscale.ColorscaleValidator",
-            "._colorbar.ColorbarValidator",
-            "._coloraxis.ColoraxisValidator",
-            "._color.ColorValidator",
-            "._cmin.CminValidator",
-            "._cmid.CmidValidator",
-            "._cmax.CmaxValidator",
-            "._cauto.CautoValidator",
-            "._autocolorscale.AutocolorscaleValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "barpolar.marker",
+    {
+        "ShowscaleValidator": (
+            "showscale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ReversescaleValidator": (
+            "reversescale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "PatternValidator": (
+            "pattern",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Pattern",
+                "data_docs": """
+            bgcolor
+                When there is no colorscale sets the color of
+                background pattern fill. Defaults to a
+                `marker.color` background when `fillmode` is
+                "overlay". Otherwise, defaults to a transparent
+                background.
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            fgcolor
+                When there is no colorscale sets the color of
+                foreground pattern fill. Defaults to a
+                `marker.color` background when `fillmode` is
+                "replace". Otherwise, defaults to dark grey or
+                white to increase contrast with the `bgcolor`.
+            fgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `fgcolor`.
+            fgopacity
+                Sets the opacity of the foreground pattern
+                fill. Defaults to a 0.5 when `fillmode` is
+                "overlay". Otherwise, defaults to 1.
+            fillmode
+                Determines whether `marker.color` should be
+                used as a default to `bgcolor` or a `fgcolor`.
+            shape
+                Sets the shape of the pattern fill. By default,
+                no pattern is used for filling the area.
+            shapesrc
+                Sets the source reference on Chart Studio Cloud
+                for `shape`.
+            size
+                Sets the size of unit squares of the pattern
+                fill in pixels, which corresponds to the
+                interval of repetition of the pattern.
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            solidity
+                Sets the solidity of the pattern fill. Solidity
+                is roughly the fraction of the area filled by
+                the pattern. Solidity of 0 shows only the
+                background color without pattern and solidty of
+                1 shows only the foreground color without
+                pattern.
+            soliditysrc
+                Sets the source reference on Chart Studio Cloud
+                for `solidity`.
+""",
+            },
+        ),
+        "OpacitysrcValidator": (
+            "opacitysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `marker.line.colorscale`. Has an
+                effect only if in `marker.line.color` is set to
+                a numerical array. In case `colorscale` is
+                unspecified or `autocolorscale` is true, the
+                default palette will be chosen according to
+                whether numbers in the `color` array are all
+                positive, all negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                in `marker.line.color`) or the bounds set in
+                `marker.line.cmin` and `marker.line.cmax` Has
+                an effect only if in `marker.line.color` is set
+                to a numerical array. Defaults to `false` when
+                `marker.line.cmin` and `marker.line.cmax` are
+                set by the user.
+            cmax
+                Sets the upper bound of the color domain. Has
+                an effect only if in `marker.line.color` is set
+                to a numerical array. Value should have the
+                same units as in `marker.line.color` and if
+                set, `marker.line.cmin` must be set as well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `marker.line.cmin` and/or
+                `marker.line.cmax` to be equidistant to this
+                point. Has an effect only if in
+                `marker.line.color` is set to a numerical
+                array. Value should have the same units as in
+                `marker.line.color`. Has no effect when
+                `marker.line.cauto` is `false`.
+            cmin
+                Sets the lower bound of the color domain. Has
+                an effect only if in `marker.line.color` is set
+                to a numerical array. Value should have the
+                same units as in `marker.line.color` and if
+                set, `marker.line.cmax` must be set as well.
+            color
+                Sets the marker.line color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `marker.line.cmin` and `marker.line.cmax` if
+                set.
+            coloraxis
+                Sets a reference to a shared color axis.
+                References to these shared color axes are
+                "coloraxis", "coloraxis2", "coloraxis3", etc.
+                Settings for these shared color axes are set in
+                the layout, under `layout.coloraxis`,
+                `layout.coloraxis2`, etc. Note that multiple
+                color scales can be linked to the same color
+                axis.
+            colorscale
+                Sets the colorscale. Has an effect only if in
+                `marker.line.color` is set to a numerical
+                array. The colorscale must be an array
+                containing arrays mapping a normalized value to
+                an rgb, rgba, hex, hsl, hsv, or named color
+                string. At minimum, a mapping for the lowest
+                (0) and highest (1) values are required. For
+                example, `[[0, 'rgb(0,0,255)'], [1,
+                'rgb(255,0,0)']]`. To control the bounds of the
+                colorscale in color space, use
+                `marker.line.cmin` and `marker.line.cmax`.
+                Alternatively, `colorscale` may be a palette
+                name string of the following list: Blackbody,Bl
+                uered,Blues,Cividis,Earth,Electric,Greens,Greys
+                ,Hot,Jet,Picnic,Portland,Rainbow,RdBu,Reds,Viri
+                dis,YlGnBu,YlOrRd.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            reversescale
+                Reverses the color mapping if true. Has an
+                effect only if in `marker.line.color` is set to
+                a numerical array. If true, `marker.line.cmin`
+                will correspond to the last color in the array
+                and `marker.line.cmax` will correspond to the
+                first color.
+            width
+                Sets the width (in px) of the lines bounding
+                the marker points.
+            widthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `width`.
+""",
+            },
+        ),
+        "ColorsrcValidator": (
+            "colorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColorscaleValidator": (
+            "colorscale",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"autocolorscale": False},
+            },
+        ),
+        "ColorbarValidator": (
+            "colorbar",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "ColorBar",
+                "data_docs": """
+            bgcolor
+                Sets the color of padded area.
+            bordercolor
+                Sets the axis line color.
+            borderwidth
+                Sets the width (in px) or the border enclosing
+                this color bar.
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            exponentformat
+                Determines a formatting rule for the tick
+                exponents. For example, consider the number
+                1,000,000,000. If "none", it appears as
+                1,000,000,000. If "e", 1e+9. If "E", 1E+9. If
+                "power", 1x10^9 (with 9 in a super script). If
+                "SI", 1G. If "B", 1B.
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            len
+                Sets the length of the color bar This measure
+                excludes the padding of both ends. That is, the
+                color bar length is this length minus the
+                padding on both ends.
+            lenmode
+                Determines whether this color bar's length
+                (i.e. the measure in the color variation
+                direction) is set in units of plot "fraction"
+                or in *pixels. Use `len` to set the value.
+            minexponent
+                Hide SI prefix for 10^n if |n| is below this
+                number. This only has an effect when
+                `tickformat` is "SI" or "B".
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            orientation
+                Sets the orientation of the colorbar.
+            outlinecolor
+                Sets the axis line color.
+            outlinewidth
+                Sets the width (in px) of the axis line.
+            separatethousands
+                If "true", even 4-digit integers are separated
+            showexponent
+                If "all", all exponents are shown besides their
+                significands. If "first", only the exponent of
+                the first tick is shown. If "last", only the
+                exponent of the last tick is shown. If "none",
+                no exponents appear.
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            thickness
+                Sets the thickness of the color bar This
+                measure excludes the size of the padding, ticks
+                and labels.
+            thicknessmode
+                Determines whether this color bar's thickness
+                (i.e. the measure in the constant color
+                direction) is set in units of plot "fraction"
+                or in "pixels". Use `thickness` to set the
+                value.
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the color bar's tick label font
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            tickformatstops
+                A tuple of :class:`plotly.graph_objects.barpola
+                r.marker.colorbar.Tickformatstop` instances or
+                dicts with compatible properties
+            tickformatstopdefaults
+                When used in a template (as layout.template.dat
+                a.barpolar.marker.colorbar.tickformatstopdefaul
+                ts), sets the default property values to use
+                for elements of
+                barpolar.marker.colorbar.tickformatstops
+            ticklabeloverflow
+                Determines how we handle tick labels that would
+                overflow either the graph div or the domain of
+                the axis. The default value for inside tick
+                labels is *hide past domain*. In other cases
+                the default is *hide past div*.
+            ticklabelposition
+                Determines where tick labels are drawn relative
+                to the ticks. Left and right options are used
+                when `orientation` is "h", top and bottom when
+                `orientation` is "v".
+            ticklabelstep
+                Sets the spacing between tick labels as
+                compared to the spacing between ticks. A value
+                of 1 (default) means each tick gets a label. A
+                value of 2 means shows every 2nd label. A
+                larger value n means only every nth tick is
+                labeled. `tick0` determines which labels are
+                shown. Not implemented for axes with `type`
+                "log" or "multicategory", or when `tickmode` is
+                "array".
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided).
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            ticksuffix
+                Sets a tick label suffix.
+            ticktext
+                Sets the text displayed at the ticks position
+                via `tickvals`. Only has an effect if
+                `tickmode` is set to "array". Used with
+                `tickvals`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            title
+                :class:`plotly.graph_objects.barpolar.marker.co
+                lorbar.Title` instance or dict with compatible
+                properties
+            titlefont
+                Deprecated: Please use
+                barpolar.marker.colorbar.title.font instead.
+                Sets this color bar's title font. Note that the
+                title's font used to be set by the now
+                deprecated `titlefont` attribute.
+            titleside
+                Deprecated: Please use
+                barpolar.marker.colorbar.title.side instead.
+                Determines the location of color bar's title
+                with respect to the color bar. Defaults to
+                "top" when `orientation` if "v" and  defaults
+                to "right" when `orientation` if "h". Note that
+                the title's location used to be set by the now
+                deprecated `titleside` attribute.
+            x
+                Sets the x position with respect to `xref` of
+                the color bar (in plot fraction). When `xref`
+                is "paper", defaults to 1.02 when `orientation`
+                is "v" and 0.5 when `orientation` is "h". When
+                `xref` is "container", defaults to 1 when
+                `orientation` is "v" and 0.5 when `orientation`
+                is "h". Must be between 0 and 1 if `xref` is
+                "container" and between "-2" and 3 if `xref` is
+                "paper".
+            xanchor
+                Sets this color bar's horizontal position
+                anchor. This anchor binds the `x` position to
+                the "left", "center" or "right" of the color
+                bar. Defaults to "left" when `orientation` is
+                "v" and "center" when `orientation` is "h".
+            xpad
+                Sets the amount of padding (in px) along the x
+                direction.
+            xref
+                Sets the container `x` refers to. "container"
+                spans the entire `width` of the plot. "paper"
+                refers to the width of the plotting area only.
+            y
+                Sets the y position with respect to `yref` of
+                the color bar (in plot fraction). When `yref`
+                is "paper", defaults to 0.5 when `orientation`
+                is "v" and 1.02 when `orientation` is "h". When
+                `yref` is "container", defaults to 0.5 when
+                `orientation` is "v" and 1 when `orientation`
+                is "h". Must be between 0 and 1 if `yref` is
+                "container" and between "-2" and 3 if `yref` is
+                "paper".
+            yanchor
+                Sets this color bar's vertical position anchor
+                This anchor binds the `y` position to the
+                "top", "middle" or "bottom" of the color bar.
+                Defaults to "middle" when `orientation` is "v"
+                and "bottom" when `orientation` is "h".
+            ypad
+                Sets the amount of padding (in px) along the y
+                direction.
+            yref
+                Sets the container `y` refers to. "container"
+                spans the entire `height` of the plot. "paper"
+                refers to the height of the plotting area only.
+""",
+            },
+        ),
+        "ColoraxisValidator": (
+            "coloraxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": None,
+                "edit_type": "calc",
+                "regex": "/^coloraxis([2-9]|[1-9][0-9]+)?$/",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "colorscale_path": "barpolar.marker.colorscale",
+            },
+        ),
+        "CminValidator": (
+            "cmin",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"cauto": False},
+            },
+        ),
+        "CmidValidator": (
+            "cmid",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "CmaxValidator": (
+            "cmax",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"cauto": False},
+            },
+        ),
+        "CautoValidator": (
+            "cauto",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "AutocolorscaleValidator": (
+            "autocolorscale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+    },
+    [],
+)
@@ -1,17 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class OrientationValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self,
-        plotly_name="orientation",
-        parent_name="barpolar.marker.colorbar",
-        **kwargs,
-    ):
-        super(OrientationValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            values=kwargs.pop("values", ["h", "v"]),
-            **kwargs,
-        )
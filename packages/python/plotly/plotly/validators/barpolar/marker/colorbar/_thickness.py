@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ThicknessValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(
-        self, plotly_name="thickness", parent_name="barpolar.marker.colorbar", **kwargs
-    ):
-        super(ThicknessValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
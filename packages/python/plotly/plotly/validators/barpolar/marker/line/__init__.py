@@ -1,37 +1,105 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._widthsrc import WidthsrcValidator
-    from ._width import WidthValidator
-    from ._reversescale import ReversescaleValidator
-    from ._colorsrc import ColorsrcValidator
-    from ._colorscale import ColorscaleValidator
-    from ._coloraxis import ColoraxisValidator
-    from ._color import ColorValidator
-    from ._cmin import CminValidator
-    from ._cmid import CmidValidator
-    from ._cmax import CmaxValidator
-    from ._cauto import CautoValidator
-    from ._autocolorscale import AutocolorscaleValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._widthsrc.WidthsrcValidator",
-            "._width.WidthValidator",
-            "._reversescale.ReversescaleValidator",
-            "._colorsrc.ColorsrcValidator",
-            "._colorscale.ColorscaleValidator",
-            "._coloraxis.ColoraxisValidator",
-            "._color.ColorValidator",
-            "._cmin.CminValidator",
-            "._cmid.CmidValidator",
-            "._cmax.CmaxValidator",
-            "._cauto.CautoValidator",
-            "._autocolorscale.AutocolorscaleValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "barpolar.marker.line",
+    {
+        "WidthsrcValidator": (
+            "widthsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "ReversescaleValidator": (
+            "reversescale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ColorsrcValidator": (
+            "colorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColorscaleValidator": (
+            "colorscale",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"autocolorscale": False},
+            },
+        ),
+        "ColoraxisValidator": (
+            "coloraxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": None,
+                "edit_type": "calc",
+                "regex": "/^coloraxis([2-9]|[1-9][0-9]+)?$/",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "colorscale_path": "barpolar.marker.line.colorscale",
+            },
+        ),
+        "CminValidator": (
+            "cmin",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"cauto": False},
+            },
+        ),
+        "CmidValidator": (
+            "cmid",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "CmaxValidator": (
+            "cmax",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"cauto": False},
+            },
+        ),
+        "CautoValidator": (
+            "cauto",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "AutocolorscaleValidator": (
+            "autocolorscale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+    },
+    [],
+)
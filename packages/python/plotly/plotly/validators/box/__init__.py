@@ -1,185 +1,777 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._zorder import ZorderValidator
-    from ._ysrc import YsrcValidator
-    from ._yperiodalignment import YperiodalignmentValidator
-    from ._yperiod0 import Yperiod0Validator
-    from ._yperiod import YperiodValidator
-    from ._yhoverformat import YhoverformatValidator
-    from ._ycalendar import YcalendarValidator
-    from ._yaxis import YaxisValidator
-    from ._y0 import Y0Validator
-    from ._y import YValidator
-    from ._xsrc import XsrcValidator
-    from ._xperiodalignment import XperiodalignmentValidator
-    from ._xperiod0 import Xperiod0Validator
-    from ._xperiod import XperiodValidator
-    from ._xhoverformat import XhoverformatValidator
-    from ._xcalendar import XcalendarValidator
-    from ._xaxis import XaxisValidator
-    from ._x0 import X0Validator
-    from ._x import XValidator
-    from ._width import WidthValidator
-    from ._whiskerwidth import WhiskerwidthValidator
-    from ._visible import VisibleValidator
-    from ._upperfencesrc import UpperfencesrcValidator
-    from ._upperfence import UpperfenceValidator
-    from ._unselected import UnselectedValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._textsrc import TextsrcValidator
-    from ._text import TextValidator
-    from ._stream import StreamValidator
-    from ._sizemode import SizemodeValidator
-    from ._showwhiskers import ShowwhiskersValidator
-    from ._showlegend import ShowlegendValidator
-    from ._selectedpoints import SelectedpointsValidator
-    from ._selected import SelectedValidator
-    from ._sdsrc import SdsrcValidator
-    from ._sdmultiple import SdmultipleValidator
-    from ._sd import SdValidator
-    from ._quartilemethod import QuartilemethodValidator
-    from ._q3src import Q3SrcValidator
-    from ._q3 import Q3Validator
-    from ._q1src import Q1SrcValidator
-    from ._q1 import Q1Validator
-    from ._pointpos import PointposValidator
-    from ._orientation import OrientationValidator
-    from ._opacity import OpacityValidator
-    from ._offsetgroup import OffsetgroupValidator
-    from ._notchwidth import NotchwidthValidator
-    from ._notchspansrc import NotchspansrcValidator
-    from ._notchspan import NotchspanValidator
-    from ._notched import NotchedValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._mediansrc import MediansrcValidator
-    from ._median import MedianValidator
-    from ._meansrc import MeansrcValidator
-    from ._mean import MeanValidator
-    from ._marker import MarkerValidator
-    from ._lowerfencesrc import LowerfencesrcValidator
-    from ._lowerfence import LowerfenceValidator
-    from ._line import LineValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._jitter import JitterValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hovertemplatesrc import HovertemplatesrcValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoveron import HoveronValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._fillcolor import FillcolorValidator
-    from ._dy import DyValidator
-    from ._dx import DxValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._boxpoints import BoxpointsValidator
-    from ._boxmean import BoxmeanValidator
-    from ._alignmentgroup import AlignmentgroupValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._zorder.ZorderValidator",
-            "._ysrc.YsrcValidator",
-            "._yperiodalignment.YperiodalignmentValidator",
-            "._yperiod0.Yperiod0Validator",
-            "._yperiod.YperiodValidator",
-            "._yhoverformat.YhoverformatValidator",
-            "._ycalendar.YcalendarValidator",
-            "._yaxis.YaxisValidator",
-            "._y0.Y0Validator",
-            "._y.YValidator",
-            "._xsrc.XsrcValidator",
-            "._xperiodalignment.XperiodalignmentValidator",
-            "._xperiod0.Xperiod0Validator",
-            "._xperiod.XperiodValidator",
-            "._xhoverformat.XhoverformatValidator",
-            "._xcalendar.XcalendarValidator",
-            "._xaxis.XaxisValidator",
-            "._x0.X0Validator",
-            "._x.XValidator",
-            "._width.WidthValidator",
-            "._whiskerwidth.WhiskerwidthValidator",
-            "._visible.VisibleValidator",
-            "._upperfencesrc.UpperfencesrcValidator",
-            "._upperfence.UpperfenceValidator",
-            "._unselected.UnselectedValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._textsrc.TextsrcValidator",
-            "._text.TextValidator",
-            "._stream.StreamValidator",
-            "._sizemode.SizemodeValidator",
-            "._showwhiskers.ShowwhiskersValidator",
-            "._showlegend.ShowlegendValidator",
-            "._selectedpoints.SelectedpointsValidator",
-            "._selected.SelectedValidator",
-            "._sdsrc.SdsrcValidator",
-            "._sdmultiple.SdmultipleValidator",
-            "._sd.SdValidator",
-            "._quartilemethod.QuartilemethodValidator",
-            "._q3src.Q3SrcValidator",
-            "._q3.Q3Validator",
-            "._q1src.Q1SrcValidator",
-            "._q1.Q1Validator",
-            "._pointpos.PointposValidator",
-            "._orientation.OrientationValidator",
-            "._opacity.OpacityValidator",
-            "._offsetgroup.OffsetgroupValidator",
-            "._notchwidth.NotchwidthValidator",
-            "._notchspansrc.NotchspansrcValidator",
-            "._notchspan.NotchspanValidator",
-            "._notched.NotchedValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._mediansrc.MediansrcValidator",
-            "._median.MedianValidator",
-            "._meansrc.MeansrcValidator",
-            "._mean.MeanValidator",
-            "._marker.MarkerValidator",
-            "._lowerfencesrc.LowerfencesrcValidator",
-            "._lowerfence.LowerfenceValidator",
-            "._line.LineValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._jitter.JitterValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hovertemplatesrc.HovertemplatesrcValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoveron.HoveronValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._fillcolor.FillcolorValidator",
-            "._dy.DyValidator",
-            "._dx.DxValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._boxpoints.BoxpointsValidator",
-            "._boxmean.BoxmeanValidator",
-            "._alignmentgroup.AlignmentgroupValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "box",
+    {
+        "ZorderValidator": (
+            "zorder",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "YsrcValidator": (
+            "ysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YperiodalignmentValidator": (
+            "yperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Yperiod0Validator": (
+            "yperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "YperiodValidator": (
+            "yperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "YhoverformatValidator": (
+            "yhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YcalendarValidator": (
+            "ycalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "YaxisValidator": (
+            "yaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "y",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "Y0Validator": (
+            "y0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XsrcValidator": (
+            "xsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XperiodalignmentValidator": (
+            "xperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Xperiod0Validator": (
+            "xperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XperiodValidator": (
+            "xperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XhoverformatValidator": (
+            "xhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XcalendarValidator": (
+            "xcalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "XaxisValidator": (
+            "xaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "x",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "X0Validator": (
+            "x0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "WhiskerwidthValidator": (
+            "whiskerwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UpperfencesrcValidator": (
+            "upperfencesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UpperfenceValidator": (
+            "upperfence",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "UnselectedValidator": (
+            "unselected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Unselected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.box.unselected.Mar
+                ker` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "SizemodeValidator": (
+            "sizemode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["quartiles", "sd"],
+            },
+        ),
+        "ShowwhiskersValidator": (
+            "showwhiskers",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "SelectedpointsValidator": (
+            "selectedpoints",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SelectedValidator": (
+            "selected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Selected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.box.selected.Marke
+                r` instance or dict with compatible properties
+""",
+            },
+        ),
+        "SdsrcValidator": (
+            "sdsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SdmultipleValidator": (
+            "sdmultiple",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "SdValidator": (
+            "sd",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "QuartilemethodValidator": (
+            "quartilemethod",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["linear", "exclusive", "inclusive"],
+            },
+        ),
+        "Q3SrcValidator": (
+            "q3src",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "Q3Validator": (
+            "q3",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "Q1SrcValidator": (
+            "q1src",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "Q1Validator": (
+            "q1",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "PointposValidator": (
+            "pointpos",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 2,
+                "min": -2,
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "values": ["v", "h"],
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "OffsetgroupValidator": (
+            "offsetgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "NotchwidthValidator": (
+            "notchwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 0.5,
+                "min": 0,
+            },
+        ),
+        "NotchspansrcValidator": (
+            "notchspansrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "NotchspanValidator": (
+            "notchspan",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "NotchedValidator": (
+            "notched",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "MediansrcValidator": (
+            "mediansrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MedianValidator": (
+            "median",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "MeansrcValidator": (
+            "meansrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MeanValidator": (
+            "mean",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            angle
+                Sets the marker angle in respect to `angleref`.
+            color
+                Sets the marker color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `marker.cmin` and `marker.cmax` if set.
+            line
+                :class:`plotly.graph_objects.box.marker.Line`
+                instance or dict with compatible properties
+            opacity
+                Sets the marker opacity.
+            outliercolor
+                Sets the color of the outlier sample points.
+            size
+                Sets the marker size (in px).
+            symbol
+                Sets the marker symbol type. Adding 100 is
+                equivalent to appending "-open" to a symbol
+                name. Adding 200 is equivalent to appending
+                "-dot" to a symbol name. Adding 300 is
+                equivalent to appending "-open-dot" or "dot-
+                open" to a symbol name.
+""",
+            },
+        ),
+        "LowerfencesrcValidator": (
+            "lowerfencesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LowerfenceValidator": (
+            "lowerfence",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the color of line bounding the box(es).
+            width
+                Sets the width (in px) of line bounding the
+                box(es).
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "JitterValidator": (
+            "jitter",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+        "HovertemplatesrcValidator": (
+            "hovertemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "HoveronValidator": (
+            "hoveron",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "style",
+                "flags": ["boxes", "points"],
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["x", "y", "z", "text", "name"],
+            },
+        ),
+        "FillcolorValidator": (
+            "fillcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "DyValidator": (
+            "dy",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DxValidator": (
+            "dx",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "BoxpointsValidator": (
+            "boxpoints",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["all", "outliers", "suspectedoutliers", False],
+            },
+        ),
+        "BoxmeanValidator": (
+            "boxmean",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, "sd", False],
+            },
+        ),
+        "AlignmentgroupValidator": (
+            "alignmentgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
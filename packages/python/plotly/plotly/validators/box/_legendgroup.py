@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class LegendgroupValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(self, plotly_name="legendgroup", parent_name="box", **kwargs):
-        super(LegendgroupValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "style"),
-            **kwargs,
-        )
@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class Q3Validator(_plotly_utils.basevalidators.DataArrayValidator):
-    def __init__(self, plotly_name="q3", parent_name="box", **kwargs):
-        super(Q3Validator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc+clearAxisTypes"),
-            **kwargs,
-        )
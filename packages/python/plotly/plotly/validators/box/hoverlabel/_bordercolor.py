@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class BordercolorValidator(_plotly_utils.basevalidators.ColorValidator):
-    def __init__(
-        self, plotly_name="bordercolor", parent_name="box.hoverlabel", **kwargs
-    ):
-        super(BordercolorValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            array_ok=kwargs.pop("array_ok", True),
-            edit_type=kwargs.pop("edit_type", "none"),
-            **kwargs,
-        )
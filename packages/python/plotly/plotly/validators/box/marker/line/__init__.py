@@ -1,21 +1,41 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._width import WidthValidator
-    from ._outlierwidth import OutlierwidthValidator
-    from ._outliercolor import OutliercolorValidator
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._width.WidthValidator",
-            "._outlierwidth.OutlierwidthValidator",
-            "._outliercolor.OutliercolorValidator",
-            "._color.ColorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "box.marker.line",
+    {
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": False,
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "OutlierwidthValidator": (
+            "outlierwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "OutliercolorValidator": (
+            "outliercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": False,
+                "edit_type": "style",
+            },
+        ),
+    },
+    [],
+)
@@ -1,12 +1,27 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._token import TokenValidator
-    from ._maxpoints import MaxpointsValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._token.TokenValidator", "._maxpoints.MaxpointsValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "box.stream",
+    {
+        "TokenValidator": (
+            "token",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+                "no_blank": True,
+                "strict": True,
+            },
+        ),
+        "MaxpointsValidator": (
+            "maxpoints",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 10000,
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
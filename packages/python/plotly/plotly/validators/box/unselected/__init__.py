@@ -1,11 +1,27 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._marker import MarkerValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._marker.MarkerValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "box.unselected",
+    {
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            color
+                Sets the marker color of unselected points,
+                applied only when a selection exists.
+            opacity
+                Sets the marker opacity of unselected points,
+                applied only when a selection exists.
+            size
+                Sets the marker size of unselected points,
+                applied only when a selection exists.
+""",
+            },
+        )
+    },
+    [],
+)
@@ -1,111 +1,473 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._zorder import ZorderValidator
-    from ._yhoverformat import YhoverformatValidator
-    from ._yaxis import YaxisValidator
-    from ._xsrc import XsrcValidator
-    from ._xperiodalignment import XperiodalignmentValidator
-    from ._xperiod0 import Xperiod0Validator
-    from ._xperiod import XperiodValidator
-    from ._xhoverformat import XhoverformatValidator
-    from ._xcalendar import XcalendarValidator
-    from ._xaxis import XaxisValidator
-    from ._x import XValidator
-    from ._whiskerwidth import WhiskerwidthValidator
-    from ._visible import VisibleValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._textsrc import TextsrcValidator
-    from ._text import TextValidator
-    from ._stream import StreamValidator
-    from ._showlegend import ShowlegendValidator
-    from ._selectedpoints import SelectedpointsValidator
-    from ._opensrc import OpensrcValidator
-    from ._open import OpenValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._lowsrc import LowsrcValidator
-    from ._low import LowValidator
-    from ._line import LineValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._increasing import IncreasingValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._highsrc import HighsrcValidator
-    from ._high import HighValidator
-    from ._decreasing import DecreasingValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._closesrc import ClosesrcValidator
-    from ._close import CloseValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._zorder.ZorderValidator",
-            "._yhoverformat.YhoverformatValidator",
-            "._yaxis.YaxisValidator",
-            "._xsrc.XsrcValidator",
-            "._xperiodalignment.XperiodalignmentValidator",
-            "._xperiod0.Xperiod0Validator",
-            "._xperiod.XperiodValidator",
-            "._xhoverformat.XhoverformatValidator",
-            "._xcalendar.XcalendarValidator",
-            "._xaxis.XaxisValidator",
-            "._x.XValidator",
-            "._whiskerwidth.WhiskerwidthValidator",
-            "._visible.VisibleValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._textsrc.TextsrcValidator",
-            "._text.TextValidator",
-            "._stream.StreamValidator",
-            "._showlegend.ShowlegendValidator",
-            "._selectedpoints.SelectedpointsValidator",
-            "._opensrc.OpensrcValidator",
-            "._open.OpenValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._lowsrc.LowsrcValidator",
-            "._low.LowValidator",
-            "._line.LineValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._increasing.IncreasingValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._highsrc.HighsrcValidator",
-            "._high.HighValidator",
-            "._decreasing.DecreasingValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._closesrc.ClosesrcValidator",
-            "._close.CloseValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "candlestick",
+    {
+        "ZorderValidator": (
+            "zorder",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "YhoverformatValidator": (
+            "yhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YaxisValidator": (
+            "yaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "y",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XsrcValidator": (
+            "xsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XperiodalignmentValidator": (
+            "xperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Xperiod0Validator": (
+            "xperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XperiodValidator": (
+            "xperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XhoverformatValidator": (
+            "xhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XcalendarValidator": (
+            "xcalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "XaxisValidator": (
+            "xaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "x",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "WhiskerwidthValidator": (
+            "whiskerwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "SelectedpointsValidator": (
+            "selectedpoints",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "OpensrcValidator": (
+            "opensrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "OpenValidator": (
+            "open",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LowsrcValidator": (
+            "lowsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LowValidator": (
+            "low",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            width
+                Sets the width (in px) of line bounding the
+                box(es). Note that this style setting can also
+                be set per direction via
+                `increasing.line.width` and
+                `decreasing.line.width`.
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "IncreasingValidator": (
+            "increasing",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Increasing",
+                "data_docs": """
+            fillcolor
+                Sets the fill color. Defaults to a half-
+                transparent variant of the line color, marker
+                color, or marker line color, whichever is
+                available.
+            line
+                :class:`plotly.graph_objects.candlestick.increa
+                sing.Line` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+            split
+                Show hover information (open, close, high, low)
+                in separate labels.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["x", "y", "z", "text", "name"],
+            },
+        ),
+        "HighsrcValidator": (
+            "highsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HighValidator": (
+            "high",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DecreasingValidator": (
+            "decreasing",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Decreasing",
+                "data_docs": """
+            fillcolor
+                Sets the fill color. Defaults to a half-
+                transparent variant of the line color, marker
+                color, or marker line color, whichever is
+                available.
+            line
+                :class:`plotly.graph_objects.candlestick.decrea
+                sing.Line` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ClosesrcValidator": (
+            "closesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CloseValidator": (
+            "close",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
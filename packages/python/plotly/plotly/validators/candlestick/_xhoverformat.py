@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class XhoverformatValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(self, plotly_name="xhoverformat", parent_name="candlestick", **kwargs):
-        super(XhoverformatValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "none"),
-            **kwargs,
-        )
@@ -1,12 +1,30 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._line import LineValidator
-    from ._fillcolor import FillcolorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._line.LineValidator", "._fillcolor.FillcolorValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "candlestick.increasing",
+    {
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the color of line bounding the box(es).
+            width
+                Sets the width (in px) of line bounding the
+                box(es).
+""",
+            },
+        ),
+        "FillcolorValidator": (
+            "fillcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+    },
+    [],
+)
@@ -1,25 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class StreamValidator(_plotly_utils.basevalidators.CompoundValidator):
-    def __init__(self, plotly_name="stream", parent_name="carpet", **kwargs):
-        super(StreamValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            data_class_str=kwargs.pop("data_class_str", "Stream"),
-            data_docs=kwargs.pop(
-                "data_docs",
-                """
-            maxpoints
-                Sets the maximum number of points to keep on
-                the plots from an incoming stream. If
-                `maxpoints` is set to 50, only the newest 50
-                points will be displayed on the plot.
-            token
-                The stream id number links a data trace on a
-                plot with a stream. See https://chart-
-                studio.plotly.com/settings for more details.
-""",
-            ),
-            **kwargs,
-        )
@@ -1,12 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class UidValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(self, plotly_name="uid", parent_name="carpet", **kwargs):
-        super(UidValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            anim=kwargs.pop("anim", True),
-            edit_type=kwargs.pop("edit_type", "plot"),
-            **kwargs,
-        )
@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ExponentformatValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self, plotly_name="exponentformat", parent_name="carpet.aaxis", **kwargs
-    ):
-        super(ExponentformatValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            values=kwargs.pop("values", ["none", "e", "E", "power", "SI", "B"]),
-            **kwargs,
-        )
@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class GridcolorValidator(_plotly_utils.basevalidators.ColorValidator):
-    def __init__(self, plotly_name="gridcolor", parent_name="carpet.aaxis", **kwargs):
-        super(GridcolorValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            **kwargs,
-        )
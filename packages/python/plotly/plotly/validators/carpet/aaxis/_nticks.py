@@ -1,12 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class NticksValidator(_plotly_utils.basevalidators.IntegerValidator):
-    def __init__(self, plotly_name="nticks", parent_name="carpet.aaxis", **kwargs):
-        super(NticksValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TickprefixValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(self, plotly_name="tickprefix", parent_name="carpet.aaxis", **kwargs):
-        super(TickprefixValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            **kwargs,
-        )
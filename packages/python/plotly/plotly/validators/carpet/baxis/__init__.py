@@ -1,129 +1,548 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._type import TypeValidator
-    from ._title import TitleValidator
-    from ._tickvalssrc import TickvalssrcValidator
-    from ._tickvals import TickvalsValidator
-    from ._ticktextsrc import TicktextsrcValidator
-    from ._ticktext import TicktextValidator
-    from ._ticksuffix import TicksuffixValidator
-    from ._tickprefix import TickprefixValidator
-    from ._tickmode import TickmodeValidator
-    from ._tickformatstopdefaults import TickformatstopdefaultsValidator
-    from ._tickformatstops import TickformatstopsValidator
-    from ._tickformat import TickformatValidator
-    from ._tickfont import TickfontValidator
-    from ._tickangle import TickangleValidator
-    from ._tick0 import Tick0Validator
-    from ._startlinewidth import StartlinewidthValidator
-    from ._startlinecolor import StartlinecolorValidator
-    from ._startline import StartlineValidator
-    from ._smoothing import SmoothingValidator
-    from ._showticksuffix import ShowticksuffixValidator
-    from ._showtickprefix import ShowtickprefixValidator
-    from ._showticklabels import ShowticklabelsValidator
-    from ._showline import ShowlineValidator
-    from ._showgrid import ShowgridValidator
-    from ._showexponent import ShowexponentValidator
-    from ._separatethousands import SeparatethousandsValidator
-    from ._rangemode import RangemodeValidator
-    from ._range import RangeValidator
-    from ._nticks import NticksValidator
-    from ._minorgridwidth import MinorgridwidthValidator
-    from ._minorgriddash import MinorgriddashValidator
-    from ._minorgridcount import MinorgridcountValidator
-    from ._minorgridcolor import MinorgridcolorValidator
-    from ._minexponent import MinexponentValidator
-    from ._linewidth import LinewidthValidator
-    from ._linecolor import LinecolorValidator
-    from ._labelsuffix import LabelsuffixValidator
-    from ._labelprefix import LabelprefixValidator
-    from ._labelpadding import LabelpaddingValidator
-    from ._labelalias import LabelaliasValidator
-    from ._gridwidth import GridwidthValidator
-    from ._griddash import GriddashValidator
-    from ._gridcolor import GridcolorValidator
-    from ._fixedrange import FixedrangeValidator
-    from ._exponentformat import ExponentformatValidator
-    from ._endlinewidth import EndlinewidthValidator
-    from ._endlinecolor import EndlinecolorValidator
-    from ._endline import EndlineValidator
-    from ._dtick import DtickValidator
-    from ._color import ColorValidator
-    from ._cheatertype import CheatertypeValidator
-    from ._categoryorder import CategoryorderValidator
-    from ._categoryarraysrc import CategoryarraysrcValidator
-    from ._categoryarray import CategoryarrayValidator
-    from ._autotypenumbers import AutotypenumbersValidator
-    from ._autorange import AutorangeValidator
-    from ._arraytick0 import Arraytick0Validator
-    from ._arraydtick import ArraydtickValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "carpet.baxis",
+    {
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["-", "linear", "date", "category"],
+            },
+        ),
+        "TitleValidator": (
+            "title",
+            "_plotly_utils.basevalidators.TitleValidator",
+            {
+                "data_class_str": "Title",
+                "data_docs": """
+            font
+                Sets this axis' title font. Note that the
+                title's font used to be set by the now
+                deprecated `titlefont` attribute.
+            offset
+                An additional amount by which to offset the
+                title from the tick labels, given in pixels.
+                Note that this used to be set by the now
+                deprecated `titleoffset` attribute.
+            text
+                Sets the title of this axis. Note that before
+                the existence of `title.text`, the title's
+                contents used to be defined as the `title`
+                attribute itself. This behavior has been
+                deprecated.
+""",
+            },
+        ),
+        "TickvalssrcValidator": (
+            "tickvalssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TickvalsValidator": (
+            "tickvals",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TicktextsrcValidator": (
+            "ticktextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TicktextValidator": (
+            "ticktext",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TicksuffixValidator": (
+            "ticksuffix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TickprefixValidator": (
+            "tickprefix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TickmodeValidator": (
+            "tickmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["linear", "array"],
+            },
+        ),
+        "TickformatstopdefaultsValidator": (
+            "tickformatstopdefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickformatstop",
+                "data_docs": """
+""",
+            },
+        ),
+        "TickformatstopsValidator": (
+            "tickformatstops",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Tickformatstop",
+                "data_docs": """
+            dtickrange
+                range [*min*, *max*], where "min", "max" -
+                dtick values which describe some zoom level, it
+                is possible to omit "min" or "max" value by
+                passing "null"
+            enabled
+                Determines whether or not this stop is used. If
+                `false`, this stop is ignored even within its
+                `dtickrange`.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            value
+                string - dtickformat for described zoom level,
+                the same as "tickformat"
+""",
+            },
+        ),
+        "TickformatValidator": (
+            "tickformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TickfontValidator": (
+            "tickfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._type.TypeValidator",
-            "._title.TitleValidator",
-            "._tickvalssrc.TickvalssrcValidator",
-            "._tickvals.TickvalsValidator",
-            "._ticktextsrc.TicktextsrcValidator",
-            "._ticktext.TicktextValidator",
-            "._ticksuffix.TicksuffixValidator",
-            "._tickprefix.TickprefixValidator",
-            "._tickmode.TickmodeValidator",
-            "._tickformatstopdefaults.TickformatstopdefaultsValidator",
-            "._tickformatstops.TickformatstopsValidator",
-            "._tickformat.TickformatValidator",
-            "._tickfont.TickfontValidator",
-            "._tickangle.TickangleValidator",
-            "._tick0.Tick0Validator",
-            "._startlinewidth.StartlinewidthValidator",
-            "._startlinecolor.StartlinecolorValidator",
-            "._startline.StartlineValidator",
-            "._smoothing.SmoothingValidator",
-            "._showticksuffix.ShowticksuffixValidator",
-            "._showtickprefix.ShowtickprefixValidator",
-            "._showticklabels.ShowticklabelsValidator",
-            "._showline.ShowlineValidator",
-            "._showgrid.ShowgridValidator",
-            "._showexponent.ShowexponentValidator",
-            "._separatethousands.SeparatethousandsValidator",
-            "._rangemode.RangemodeValidator",
-            "._range.RangeValidator",
-            "._nticks.NticksValidator",
-            "._minorgridwidth.MinorgridwidthValidator",
-            "._minorgriddash.MinorgriddashValidator",
-            "._minorgridcount.MinorgridcountValidator",
-            "._minorgridcolor.MinorgridcolorValidator",
-            "._minexponent.MinexponentValidator",
-            "._linewidth.LinewidthValidator",
-            "._linecolor.LinecolorValidator",
-            "._labelsuffix.LabelsuffixValidator",
-            "._labelprefix.LabelprefixValidator",
-            "._labelpadding.LabelpaddingValidator",
-            "._labelalias.LabelaliasValidator",
-            "._gridwidth.GridwidthValidator",
-            "._griddash.GriddashValidator",
-            "._gridcolor.GridcolorValidator",
-            "._fixedrange.FixedrangeValidator",
-            "._exponentformat.ExponentformatValidator",
-            "._endlinewidth.EndlinewidthValidator",
-            "._endlinecolor.EndlinecolorValidator",
-            "._endline.EndlineValidator",
-            "._dtick.DtickValidator",
-            "._color.ColorValidator",
-            "._cheatertype.CheatertypeValidator",
-            "._categoryorder.CategoryorderValidator",
-            "._categoryarraysrc.CategoryarraysrcValidator",
-            "._categoryarray.CategoryarrayValidator",
-            "._autotypenumbers.AutotypenumbersValidator",
-            "._autorange.AutorangeValidator",
-            "._arraytick0.Arraytick0Validator",
-            "._arraydtick.ArraydtickValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "TickangleValidator": (
+            "tickangle",
+            "_plotly_utils.basevalidators.AngleValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "Tick0Validator": (
+            "tick0",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "StartlinewidthValidator": (
+            "startlinewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "StartlinecolorValidator": (
+            "startlinecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "StartlineValidator": (
+            "startline",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SmoothingValidator": (
+            "smoothing",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1.3,
+                "min": 0,
+            },
+        ),
+        "ShowticksuffixValidator": (
+            "showticksuffix",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowtickprefixValidator": (
+            "showtickprefix",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowticklabelsValidator": (
+            "showticklabels",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["start", "end", "both", "none"],
+            },
+        ),
+        "ShowlineValidator": (
+            "showline",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ShowgridValidator": (
+            "showgrid",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ShowexponentValidator": (
+            "showexponent",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "SeparatethousandsValidator": (
+            "separatethousands",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "RangemodeValidator": (
+            "rangemode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["normal", "tozero", "nonnegative"],
+            },
+        ),
+        "RangeValidator": (
+            "range",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "calc",
+                "items": [
+                    {"editType": "calc", "valType": "any"},
+                    {"editType": "calc", "valType": "any"},
+                ],
+            },
+        ),
+        "NticksValidator": (
+            "nticks",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "MinorgridwidthValidator": (
+            "minorgridwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "MinorgriddashValidator": (
+            "minorgriddash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "MinorgridcountValidator": (
+            "minorgridcount",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "MinorgridcolorValidator": (
+            "minorgridcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "MinexponentValidator": (
+            "minexponent",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "LinewidthValidator": (
+            "linewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "LinecolorValidator": (
+            "linecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "LabelsuffixValidator": (
+            "labelsuffix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "LabelprefixValidator": (
+            "labelprefix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "LabelpaddingValidator": (
+            "labelpadding",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "LabelaliasValidator": (
+            "labelalias",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "GridwidthValidator": (
+            "gridwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "GriddashValidator": (
+            "griddash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "GridcolorValidator": (
+            "gridcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "FixedrangeValidator": (
+            "fixedrange",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ExponentformatValidator": (
+            "exponentformat",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["none", "e", "E", "power", "SI", "B"],
+            },
+        ),
+        "EndlinewidthValidator": (
+            "endlinewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "EndlinecolorValidator": (
+            "endlinecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "EndlineValidator": (
+            "endline",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DtickValidator": (
+            "dtick",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CheatertypeValidator": (
+            "cheatertype",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["index", "value"],
+            },
+        ),
+        "CategoryorderValidator": (
+            "categoryorder",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "trace",
+                    "category ascending",
+                    "category descending",
+                    "array",
+                ],
+            },
+        ),
+        "CategoryarraysrcValidator": (
+            "categoryarraysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CategoryarrayValidator": (
+            "categoryarray",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "AutotypenumbersValidator": (
+            "autotypenumbers",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["convert types", "strict"],
+            },
+        ),
+        "AutorangeValidator": (
+            "autorange",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "reversed"],
+            },
+        ),
+        "Arraytick0Validator": (
+            "arraytick0",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "ArraydtickValidator": (
+            "arraydtick",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 1,
+            },
+        ),
+    },
+    [],
+)
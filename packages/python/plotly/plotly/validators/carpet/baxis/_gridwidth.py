@@ -1,12 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class GridwidthValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(self, plotly_name="gridwidth", parent_name="carpet.baxis", **kwargs):
-        super(GridwidthValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
@@ -1,23 +1,48 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._value import ValueValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._name import NameValidator
-    from ._enabled import EnabledValidator
-    from ._dtickrange import DtickrangeValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._value.ValueValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._name.NameValidator",
-            "._enabled.EnabledValidator",
-            "._dtickrange.DtickrangeValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "carpet.baxis.tickformatstop",
+    {
+        "ValueValidator": (
+            "value",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "EnabledValidator": (
+            "enabled",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DtickrangeValidator": (
+            "dtickrange",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "calc",
+                "items": [
+                    {"editType": "calc", "valType": "any"},
+                    {"editType": "calc", "valType": "any"},
+                ],
+            },
+        ),
+    },
+    [],
+)
@@ -1,111 +1,478 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yref import YrefValidator
-    from ._ypad import YpadValidator
-    from ._yanchor import YanchorValidator
-    from ._y import YValidator
-    from ._xref import XrefValidator
-    from ._xpad import XpadValidator
-    from ._xanchor import XanchorValidator
-    from ._x import XValidator
-    from ._title import TitleValidator
-    from ._tickwidth import TickwidthValidator
-    from ._tickvalssrc import TickvalssrcValidator
-    from ._tickvals import TickvalsValidator
-    from ._ticktextsrc import TicktextsrcValidator
-    from ._ticktext import TicktextValidator
-    from ._ticksuffix import TicksuffixValidator
-    from ._ticks import TicksValidator
-    from ._tickprefix import TickprefixValidator
-    from ._tickmode import TickmodeValidator
-    from ._ticklen import TicklenValidator
-    from ._ticklabelstep import TicklabelstepValidator
-    from ._ticklabelposition import TicklabelpositionValidator
-    from ._ticklabeloverflow import TicklabeloverflowValidator
-    from ._tickformatstopdefaults import TickformatstopdefaultsValidator
-    from ._tickformatstops import TickformatstopsValidator
-    from ._tickformat import TickformatValidator
-    from ._tickfont import TickfontValidator
-    from ._tickcolor import TickcolorValidator
-    from ._tickangle import TickangleValidator
-    from ._tick0 import Tick0Validator
-    from ._thicknessmode import ThicknessmodeValidator
-    from ._thickness import ThicknessValidator
-    from ._showticksuffix import ShowticksuffixValidator
-    from ._showtickprefix import ShowtickprefixValidator
-    from ._showticklabels import ShowticklabelsValidator
-    from ._showexponent import ShowexponentValidator
-    from ._separatethousands import SeparatethousandsValidator
-    from ._outlinewidth import OutlinewidthValidator
-    from ._outlinecolor import OutlinecolorValidator
-    from ._orientation import OrientationValidator
-    from ._nticks import NticksValidator
-    from ._minexponent import MinexponentValidator
-    from ._lenmode import LenmodeValidator
-    from ._len import LenValidator
-    from ._labelalias import LabelaliasValidator
-    from ._exponentformat import ExponentformatValidator
-    from ._dtick import DtickValidator
-    from ._borderwidth import BorderwidthValidator
-    from ._bordercolor import BordercolorValidator
-    from ._bgcolor import BgcolorValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "choropleth.colorbar",
+    {
+        "YrefValidator": (
+            "yref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["container", "paper"],
+            },
+        ),
+        "YpadValidator": (
+            "ypad",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "YanchorValidator": (
+            "yanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["top", "middle", "bottom"],
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "XrefValidator": (
+            "xref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["container", "paper"],
+            },
+        ),
+        "XpadValidator": (
+            "xpad",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "XanchorValidator": (
+            "xanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["left", "center", "right"],
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TitleValidator": (
+            "title",
+            "_plotly_utils.basevalidators.TitleValidator",
+            {
+                "data_class_str": "Title",
+                "data_docs": """
+            font
+                Sets this color bar's title font. Note that the
+                title's font used to be set by the now
+                deprecated `titlefont` attribute.
+            side
+                Determines the location of color bar's title
+                with respect to the color bar. Defaults to
+                "top" when `orientation` if "v" and  defaults
+                to "right" when `orientation` if "h". Note that
+                the title's location used to be set by the now
+                deprecated `titleside` attribute.
+            text
+                Sets the title of the color bar. Note that
+                before the existence of `title.text`, the
+                title's contents used to be defined as the
+                `title` attribute itself. This behavior has
+                been deprecated.
+""",
+            },
+        ),
+        "TickwidthValidator": (
+            "tickwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "TickvalssrcValidator": (
+            "tickvalssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TickvalsValidator": (
+            "tickvals",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TicktextsrcValidator": (
+            "ticktextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TicktextValidator": (
+            "ticktext",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TicksuffixValidator": (
+            "ticksuffix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TicksValidator": (
+            "ticks",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["outside", "inside", ""],
+            },
+        ),
+        "TickprefixValidator": (
+            "tickprefix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TickmodeValidator": (
+            "tickmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "implied_edits": {},
+                "values": ["auto", "linear", "array"],
+            },
+        ),
+        "TicklenValidator": (
+            "ticklen",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "TicklabelstepValidator": (
+            "ticklabelstep",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 1,
+            },
+        ),
+        "TicklabelpositionValidator": (
+            "ticklabelposition",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": [
+                    "outside",
+                    "inside",
+                    "outside top",
+                    "inside top",
+                    "outside left",
+                    "inside left",
+                    "outside right",
+                    "inside right",
+                    "outside bottom",
+                    "inside bottom",
+                ],
+            },
+        ),
+        "TicklabeloverflowValidator": (
+            "ticklabeloverflow",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["allow", "hide past div", "hide past domain"],
+            },
+        ),
+        "TickformatstopdefaultsValidator": (
+            "tickformatstopdefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickformatstop",
+                "data_docs": """
+""",
+            },
+        ),
+        "TickformatstopsValidator": (
+            "tickformatstops",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Tickformatstop",
+                "data_docs": """
+            dtickrange
+                range [*min*, *max*], where "min", "max" -
+                dtick values which describe some zoom level, it
+                is possible to omit "min" or "max" value by
+                passing "null"
+            enabled
+                Determines whether or not this stop is used. If
+                `false`, this stop is ignored even within its
+                `dtickrange`.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            value
+                string - dtickformat for described zoom level,
+                the same as "tickformat"
+""",
+            },
+        ),
+        "TickformatValidator": (
+            "tickformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TickfontValidator": (
+            "tickfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yref.YrefValidator",
-            "._ypad.YpadValidator",
-            "._yanchor.YanchorValidator",
-            "._y.YValidator",
-            "._xref.XrefValidator",
-            "._xpad.XpadValidator",
-            "._xanchor.XanchorValidator",
-            "._x.XValidator",
-            "._title.TitleValidator",
-            "._tickwidth.TickwidthValidator",
-            "._tickvalssrc.TickvalssrcValidator",
-            "._tickvals.TickvalsValidator",
-            "._ticktextsrc.TicktextsrcValidator",
-            "._ticktext.TicktextValidator",
-            "._ticksuffix.TicksuffixValidator",
-            "._ticks.TicksValidator",
-            "._tickprefix.TickprefixValidator",
-            "._tickmode.TickmodeValidator",
-            "._ticklen.TicklenValidator",
-            "._ticklabelstep.TicklabelstepValidator",
-            "._ticklabelposition.TicklabelpositionValidator",
-            "._ticklabeloverflow.TicklabeloverflowValidator",
-            "._tickformatstopdefaults.TickformatstopdefaultsValidator",
-            "._tickformatstops.TickformatstopsValidator",
-            "._tickformat.TickformatValidator",
-            "._tickfont.TickfontValidator",
-            "._tickcolor.TickcolorValidator",
-            "._tickangle.TickangleValidator",
-            "._tick0.Tick0Validator",
-            "._thicknessmode.ThicknessmodeValidator",
-            "._thickness.ThicknessValidator",
-            "._showticksuffix.ShowticksuffixValidator",
-            "._showtickprefix.ShowtickprefixValidator",
-            "._showticklabels.ShowticklabelsValidator",
-            "._showexponent.ShowexponentValidator",
-            "._separatethousands.SeparatethousandsValidator",
-            "._outlinewidth.OutlinewidthValidator",
-            "._outlinecolor.OutlinecolorValidator",
-            "._orientation.OrientationValidator",
-            "._nticks.NticksValidator",
-            "._minexponent.MinexponentValidator",
-            "._lenmode.LenmodeValidator",
-            "._len.LenValidator",
-            "._labelalias.LabelaliasValidator",
-            "._exponentformat.ExponentformatValidator",
-            "._dtick.DtickValidator",
-            "._borderwidth.BorderwidthValidator",
-            "._bordercolor.BordercolorValidator",
-            "._bgcolor.BgcolorValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "TickcolorValidator": (
+            "tickcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "TickangleValidator": (
+            "tickangle",
+            "_plotly_utils.basevalidators.AngleValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "Tick0Validator": (
+            "tick0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "colorbars",
+                "implied_edits": {"tickmode": "linear"},
+            },
+        ),
+        "ThicknessmodeValidator": (
+            "thicknessmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["fraction", "pixels"],
+            },
+        ),
+        "ThicknessValidator": (
+            "thickness",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "ShowticksuffixValidator": (
+            "showticksuffix",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowtickprefixValidator": (
+            "showtickprefix",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowticklabelsValidator": (
+            "showticklabels",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "ShowexponentValidator": (
+            "showexponent",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "SeparatethousandsValidator": (
+            "separatethousands",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "OutlinewidthValidator": (
+            "outlinewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "OutlinecolorValidator": (
+            "outlinecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["h", "v"],
+            },
+        ),
+        "NticksValidator": (
+            "nticks",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "MinexponentValidator": (
+            "minexponent",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "LenmodeValidator": (
+            "lenmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["fraction", "pixels"],
+            },
+        ),
+        "LenValidator": (
+            "len",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "LabelaliasValidator": (
+            "labelalias",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "ExponentformatValidator": (
+            "exponentformat",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "colorbars",
+                "values": ["none", "e", "E", "power", "SI", "B"],
+            },
+        ),
+        "DtickValidator": (
+            "dtick",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "colorbars",
+                "implied_edits": {"tickmode": "linear"},
+            },
+        ),
+        "BorderwidthValidator": (
+            "borderwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "colorbars",
+                "min": 0,
+            },
+        ),
+        "BordercolorValidator": (
+            "bordercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "colorbars",
+            },
+        ),
+    },
+    [],
+)
@@ -1,19 +1,51 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._opacitysrc import OpacitysrcValidator
-    from ._opacity import OpacityValidator
-    from ._line import LineValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._opacitysrc.OpacitysrcValidator",
-            "._opacity.OpacityValidator",
-            "._line.LineValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "choropleth.marker",
+    {
+        "OpacitysrcValidator": (
+            "opacitysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the marker.line color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `marker.line.cmin` and `marker.line.cmax` if
+                set.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            width
+                Sets the width (in px) of the lines bounding
+                the marker points.
+            widthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `width`.
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,11 +1,18 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._opacity import OpacityValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._opacity.OpacityValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "choropleth.selected.marker",
+    {
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        )
+    },
+    [],
+)
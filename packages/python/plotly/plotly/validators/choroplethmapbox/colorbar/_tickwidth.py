@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TickwidthValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(
-        self, plotly_name="tickwidth", parent_name="choroplethmapbox.colorbar", **kwargs
-    ):
-        super(TickwidthValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
@@ -1,12 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TicklenValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(self, plotly_name="ticklen", parent_name="cone.colorbar", **kwargs):
-        super(TicklenValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "colorbars"),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
@@ -1,13 +1,36 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._z import ZValidator
-    from ._y import YValidator
-    from ._x import XValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._z.ZValidator", "._y.YValidator", "._x.XValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "cone.lightposition",
+    {
+        "ZValidator": (
+            "z",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 100000,
+                "min": -100000,
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 100000,
+                "min": -100000,
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 100000,
+                "min": -100000,
+            },
+        ),
+    },
+    [],
+)
@@ -1,159 +1,1041 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._zsrc import ZsrcValidator
-    from ._zorder import ZorderValidator
-    from ._zmin import ZminValidator
-    from ._zmid import ZmidValidator
-    from ._zmax import ZmaxValidator
-    from ._zhoverformat import ZhoverformatValidator
-    from ._zauto import ZautoValidator
-    from ._z import ZValidator
-    from ._ytype import YtypeValidator
-    from ._ysrc import YsrcValidator
-    from ._yperiodalignment import YperiodalignmentValidator
-    from ._yperiod0 import Yperiod0Validator
-    from ._yperiod import YperiodValidator
-    from ._yhoverformat import YhoverformatValidator
-    from ._ycalendar import YcalendarValidator
-    from ._yaxis import YaxisValidator
-    from ._y0 import Y0Validator
-    from ._y import YValidator
-    from ._xtype import XtypeValidator
-    from ._xsrc import XsrcValidator
-    from ._xperiodalignment import XperiodalignmentValidator
-    from ._xperiod0 import Xperiod0Validator
-    from ._xperiod import XperiodValidator
-    from ._xhoverformat import XhoverformatValidator
-    from ._xcalendar import XcalendarValidator
-    from ._xaxis import XaxisValidator
-    from ._x0 import X0Validator
-    from ._x import XValidator
-    from ._visible import VisibleValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._transpose import TransposeValidator
-    from ._texttemplate import TexttemplateValidator
-    from ._textsrc import TextsrcValidator
-    from ._textfont import TextfontValidator
-    from ._text import TextValidator
-    from ._stream import StreamValidator
-    from ._showscale import ShowscaleValidator
-    from ._showlegend import ShowlegendValidator
-    from ._reversescale import ReversescaleValidator
-    from ._opacity import OpacityValidator
-    from ._ncontours import NcontoursValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._line import LineValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hovertemplatesrc import HovertemplatesrcValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoverongaps import HoverongapsValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._fillcolor import FillcolorValidator
-    from ._dy import DyValidator
-    from ._dx import DxValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._contours import ContoursValidator
-    from ._connectgaps import ConnectgapsValidator
-    from ._colorscale import ColorscaleValidator
-    from ._colorbar import ColorbarValidator
-    from ._coloraxis import ColoraxisValidator
-    from ._autocontour import AutocontourValidator
-    from ._autocolorscale import AutocolorscaleValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "contour",
+    {
+        "ZsrcValidator": (
+            "zsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ZorderValidator": (
+            "zorder",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ZminValidator": (
+            "zmin",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"zauto": False},
+            },
+        ),
+        "ZmidValidator": (
+            "zmid",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "ZmaxValidator": (
+            "zmax",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"zauto": False},
+            },
+        ),
+        "ZhoverformatValidator": (
+            "zhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ZautoValidator": (
+            "zauto",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "ZValidator": (
+            "z",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "YtypeValidator": (
+            "ytype",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "values": ["array", "scaled"],
+            },
+        ),
+        "YsrcValidator": (
+            "ysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YperiodalignmentValidator": (
+            "yperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"ytype": "scaled"},
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Yperiod0Validator": (
+            "yperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "YperiodValidator": (
+            "yperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"ytype": "scaled"},
+            },
+        ),
+        "YhoverformatValidator": (
+            "yhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YcalendarValidator": (
+            "ycalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "YaxisValidator": (
+            "yaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "y",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "Y0Validator": (
+            "y0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "implied_edits": {"ytype": "scaled"},
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "implied_edits": {"ytype": "array"},
+            },
+        ),
+        "XtypeValidator": (
+            "xtype",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "values": ["array", "scaled"],
+            },
+        ),
+        "XsrcValidator": (
+            "xsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XperiodalignmentValidator": (
+            "xperiodalignment",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"xtype": "scaled"},
+                "values": ["start", "middle", "end"],
+            },
+        ),
+        "Xperiod0Validator": (
+            "xperiod0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "XperiodValidator": (
+            "xperiod",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"xtype": "scaled"},
+            },
+        ),
+        "XhoverformatValidator": (
+            "xhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XcalendarValidator": (
+            "xcalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "XaxisValidator": (
+            "xaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "x",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "X0Validator": (
+            "x0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "implied_edits": {"xtype": "scaled"},
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "implied_edits": {"xtype": "array"},
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TransposeValidator": (
+            "transpose",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TexttemplateValidator": (
+            "texttemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextfontValidator": (
+            "textfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Textfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._zsrc.ZsrcValidator",
-            "._zorder.ZorderValidator",
-            "._zmin.ZminValidator",
-            "._zmid.ZmidValidator",
-            "._zmax.ZmaxValidator",
-            "._zhoverformat.ZhoverformatValidator",
-            "._zauto.ZautoValidator",
-            "._z.ZValidator",
-            "._ytype.YtypeValidator",
-            "._ysrc.YsrcValidator",
-            "._yperiodalignment.YperiodalignmentValidator",
-            "._yperiod0.Yperiod0Validator",
-            "._yperiod.YperiodValidator",
-            "._yhoverformat.YhoverformatValidator",
-            "._ycalendar.YcalendarValidator",
-            "._yaxis.YaxisValidator",
-            "._y0.Y0Validator",
-            "._y.YValidator",
-            "._xtype.XtypeValidator",
-            "._xsrc.XsrcValidator",
-            "._xperiodalignment.XperiodalignmentValidator",
-            "._xperiod0.Xperiod0Validator",
-            "._xperiod.XperiodValidator",
-            "._xhoverformat.XhoverformatValidator",
-            "._xcalendar.XcalendarValidator",
-            "._xaxis.XaxisValidator",
-            "._x0.X0Validator",
-            "._x.XValidator",
-            "._visible.VisibleValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._transpose.TransposeValidator",
-            "._texttemplate.TexttemplateValidator",
-            "._textsrc.TextsrcValidator",
-            "._textfont.TextfontValidator",
-            "._text.TextValidator",
-            "._stream.StreamValidator",
-            "._showscale.ShowscaleValidator",
-            "._showlegend.ShowlegendValidator",
-            "._reversescale.ReversescaleValidator",
-            "._opacity.OpacityValidator",
-            "._ncontours.NcontoursValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._line.LineValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hovertemplatesrc.HovertemplatesrcValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoverongaps.HoverongapsValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._fillcolor.FillcolorValidator",
-            "._dy.DyValidator",
-            "._dx.DxValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._contours.ContoursValidator",
-            "._connectgaps.ConnectgapsValidator",
-            "._colorscale.ColorscaleValidator",
-            "._colorbar.ColorbarValidator",
-            "._coloraxis.ColoraxisValidator",
-            "._autocontour.AutocontourValidator",
-            "._autocolorscale.AutocolorscaleValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "ShowscaleValidator": (
+            "showscale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "ReversescaleValidator": (
+            "reversescale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NcontoursValidator": (
+            "ncontours",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 1,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the color of the contour level. Has no
+                effect if `contours.coloring` is set to
+                "lines".
+            dash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            smoothing
+                Sets the amount of smoothing for the contour
+                lines, where 0 corresponds to no smoothing.
+            width
+                Sets the contour line width in (in px) Defaults
+                to 0.5 when `contours.type` is "levels".
+                Defaults to 2 when `contour.type` is
+                "constraint".
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HovertemplatesrcValidator": (
+            "hovertemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "HoverongapsValidator": (
+            "hoverongaps",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["x", "y", "z", "text", "name"],
+            },
+        ),
+        "FillcolorValidator": (
+            "fillcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+                "colorscale_path": "contour.colorscale",
+            },
+        ),
+        "DyValidator": (
+            "dy",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"ytype": "scaled"},
+            },
+        ),
+        "DxValidator": (
+            "dx",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"xtype": "scaled"},
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ContoursValidator": (
+            "contours",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Contours",
+                "data_docs": """
+            coloring
+                Determines the coloring method showing the
+                contour values. If "fill", coloring is done
+                evenly between each contour level If "heatmap",
+                a heatmap gradient coloring is applied between
+                each contour level. If "lines", coloring is
+                done on the contour lines. If "none", no
+                coloring is applied on this trace.
+            end
+                Sets the end contour level value. Must be more
+                than `contours.start`
+            labelfont
+                Sets the font used for labeling the contour
+                levels. The default color comes from the lines,
+                if shown. The default family and size come from
+                `layout.font`.
+            labelformat
+                Sets the contour label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format.
+            operation
+                Sets the constraint operation. "=" keeps
+                regions equal to `value` "<" and "<=" keep
+                regions less than `value` ">" and ">=" keep
+                regions greater than `value` "[]", "()", "[)",
+                and "(]" keep regions inside `value[0]` to
+                `value[1]` "][", ")(", "](", ")[" keep regions
+                outside `value[0]` to value[1]` Open vs. closed
+                intervals make no difference to constraint
+                display, but all versions are allowed for
+                consistency with filter transforms.
+            showlabels
+                Determines whether to label the contour lines
+                with their values.
+            showlines
+                Determines whether or not the contour lines are
+                drawn. Has an effect only if
+                `contours.coloring` is set to "fill".
+            size
+                Sets the step between each contour level. Must
+                be positive.
+            start
+                Sets the starting contour level value. Must be
+                less than `contours.end`
+            type
+                If `levels`, the data is represented as a
+                contour plot with multiple levels displayed. If
+                `constraint`, the data is represented as
+                constraints with the invalid region shaded as
+                specified by the `operation` and `value`
+                parameters.
+            value
+                Sets the value or values of the constraint
+                boundary. When `operation` is set to one of the
+                comparison values (=,<,>=,>,<=) "value" is
+                expected to be a number. When `operation` is
+                set to one of the interval values
+                ([],(),[),(],][,)(,](,)[) "value" is expected
+                to be an array of two numbers where the first
+                is the lower bound and the second is the upper
+                bound.
+""",
+            },
+        ),
+        "ConnectgapsValidator": (
+            "connectgaps",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ColorscaleValidator": (
+            "colorscale",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {"autocolorscale": False},
+            },
+        ),
+        "ColorbarValidator": (
+            "colorbar",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "ColorBar",
+                "data_docs": """
+            bgcolor
+                Sets the color of padded area.
+            bordercolor
+                Sets the axis line color.
+            borderwidth
+                Sets the width (in px) or the border enclosing
+                this color bar.
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            exponentformat
+                Determines a formatting rule for the tick
+                exponents. For example, consider the number
+                1,000,000,000. If "none", it appears as
+                1,000,000,000. If "e", 1e+9. If "E", 1E+9. If
+                "power", 1x10^9 (with 9 in a super script). If
+                "SI", 1G. If "B", 1B.
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            len
+                Sets the length of the color bar This measure
+                excludes the padding of both ends. That is, the
+                color bar length is this length minus the
+                padding on both ends.
+            lenmode
+                Determines whether this color bar's length
+                (i.e. the measure in the color variation
+                direction) is set in units of plot "fraction"
+                or in *pixels. Use `len` to set the value.
+            minexponent
+                Hide SI prefix for 10^n if |n| is below this
+                number. This only has an effect when
+                `tickformat` is "SI" or "B".
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            orientation
+                Sets the orientation of the colorbar.
+            outlinecolor
+                Sets the axis line color.
+            outlinewidth
+                Sets the width (in px) of the axis line.
+            separatethousands
+                If "true", even 4-digit integers are separated
+            showexponent
+                If "all", all exponents are shown besides their
+                significands. If "first", only the exponent of
+                the first tick is shown. If "last", only the
+                exponent of the last tick is shown. If "none",
+                no exponents appear.
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            thickness
+                Sets the thickness of the color bar This
+                measure excludes the size of the padding, ticks
+                and labels.
+            thicknessmode
+                Determines whether this color bar's thickness
+                (i.e. the measure in the constant color
+                direction) is set in units of plot "fraction"
+                or in "pixels". Use `thickness` to set the
+                value.
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the color bar's tick label font
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            tickformatstops
+                A tuple of :class:`plotly.graph_objects.contour
+                .colorbar.Tickformatstop` instances or dicts
+                with compatible properties
+            tickformatstopdefaults
+                When used in a template (as layout.template.dat
+                a.contour.colorbar.tickformatstopdefaults),
+                sets the default property values to use for
+                elements of contour.colorbar.tickformatstops
+            ticklabeloverflow
+                Determines how we handle tick labels that would
+                overflow either the graph div or the domain of
+                the axis. The default value for inside tick
+                labels is *hide past domain*. In other cases
+                the default is *hide past div*.
+            ticklabelposition
+                Determines where tick labels are drawn relative
+                to the ticks. Left and right options are used
+                when `orientation` is "h", top and bottom when
+                `orientation` is "v".
+            ticklabelstep
+                Sets the spacing between tick labels as
+                compared to the spacing between ticks. A value
+                of 1 (default) means each tick gets a label. A
+                value of 2 means shows every 2nd label. A
+                larger value n means only every nth tick is
+                labeled. `tick0` determines which labels are
+                shown. Not implemented for axes with `type`
+                "log" or "multicategory", or when `tickmode` is
+                "array".
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided).
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            ticksuffix
+                Sets a tick label suffix.
+            ticktext
+                Sets the text displayed at the ticks position
+                via `tickvals`. Only has an effect if
+                `tickmode` is set to "array". Used with
+                `tickvals`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            title
+                :class:`plotly.graph_objects.contour.colorbar.T
+                itle` instance or dict with compatible
+                properties
+            titlefont
+                Deprecated: Please use
+                contour.colorbar.title.font instead. Sets this
+                color bar's title font. Note that the title's
+                font used to be set by the now deprecated
+                `titlefont` attribute.
+            titleside
+                Deprecated: Please use
+                contour.colorbar.title.side instead. Determines
+                the location of color bar's title with respect
+                to the color bar. Defaults to "top" when
+                `orientation` if "v" and  defaults to "right"
+                when `orientation` if "h". Note that the
+                title's location used to be set by the now
+                deprecated `titleside` attribute.
+            x
+                Sets the x position with respect to `xref` of
+                the color bar (in plot fraction). When `xref`
+                is "paper", defaults to 1.02 when `orientation`
+                is "v" and 0.5 when `orientation` is "h". When
+                `xref` is "container", defaults to 1 when
+                `orientation` is "v" and 0.5 when `orientation`
+                is "h". Must be between 0 and 1 if `xref` is
+                "container" and between "-2" and 3 if `xref` is
+                "paper".
+            xanchor
+                Sets this color bar's horizontal position
+                anchor. This anchor binds the `x` position to
+                the "left", "center" or "right" of the color
+                bar. Defaults to "left" when `orientation` is
+                "v" and "center" when `orientation` is "h".
+            xpad
+                Sets the amount of padding (in px) along the x
+                direction.
+            xref
+                Sets the container `x` refers to. "container"
+                spans the entire `width` of the plot. "paper"
+                refers to the width of the plotting area only.
+            y
+                Sets the y position with respect to `yref` of
+                the color bar (in plot fraction). When `yref`
+                is "paper", defaults to 0.5 when `orientation`
+                is "v" and 1.02 when `orientation` is "h". When
+                `yref` is "container", defaults to 0.5 when
+                `orientation` is "v" and 1 when `orientation`
+                is "h". Must be between 0 and 1 if `yref` is
+                "container" and between "-2" and 3 if `yref` is
+                "paper".
+            yanchor
+                Sets this color bar's vertical position anchor
+                This anchor binds the `y` position to the
+                "top", "middle" or "bottom" of the color bar.
+                Defaults to "middle" when `orientation` is "v"
+                and "bottom" when `orientation` is "h".
+            ypad
+                Sets the amount of padding (in px) along the y
+                direction.
+            yref
+                Sets the container `y` refers to. "container"
+                spans the entire `height` of the plot. "paper"
+                refers to the height of the plotting area only.
+""",
+            },
+        ),
+        "ColoraxisValidator": (
+            "coloraxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": None,
+                "edit_type": "calc",
+                "regex": "/^coloraxis([2-9]|[1-9][0-9]+)?$/",
+            },
+        ),
+        "AutocontourValidator": (
+            "autocontour",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+        "AutocolorscaleValidator": (
+            "autocolorscale",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+                "implied_edits": {},
+            },
+        ),
+    },
+    [],
+)
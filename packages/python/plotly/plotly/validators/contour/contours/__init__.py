@@ -1,35 +1,137 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._value import ValueValidator
-    from ._type import TypeValidator
-    from ._start import StartValidator
-    from ._size import SizeValidator
-    from ._showlines import ShowlinesValidator
-    from ._showlabels import ShowlabelsValidator
-    from ._operation import OperationValidator
-    from ._labelformat import LabelformatValidator
-    from ._labelfont import LabelfontValidator
-    from ._end import EndValidator
-    from ._coloring import ColoringValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "contour.contours",
+    {
+        "ValueValidator": (
+            "value",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["levels", "constraint"],
+            },
+        ),
+        "StartValidator": (
+            "start",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"^autocontour": False},
+            },
+        ),
+        "SizeValidator": (
+            "size",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"^autocontour": False},
+                "min": 0,
+            },
+        ),
+        "ShowlinesValidator": (
+            "showlines",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowlabelsValidator": (
+            "showlabels",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "OperationValidator": (
+            "operation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "=",
+                    "<",
+                    ">=",
+                    ">",
+                    "<=",
+                    "[]",
+                    "()",
+                    "[)",
+                    "(]",
+                    "][",
+                    ")(",
+                    "](",
+                    ")[",
+                ],
+            },
+        ),
+        "LabelformatValidator": (
+            "labelformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "LabelfontValidator": (
+            "labelfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Labelfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._value.ValueValidator",
-            "._type.TypeValidator",
-            "._start.StartValidator",
-            "._size.SizeValidator",
-            "._showlines.ShowlinesValidator",
-            "._showlabels.ShowlabelsValidator",
-            "._operation.OperationValidator",
-            "._labelformat.LabelformatValidator",
-            "._labelfont.LabelfontValidator",
-            "._end.EndValidator",
-            "._coloring.ColoringValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "EndValidator": (
+            "end",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"^autocontour": False},
+            },
+        ),
+        "ColoringValidator": (
+            "coloring",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["fill", "heatmap", "lines", "none"],
+            },
+        ),
+    },
+    [],
+)
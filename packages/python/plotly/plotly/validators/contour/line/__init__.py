@@ -1,21 +1,48 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._width import WidthValidator
-    from ._smoothing import SmoothingValidator
-    from ._dash import DashValidator
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._width.WidthValidator",
-            "._smoothing.SmoothingValidator",
-            "._dash.DashValidator",
-            "._color.ColorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "contour.line",
+    {
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style+colorbars",
+                "min": 0,
+            },
+        ),
+        "SmoothingValidator": (
+            "smoothing",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1.3,
+                "min": 0,
+            },
+        ),
+        "DashValidator": (
+            "dash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "style",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "style+colorbars",
+            },
+        ),
+    },
+    [],
+)
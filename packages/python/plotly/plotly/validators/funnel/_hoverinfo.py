@@ -1,25 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class HoverinfoValidator(_plotly_utils.basevalidators.FlaglistValidator):
-    def __init__(self, plotly_name="hoverinfo", parent_name="funnel", **kwargs):
-        super(HoverinfoValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            array_ok=kwargs.pop("array_ok", True),
-            edit_type=kwargs.pop("edit_type", "none"),
-            extras=kwargs.pop("extras", ["all", "none", "skip"]),
-            flags=kwargs.pop(
-                "flags",
-                [
-                    "name",
-                    "x",
-                    "y",
-                    "text",
-                    "percent initial",
-                    "percent previous",
-                    "percent total",
-                ],
-            ),
-            **kwargs,
-        )
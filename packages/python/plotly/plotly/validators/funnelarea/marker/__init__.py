@@ -1,21 +1,101 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._pattern import PatternValidator
-    from ._line import LineValidator
-    from ._colorssrc import ColorssrcValidator
-    from ._colors import ColorsValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._pattern.PatternValidator",
-            "._line.LineValidator",
-            "._colorssrc.ColorssrcValidator",
-            "._colors.ColorsValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "funnelarea.marker",
+    {
+        "PatternValidator": (
+            "pattern",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Pattern",
+                "data_docs": """
+            bgcolor
+                When there is no colorscale sets the color of
+                background pattern fill. Defaults to a
+                `marker.color` background when `fillmode` is
+                "overlay". Otherwise, defaults to a transparent
+                background.
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            fgcolor
+                When there is no colorscale sets the color of
+                foreground pattern fill. Defaults to a
+                `marker.color` background when `fillmode` is
+                "replace". Otherwise, defaults to dark grey or
+                white to increase contrast with the `bgcolor`.
+            fgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `fgcolor`.
+            fgopacity
+                Sets the opacity of the foreground pattern
+                fill. Defaults to a 0.5 when `fillmode` is
+                "overlay". Otherwise, defaults to 1.
+            fillmode
+                Determines whether `marker.color` should be
+                used as a default to `bgcolor` or a `fgcolor`.
+            shape
+                Sets the shape of the pattern fill. By default,
+                no pattern is used for filling the area.
+            shapesrc
+                Sets the source reference on Chart Studio Cloud
+                for `shape`.
+            size
+                Sets the size of unit squares of the pattern
+                fill in pixels, which corresponds to the
+                interval of repetition of the pattern.
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            solidity
+                Sets the solidity of the pattern fill. Solidity
+                is roughly the fraction of the area filled by
+                the pattern. Solidity of 0 shows only the
+                background color without pattern and solidty of
+                1 shows only the foreground color without
+                pattern.
+            soliditysrc
+                Sets the source reference on Chart Studio Cloud
+                for `solidity`.
+""",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the color of the line enclosing each
+                sector. Defaults to the `paper_bgcolor` value.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            width
+                Sets the width (in px) of the line enclosing
+                each sector.
+            widthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `width`.
+""",
+            },
+        ),
+        "ColorssrcValidator": (
+            "colorssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColorsValidator": (
+            "colors",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
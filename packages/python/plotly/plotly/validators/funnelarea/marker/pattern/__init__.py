@@ -1,37 +1,105 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._soliditysrc import SoliditysrcValidator
-    from ._solidity import SolidityValidator
-    from ._sizesrc import SizesrcValidator
-    from ._size import SizeValidator
-    from ._shapesrc import ShapesrcValidator
-    from ._shape import ShapeValidator
-    from ._fillmode import FillmodeValidator
-    from ._fgopacity import FgopacityValidator
-    from ._fgcolorsrc import FgcolorsrcValidator
-    from ._fgcolor import FgcolorValidator
-    from ._bgcolorsrc import BgcolorsrcValidator
-    from ._bgcolor import BgcolorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._soliditysrc.SoliditysrcValidator",
-            "._solidity.SolidityValidator",
-            "._sizesrc.SizesrcValidator",
-            "._size.SizeValidator",
-            "._shapesrc.ShapesrcValidator",
-            "._shape.ShapeValidator",
-            "._fillmode.FillmodeValidator",
-            "._fgopacity.FgopacityValidator",
-            "._fgcolorsrc.FgcolorsrcValidator",
-            "._fgcolor.FgcolorValidator",
-            "._bgcolorsrc.BgcolorsrcValidator",
-            "._bgcolor.BgcolorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "funnelarea.marker.pattern",
+    {
+        "SoliditysrcValidator": (
+            "soliditysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SolidityValidator": (
+            "solidity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "SizesrcValidator": (
+            "sizesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SizeValidator": (
+            "size",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "ShapesrcValidator": (
+            "shapesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ShapeValidator": (
+            "shape",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+                "values": ["", "/", "\\", "x", "-", "|", "+", "."],
+            },
+        ),
+        "FillmodeValidator": (
+            "fillmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "style",
+                "values": ["replace", "overlay"],
+            },
+        ),
+        "FgopacityValidator": (
+            "fgopacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "FgcolorsrcValidator": (
+            "fgcolorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "FgcolorValidator": (
+            "fgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+        "BgcolorsrcValidator": (
+            "bgcolorsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+    },
+    [],
+)
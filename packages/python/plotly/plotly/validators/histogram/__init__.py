@@ -1,145 +1,1043 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._zorder import ZorderValidator
-    from ._ysrc import YsrcValidator
-    from ._yhoverformat import YhoverformatValidator
-    from ._ycalendar import YcalendarValidator
-    from ._ybins import YbinsValidator
-    from ._yaxis import YaxisValidator
-    from ._y import YValidator
-    from ._xsrc import XsrcValidator
-    from ._xhoverformat import XhoverformatValidator
-    from ._xcalendar import XcalendarValidator
-    from ._xbins import XbinsValidator
-    from ._xaxis import XaxisValidator
-    from ._x import XValidator
-    from ._visible import VisibleValidator
-    from ._unselected import UnselectedValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._texttemplate import TexttemplateValidator
-    from ._textsrc import TextsrcValidator
-    from ._textposition import TextpositionValidator
-    from ._textfont import TextfontValidator
-    from ._textangle import TextangleValidator
-    from ._text import TextValidator
-    from ._stream import StreamValidator
-    from ._showlegend import ShowlegendValidator
-    from ._selectedpoints import SelectedpointsValidator
-    from ._selected import SelectedValidator
-    from ._outsidetextfont import OutsidetextfontValidator
-    from ._orientation import OrientationValidator
-    from ._opacity import OpacityValidator
-    from ._offsetgroup import OffsetgroupValidator
-    from ._nbinsy import NbinsyValidator
-    from ._nbinsx import NbinsxValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._marker import MarkerValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._insidetextfont import InsidetextfontValidator
-    from ._insidetextanchor import InsidetextanchorValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hovertemplatesrc import HovertemplatesrcValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._histnorm import HistnormValidator
-    from ._histfunc import HistfuncValidator
-    from ._error_y import Error_YValidator
-    from ._error_x import Error_XValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._cumulative import CumulativeValidator
-    from ._constraintext import ConstraintextValidator
-    from ._cliponaxis import CliponaxisValidator
-    from ._bingroup import BingroupValidator
-    from ._autobiny import AutobinyValidator
-    from ._autobinx import AutobinxValidator
-    from ._alignmentgroup import AlignmentgroupValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "histogram",
+    {
+        "ZorderValidator": (
+            "zorder",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "YsrcValidator": (
+            "ysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YhoverformatValidator": (
+            "yhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "YcalendarValidator": (
+            "ycalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "YbinsValidator": (
+            "ybins",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "YBins",
+                "data_docs": """
+            end
+                Sets the end value for the y axis bins. The
+                last bin may not end exactly at this value, we
+                increment the bin edge by `size` from `start`
+                until we reach or exceed `end`. Defaults to the
+                maximum data value. Like `start`, for dates use
+                a date string, and for category data `end` is
+                based on the category serial numbers.
+            size
+                Sets the size of each y axis bin. Default
+                behavior: If `nbinsy` is 0 or omitted, we
+                choose a nice round bin size such that the
+                number of bins is about the same as the typical
+                number of samples in each bin. If `nbinsy` is
+                provided, we choose a nice round bin size
+                giving no more than that many bins. For date
+                data, use milliseconds or "M<n>" for months, as
+                in `axis.dtick`. For category data, the number
+                of categories to bin together (always defaults
+                to 1). If multiple non-overlaying histograms
+                share a subplot, the first explicit `size` is
+                used and all others discarded. If no `size` is
+                provided,the sample data from all traces is
+                combined to determine `size` as described
+                above.
+            start
+                Sets the starting value for the y axis bins.
+                Defaults to the minimum data value, shifted
+                down if necessary to make nice round values and
+                to remove ambiguous bin edges. For example, if
+                most of the data is integers we shift the bin
+                edges 0.5 down, so a `size` of 5 would have a
+                default `start` of -0.5, so it is clear that
+                0-4 are in the first bin, 5-9 in the second,
+                but continuous data gets a start of 0 and bins
+                [0,5), [5,10) etc. Dates behave similarly, and
+                `start` should be a date string. For category
+                data, `start` is based on the category serial
+                numbers, and defaults to -0.5. If multiple non-
+                overlaying histograms share a subplot, the
+                first explicit `start` is used exactly and all
+                others are shifted down (if necessary) to
+                differ from that one by an integer number of
+                bins.
+""",
+            },
+        ),
+        "YaxisValidator": (
+            "yaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "y",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XsrcValidator": (
+            "xsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XhoverformatValidator": (
+            "xhoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "XcalendarValidator": (
+            "xcalendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "XbinsValidator": (
+            "xbins",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "XBins",
+                "data_docs": """
+            end
+                Sets the end value for the x axis bins. The
+                last bin may not end exactly at this value, we
+                increment the bin edge by `size` from `start`
+                until we reach or exceed `end`. Defaults to the
+                maximum data value. Like `start`, for dates use
+                a date string, and for category data `end` is
+                based on the category serial numbers.
+            size
+                Sets the size of each x axis bin. Default
+                behavior: If `nbinsx` is 0 or omitted, we
+                choose a nice round bin size such that the
+                number of bins is about the same as the typical
+                number of samples in each bin. If `nbinsx` is
+                provided, we choose a nice round bin size
+                giving no more than that many bins. For date
+                data, use milliseconds or "M<n>" for months, as
+                in `axis.dtick`. For category data, the number
+                of categories to bin together (always defaults
+                to 1). If multiple non-overlaying histograms
+                share a subplot, the first explicit `size` is
+                used and all others discarded. If no `size` is
+                provided,the sample data from all traces is
+                combined to determine `size` as described
+                above.
+            start
+                Sets the starting value for the x axis bins.
+                Defaults to the minimum data value, shifted
+                down if necessary to make nice round values and
+                to remove ambiguous bin edges. For example, if
+                most of the data is integers we shift the bin
+                edges 0.5 down, so a `size` of 5 would have a
+                default `start` of -0.5, so it is clear that
+                0-4 are in the first bin, 5-9 in the second,
+                but continuous data gets a start of 0 and bins
+                [0,5), [5,10) etc. Dates behave similarly, and
+                `start` should be a date string. For category
+                data, `start` is based on the category serial
+                numbers, and defaults to -0.5. If multiple non-
+                overlaying histograms share a subplot, the
+                first explicit `start` is used exactly and all
+                others are shifted down (if necessary) to
+                differ from that one by an integer number of
+                bins.
+""",
+            },
+        ),
+        "XaxisValidator": (
+            "xaxis",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "x",
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UnselectedValidator": (
+            "unselected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Unselected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.histogram.unselect
+                ed.Marker` instance or dict with compatible
+                properties
+            textfont
+                :class:`plotly.graph_objects.histogram.unselect
+                ed.Textfont` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TexttemplateValidator": (
+            "texttemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextpositionValidator": (
+            "textposition",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "array_ok": False,
+                "edit_type": "calc",
+                "values": ["inside", "outside", "auto", "none"],
+            },
+        ),
+        "TextfontValidator": (
+            "textfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Textfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._zorder.ZorderValidator",
-            "._ysrc.YsrcValidator",
-            "._yhoverformat.YhoverformatValidator",
-            "._ycalendar.YcalendarValidator",
-            "._ybins.YbinsValidator",
-            "._yaxis.YaxisValidator",
-            "._y.YValidator",
-            "._xsrc.XsrcValidator",
-            "._xhoverformat.XhoverformatValidator",
-            "._xcalendar.XcalendarValidator",
-            "._xbins.XbinsValidator",
-            "._xaxis.XaxisValidator",
-            "._x.XValidator",
-            "._visible.VisibleValidator",
-            "._unselected.UnselectedValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._texttemplate.TexttemplateValidator",
-            "._textsrc.TextsrcValidator",
-            "._textposition.TextpositionValidator",
-            "._textfont.TextfontValidator",
-            "._textangle.TextangleValidator",
-            "._text.TextValidator",
-            "._stream.StreamValidator",
-            "._showlegend.ShowlegendValidator",
-            "._selectedpoints.SelectedpointsValidator",
-            "._selected.SelectedValidator",
-            "._outsidetextfont.OutsidetextfontValidator",
-            "._orientation.OrientationValidator",
-            "._opacity.OpacityValidator",
-            "._offsetgroup.OffsetgroupValidator",
-            "._nbinsy.NbinsyValidator",
-            "._nbinsx.NbinsxValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._marker.MarkerValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._insidetextfont.InsidetextfontValidator",
-            "._insidetextanchor.InsidetextanchorValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hovertemplatesrc.HovertemplatesrcValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._histnorm.HistnormValidator",
-            "._histfunc.HistfuncValidator",
-            "._error_y.Error_YValidator",
-            "._error_x.Error_XValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._cumulative.CumulativeValidator",
-            "._constraintext.ConstraintextValidator",
-            "._cliponaxis.CliponaxisValidator",
-            "._bingroup.BingroupValidator",
-            "._autobiny.AutobinyValidator",
-            "._autobinx.AutobinxValidator",
-            "._alignmentgroup.AlignmentgroupValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "TextangleValidator": (
+            "textangle",
+            "_plotly_utils.basevalidators.AngleValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "SelectedpointsValidator": (
+            "selectedpoints",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SelectedValidator": (
+            "selected",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Selected",
+                "data_docs": """
+            marker
+                :class:`plotly.graph_objects.histogram.selected
+                .Marker` instance or dict with compatible
+                properties
+            textfont
+                :class:`plotly.graph_objects.histogram.selected
+                .Textfont` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "OutsidetextfontValidator": (
+            "outsidetextfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Outsidetextfont",
+                "data_docs": """
+            color
+
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+clearAxisTypes",
+                "values": ["v", "h"],
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "OffsetgroupValidator": (
+            "offsetgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "NbinsyValidator": (
+            "nbinsy",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "NbinsxValidator": (
+            "nbinsx",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `marker.colorscale`. Has an
+                effect only if in `marker.color` is set to a
+                numerical array. In case `colorscale` is
+                unspecified or `autocolorscale` is true, the
+                default palette will be chosen according to
+                whether numbers in the `color` array are all
+                positive, all negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                in `marker.color`) or the bounds set in
+                `marker.cmin` and `marker.cmax` Has an effect
+                only if in `marker.color` is set to a numerical
+                array. Defaults to `false` when `marker.cmin`
+                and `marker.cmax` are set by the user.
+            cmax
+                Sets the upper bound of the color domain. Has
+                an effect only if in `marker.color` is set to a
+                numerical array. Value should have the same
+                units as in `marker.color` and if set,
+                `marker.cmin` must be set as well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `marker.cmin` and/or `marker.cmax` to
+                be equidistant to this point. Has an effect
+                only if in `marker.color` is set to a numerical
+                array. Value should have the same units as in
+                `marker.color`. Has no effect when
+                `marker.cauto` is `false`.
+            cmin
+                Sets the lower bound of the color domain. Has
+                an effect only if in `marker.color` is set to a
+                numerical array. Value should have the same
+                units as in `marker.color` and if set,
+                `marker.cmax` must be set as well.
+            color
+                Sets the marker color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `marker.cmin` and `marker.cmax` if set.
+            coloraxis
+                Sets a reference to a shared color axis.
+                References to these shared color axes are
+                "coloraxis", "coloraxis2", "coloraxis3", etc.
+                Settings for these shared color axes are set in
+                the layout, under `layout.coloraxis`,
+                `layout.coloraxis2`, etc. Note that multiple
+                color scales can be linked to the same color
+                axis.
+            colorbar
+                :class:`plotly.graph_objects.histogram.marker.C
+                olorBar` instance or dict with compatible
+                properties
+            colorscale
+                Sets the colorscale. Has an effect only if in
+                `marker.color` is set to a numerical array. The
+                colorscale must be an array containing arrays
+                mapping a normalized value to an rgb, rgba,
+                hex, hsl, hsv, or named color string. At
+                minimum, a mapping for the lowest (0) and
+                highest (1) values are required. For example,
+                `[[0, 'rgb(0,0,255)'], [1, 'rgb(255,0,0)']]`.
+                To control the bounds of the colorscale in
+                color space, use `marker.cmin` and
+                `marker.cmax`. Alternatively, `colorscale` may
+                be a palette name string of the following list:
+                Blackbody,Bluered,Blues,Cividis,Earth,Electric,
+                Greens,Greys,Hot,Jet,Picnic,Portland,Rainbow,Rd
+                Bu,Reds,Viridis,YlGnBu,YlOrRd.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            cornerradius
+                Sets the rounding of corners. May be an integer
+                number of pixels, or a percentage of bar width
+                (as a string ending in %). Defaults to
+                `layout.barcornerradius`. In stack or relative
+                barmode, the first trace to set cornerradius is
+                used for the whole stack.
+            line
+                :class:`plotly.graph_objects.histogram.marker.L
+                ine` instance or dict with compatible
+                properties
+            opacity
+                Sets the opacity of the bars.
+            opacitysrc
+                Sets the source reference on Chart Studio Cloud
+                for `opacity`.
+            pattern
+                Sets the pattern within the marker.
+            reversescale
+                Reverses the color mapping if true. Has an
+                effect only if in `marker.color` is set to a
+                numerical array. If true, `marker.cmin` will
+                correspond to the last color in the array and
+                `marker.cmax` will correspond to the first
+                color.
+            showscale
+                Determines whether or not a colorbar is
+                displayed for this trace. Has an effect only if
+                in `marker.color` is set to a numerical array.
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "InsidetextfontValidator": (
+            "insidetextfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Insidetextfont",
+                "data_docs": """
+            color
+
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "InsidetextanchorValidator": (
+            "insidetextanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["end", "middle", "start"],
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+        "HovertemplatesrcValidator": (
+            "hovertemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["x", "y", "z", "text", "name"],
+            },
+        ),
+        "HistnormValidator": (
+            "histnorm",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "",
+                    "percent",
+                    "probability",
+                    "density",
+                    "probability density",
+                ],
+            },
+        ),
+        "HistfuncValidator": (
+            "histfunc",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["count", "sum", "avg", "min", "max"],
+            },
+        ),
+        "Error_YValidator": (
+            "error_y",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "ErrorY",
+                "data_docs": """
+            array
+                Sets the data corresponding the length of each
+                error bar. Values are plotted relative to the
+                underlying data.
+            arrayminus
+                Sets the data corresponding the length of each
+                error bar in the bottom (left) direction for
+                vertical (horizontal) bars Values are plotted
+                relative to the underlying data.
+            arrayminussrc
+                Sets the source reference on Chart Studio Cloud
+                for `arrayminus`.
+            arraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `array`.
+            color
+                Sets the stoke color of the error bars.
+            symmetric
+                Determines whether or not the error bars have
+                the same length in both direction (top/bottom
+                for vertical bars, left/right for horizontal
+                bars.
+            thickness
+                Sets the thickness (in px) of the error bars.
+            traceref
+
+            tracerefminus
+
+            type
+                Determines the rule used to generate the error
+                bars. If *constant`, the bar lengths are of a
+                constant value. Set this constant in `value`.
+                If "percent", the bar lengths correspond to a
+                percentage of underlying data. Set this
+                percentage in `value`. If "sqrt", the bar
+                lengths correspond to the square of the
+                underlying data. If "data", the bar lengths are
+                set with data set `array`.
+            value
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars.
+            valueminus
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars in the bottom
+                (left) direction for vertical (horizontal) bars
+            visible
+                Determines whether or not this set of error
+                bars is visible.
+            width
+                Sets the width (in px) of the cross-bar at both
+                ends of the error bars.
+""",
+            },
+        ),
+        "Error_XValidator": (
+            "error_x",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "ErrorX",
+                "data_docs": """
+            array
+                Sets the data corresponding the length of each
+                error bar. Values are plotted relative to the
+                underlying data.
+            arrayminus
+                Sets the data corresponding the length of each
+                error bar in the bottom (left) direction for
+                vertical (horizontal) bars Values are plotted
+                relative to the underlying data.
+            arrayminussrc
+                Sets the source reference on Chart Studio Cloud
+                for `arrayminus`.
+            arraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `array`.
+            color
+                Sets the stoke color of the error bars.
+            copy_ystyle
+
+            symmetric
+                Determines whether or not the error bars have
+                the same length in both direction (top/bottom
+                for vertical bars, left/right for horizontal
+                bars.
+            thickness
+                Sets the thickness (in px) of the error bars.
+            traceref
+
+            tracerefminus
+
+            type
+                Determines the rule used to generate the error
+                bars. If *constant`, the bar lengths are of a
+                constant value. Set this constant in `value`.
+                If "percent", the bar lengths correspond to a
+                percentage of underlying data. Set this
+                percentage in `value`. If "sqrt", the bar
+                lengths correspond to the square of the
+                underlying data. If "data", the bar lengths are
+                set with data set `array`.
+            value
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars.
+            valueminus
+                Sets the value of either the percentage (if
+                `type` is set to "percent") or the constant (if
+                `type` is set to "constant") corresponding to
+                the lengths of the error bars in the bottom
+                (left) direction for vertical (horizontal) bars
+            visible
+                Determines whether or not this set of error
+                bars is visible.
+            width
+                Sets the width (in px) of the cross-bar at both
+                ends of the error bars.
+""",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CumulativeValidator": (
+            "cumulative",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Cumulative",
+                "data_docs": """
+            currentbin
+                Only applies if cumulative is enabled. Sets
+                whether the current bin is included, excluded,
+                or has half of its value included in the
+                current cumulative value. "include" is the
+                default for compatibility with various other
+                tools, however it introduces a half-bin bias to
+                the results. "exclude" makes the opposite half-
+                bin bias, and "half" removes it.
+            direction
+                Only applies if cumulative is enabled. If
+                "increasing" (default) we sum all prior bins,
+                so the result increases from left to right. If
+                "decreasing" we sum later bins so the result
+                decreases from left to right.
+            enabled
+                If true, display the cumulative distribution by
+                summing the binned values. Use the `direction`
+                and `centralbin` attributes to tune the
+                accumulation method. Note: in this mode, the
+                "density" `histnorm` settings behave the same
+                as their equivalents without "density": "" and
+                "density" both rise to the number of data
+                points, and "probability" and *probability
+                density* both rise to the number of sample
+                points.
+""",
+            },
+        ),
+        "ConstraintextValidator": (
+            "constraintext",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["inside", "outside", "both", "none"],
+            },
+        ),
+        "CliponaxisValidator": (
+            "cliponaxis",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "BingroupValidator": (
+            "bingroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "AutobinyValidator": (
+            "autobiny",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "AutobinxValidator": (
+            "autobinx",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "AlignmentgroupValidator": (
+            "alignmentgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
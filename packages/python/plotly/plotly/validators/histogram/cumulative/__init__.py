@@ -1,19 +1,32 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._enabled import EnabledValidator
-    from ._direction import DirectionValidator
-    from ._currentbin import CurrentbinValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._enabled.EnabledValidator",
-            "._direction.DirectionValidator",
-            "._currentbin.CurrentbinValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "histogram.cumulative",
+    {
+        "EnabledValidator": (
+            "enabled",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DirectionValidator": (
+            "direction",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["increasing", "decreasing"],
+            },
+        ),
+        "CurrentbinValidator": (
+            "currentbin",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["include", "exclude", "half"],
+            },
+        ),
+    },
+    [],
+)
@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class FgcolorValidator(_plotly_utils.basevalidators.ColorValidator):
-    def __init__(
-        self, plotly_name="fgcolor", parent_name="histogram.marker.pattern", **kwargs
-    ):
-        super(FgcolorValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            array_ok=kwargs.pop("array_ok", True),
-            edit_type=kwargs.pop("edit_type", "style"),
-            **kwargs,
-        )
@@ -1,15 +1,30 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._start import StartValidator
-    from ._size import SizeValidator
-    from ._end import EndValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        ["._start.StartValidator", "._size.SizeValidator", "._end.EndValidator"],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "histogram.ybins",
+    {
+        "StartValidator": (
+            "start",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SizeValidator": (
+            "size",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "EndValidator": (
+            "end",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
@@ -1,111 +1,752 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._valuessrc import ValuessrcValidator
-    from ._values import ValuesValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._tiling import TilingValidator
-    from ._texttemplatesrc import TexttemplatesrcValidator
-    from ._texttemplate import TexttemplateValidator
-    from ._textsrc import TextsrcValidator
-    from ._textposition import TextpositionValidator
-    from ._textinfo import TextinfoValidator
-    from ._textfont import TextfontValidator
-    from ._text import TextValidator
-    from ._stream import StreamValidator
-    from ._sort import SortValidator
-    from ._root import RootValidator
-    from ._pathbar import PathbarValidator
-    from ._parentssrc import ParentssrcValidator
-    from ._parents import ParentsValidator
-    from ._outsidetextfont import OutsidetextfontValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._maxdepth import MaxdepthValidator
-    from ._marker import MarkerValidator
-    from ._level import LevelValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legend import LegendValidator
-    from ._leaf import LeafValidator
-    from ._labelssrc import LabelssrcValidator
-    from ._labels import LabelsValidator
-    from ._insidetextfont import InsidetextfontValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hovertextsrc import HovertextsrcValidator
-    from ._hovertext import HovertextValidator
-    from ._hovertemplatesrc import HovertemplatesrcValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._domain import DomainValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._count import CountValidator
-    from ._branchvalues import BranchvaluesValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "icicle",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "ValuessrcValidator": (
+            "valuessrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ValuesValidator": (
+            "values",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "anim": True,
+                "edit_type": "plot",
+            },
+        ),
+        "TilingValidator": (
+            "tiling",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tiling",
+                "data_docs": """
+            flip
+                Determines if the positions obtained from
+                solver are flipped on each axis.
+            orientation
+                When set in conjunction with `tiling.flip`,
+                determines on which side the root nodes are
+                drawn in the chart. If `tiling.orientation` is
+                "v" and `tiling.flip` is "", the root nodes
+                appear at the top. If `tiling.orientation` is
+                "v" and `tiling.flip` is "y", the root nodes
+                appear at the bottom. If `tiling.orientation`
+                is "h" and `tiling.flip` is "", the root nodes
+                appear at the left. If `tiling.orientation` is
+                "h" and `tiling.flip` is "x", the root nodes
+                appear at the right.
+            pad
+                Sets the inner padding (in px).
+""",
+            },
+        ),
+        "TexttemplatesrcValidator": (
+            "texttemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TexttemplateValidator": (
+            "texttemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "TextsrcValidator": (
+            "textsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TextpositionValidator": (
+            "textposition",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "top left",
+                    "top center",
+                    "top right",
+                    "middle left",
+                    "middle center",
+                    "middle right",
+                    "bottom left",
+                    "bottom center",
+                    "bottom right",
+                ],
+            },
+        ),
+        "TextinfoValidator": (
+            "textinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "plot",
+                "extras": ["none"],
+                "flags": [
+                    "label",
+                    "text",
+                    "value",
+                    "current path",
+                    "percent root",
+                    "percent entry",
+                    "percent parent",
+                ],
+            },
+        ),
+        "TextfontValidator": (
+            "textfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Textfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._valuessrc.ValuessrcValidator",
-            "._values.ValuesValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._tiling.TilingValidator",
-            "._texttemplatesrc.TexttemplatesrcValidator",
-            "._texttemplate.TexttemplateValidator",
-            "._textsrc.TextsrcValidator",
-            "._textposition.TextpositionValidator",
-            "._textinfo.TextinfoValidator",
-            "._textfont.TextfontValidator",
-            "._text.TextValidator",
-            "._stream.StreamValidator",
-            "._sort.SortValidator",
-            "._root.RootValidator",
-            "._pathbar.PathbarValidator",
-            "._parentssrc.ParentssrcValidator",
-            "._parents.ParentsValidator",
-            "._outsidetextfont.OutsidetextfontValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._maxdepth.MaxdepthValidator",
-            "._marker.MarkerValidator",
-            "._level.LevelValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legend.LegendValidator",
-            "._leaf.LeafValidator",
-            "._labelssrc.LabelssrcValidator",
-            "._labels.LabelsValidator",
-            "._insidetextfont.InsidetextfontValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hovertextsrc.HovertextsrcValidator",
-            "._hovertext.HovertextValidator",
-            "._hovertemplatesrc.HovertemplatesrcValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._domain.DomainValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._count.CountValidator",
-            "._branchvalues.BranchvaluesValidator",
-        ],
-    )
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "SortValidator": (
+            "sort",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "RootValidator": (
+            "root",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Root",
+                "data_docs": """
+            color
+                sets the color of the root node for a
+                sunburst/treemap/icicle trace. this has no
+                effect when a colorscale is used to set the
+                markers.
+""",
+            },
+        ),
+        "PathbarValidator": (
+            "pathbar",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Pathbar",
+                "data_docs": """
+            edgeshape
+                Determines which shape is used for edges
+                between `barpath` labels.
+            side
+                Determines on which side of the the treemap the
+                `pathbar` should be presented.
+            textfont
+                Sets the font used inside `pathbar`.
+            thickness
+                Sets the thickness of `pathbar` (in px). If not
+                specified the `pathbar.textfont.size` is used
+                with 3 pixles extra padding on each side.
+            visible
+                Determines if the path bar is drawn i.e.
+                outside the trace `domain` and with one pixel
+                gap.
+""",
+            },
+        ),
+        "ParentssrcValidator": (
+            "parentssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ParentsValidator": (
+            "parents",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "OutsidetextfontValidator": (
+            "outsidetextfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Outsidetextfont",
+                "data_docs": """
+            color
+
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "MaxdepthValidator": (
+            "maxdepth",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "MarkerValidator": (
+            "marker",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Marker",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `marker.colorscale`. Has an
+                effect only if colors is set to a numerical
+                array. In case `colorscale` is unspecified or
+                `autocolorscale` is true, the default palette
+                will be chosen according to whether numbers in
+                the `color` array are all positive, all
+                negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                colors) or the bounds set in `marker.cmin` and
+                `marker.cmax` Has an effect only if colors is
+                set to a numerical array. Defaults to `false`
+                when `marker.cmin` and `marker.cmax` are set by
+                the user.
+            cmax
+                Sets the upper bound of the color domain. Has
+                an effect only if colors is set to a numerical
+                array. Value should have the same units as
+                colors and if set, `marker.cmin` must be set as
+                well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `marker.cmin` and/or `marker.cmax` to
+                be equidistant to this point. Has an effect
+                only if colors is set to a numerical array.
+                Value should have the same units as colors. Has
+                no effect when `marker.cauto` is `false`.
+            cmin
+                Sets the lower bound of the color domain. Has
+                an effect only if colors is set to a numerical
+                array. Value should have the same units as
+                colors and if set, `marker.cmax` must be set as
+                well.
+            coloraxis
+                Sets a reference to a shared color axis.
+                References to these shared color axes are
+                "coloraxis", "coloraxis2", "coloraxis3", etc.
+                Settings for these shared color axes are set in
+                the layout, under `layout.coloraxis`,
+                `layout.coloraxis2`, etc. Note that multiple
+                color scales can be linked to the same color
+                axis.
+            colorbar
+                :class:`plotly.graph_objects.icicle.marker.Colo
+                rBar` instance or dict with compatible
+                properties
+            colors
+                Sets the color of each sector of this trace. If
+                not specified, the default trace color set is
+                used to pick the sector colors.
+            colorscale
+                Sets the colorscale. Has an effect only if
+                colors is set to a numerical array. The
+                colorscale must be an array containing arrays
+                mapping a normalized value to an rgb, rgba,
+                hex, hsl, hsv, or named color string. At
+                minimum, a mapping for the lowest (0) and
+                highest (1) values are required. For example,
+                `[[0, 'rgb(0,0,255)'], [1, 'rgb(255,0,0)']]`.
+                To control the bounds of the colorscale in
+                color space, use `marker.cmin` and
+                `marker.cmax`. Alternatively, `colorscale` may
+                be a palette name string of the following list:
+                Blackbody,Bluered,Blues,Cividis,Earth,Electric,
+                Greens,Greys,Hot,Jet,Picnic,Portland,Rainbow,Rd
+                Bu,Reds,Viridis,YlGnBu,YlOrRd.
+            colorssrc
+                Sets the source reference on Chart Studio Cloud
+                for `colors`.
+            line
+                :class:`plotly.graph_objects.icicle.marker.Line
+                ` instance or dict with compatible properties
+            pattern
+                Sets the pattern within the marker.
+            reversescale
+                Reverses the color mapping if true. Has an
+                effect only if colors is set to a numerical
+                array. If true, `marker.cmin` will correspond
+                to the last color in the array and
+                `marker.cmax` will correspond to the first
+                color.
+            showscale
+                Determines whether or not a colorbar is
+                displayed for this trace. Has an effect only if
+                colors is set to a numerical array.
+""",
+            },
+        ),
+        "LevelValidator": (
+            "level",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "anim": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "LeafValidator": (
+            "leaf",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Leaf",
+                "data_docs": """
+            opacity
+                Sets the opacity of the leaves. With colorscale
+                it is defaulted to 1; otherwise it is defaulted
+                to 0.7
+""",
+            },
+        ),
+        "LabelssrcValidator": (
+            "labelssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LabelsValidator": (
+            "labels",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "InsidetextfontValidator": (
+            "insidetextfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Insidetextfont",
+                "data_docs": """
+            color
+
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            familysrc
+                Sets the source reference on Chart Studio Cloud
+                for `family`.
+            size
+
+            sizesrc
+                Sets the source reference on Chart Studio Cloud
+                for `size`.
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            stylesrc
+                Sets the source reference on Chart Studio Cloud
+                for `style`.
+            variant
+                Sets the variant of the font.
+            variantsrc
+                Sets the source reference on Chart Studio Cloud
+                for `variant`.
+            weight
+                Sets the weight (or boldness) of the font.
+            weightsrc
+                Sets the source reference on Chart Studio Cloud
+                for `weight`.
+""",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "anim": True,
+                "edit_type": "calc",
+            },
+        ),
+        "HovertextsrcValidator": (
+            "hovertextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "style",
+            },
+        ),
+        "HovertemplatesrcValidator": (
+            "hovertemplatesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": [
+                    "label",
+                    "text",
+                    "value",
+                    "name",
+                    "current path",
+                    "percent root",
+                    "percent entry",
+                    "percent parent",
+                ],
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this icicle trace .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this icicle trace .
+            x
+                Sets the horizontal domain of this icicle trace
+                (in plot fraction).
+            y
+                Sets the vertical domain of this icicle trace
+                (in plot fraction).
+""",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CountValidator": (
+            "count",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "calc",
+                "flags": ["branches", "leaves"],
+            },
+        ),
+        "BranchvaluesValidator": (
+            "branchvalues",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["remainder", "total"],
+            },
+        ),
+    },
+    [],
+)
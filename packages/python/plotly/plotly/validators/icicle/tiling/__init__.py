@@ -1,19 +1,33 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._pad import PadValidator
-    from ._orientation import OrientationValidator
-    from ._flip import FlipValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._pad.PadValidator",
-            "._orientation.OrientationValidator",
-            "._flip.FlipValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "icicle.tiling",
+    {
+        "PadValidator": (
+            "pad",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["v", "h"],
+            },
+        ),
+        "FlipValidator": (
+            "flip",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "plot",
+                "flags": ["x", "y"],
+            },
+        ),
+    },
+    [],
+)
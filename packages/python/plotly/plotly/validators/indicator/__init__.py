@@ -1,59 +1,295 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._value import ValueValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._title import TitleValidator
-    from ._stream import StreamValidator
-    from ._number import NumberValidator
-    from ._name import NameValidator
-    from ._mode import ModeValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legend import LegendValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._gauge import GaugeValidator
-    from ._domain import DomainValidator
-    from ._delta import DeltaValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._align import AlignValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._value.ValueValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._title.TitleValidator",
-            "._stream.StreamValidator",
-            "._number.NumberValidator",
-            "._name.NameValidator",
-            "._mode.ModeValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legend.LegendValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._gauge.GaugeValidator",
-            "._domain.DomainValidator",
-            "._delta.DeltaValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._align.AlignValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "indicator",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "ValueValidator": (
+            "value",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "anim": True,
+                "edit_type": "calc",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "anim": True,
+                "edit_type": "plot",
+            },
+        ),
+        "TitleValidator": (
+            "title",
+            "_plotly_utils.basevalidators.TitleValidator",
+            {
+                "data_class_str": "Title",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the title. It
+                defaults to `center` except for bullet charts
+                for which it defaults to right.
+            font
+                Set the font used to display the title
+            text
+                Sets the title of this indicator.
+""",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "NumberValidator": (
+            "number",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Number",
+                "data_docs": """
+            font
+                Set the font used to display main number
+            prefix
+                Sets a prefix appearing before the number.
+            suffix
+                Sets a suffix appearing next to the number.
+            valueformat
+                Sets the value formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format.
+""",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "ModeValidator": (
+            "mode",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "calc",
+                "flags": ["number", "delta", "gauge"],
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "anim": True,
+                "edit_type": "calc",
+            },
+        ),
+        "GaugeValidator": (
+            "gauge",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Gauge",
+                "data_docs": """
+            axis
+                :class:`plotly.graph_objects.indicator.gauge.Ax
+                is` instance or dict with compatible properties
+            bar
+                Set the appearance of the gauge's value
+            bgcolor
+                Sets the gauge background color.
+            bordercolor
+                Sets the color of the border enclosing the
+                gauge.
+            borderwidth
+                Sets the width (in px) of the border enclosing
+                the gauge.
+            shape
+                Set the shape of the gauge
+            steps
+                A tuple of :class:`plotly.graph_objects.indicat
+                or.gauge.Step` instances or dicts with
+                compatible properties
+            stepdefaults
+                When used in a template (as layout.template.dat
+                a.indicator.gauge.stepdefaults), sets the
+                default property values to use for elements of
+                indicator.gauge.steps
+            threshold
+                :class:`plotly.graph_objects.indicator.gauge.Th
+                reshold` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this indicator
+                trace .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this indicator trace .
+            x
+                Sets the horizontal domain of this indicator
+                trace (in plot fraction).
+            y
+                Sets the vertical domain of this indicator
+                trace (in plot fraction).
+""",
+            },
+        ),
+        "DeltaValidator": (
+            "delta",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Delta",
+                "data_docs": """
+            decreasing
+                :class:`plotly.graph_objects.indicator.delta.De
+                creasing` instance or dict with compatible
+                properties
+            font
+                Set the font used to display the delta
+            increasing
+                :class:`plotly.graph_objects.indicator.delta.In
+                creasing` instance or dict with compatible
+                properties
+            position
+                Sets the position of delta with respect to the
+                number.
+            prefix
+                Sets a prefix appearing before the delta.
+            reference
+                Sets the reference value to compute the delta.
+                By default, it is set to the current value.
+            relative
+                Show relative change
+            suffix
+                Sets a suffix appearing next to the delta.
+            valueformat
+                Sets the value formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format.
+""",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "AlignValidator": (
+            "align",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["left", "center", "right"],
+            },
+        ),
+    },
+    [],
+)
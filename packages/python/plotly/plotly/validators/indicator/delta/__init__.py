@@ -1,31 +1,115 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._valueformat import ValueformatValidator
-    from ._suffix import SuffixValidator
-    from ._relative import RelativeValidator
-    from ._reference import ReferenceValidator
-    from ._prefix import PrefixValidator
-    from ._position import PositionValidator
-    from ._increasing import IncreasingValidator
-    from ._font import FontValidator
-    from ._decreasing import DecreasingValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "indicator.delta",
+    {
+        "ValueformatValidator": (
+            "valueformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "SuffixValidator": (
+            "suffix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "RelativeValidator": (
+            "relative",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ReferenceValidator": (
+            "reference",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "PrefixValidator": (
+            "prefix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "PositionValidator": (
+            "position",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["top", "bottom", "left", "right"],
+            },
+        ),
+        "IncreasingValidator": (
+            "increasing",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Increasing",
+                "data_docs": """
+            color
+                Sets the color for increasing value.
+            symbol
+                Sets the symbol to display for increasing value
+""",
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._valueformat.ValueformatValidator",
-            "._suffix.SuffixValidator",
-            "._relative.RelativeValidator",
-            "._reference.ReferenceValidator",
-            "._prefix.PrefixValidator",
-            "._position.PositionValidator",
-            "._increasing.IncreasingValidator",
-            "._font.FontValidator",
-            "._decreasing.DecreasingValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "DecreasingValidator": (
+            "decreasing",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Decreasing",
+                "data_docs": """
+            color
+                Sets the color for increasing value.
+            symbol
+                Sets the symbol to display for increasing value
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,48 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class StepsValidator(_plotly_utils.basevalidators.CompoundArrayValidator):
-    def __init__(self, plotly_name="steps", parent_name="indicator.gauge", **kwargs):
-        super(StepsValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            data_class_str=kwargs.pop("data_class_str", "Step"),
-            data_docs=kwargs.pop(
-                "data_docs",
-                """
-            color
-                Sets the background color of the arc.
-            line
-                :class:`plotly.graph_objects.indicator.gauge.st
-                ep.Line` instance or dict with compatible
-                properties
-            name
-                When used in a template, named items are
-                created in the output figure in addition to any
-                items the figure already has in this array. You
-                can modify these items in the output figure by
-                making your own item with `templateitemname`
-                matching this `name` alongside your
-                modifications (including `visible: false` or
-                `enabled: false` to hide it). Has no effect
-                outside of a template.
-            range
-                Sets the range of this axis.
-            templateitemname
-                Used to refer to a named item in this array in
-                the template. Named items from the template
-                will be created even without a matching item in
-                the input figure, but you can modify one by
-                making an item with `templateitemname` matching
-                its `name`, alongside your modifications
-                (including `visible: false` or `enabled: false`
-                to hide it). If there is no template or no
-                matching item, this item will be hidden unless
-                you explicitly show it with `visible: true`.
-            thickness
-                Sets the thickness of the bar as a fraction of
-                the total thickness of the gauge.
-""",
-            ),
-            **kwargs,
-        )
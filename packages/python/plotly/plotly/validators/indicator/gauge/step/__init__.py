@@ -1,25 +1,65 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._thickness import ThicknessValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._range import RangeValidator
-    from ._name import NameValidator
-    from ._line import LineValidator
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._thickness.ThicknessValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._range.RangeValidator",
-            "._name.NameValidator",
-            "._line.LineValidator",
-            "._color.ColorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "indicator.gauge.step",
+    {
+        "ThicknessValidator": (
+            "thickness",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "RangeValidator": (
+            "range",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "valType": "number"},
+                    {"editType": "plot", "valType": "number"},
+                ],
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the color of the line enclosing each
+                sector.
+            width
+                Sets the width (in px) of the line enclosing
+                each sector.
+""",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
@@ -1,12 +1,25 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._show import ShowValidator
-    from ._fill import FillValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._show.ShowValidator", "._fill.FillValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "isosurface.caps.x",
+    {
+        "ShowValidator": (
+            "show",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "FillValidator": (
+            "fill",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
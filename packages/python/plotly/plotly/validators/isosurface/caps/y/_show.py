@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ShowValidator(_plotly_utils.basevalidators.BooleanValidator):
-    def __init__(self, plotly_name="show", parent_name="isosurface.caps.y", **kwargs):
-        super(ShowValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            **kwargs,
-        )
@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class FillValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(self, plotly_name="fill", parent_name="isosurface.caps.z", **kwargs):
-        super(FillValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            max=kwargs.pop("max", 1),
-            min=kwargs.pop("min", 0),
-            **kwargs,
-        )
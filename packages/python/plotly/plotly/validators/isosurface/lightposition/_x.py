@@ -1,15 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class XValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(
-        self, plotly_name="x", parent_name="isosurface.lightposition", **kwargs
-    ):
-        super(XValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            max=kwargs.pop("max", 100000),
-            min=kwargs.pop("min", -100000),
-            **kwargs,
-        )
@@ -1,21 +1,42 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._show import ShowValidator
-    from ._pattern import PatternValidator
-    from ._fill import FillValidator
-    from ._count import CountValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._show.ShowValidator",
-            "._pattern.PatternValidator",
-            "._fill.FillValidator",
-            "._count.CountValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "isosurface.surface",
+    {
+        "ShowValidator": (
+            "show",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "PatternValidator": (
+            "pattern",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "calc",
+                "extras": ["all", "odd", "even"],
+                "flags": ["A", "B", "C", "D", "E"],
+            },
+        ),
+        "FillValidator": (
+            "fill",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "CountValidator": (
+            "count",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "calc",
+                "min": 1,
+            },
+        ),
+    },
+    [],
+)
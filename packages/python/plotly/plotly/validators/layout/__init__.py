@@ -1,201 +1,3676 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yaxis import YaxisValidator
-    from ._xaxis import XaxisValidator
-    from ._width import WidthValidator
-    from ._waterfallmode import WaterfallmodeValidator
-    from ._waterfallgroupgap import WaterfallgroupgapValidator
-    from ._waterfallgap import WaterfallgapValidator
-    from ._violinmode import ViolinmodeValidator
-    from ._violingroupgap import ViolingroupgapValidator
-    from ._violingap import ViolingapValidator
-    from ._updatemenudefaults import UpdatemenudefaultsValidator
-    from ._updatemenus import UpdatemenusValidator
-    from ._uniformtext import UniformtextValidator
-    from ._uirevision import UirevisionValidator
-    from ._treemapcolorway import TreemapcolorwayValidator
-    from ._transition import TransitionValidator
-    from ._title import TitleValidator
-    from ._ternary import TernaryValidator
-    from ._template import TemplateValidator
-    from ._sunburstcolorway import SunburstcolorwayValidator
-    from ._spikedistance import SpikedistanceValidator
-    from ._smith import SmithValidator
-    from ._sliderdefaults import SliderdefaultsValidator
-    from ._sliders import SlidersValidator
-    from ._showlegend import ShowlegendValidator
-    from ._shapedefaults import ShapedefaultsValidator
-    from ._shapes import ShapesValidator
-    from ._separators import SeparatorsValidator
-    from ._selectiondefaults import SelectiondefaultsValidator
-    from ._selections import SelectionsValidator
-    from ._selectionrevision import SelectionrevisionValidator
-    from ._selectdirection import SelectdirectionValidator
-    from ._scene import SceneValidator
-    from ._scattermode import ScattermodeValidator
-    from ._scattergap import ScattergapValidator
-    from ._polar import PolarValidator
-    from ._plot_bgcolor import Plot_BgcolorValidator
-    from ._piecolorway import PiecolorwayValidator
-    from ._paper_bgcolor import Paper_BgcolorValidator
-    from ._newshape import NewshapeValidator
-    from ._newselection import NewselectionValidator
-    from ._modebar import ModebarValidator
-    from ._minreducedwidth import MinreducedwidthValidator
-    from ._minreducedheight import MinreducedheightValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._margin import MarginValidator
-    from ._mapbox import MapboxValidator
-    from ._legend import LegendValidator
-    from ._imagedefaults import ImagedefaultsValidator
-    from ._images import ImagesValidator
-    from ._iciclecolorway import IciclecolorwayValidator
-    from ._hoversubplots import HoversubplotsValidator
-    from ._hovermode import HovermodeValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverdistance import HoverdistanceValidator
-    from ._hidesources import HidesourcesValidator
-    from ._hiddenlabelssrc import HiddenlabelssrcValidator
-    from ._hiddenlabels import HiddenlabelsValidator
-    from ._height import HeightValidator
-    from ._grid import GridValidator
-    from ._geo import GeoValidator
-    from ._funnelmode import FunnelmodeValidator
-    from ._funnelgroupgap import FunnelgroupgapValidator
-    from ._funnelgap import FunnelgapValidator
-    from ._funnelareacolorway import FunnelareacolorwayValidator
-    from ._font import FontValidator
-    from ._extendtreemapcolors import ExtendtreemapcolorsValidator
-    from ._extendsunburstcolors import ExtendsunburstcolorsValidator
-    from ._extendpiecolors import ExtendpiecolorsValidator
-    from ._extendiciclecolors import ExtendiciclecolorsValidator
-    from ._extendfunnelareacolors import ExtendfunnelareacolorsValidator
-    from ._editrevision import EditrevisionValidator
-    from ._dragmode import DragmodeValidator
-    from ._datarevision import DatarevisionValidator
-    from ._computed import ComputedValidator
-    from ._colorway import ColorwayValidator
-    from ._colorscale import ColorscaleValidator
-    from ._coloraxis import ColoraxisValidator
-    from ._clickmode import ClickmodeValidator
-    from ._calendar import CalendarValidator
-    from ._boxmode import BoxmodeValidator
-    from ._boxgroupgap import BoxgroupgapValidator
-    from ._boxgap import BoxgapValidator
-    from ._barnorm import BarnormValidator
-    from ._barmode import BarmodeValidator
-    from ._bargroupgap import BargroupgapValidator
-    from ._bargap import BargapValidator
-    from ._barcornerradius import BarcornerradiusValidator
-    from ._autotypenumbers import AutotypenumbersValidator
-    from ._autosize import AutosizeValidator
-    from ._annotationdefaults import AnnotationdefaultsValidator
-    from ._annotations import AnnotationsValidator
-    from ._activeshape import ActiveshapeValidator
-    from ._activeselection import ActiveselectionValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout",
+    {
+        "YaxisValidator": (
+            "yaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "YAxis",
+                "data_docs": """
+            anchor
+                If set to an opposite-letter axis id (e.g.
+                `x2`, `y`), this axis is bound to the
+                corresponding opposite-letter axis. If set to
+                "free", this axis' position is determined by
+                `position`.
+            automargin
+                Determines whether long tick labels
+                automatically grow the figure margins.
+            autorange
+                Determines whether or not the range of this
+                axis is computed in relation to the input data.
+                See `rangemode` for more info. If `range` is
+                provided and it has a value for both the lower
+                and upper bound, `autorange` is set to False.
+                Using "min" applies autorange only to set the
+                minimum. Using "max" applies autorange only to
+                set the maximum. Using *min reversed* applies
+                autorange only to set the minimum on a reversed
+                axis. Using *max reversed* applies autorange
+                only to set the maximum on a reversed axis.
+                Using "reversed" applies autorange on both ends
+                and reverses the axis direction.
+            autorangeoptions
+                :class:`plotly.graph_objects.layout.yaxis.Autor
+                angeoptions` instance or dict with compatible
+                properties
+            autoshift
+                Automatically reposition the axis to avoid
+                overlap with other axes with the same
+                `overlaying` value. This repositioning will
+                account for any `shift` amount applied to other
+                axes on the same side with `autoshift` is set
+                to true. Only has an effect if `anchor` is set
+                to "free".
+            autotickangles
+                When `tickangle` is set to "auto", it will be
+                set to the first angle in this array that is
+                large enough to prevent label overlap.
+            autotypenumbers
+                Using "strict" a numeric string in trace data
+                is not converted to a number. Using *convert
+                types* a numeric string in trace data may be
+                treated as a number during automatic axis
+                `type` detection. Defaults to
+                layout.autotypenumbers.
+            calendar
+                Sets the calendar system to use for `range` and
+                `tick0` if this is a date axis. This does not
+                set the calendar for interpreting data on this
+                axis, that's specified in the trace or via the
+                global `layout.calendar`
+            categoryarray
+                Sets the order in which categories on this axis
+                appear. Only has an effect if `categoryorder`
+                is set to "array". Used with `categoryorder`.
+            categoryarraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `categoryarray`.
+            categoryorder
+                Specifies the ordering logic for the case of
+                categorical variables. By default, plotly uses
+                "trace", which specifies the order that is
+                present in the data supplied. Set
+                `categoryorder` to *category ascending* or
+                *category descending* if order should be
+                determined by the alphanumerical order of the
+                category names. Set `categoryorder` to "array"
+                to derive the ordering from the attribute
+                `categoryarray`. If a category is not found in
+                the `categoryarray` array, the sorting behavior
+                for that attribute will be identical to the
+                "trace" mode. The unspecified categories will
+                follow the categories in `categoryarray`. Set
+                `categoryorder` to *total ascending* or *total
+                descending* if order should be determined by
+                the numerical order of the values. Similarly,
+                the order can be determined by the min, max,
+                sum, mean or median of all the values.
+            color
+                Sets default for all colors associated with
+                this axis all at once: line, font, tick, and
+                grid colors. Grid color is lightened by
+                blending this with the plot background
+                Individual pieces can override this.
+            constrain
+                If this axis needs to be compressed (either due
+                to its own `scaleanchor` and `scaleratio` or
+                those of the other axis), determines how that
+                happens: by increasing the "range", or by
+                decreasing the "domain". Default is "domain"
+                for axes containing image traces, "range"
+                otherwise.
+            constraintoward
+                If this axis needs to be compressed (either due
+                to its own `scaleanchor` and `scaleratio` or
+                those of the other axis), determines which
+                direction we push the originally specified plot
+                area. Options are "left", "center" (default),
+                and "right" for x axes, and "top", "middle"
+                (default), and "bottom" for y axes.
+            dividercolor
+                Sets the color of the dividers Only has an
+                effect on "multicategory" axes.
+            dividerwidth
+                Sets the width (in px) of the dividers Only has
+                an effect on "multicategory" axes.
+            domain
+                Sets the domain of this axis (in plot
+                fraction).
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            exponentformat
+                Determines a formatting rule for the tick
+                exponents. For example, consider the number
+                1,000,000,000. If "none", it appears as
+                1,000,000,000. If "e", 1e+9. If "E", 1E+9. If
+                "power", 1x10^9 (with 9 in a super script). If
+                "SI", 1G. If "B", 1B.
+            fixedrange
+                Determines whether or not this axis is zoom-
+                able. If true, then zoom is disabled.
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            hoverformat
+                Sets the hover text formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            insiderange
+                Could be used to set the desired inside range
+                of this axis (excluding the labels) when
+                `ticklabelposition` of the anchored axis has
+                "inside". Not implemented for axes with `type`
+                "log". This would be ignored when `range` is
+                provided.
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            layer
+                Sets the layer on which this axis is displayed.
+                If *above traces*, this axis is displayed above
+                all the subplot's traces If *below traces*,
+                this axis is displayed below all the subplot's
+                traces, but above the grid lines. Useful when
+                used together with scatter-like traces with
+                `cliponaxis` set to False to show markers
+                and/or text nodes above this axis.
+            linecolor
+                Sets the axis line color.
+            linewidth
+                Sets the width (in px) of the axis line.
+            matches
+                If set to another axis id (e.g. `x2`, `y`), the
+                range of this axis will match the range of the
+                corresponding axis in data-coordinates space.
+                Moreover, matching axes share auto-range
+                values, category lists and histogram auto-bins.
+                Note that setting axes simultaneously in both a
+                `scaleanchor` and a `matches` constraint is
+                currently forbidden. Moreover, note that
+                matching axes must have the same `type`.
+            maxallowed
+                Determines the maximum range of this axis.
+            minallowed
+                Determines the minimum range of this axis.
+            minexponent
+                Hide SI prefix for 10^n if |n| is below this
+                number. This only has an effect when
+                `tickformat` is "SI" or "B".
+            minor
+                :class:`plotly.graph_objects.layout.yaxis.Minor
+                ` instance or dict with compatible properties
+            mirror
+                Determines if the axis lines or/and ticks are
+                mirrored to the opposite side of the plotting
+                area. If True, the axis lines are mirrored. If
+                "ticks", the axis lines and ticks are mirrored.
+                If False, mirroring is disable. If "all", axis
+                lines are mirrored on all shared-axes subplots.
+                If "allticks", axis lines and ticks are
+                mirrored on all shared-axes subplots.
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            overlaying
+                If set a same-letter axis id, this axis is
+                overlaid on top of the corresponding same-
+                letter axis, with traces and axes visible for
+                both axes. If False, this axis does not overlay
+                any same-letter axes. In this case, for axes
+                with overlapping domains only the highest-
+                numbered axis will be visible.
+            position
+                Sets the position of this axis in the plotting
+                space (in normalized coordinates). Only has an
+                effect if `anchor` is set to "free".
+            range
+                Sets the range of this axis. If the axis `type`
+                is "log", then you must take the log of your
+                desired range (e.g. to set the range from 1 to
+                100, set the range from 0 to 2). If the axis
+                `type` is "date", it should be date strings,
+                like date data, though Date objects and unix
+                milliseconds will be accepted and converted to
+                strings. If the axis `type` is "category", it
+                should be numbers, using the scale where each
+                category is assigned a serial number from zero
+                in the order it appears. Leaving either or both
+                elements `null` impacts the default
+                `autorange`.
+            rangebreaks
+                A tuple of :class:`plotly.graph_objects.layout.
+                yaxis.Rangebreak` instances or dicts with
+                compatible properties
+            rangebreakdefaults
+                When used in a template (as layout.template.lay
+                out.yaxis.rangebreakdefaults), sets the default
+                property values to use for elements of
+                layout.yaxis.rangebreaks
+            rangemode
+                If "normal", the range is computed in relation
+                to the extrema of the input data. If *tozero*`,
+                the range extends to 0, regardless of the input
+                data If "nonnegative", the range is non-
+                negative, regardless of the input data. Applies
+                only to linear axes.
+            scaleanchor
+                If set to another axis id (e.g. `x2`, `y`), the
+                range of this axis changes together with the
+                range of the corresponding axis such that the
+                scale of pixels per unit is in a constant
+                ratio. Both axes are still zoomable, but when
+                you zoom one, the other will zoom the same
+                amount, keeping a fixed midpoint. `constrain`
+                and `constraintoward` determine how we enforce
+                the constraint. You can chain these, ie `yaxis:
+                {scaleanchor: *x*}, xaxis2: {scaleanchor: *y*}`
+                but you can only link axes of the same `type`.
+                The linked axis can have the opposite letter
+                (to constrain the aspect ratio) or the same
+                letter (to match scales across subplots). Loops
+                (`yaxis: {scaleanchor: *x*}, xaxis:
+                {scaleanchor: *y*}` or longer) are redundant
+                and the last constraint encountered will be
+                ignored to avoid possible inconsistent
+                constraints via `scaleratio`. Note that setting
+                axes simultaneously in both a `scaleanchor` and
+                a `matches` constraint is currently forbidden.
+                Setting `false` allows to remove a default
+                constraint (occasionally, you may need to
+                prevent a default `scaleanchor` constraint from
+                being applied, eg. when having an image trace
+                `yaxis: {scaleanchor: "x"}` is set
+                automatically in order for pixels to be
+                rendered as squares, setting `yaxis:
+                {scaleanchor: false}` allows to remove the
+                constraint).
+            scaleratio
+                If this axis is linked to another by
+                `scaleanchor`, this determines the pixel to
+                unit scale ratio. For example, if this value is
+                10, then every unit on this axis spans 10 times
+                the number of pixels as a unit on the linked
+                axis. Use this for example to create an
+                elevation profile where the vertical scale is
+                exaggerated a fixed amount with respect to the
+                horizontal.
+            separatethousands
+                If "true", even 4-digit integers are separated
+            shift
+                Moves the axis a given number of pixels from
+                where it would have been otherwise. Accepts
+                both positive and negative values, which will
+                shift the axis either right or left,
+                respectively. If `autoshift` is set to true,
+                then this defaults to a padding of -3 if `side`
+                is set to "left". and defaults to +3 if `side`
+                is set to "right". Defaults to 0 if `autoshift`
+                is set to false. Only has an effect if `anchor`
+                is set to "free".
+            showdividers
+                Determines whether or not a dividers are drawn
+                between the category levels of this axis. Only
+                has an effect on "multicategory" axes.
+            showexponent
+                If "all", all exponents are shown besides their
+                significands. If "first", only the exponent of
+                the first tick is shown. If "last", only the
+                exponent of the last tick is shown. If "none",
+                no exponents appear.
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            showline
+                Determines whether or not a line bounding this
+                axis is drawn.
+            showspikes
+                Determines whether or not spikes (aka
+                droplines) are drawn for this axis. Note: This
+                only takes affect when hovermode = closest
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            side
+                Determines whether a x (y) axis is positioned
+                at the "bottom" ("left") or "top" ("right") of
+                the plotting area.
+            spikecolor
+                Sets the spike color. If undefined, will use
+                the series color
+            spikedash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            spikemode
+                Determines the drawing mode for the spike line
+                If "toaxis", the line is drawn from the data
+                point to the axis the  series is plotted on. If
+                "across", the line is drawn across the entire
+                plot area, and supercedes "toaxis". If
+                "marker", then a marker dot is drawn on the
+                axis the series is plotted on
+            spikesnap
+                Determines whether spikelines are stuck to the
+                cursor or to the closest datapoints.
+            spikethickness
+                Sets the width (in px) of the zero line.
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the tick font.
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            tickformatstops
+                A tuple of :class:`plotly.graph_objects.layout.
+                yaxis.Tickformatstop` instances or dicts with
+                compatible properties
+            tickformatstopdefaults
+                When used in a template (as layout.template.lay
+                out.yaxis.tickformatstopdefaults), sets the
+                default property values to use for elements of
+                layout.yaxis.tickformatstops
+            ticklabelmode
+                Determines where tick labels are drawn with
+                respect to their corresponding ticks and grid
+                lines. Only has an effect for axes of `type`
+                "date" When set to "period", tick labels are
+                drawn in the middle of the period between
+                ticks.
+            ticklabeloverflow
+                Determines how we handle tick labels that would
+                overflow either the graph div or the domain of
+                the axis. The default value for inside tick
+                labels is *hide past domain*. Otherwise on
+                "category" and "multicategory" axes the default
+                is "allow". In other cases the default is *hide
+                past div*.
+            ticklabelposition
+                Determines where tick labels are drawn with
+                respect to the axis Please note that top or
+                bottom has no effect on x axes or when
+                `ticklabelmode` is set to "period". Similarly
+                left or right has no effect on y axes or when
+                `ticklabelmode` is set to "period". Has no
+                effect on "multicategory" axes or when
+                `tickson` is set to "boundaries". When used on
+                axes linked by `matches` or `scaleanchor`, no
+                extra padding for inside labels would be added
+                by autorange, so that the scales could match.
+            ticklabelstep
+                Sets the spacing between tick labels as
+                compared to the spacing between ticks. A value
+                of 1 (default) means each tick gets a label. A
+                value of 2 means shows every 2nd label. A
+                larger value n means only every nth tick is
+                labeled. `tick0` determines which labels are
+                shown. Not implemented for axes with `type`
+                "log" or "multicategory", or when `tickmode` is
+                "array".
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided). If "sync", the number of ticks will
+                sync with the overlayed axis set by
+                `overlaying` property.
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            tickson
+                Determines where ticks and grid lines are drawn
+                with respect to their corresponding tick
+                labels. Only has an effect for axes of `type`
+                "category" or "multicategory". When set to
+                "boundaries", ticks and grid lines are drawn
+                half a category to the left/bottom of labels.
+            ticksuffix
+                Sets a tick label suffix.
+            ticktext
+                Sets the text displayed at the ticks position
+                via `tickvals`. Only has an effect if
+                `tickmode` is set to "array". Used with
+                `tickvals`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            title
+                :class:`plotly.graph_objects.layout.yaxis.Title
+                ` instance or dict with compatible properties
+            titlefont
+                Deprecated: Please use layout.yaxis.title.font
+                instead. Sets this axis' title font. Note that
+                the title's font used to be customized by the
+                now deprecated `titlefont` attribute.
+            type
+                Sets the axis type. By default, plotly attempts
+                to determined the axis type by looking into the
+                data of the traces that referenced the axis in
+                question.
+            uirevision
+                Controls persistence of user-driven changes in
+                axis `range`, `autorange`, and `title` if in
+                `editable: true` configuration. Defaults to
+                `layout.uirevision`.
+            visible
+                A single toggle to hide the axis while
+                preserving interaction like dragging. Default
+                is true when a cheater plot is present on the
+                axis, otherwise false
+            zeroline
+                Determines whether or not a line is drawn at
+                along the 0 value of this axis. If True, the
+                zero line is drawn on top of the grid lines.
+            zerolinecolor
+                Sets the line color of the zero line.
+            zerolinewidth
+                Sets the width (in px) of the zero line.
+""",
+            },
+        ),
+        "XaxisValidator": (
+            "xaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "XAxis",
+                "data_docs": """
+            anchor
+                If set to an opposite-letter axis id (e.g.
+                `x2`, `y`), this axis is bound to the
+                corresponding opposite-letter axis. If set to
+                "free", this axis' position is determined by
+                `position`.
+            automargin
+                Determines whether long tick labels
+                automatically grow the figure margins.
+            autorange
+                Determines whether or not the range of this
+                axis is computed in relation to the input data.
+                See `rangemode` for more info. If `range` is
+                provided and it has a value for both the lower
+                and upper bound, `autorange` is set to False.
+                Using "min" applies autorange only to set the
+                minimum. Using "max" applies autorange only to
+                set the maximum. Using *min reversed* applies
+                autorange only to set the minimum on a reversed
+                axis. Using *max reversed* applies autorange
+                only to set the maximum on a reversed axis.
+                Using "reversed" applies autorange on both ends
+                and reverses the axis direction.
+            autorangeoptions
+                :class:`plotly.graph_objects.layout.xaxis.Autor
+                angeoptions` instance or dict with compatible
+                properties
+            autotickangles
+                When `tickangle` is set to "auto", it will be
+                set to the first angle in this array that is
+                large enough to prevent label overlap.
+            autotypenumbers
+                Using "strict" a numeric string in trace data
+                is not converted to a number. Using *convert
+                types* a numeric string in trace data may be
+                treated as a number during automatic axis
+                `type` detection. Defaults to
+                layout.autotypenumbers.
+            calendar
+                Sets the calendar system to use for `range` and
+                `tick0` if this is a date axis. This does not
+                set the calendar for interpreting data on this
+                axis, that's specified in the trace or via the
+                global `layout.calendar`
+            categoryarray
+                Sets the order in which categories on this axis
+                appear. Only has an effect if `categoryorder`
+                is set to "array". Used with `categoryorder`.
+            categoryarraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `categoryarray`.
+            categoryorder
+                Specifies the ordering logic for the case of
+                categorical variables. By default, plotly uses
+                "trace", which specifies the order that is
+                present in the data supplied. Set
+                `categoryorder` to *category ascending* or
+                *category descending* if order should be
+                determined by the alphanumerical order of the
+                category names. Set `categoryorder` to "array"
+                to derive the ordering from the attribute
+                `categoryarray`. If a category is not found in
+                the `categoryarray` array, the sorting behavior
+                for that attribute will be identical to the
+                "trace" mode. The unspecified categories will
+                follow the categories in `categoryarray`. Set
+                `categoryorder` to *total ascending* or *total
+                descending* if order should be determined by
+                the numerical order of the values. Similarly,
+                the order can be determined by the min, max,
+                sum, mean or median of all the values.
+            color
+                Sets default for all colors associated with
+                this axis all at once: line, font, tick, and
+                grid colors. Grid color is lightened by
+                blending this with the plot background
+                Individual pieces can override this.
+            constrain
+                If this axis needs to be compressed (either due
+                to its own `scaleanchor` and `scaleratio` or
+                those of the other axis), determines how that
+                happens: by increasing the "range", or by
+                decreasing the "domain". Default is "domain"
+                for axes containing image traces, "range"
+                otherwise.
+            constraintoward
+                If this axis needs to be compressed (either due
+                to its own `scaleanchor` and `scaleratio` or
+                those of the other axis), determines which
+                direction we push the originally specified plot
+                area. Options are "left", "center" (default),
+                and "right" for x axes, and "top", "middle"
+                (default), and "bottom" for y axes.
+            dividercolor
+                Sets the color of the dividers Only has an
+                effect on "multicategory" axes.
+            dividerwidth
+                Sets the width (in px) of the dividers Only has
+                an effect on "multicategory" axes.
+            domain
+                Sets the domain of this axis (in plot
+                fraction).
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            exponentformat
+                Determines a formatting rule for the tick
+                exponents. For example, consider the number
+                1,000,000,000. If "none", it appears as
+                1,000,000,000. If "e", 1e+9. If "E", 1E+9. If
+                "power", 1x10^9 (with 9 in a super script). If
+                "SI", 1G. If "B", 1B.
+            fixedrange
+                Determines whether or not this axis is zoom-
+                able. If true, then zoom is disabled.
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            hoverformat
+                Sets the hover text formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            insiderange
+                Could be used to set the desired inside range
+                of this axis (excluding the labels) when
+                `ticklabelposition` of the anchored axis has
+                "inside". Not implemented for axes with `type`
+                "log". This would be ignored when `range` is
+                provided.
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            layer
+                Sets the layer on which this axis is displayed.
+                If *above traces*, this axis is displayed above
+                all the subplot's traces If *below traces*,
+                this axis is displayed below all the subplot's
+                traces, but above the grid lines. Useful when
+                used together with scatter-like traces with
+                `cliponaxis` set to False to show markers
+                and/or text nodes above this axis.
+            linecolor
+                Sets the axis line color.
+            linewidth
+                Sets the width (in px) of the axis line.
+            matches
+                If set to another axis id (e.g. `x2`, `y`), the
+                range of this axis will match the range of the
+                corresponding axis in data-coordinates space.
+                Moreover, matching axes share auto-range
+                values, category lists and histogram auto-bins.
+                Note that setting axes simultaneously in both a
+                `scaleanchor` and a `matches` constraint is
+                currently forbidden. Moreover, note that
+                matching axes must have the same `type`.
+            maxallowed
+                Determines the maximum range of this axis.
+            minallowed
+                Determines the minimum range of this axis.
+            minexponent
+                Hide SI prefix for 10^n if |n| is below this
+                number. This only has an effect when
+                `tickformat` is "SI" or "B".
+            minor
+                :class:`plotly.graph_objects.layout.xaxis.Minor
+                ` instance or dict with compatible properties
+            mirror
+                Determines if the axis lines or/and ticks are
+                mirrored to the opposite side of the plotting
+                area. If True, the axis lines are mirrored. If
+                "ticks", the axis lines and ticks are mirrored.
+                If False, mirroring is disable. If "all", axis
+                lines are mirrored on all shared-axes subplots.
+                If "allticks", axis lines and ticks are
+                mirrored on all shared-axes subplots.
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            overlaying
+                If set a same-letter axis id, this axis is
+                overlaid on top of the corresponding same-
+                letter axis, with traces and axes visible for
+                both axes. If False, this axis does not overlay
+                any same-letter axes. In this case, for axes
+                with overlapping domains only the highest-
+                numbered axis will be visible.
+            position
+                Sets the position of this axis in the plotting
+                space (in normalized coordinates). Only has an
+                effect if `anchor` is set to "free".
+            range
+                Sets the range of this axis. If the axis `type`
+                is "log", then you must take the log of your
+                desired range (e.g. to set the range from 1 to
+                100, set the range from 0 to 2). If the axis
+                `type` is "date", it should be date strings,
+                like date data, though Date objects and unix
+                milliseconds will be accepted and converted to
+                strings. If the axis `type` is "category", it
+                should be numbers, using the scale where each
+                category is assigned a serial number from zero
+                in the order it appears. Leaving either or both
+                elements `null` impacts the default
+                `autorange`.
+            rangebreaks
+                A tuple of :class:`plotly.graph_objects.layout.
+                xaxis.Rangebreak` instances or dicts with
+                compatible properties
+            rangebreakdefaults
+                When used in a template (as layout.template.lay
+                out.xaxis.rangebreakdefaults), sets the default
+                property values to use for elements of
+                layout.xaxis.rangebreaks
+            rangemode
+                If "normal", the range is computed in relation
+                to the extrema of the input data. If *tozero*`,
+                the range extends to 0, regardless of the input
+                data If "nonnegative", the range is non-
+                negative, regardless of the input data. Applies
+                only to linear axes.
+            rangeselector
+                :class:`plotly.graph_objects.layout.xaxis.Range
+                selector` instance or dict with compatible
+                properties
+            rangeslider
+                :class:`plotly.graph_objects.layout.xaxis.Range
+                slider` instance or dict with compatible
+                properties
+            scaleanchor
+                If set to another axis id (e.g. `x2`, `y`), the
+                range of this axis changes together with the
+                range of the corresponding axis such that the
+                scale of pixels per unit is in a constant
+                ratio. Both axes are still zoomable, but when
+                you zoom one, the other will zoom the same
+                amount, keeping a fixed midpoint. `constrain`
+                and `constraintoward` determine how we enforce
+                the constraint. You can chain these, ie `yaxis:
+                {scaleanchor: *x*}, xaxis2: {scaleanchor: *y*}`
+                but you can only link axes of the same `type`.
+                The linked axis can have the opposite letter
+                (to constrain the aspect ratio) or the same
+                letter (to match scales across subplots). Loops
+                (`yaxis: {scaleanchor: *x*}, xaxis:
+                {scaleanchor: *y*}` or longer) are redundant
+                and the last constraint encountered will be
+                ignored to avoid possible inconsistent
+                constraints via `scaleratio`. Note that setting
+                axes simultaneously in both a `scaleanchor` and
+                a `matches` constraint is currently forbidden.
+                Setting `false` allows to remove a default
+                constraint (occasionally, you may need to
+                prevent a default `scaleanchor` constraint from
+                being applied, eg. when having an image trace
+                `yaxis: {scaleanchor: "x"}` is set
+                automatically in order for pixels to be
+                rendered as squares, setting `yaxis:
+                {scaleanchor: false}` allows to remove the
+                constraint).
+            scaleratio
+                If this axis is linked to another by
+                `scaleanchor`, this determines the pixel to
+                unit scale ratio. For example, if this value is
+                10, then every unit on this axis spans 10 times
+                the number of pixels as a unit on the linked
+                axis. Use this for example to create an
+                elevation profile where the vertical scale is
+                exaggerated a fixed amount with respect to the
+                horizontal.
+            separatethousands
+                If "true", even 4-digit integers are separated
+            showdividers
+                Determines whether or not a dividers are drawn
+                between the category levels of this axis. Only
+                has an effect on "multicategory" axes.
+            showexponent
+                If "all", all exponents are shown besides their
+                significands. If "first", only the exponent of
+                the first tick is shown. If "last", only the
+                exponent of the last tick is shown. If "none",
+                no exponents appear.
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            showline
+                Determines whether or not a line bounding this
+                axis is drawn.
+            showspikes
+                Determines whether or not spikes (aka
+                droplines) are drawn for this axis. Note: This
+                only takes affect when hovermode = closest
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            side
+                Determines whether a x (y) axis is positioned
+                at the "bottom" ("left") or "top" ("right") of
+                the plotting area.
+            spikecolor
+                Sets the spike color. If undefined, will use
+                the series color
+            spikedash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            spikemode
+                Determines the drawing mode for the spike line
+                If "toaxis", the line is drawn from the data
+                point to the axis the  series is plotted on. If
+                "across", the line is drawn across the entire
+                plot area, and supercedes "toaxis". If
+                "marker", then a marker dot is drawn on the
+                axis the series is plotted on
+            spikesnap
+                Determines whether spikelines are stuck to the
+                cursor or to the closest datapoints.
+            spikethickness
+                Sets the width (in px) of the zero line.
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the tick font.
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            tickformatstops
+                A tuple of :class:`plotly.graph_objects.layout.
+                xaxis.Tickformatstop` instances or dicts with
+                compatible properties
+            tickformatstopdefaults
+                When used in a template (as layout.template.lay
+                out.xaxis.tickformatstopdefaults), sets the
+                default property values to use for elements of
+                layout.xaxis.tickformatstops
+            ticklabelmode
+                Determines where tick labels are drawn with
+                respect to their corresponding ticks and grid
+                lines. Only has an effect for axes of `type`
+                "date" When set to "period", tick labels are
+                drawn in the middle of the period between
+                ticks.
+            ticklabeloverflow
+                Determines how we handle tick labels that would
+                overflow either the graph div or the domain of
+                the axis. The default value for inside tick
+                labels is *hide past domain*. Otherwise on
+                "category" and "multicategory" axes the default
+                is "allow". In other cases the default is *hide
+                past div*.
+            ticklabelposition
+                Determines where tick labels are drawn with
+                respect to the axis Please note that top or
+                bottom has no effect on x axes or when
+                `ticklabelmode` is set to "period". Similarly
+                left or right has no effect on y axes or when
+                `ticklabelmode` is set to "period". Has no
+                effect on "multicategory" axes or when
+                `tickson` is set to "boundaries". When used on
+                axes linked by `matches` or `scaleanchor`, no
+                extra padding for inside labels would be added
+                by autorange, so that the scales could match.
+            ticklabelstep
+                Sets the spacing between tick labels as
+                compared to the spacing between ticks. A value
+                of 1 (default) means each tick gets a label. A
+                value of 2 means shows every 2nd label. A
+                larger value n means only every nth tick is
+                labeled. `tick0` determines which labels are
+                shown. Not implemented for axes with `type`
+                "log" or "multicategory", or when `tickmode` is
+                "array".
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided). If "sync", the number of ticks will
+                sync with the overlayed axis set by
+                `overlaying` property.
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            tickson
+                Determines where ticks and grid lines are drawn
+                with respect to their corresponding tick
+                labels. Only has an effect for axes of `type`
+                "category" or "multicategory". When set to
+                "boundaries", ticks and grid lines are drawn
+                half a category to the left/bottom of labels.
+            ticksuffix
+                Sets a tick label suffix.
+            ticktext
+                Sets the text displayed at the ticks position
+                via `tickvals`. Only has an effect if
+                `tickmode` is set to "array". Used with
+                `tickvals`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            title
+                :class:`plotly.graph_objects.layout.xaxis.Title
+                ` instance or dict with compatible properties
+            titlefont
+                Deprecated: Please use layout.xaxis.title.font
+                instead. Sets this axis' title font. Note that
+                the title's font used to be customized by the
+                now deprecated `titlefont` attribute.
+            type
+                Sets the axis type. By default, plotly attempts
+                to determined the axis type by looking into the
+                data of the traces that referenced the axis in
+                question.
+            uirevision
+                Controls persistence of user-driven changes in
+                axis `range`, `autorange`, and `title` if in
+                `editable: true` configuration. Defaults to
+                `layout.uirevision`.
+            visible
+                A single toggle to hide the axis while
+                preserving interaction like dragging. Default
+                is true when a cheater plot is present on the
+                axis, otherwise false
+            zeroline
+                Determines whether or not a line is drawn at
+                along the 0 value of this axis. If True, the
+                zero line is drawn on top of the grid lines.
+            zerolinecolor
+                Sets the line color of the zero line.
+            zerolinewidth
+                Sets the width (in px) of the zero line.
+""",
+            },
+        ),
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 10,
+            },
+        ),
+        "WaterfallmodeValidator": (
+            "waterfallmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["group", "overlay"],
+            },
+        ),
+        "WaterfallgroupgapValidator": (
+            "waterfallgroupgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "WaterfallgapValidator": (
+            "waterfallgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "ViolinmodeValidator": (
+            "violinmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["group", "overlay"],
+            },
+        ),
+        "ViolingroupgapValidator": (
+            "violingroupgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "ViolingapValidator": (
+            "violingap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "UpdatemenudefaultsValidator": (
+            "updatemenudefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Updatemenu",
+                "data_docs": """
+""",
+            },
+        ),
+        "UpdatemenusValidator": (
+            "updatemenus",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Updatemenu",
+                "data_docs": """
+            active
+                Determines which button (by index starting from
+                0) is considered active.
+            bgcolor
+                Sets the background color of the update menu
+                buttons.
+            bordercolor
+                Sets the color of the border enclosing the
+                update menu.
+            borderwidth
+                Sets the width (in px) of the border enclosing
+                the update menu.
+            buttons
+                A tuple of :class:`plotly.graph_objects.layout.
+                updatemenu.Button` instances or dicts with
+                compatible properties
+            buttondefaults
+                When used in a template (as layout.template.lay
+                out.updatemenu.buttondefaults), sets the
+                default property values to use for elements of
+                layout.updatemenu.buttons
+            direction
+                Determines the direction in which the buttons
+                are laid out, whether in a dropdown menu or a
+                row/column of buttons. For `left` and `up`, the
+                buttons will still appear in left-to-right or
+                top-to-bottom order respectively.
+            font
+                Sets the font of the update menu button text.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            pad
+                Sets the padding around the buttons or dropdown
+                menu.
+            showactive
+                Highlights active dropdown item or active
+                button if true.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            type
+                Determines whether the buttons are accessible
+                via a dropdown menu or whether the buttons are
+                stacked horizontally or vertically
+            visible
+                Determines whether or not the update menu is
+                visible.
+            x
+                Sets the x position (in normalized coordinates)
+                of the update menu.
+            xanchor
+                Sets the update menu's horizontal position
+                anchor. This anchor binds the `x` position to
+                the "left", "center" or "right" of the range
+                selector.
+            y
+                Sets the y position (in normalized coordinates)
+                of the update menu.
+            yanchor
+                Sets the update menu's vertical position anchor
+                This anchor binds the `y` position to the
+                "top", "middle" or "bottom" of the range
+                selector.
+""",
+            },
+        ),
+        "UniformtextValidator": (
+            "uniformtext",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Uniformtext",
+                "data_docs": """
+            minsize
+                Sets the minimum text size between traces of
+                the same type.
+            mode
+                Determines how the font size for various text
+                elements are uniformed between each trace type.
+                If the computed text sizes were smaller than
+                the minimum size defined by
+                `uniformtext.minsize` using "hide" option hides
+                the text; and using "show" option shows the
+                text without further downscaling. Please note
+                that if the size defined by `minsize` is
+                greater than the font size defined by trace,
+                then the `minsize` is used.
+""",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TreemapcolorwayValidator": (
+            "treemapcolorway",
+            "_plotly_utils.basevalidators.ColorlistValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "TransitionValidator": (
+            "transition",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Transition",
+                "data_docs": """
+            duration
+                The duration of the transition, in
+                milliseconds. If equal to zero, updates are
+                synchronous.
+            easing
+                The easing function used for the transition
+            ordering
+                Determines whether the figure's layout or
+                traces smoothly transitions during updates that
+                make both traces and layout change.
+""",
+            },
+        ),
+        "TitleValidator": (
+            "title",
+            "_plotly_utils.basevalidators.TitleValidator",
+            {
+                "data_class_str": "Title",
+                "data_docs": """
+            automargin
+                Determines whether the title can automatically
+                push the figure margins. If `yref='paper'` then
+                the margin will expand to ensure that the title
+                doesn’t overlap with the edges of the
+                container. If `yref='container'` then the
+                margins will ensure that the title doesn’t
+                overlap with the plot area, tick labels, and
+                axis titles. If `automargin=true` and the
+                margins need to be expanded, then y will be set
+                to a default 1 and yanchor will be set to an
+                appropriate default to ensure that minimal
+                margin space is needed. Note that when
+                `yref='paper'`, only 1 or 0 are allowed y
+                values. Invalid values will be reset to the
+                default 1.
+            font
+                Sets the title font. Note that the title's font
+                used to be customized by the now deprecated
+                `titlefont` attribute.
+            pad
+                Sets the padding of the title. Each padding
+                value only applies when the corresponding
+                `xanchor`/`yanchor` value is set accordingly.
+                E.g. for left padding to take effect, `xanchor`
+                must be set to "left". The same rule applies if
+                `xanchor`/`yanchor` is determined
+                automatically. Padding is muted if the
+                respective anchor value is "middle*/*center".
+            text
+                Sets the plot's title. Note that before the
+                existence of `title.text`, the title's contents
+                used to be defined as the `title` attribute
+                itself. This behavior has been deprecated.
+            x
+                Sets the x position with respect to `xref` in
+                normalized coordinates from 0 (left) to 1
+                (right).
+            xanchor
+                Sets the title's horizontal alignment with
+                respect to its x position. "left" means that
+                the title starts at x, "right" means that the
+                title ends at x and "center" means that the
+                title's center is at x. "auto" divides `xref`
+                by three and calculates the `xanchor` value
+                automatically based on the value of `x`.
+            xref
+                Sets the container `x` refers to. "container"
+                spans the entire `width` of the plot. "paper"
+                refers to the width of the plotting area only.
+            y
+                Sets the y position with respect to `yref` in
+                normalized coordinates from 0 (bottom) to 1
+                (top). "auto" places the baseline of the title
+                onto the vertical center of the top margin.
+            yanchor
+                Sets the title's vertical alignment with
+                respect to its y position. "top" means that the
+                title's cap line is at y, "bottom" means that
+                the title's baseline is at y and "middle" means
+                that the title's midline is at y. "auto"
+                divides `yref` by three and calculates the
+                `yanchor` value automatically based on the
+                value of `y`.
+            yref
+                Sets the container `y` refers to. "container"
+                spans the entire `height` of the plot. "paper"
+                refers to the height of the plotting area only.
+""",
+            },
+        ),
+        "TernaryValidator": (
+            "ternary",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Ternary",
+                "data_docs": """
+            aaxis
+                :class:`plotly.graph_objects.layout.ternary.Aax
+                is` instance or dict with compatible properties
+            baxis
+                :class:`plotly.graph_objects.layout.ternary.Bax
+                is` instance or dict with compatible properties
+            bgcolor
+                Set the background color of the subplot
+            caxis
+                :class:`plotly.graph_objects.layout.ternary.Cax
+                is` instance or dict with compatible properties
+            domain
+                :class:`plotly.graph_objects.layout.ternary.Dom
+                ain` instance or dict with compatible
+                properties
+            sum
+                The number each triplet should sum to, and the
+                maximum range of each axis
+            uirevision
+                Controls persistence of user-driven changes in
+                axis `min` and `title`, if not overridden in
+                the individual axes. Defaults to
+                `layout.uirevision`.
+""",
+            },
+        ),
+        "TemplateValidator": (
+            "template",
+            "_plotly_utils.basevalidators.BaseTemplateValidator",
+            {
+                "data_class_str": "Template",
+                "data_docs": """
+            data
+                :class:`plotly.graph_objects.layout.template.Da
+                ta` instance or dict with compatible properties
+            layout
+                :class:`plotly.graph_objects.Layout` instance
+                or dict with compatible properties
+""",
+            },
+        ),
+        "SunburstcolorwayValidator": (
+            "sunburstcolorway",
+            "_plotly_utils.basevalidators.ColorlistValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SpikedistanceValidator": (
+            "spikedistance",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "none",
+                "min": -1,
+            },
+        ),
+        "SmithValidator": (
+            "smith",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Smith",
+                "data_docs": """
+            bgcolor
+                Set the background color of the subplot
+            domain
+                :class:`plotly.graph_objects.layout.smith.Domai
+                n` instance or dict with compatible properties
+            imaginaryaxis
+                :class:`plotly.graph_objects.layout.smith.Imagi
+                naryaxis` instance or dict with compatible
+                properties
+            realaxis
+                :class:`plotly.graph_objects.layout.smith.Reala
+                xis` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "SliderdefaultsValidator": (
+            "sliderdefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Slider",
+                "data_docs": """
+""",
+            },
+        ),
+        "SlidersValidator": (
+            "sliders",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Slider",
+                "data_docs": """
+            active
+                Determines which button (by index starting from
+                0) is considered active.
+            activebgcolor
+                Sets the background color of the slider grip
+                while dragging.
+            bgcolor
+                Sets the background color of the slider.
+            bordercolor
+                Sets the color of the border enclosing the
+                slider.
+            borderwidth
+                Sets the width (in px) of the border enclosing
+                the slider.
+            currentvalue
+                :class:`plotly.graph_objects.layout.slider.Curr
+                entvalue` instance or dict with compatible
+                properties
+            font
+                Sets the font of the slider step labels.
+            len
+                Sets the length of the slider This measure
+                excludes the padding of both ends. That is, the
+                slider's length is this length minus the
+                padding on both ends.
+            lenmode
+                Determines whether this slider length is set in
+                units of plot "fraction" or in *pixels. Use
+                `len` to set the value.
+            minorticklen
+                Sets the length in pixels of minor step tick
+                marks
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            pad
+                Set the padding of the slider component along
+                each side.
+            steps
+                A tuple of :class:`plotly.graph_objects.layout.
+                slider.Step` instances or dicts with compatible
+                properties
+            stepdefaults
+                When used in a template (as
+                layout.template.layout.slider.stepdefaults),
+                sets the default property values to use for
+                elements of layout.slider.steps
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            tickcolor
+                Sets the color of the border enclosing the
+                slider.
+            ticklen
+                Sets the length in pixels of step tick marks
+            tickwidth
+                Sets the tick width (in px).
+            transition
+                :class:`plotly.graph_objects.layout.slider.Tran
+                sition` instance or dict with compatible
+                properties
+            visible
+                Determines whether or not the slider is
+                visible.
+            x
+                Sets the x position (in normalized coordinates)
+                of the slider.
+            xanchor
+                Sets the slider's horizontal position anchor.
+                This anchor binds the `x` position to the
+                "left", "center" or "right" of the range
+                selector.
+            y
+                Sets the y position (in normalized coordinates)
+                of the slider.
+            yanchor
+                Sets the slider's vertical position anchor This
+                anchor binds the `y` position to the "top",
+                "middle" or "bottom" of the range selector.
+""",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "legend",
+            },
+        ),
+        "ShapedefaultsValidator": (
+            "shapedefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Shape",
+                "data_docs": """
+""",
+            },
+        ),
+        "ShapesValidator": (
+            "shapes",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Shape",
+                "data_docs": """
+            editable
+                Determines whether the shape could be activated
+                for edit or not. Has no effect when the older
+                editable shapes mode is enabled via
+                `config.editable` or
+                `config.edits.shapePosition`.
+            fillcolor
+                Sets the color filling the shape's interior.
+                Only applies to closed shapes.
+            fillrule
+                Determines which regions of complex paths
+                constitute the interior. For more info please
+                visit https://developer.mozilla.org/en-
+                US/docs/Web/SVG/Attribute/fill-rule
+            label
+                :class:`plotly.graph_objects.layout.shape.Label
+                ` instance or dict with compatible properties
+            layer
+                Specifies whether shapes are drawn below
+                gridlines ("below"), between gridlines and
+                traces ("between") or above traces ("above").
+            legend
+                Sets the reference to a legend to show this
+                shape in. References to these legends are
+                "legend", "legend2", "legend3", etc. Settings
+                for these legends are set in the layout, under
+                `layout.legend`, `layout.legend2`, etc.
+            legendgroup
+                Sets the legend group for this shape. Traces
+                and shapes part of the same legend group
+                hide/show at the same time when toggling legend
+                items.
+            legendgrouptitle
+                :class:`plotly.graph_objects.layout.shape.Legen
+                dgrouptitle` instance or dict with compatible
+                properties
+            legendrank
+                Sets the legend rank for this shape. Items and
+                groups with smaller ranks are presented on
+                top/left side while with "reversed"
+                `legend.traceorder` they are on bottom/right
+                side. The default legendrank is 1000, so that
+                you can use ranks less than 1000 to place
+                certain items before all unranked items, and
+                ranks greater than 1000 to go after all
+                unranked items. When having unranked or equal
+                rank items shapes would be displayed after
+                traces i.e. according to their order in data
+                and layout.
+            legendwidth
+                Sets the width (in px or fraction) of the
+                legend for this shape.
+            line
+                :class:`plotly.graph_objects.layout.shape.Line`
+                instance or dict with compatible properties
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            opacity
+                Sets the opacity of the shape.
+            path
+                For `type` "path" - a valid SVG path with the
+                pixel values replaced by data values in
+                `xsizemode`/`ysizemode` being "scaled" and
+                taken unmodified as pixels relative to
+                `xanchor` and `yanchor` in case of "pixel" size
+                mode. There are a few restrictions / quirks
+                only absolute instructions, not relative. So
+                the allowed segments are: M, L, H, V, Q, C, T,
+                S, and Z arcs (A) are not allowed because
+                radius rx and ry are relative. In the future we
+                could consider supporting relative commands,
+                but we would have to decide on how to handle
+                date and log axes. Note that even as is, Q and
+                C Bezier paths that are smooth on linear axes
+                may not be smooth on log, and vice versa. no
+                chained "polybezier" commands - specify the
+                segment type for each one. On category axes,
+                values are numbers scaled to the serial numbers
+                of categories because using the categories
+                themselves there would be no way to describe
+                fractional positions On data axes: because
+                space and T are both normal components of path
+                strings, we can't use either to separate date
+                from time parts. Therefore we'll use underscore
+                for this purpose: 2015-02-21_13:45:56.789
+            showlegend
+                Determines whether or not this shape is shown
+                in the legend.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            type
+                Specifies the shape type to be drawn. If
+                "line", a line is drawn from (`x0`,`y0`) to
+                (`x1`,`y1`) with respect to the axes' sizing
+                mode. If "circle", a circle is drawn from
+                ((`x0`+`x1`)/2, (`y0`+`y1`)/2)) with radius
+                (|(`x0`+`x1`)/2 - `x0`|, |(`y0`+`y1`)/2
+                -`y0`)|) with respect to the axes' sizing mode.
+                If "rect", a rectangle is drawn linking
+                (`x0`,`y0`), (`x1`,`y0`), (`x1`,`y1`),
+                (`x0`,`y1`), (`x0`,`y0`) with respect to the
+                axes' sizing mode. If "path", draw a custom SVG
+                path using `path`. with respect to the axes'
+                sizing mode.
+            visible
+                Determines whether or not this shape is
+                visible. If "legendonly", the shape is not
+                drawn, but can appear as a legend item
+                (provided that the legend itself is visible).
+            x0
+                Sets the shape's starting x position. See
+                `type` and `xsizemode` for more info.
+            x1
+                Sets the shape's end x position. See `type` and
+                `xsizemode` for more info.
+            xanchor
+                Only relevant in conjunction with `xsizemode`
+                set to "pixel". Specifies the anchor point on
+                the x axis to which `x0`, `x1` and x
+                coordinates within `path` are relative to. E.g.
+                useful to attach a pixel sized shape to a
+                certain data value. No effect when `xsizemode`
+                not set to "pixel".
+            xref
+                Sets the shape's x coordinate axis. If set to a
+                x axis id (e.g. "x" or "x2"), the `x` position
+                refers to a x coordinate. If set to "paper",
+                the `x` position refers to the distance from
+                the left of the plotting area in normalized
+                coordinates where 0 (1) corresponds to the left
+                (right). If set to a x axis ID followed by
+                "domain" (separated by a space), the position
+                behaves like for "paper", but refers to the
+                distance in fractions of the domain length from
+                the left of the domain of that axis: e.g., *x2
+                domain* refers to the domain of the second x
+                axis and a x position of 0.5 refers to the
+                point between the left and the right of the
+                domain of the second x axis.
+            xsizemode
+                Sets the shapes's sizing mode along the x axis.
+                If set to "scaled", `x0`, `x1` and x
+                coordinates within `path` refer to data values
+                on the x axis or a fraction of the plot area's
+                width (`xref` set to "paper"). If set to
+                "pixel", `xanchor` specifies the x position in
+                terms of data or plot fraction but `x0`, `x1`
+                and x coordinates within `path` are pixels
+                relative to `xanchor`. This way, the shape can
+                have a fixed width while maintaining a position
+                relative to data or plot fraction.
+            y0
+                Sets the shape's starting y position. See
+                `type` and `ysizemode` for more info.
+            y1
+                Sets the shape's end y position. See `type` and
+                `ysizemode` for more info.
+            yanchor
+                Only relevant in conjunction with `ysizemode`
+                set to "pixel". Specifies the anchor point on
+                the y axis to which `y0`, `y1` and y
+                coordinates within `path` are relative to. E.g.
+                useful to attach a pixel sized shape to a
+                certain data value. No effect when `ysizemode`
+                not set to "pixel".
+            yref
+                Sets the shape's y coordinate axis. If set to a
+                y axis id (e.g. "y" or "y2"), the `y` position
+                refers to a y coordinate. If set to "paper",
+                the `y` position refers to the distance from
+                the bottom of the plotting area in normalized
+                coordinates where 0 (1) corresponds to the
+                bottom (top). If set to a y axis ID followed by
+                "domain" (separated by a space), the position
+                behaves like for "paper", but refers to the
+                distance in fractions of the domain length from
+                the bottom of the domain of that axis: e.g.,
+                *y2 domain* refers to the domain of the second
+                y  axis and a y position of 0.5 refers to the
+                point between the bottom and the top of the
+                domain of the second y axis.
+            ysizemode
+                Sets the shapes's sizing mode along the y axis.
+                If set to "scaled", `y0`, `y1` and y
+                coordinates within `path` refer to data values
+                on the y axis or a fraction of the plot area's
+                height (`yref` set to "paper"). If set to
+                "pixel", `yanchor` specifies the y position in
+                terms of data or plot fraction but `y0`, `y1`
+                and y coordinates within `path` are pixels
+                relative to `yanchor`. This way, the shape can
+                have a fixed height while maintaining a
+                position relative to data or plot fraction.
+""",
+            },
+        ),
+        "SeparatorsValidator": (
+            "separators",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "SelectiondefaultsValidator": (
+            "selectiondefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Selection",
+                "data_docs": """
+""",
+            },
+        ),
+        "SelectionsValidator": (
+            "selections",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Selection",
+                "data_docs": """
+            line
+                :class:`plotly.graph_objects.layout.selection.L
+                ine` instance or dict with compatible
+                properties
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            opacity
+                Sets the opacity of the selection.
+            path
+                For `type` "path" - a valid SVG path similar to
+                `shapes.path` in data coordinates. Allowed
+                segments are: M, L and Z.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            type
+                Specifies the selection type to be drawn. If
+                "rect", a rectangle is drawn linking
+                (`x0`,`y0`), (`x1`,`y0`), (`x1`,`y1`) and
+                (`x0`,`y1`). If "path", draw a custom SVG path
+                using `path`.
+            x0
+                Sets the selection's starting x position.
+            x1
+                Sets the selection's end x position.
+            xref
+                Sets the selection's x coordinate axis. If set
+                to a x axis id (e.g. "x" or "x2"), the `x`
+                position refers to a x coordinate. If set to
+                "paper", the `x` position refers to the
+                distance from the left of the plotting area in
+                normalized coordinates where 0 (1) corresponds
+                to the left (right). If set to a x axis ID
+                followed by "domain" (separated by a space),
+                the position behaves like for "paper", but
+                refers to the distance in fractions of the
+                domain length from the left of the domain of
+                that axis: e.g., *x2 domain* refers to the
+                domain of the second x  axis and a x position
+                of 0.5 refers to the point between the left and
+                the right of the domain of the second x axis.
+            y0
+                Sets the selection's starting y position.
+            y1
+                Sets the selection's end y position.
+            yref
+                Sets the selection's x coordinate axis. If set
+                to a y axis id (e.g. "y" or "y2"), the `y`
+                position refers to a y coordinate. If set to
+                "paper", the `y` position refers to the
+                distance from the bottom of the plotting area
+                in normalized coordinates where 0 (1)
+                corresponds to the bottom (top). If set to a y
+                axis ID followed by "domain" (separated by a
+                space), the position behaves like for "paper",
+                but refers to the distance in fractions of the
+                domain length from the bottom of the domain of
+                that axis: e.g., *y2 domain* refers to the
+                domain of the second y  axis and a y position
+                of 0.5 refers to the point between the bottom
+                and the top of the domain of the second y axis.
+""",
+            },
+        ),
+        "SelectionrevisionValidator": (
+            "selectionrevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SelectdirectionValidator": (
+            "selectdirection",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["h", "v", "d", "any"],
+            },
+        ),
+        "SceneValidator": (
+            "scene",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Scene",
+                "data_docs": """
+            annotations
+                A tuple of :class:`plotly.graph_objects.layout.
+                scene.Annotation` instances or dicts with
+                compatible properties
+            annotationdefaults
+                When used in a template (as layout.template.lay
+                out.scene.annotationdefaults), sets the default
+                property values to use for elements of
+                layout.scene.annotations
+            aspectmode
+                If "cube", this scene's axes are drawn as a
+                cube, regardless of the axes' ranges. If
+                "data", this scene's axes are drawn in
+                proportion with the axes' ranges. If "manual",
+                this scene's axes are drawn in proportion with
+                the input of "aspectratio" (the default
+                behavior if "aspectratio" is provided). If
+                "auto", this scene's axes are drawn using the
+                results of "data" except when one axis is more
+                than four times the size of the two others,
+                where in that case the results of "cube" are
+                used.
+            aspectratio
+                Sets this scene's axis aspectratio.
+            bgcolor
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yaxis.YaxisValidator",
-            "._xaxis.XaxisValidator",
-            "._width.WidthValidator",
-            "._waterfallmode.WaterfallmodeValidator",
-            "._waterfallgroupgap.WaterfallgroupgapValidator",
-            "._waterfallgap.WaterfallgapValidator",
-            "._violinmode.ViolinmodeValidator",
-            "._violingroupgap.ViolingroupgapValidator",
-            "._violingap.ViolingapValidator",
-            "._updatemenudefaults.UpdatemenudefaultsValidator",
-            "._updatemenus.UpdatemenusValidator",
-            "._uniformtext.UniformtextValidator",
-            "._uirevision.UirevisionValidator",
-            "._treemapcolorway.TreemapcolorwayValidator",
-            "._transition.TransitionValidator",
-            "._title.TitleValidator",
-            "._ternary.TernaryValidator",
-            "._template.TemplateValidator",
-            "._sunburstcolorway.SunburstcolorwayValidator",
-            "._spikedistance.SpikedistanceValidator",
-            "._smith.SmithValidator",
-            "._sliderdefaults.SliderdefaultsValidator",
-            "._sliders.SlidersValidator",
-            "._showlegend.ShowlegendValidator",
-            "._shapedefaults.ShapedefaultsValidator",
-            "._shapes.ShapesValidator",
-            "._separators.SeparatorsValidator",
-            "._selectiondefaults.SelectiondefaultsValidator",
-            "._selections.SelectionsValidator",
-            "._selectionrevision.SelectionrevisionValidator",
-            "._selectdirection.SelectdirectionValidator",
-            "._scene.SceneValidator",
-            "._scattermode.ScattermodeValidator",
-            "._scattergap.ScattergapValidator",
-            "._polar.PolarValidator",
-            "._plot_bgcolor.Plot_BgcolorValidator",
-            "._piecolorway.PiecolorwayValidator",
-            "._paper_bgcolor.Paper_BgcolorValidator",
-            "._newshape.NewshapeValidator",
-            "._newselection.NewselectionValidator",
-            "._modebar.ModebarValidator",
-            "._minreducedwidth.MinreducedwidthValidator",
-            "._minreducedheight.MinreducedheightValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._margin.MarginValidator",
-            "._mapbox.MapboxValidator",
-            "._legend.LegendValidator",
-            "._imagedefaults.ImagedefaultsValidator",
-            "._images.ImagesValidator",
-            "._iciclecolorway.IciclecolorwayValidator",
-            "._hoversubplots.HoversubplotsValidator",
-            "._hovermode.HovermodeValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverdistance.HoverdistanceValidator",
-            "._hidesources.HidesourcesValidator",
-            "._hiddenlabelssrc.HiddenlabelssrcValidator",
-            "._hiddenlabels.HiddenlabelsValidator",
-            "._height.HeightValidator",
-            "._grid.GridValidator",
-            "._geo.GeoValidator",
-            "._funnelmode.FunnelmodeValidator",
-            "._funnelgroupgap.FunnelgroupgapValidator",
-            "._funnelgap.FunnelgapValidator",
-            "._funnelareacolorway.FunnelareacolorwayValidator",
-            "._font.FontValidator",
-            "._extendtreemapcolors.ExtendtreemapcolorsValidator",
-            "._extendsunburstcolors.ExtendsunburstcolorsValidator",
-            "._extendpiecolors.ExtendpiecolorsValidator",
-            "._extendiciclecolors.ExtendiciclecolorsValidator",
-            "._extendfunnelareacolors.ExtendfunnelareacolorsValidator",
-            "._editrevision.EditrevisionValidator",
-            "._dragmode.DragmodeValidator",
-            "._datarevision.DatarevisionValidator",
-            "._computed.ComputedValidator",
-            "._colorway.ColorwayValidator",
-            "._colorscale.ColorscaleValidator",
-            "._coloraxis.ColoraxisValidator",
-            "._clickmode.ClickmodeValidator",
-            "._calendar.CalendarValidator",
-            "._boxmode.BoxmodeValidator",
-            "._boxgroupgap.BoxgroupgapValidator",
-            "._boxgap.BoxgapValidator",
-            "._barnorm.BarnormValidator",
-            "._barmode.BarmodeValidator",
-            "._bargroupgap.BargroupgapValidator",
-            "._bargap.BargapValidator",
-            "._barcornerradius.BarcornerradiusValidator",
-            "._autotypenumbers.AutotypenumbersValidator",
-            "._autosize.AutosizeValidator",
-            "._annotationdefaults.AnnotationdefaultsValidator",
-            "._annotations.AnnotationsValidator",
-            "._activeshape.ActiveshapeValidator",
-            "._activeselection.ActiveselectionValidator",
-        ],
-    )
+            camera
+                :class:`plotly.graph_objects.layout.scene.Camer
+                a` instance or dict with compatible properties
+            domain
+                :class:`plotly.graph_objects.layout.scene.Domai
+                n` instance or dict with compatible properties
+            dragmode
+                Determines the mode of drag interactions for
+                this scene.
+            hovermode
+                Determines the mode of hover interactions for
+                this scene.
+            uirevision
+                Controls persistence of user-driven changes in
+                camera attributes. Defaults to
+                `layout.uirevision`.
+            xaxis
+                :class:`plotly.graph_objects.layout.scene.XAxis
+                ` instance or dict with compatible properties
+            yaxis
+                :class:`plotly.graph_objects.layout.scene.YAxis
+                ` instance or dict with compatible properties
+            zaxis
+                :class:`plotly.graph_objects.layout.scene.ZAxis
+                ` instance or dict with compatible properties
+""",
+            },
+        ),
+        "ScattermodeValidator": (
+            "scattermode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["group", "overlay"],
+            },
+        ),
+        "ScattergapValidator": (
+            "scattergap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "PolarValidator": (
+            "polar",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Polar",
+                "data_docs": """
+            angularaxis
+                :class:`plotly.graph_objects.layout.polar.Angul
+                arAxis` instance or dict with compatible
+                properties
+            bargap
+                Sets the gap between bars of adjacent location
+                coordinates. Values are unitless, they
+                represent fractions of the minimum difference
+                in bar positions in the data.
+            barmode
+                Determines how bars at the same location
+                coordinate are displayed on the graph. With
+                "stack", the bars are stacked on top of one
+                another With "overlay", the bars are plotted
+                over one another, you might need to reduce
+                "opacity" to see multiple bars.
+            bgcolor
+                Set the background color of the subplot
+            domain
+                :class:`plotly.graph_objects.layout.polar.Domai
+                n` instance or dict with compatible properties
+            gridshape
+                Determines if the radial axis grid lines and
+                angular axis line are drawn as "circular"
+                sectors or as "linear" (polygon) sectors. Has
+                an effect only when the angular axis has `type`
+                "category". Note that `radialaxis.angle` is
+                snapped to the angle of the closest vertex when
+                `gridshape` is "circular" (so that radial axis
+                scale is the same as the data scale).
+            hole
+                Sets the fraction of the radius to cut out of
+                the polar subplot.
+            radialaxis
+                :class:`plotly.graph_objects.layout.polar.Radia
+                lAxis` instance or dict with compatible
+                properties
+            sector
+                Sets angular span of this polar subplot with
+                two angles (in degrees). Sector are assumed to
+                be spanned in the counterclockwise direction
+                with 0 corresponding to rightmost limit of the
+                polar subplot.
+            uirevision
+                Controls persistence of user-driven changes in
+                axis attributes, if not overridden in the
+                individual axes. Defaults to
+                `layout.uirevision`.
+""",
+            },
+        ),
+        "Plot_BgcolorValidator": (
+            "plot_bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "layoutstyle",
+            },
+        ),
+        "PiecolorwayValidator": (
+            "piecolorway",
+            "_plotly_utils.basevalidators.ColorlistValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "Paper_BgcolorValidator": (
+            "paper_bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "NewshapeValidator": (
+            "newshape",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Newshape",
+                "data_docs": """
+            drawdirection
+                When `dragmode` is set to "drawrect",
+                "drawline" or "drawcircle" this limits the drag
+                to be horizontal, vertical or diagonal. Using
+                "diagonal" there is no limit e.g. in drawing
+                lines in any direction. "ortho" limits the draw
+                to be either horizontal or vertical.
+                "horizontal" allows horizontal extend.
+                "vertical" allows vertical extend.
+            fillcolor
+                Sets the color filling new shapes' interior.
+                Please note that if using a fillcolor with
+                alpha greater than half, drag inside the active
+                shape starts moving the shape underneath,
+                otherwise a new shape could be started over.
+            fillrule
+                Determines the path's interior. For more info
+                please visit https://developer.mozilla.org/en-
+                US/docs/Web/SVG/Attribute/fill-rule
+            label
+                :class:`plotly.graph_objects.layout.newshape.La
+                bel` instance or dict with compatible
+                properties
+            layer
+                Specifies whether new shapes are drawn below
+                gridlines ("below"), between gridlines and
+                traces ("between") or above traces ("above").
+            legend
+                Sets the reference to a legend to show new
+                shape in. References to these legends are
+                "legend", "legend2", "legend3", etc. Settings
+                for these legends are set in the layout, under
+                `layout.legend`, `layout.legend2`, etc.
+            legendgroup
+                Sets the legend group for new shape. Traces and
+                shapes part of the same legend group hide/show
+                at the same time when toggling legend items.
+            legendgrouptitle
+                :class:`plotly.graph_objects.layout.newshape.Le
+                gendgrouptitle` instance or dict with
+                compatible properties
+            legendrank
+                Sets the legend rank for new shape. Items and
+                groups with smaller ranks are presented on
+                top/left side while with "reversed"
+                `legend.traceorder` they are on bottom/right
+                side. The default legendrank is 1000, so that
+                you can use ranks less than 1000 to place
+                certain items before all unranked items, and
+                ranks greater than 1000 to go after all
+                unranked items.
+            legendwidth
+                Sets the width (in px or fraction) of the
+                legend for new shape.
+            line
+                :class:`plotly.graph_objects.layout.newshape.Li
+                ne` instance or dict with compatible properties
+            name
+                Sets new shape name. The name appears as the
+                legend item.
+            opacity
+                Sets the opacity of new shapes.
+            showlegend
+                Determines whether or not new shape is shown in
+                the legend.
+            visible
+                Determines whether or not new shape is visible.
+                If "legendonly", the shape is not drawn, but
+                can appear as a legend item (provided that the
+                legend itself is visible).
+""",
+            },
+        ),
+        "NewselectionValidator": (
+            "newselection",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Newselection",
+                "data_docs": """
+            line
+                :class:`plotly.graph_objects.layout.newselectio
+                n.Line` instance or dict with compatible
+                properties
+            mode
+                Describes how a new selection is created. If
+                `immediate`, a new selection is created after
+                first mouse up. If `gradual`, a new selection
+                is not created after first mouse. By adding to
+                and subtracting from the initial selection,
+                this option allows declaring extra outlines of
+                the selection.
+""",
+            },
+        ),
+        "ModebarValidator": (
+            "modebar",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Modebar",
+                "data_docs": """
+            activecolor
+                Sets the color of the active or hovered on
+                icons in the modebar.
+            add
+                Determines which predefined modebar buttons to
+                add. Please note that these buttons will only
+                be shown if they are compatible with all trace
+                types used in a graph. Similar to
+                `config.modeBarButtonsToAdd` option. This may
+                include "v1hovermode", "hoverclosest",
+                "hovercompare", "togglehover",
+                "togglespikelines", "drawline", "drawopenpath",
+                "drawclosedpath", "drawcircle", "drawrect",
+                "eraseshape".
+            addsrc
+                Sets the source reference on Chart Studio Cloud
+                for `add`.
+            bgcolor
+                Sets the background color of the modebar.
+            color
+                Sets the color of the icons in the modebar.
+            orientation
+                Sets the orientation of the modebar.
+            remove
+                Determines which predefined modebar buttons to
+                remove. Similar to
+                `config.modeBarButtonsToRemove` option. This
+                may include "autoScale2d", "autoscale",
+                "editInChartStudio", "editinchartstudio",
+                "hoverCompareCartesian", "hovercompare",
+                "lasso", "lasso2d", "orbitRotation",
+                "orbitrotation", "pan", "pan2d", "pan3d",
+                "reset", "resetCameraDefault3d",
+                "resetCameraLastSave3d", "resetGeo",
+                "resetSankeyGroup", "resetScale2d",
+                "resetViewMapbox", "resetViews",
+                "resetcameradefault", "resetcameralastsave",
+                "resetsankeygroup", "resetscale", "resetview",
+                "resetviews", "select", "select2d",
+                "sendDataToCloud", "senddatatocloud",
+                "tableRotation", "tablerotation", "toImage",
+                "toggleHover", "toggleSpikelines",
+                "togglehover", "togglespikelines", "toimage",
+                "zoom", "zoom2d", "zoom3d", "zoomIn2d",
+                "zoomInGeo", "zoomInMapbox", "zoomOut2d",
+                "zoomOutGeo", "zoomOutMapbox", "zoomin",
+                "zoomout".
+            removesrc
+                Sets the source reference on Chart Studio Cloud
+                for `remove`.
+            uirevision
+                Controls persistence of user-driven changes
+                related to the modebar, including `hovermode`,
+                `dragmode`, and `showspikes` at both the root
+                level and inside subplots. Defaults to
+                `layout.uirevision`.
+""",
+            },
+        ),
+        "MinreducedwidthValidator": (
+            "minreducedwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 2,
+            },
+        ),
+        "MinreducedheightValidator": (
+            "minreducedheight",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 2,
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "MarginValidator": (
+            "margin",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Margin",
+                "data_docs": """
+            autoexpand
+                Turns on/off margin expansion computations.
+                Legends, colorbars, updatemenus, sliders, axis
+                rangeselector and rangeslider are allowed to
+                push the margins by defaults.
+            b
+                Sets the bottom margin (in px).
+            l
+                Sets the left margin (in px).
+            pad
+                Sets the amount of padding (in px) between the
+                plotting area and the axis lines
+            r
+                Sets the right margin (in px).
+            t
+                Sets the top margin (in px).
+""",
+            },
+        ),
+        "MapboxValidator": (
+            "mapbox",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Mapbox",
+                "data_docs": """
+            accesstoken
+                Sets the mapbox access token to be used for
+                this mapbox map. Alternatively, the mapbox
+                access token can be set in the configuration
+                options under `mapboxAccessToken`. Note that
+                accessToken are only required when `style` (e.g
+                with values : basic, streets, outdoors, light,
+                dark, satellite, satellite-streets ) and/or a
+                layout layer references the Mapbox server.
+            bearing
+                Sets the bearing angle of the map in degrees
+                counter-clockwise from North (mapbox.bearing).
+            bounds
+                :class:`plotly.graph_objects.layout.mapbox.Boun
+                ds` instance or dict with compatible properties
+            center
+                :class:`plotly.graph_objects.layout.mapbox.Cent
+                er` instance or dict with compatible properties
+            domain
+                :class:`plotly.graph_objects.layout.mapbox.Doma
+                in` instance or dict with compatible properties
+            layers
+                A tuple of :class:`plotly.graph_objects.layout.
+                mapbox.Layer` instances or dicts with
+                compatible properties
+            layerdefaults
+                When used in a template (as
+                layout.template.layout.mapbox.layerdefaults),
+                sets the default property values to use for
+                elements of layout.mapbox.layers
+            pitch
+                Sets the pitch angle of the map (in degrees,
+                where 0 means perpendicular to the surface of
+                the map) (mapbox.pitch).
+            style
+                Defines the map layers that are rendered by
+                default below the trace layers defined in
+                `data`, which are themselves by default
+                rendered below the layers defined in
+                `layout.mapbox.layers`.  These layers can be
+                defined either explicitly as a Mapbox Style
+                object which can contain multiple layer
+                definitions that load data from any public or
+                private Tile Map Service (TMS or XYZ) or Web
+                Map Service (WMS) or implicitly by using one of
+                the built-in style objects which use WMSes
+                which do not require any access tokens, or by
+                using a default Mapbox style or custom Mapbox
+                style URL, both of which require a Mapbox
+                access token  Note that Mapbox access token can
+                be set in the `accesstoken` attribute or in the
+                `mapboxAccessToken` config option.  Mapbox
+                Style objects are of the form described in the
+                Mapbox GL JS documentation available at
+                https://docs.mapbox.com/mapbox-gl-js/style-spec
+                The built-in plotly.js styles objects are:
+                carto-darkmatter, carto-positron, open-street-
+                map, stamen-terrain, stamen-toner, stamen-
+                watercolor, white-bg  The built-in Mapbox
+                styles are: basic, streets, outdoors, light,
+                dark, satellite, satellite-streets  Mapbox
+                style URLs are of the form:
+                mapbox://mapbox.mapbox-<name>-<version>
+            uirevision
+                Controls persistence of user-driven changes in
+                the view: `center`, `zoom`, `bearing`, `pitch`.
+                Defaults to `layout.uirevision`.
+            zoom
+                Sets the zoom level of the map (mapbox.zoom).
+""",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legend",
+                "data_docs": """
+            bgcolor
+                Sets the legend background color. Defaults to
+                `layout.paper_bgcolor`.
+            bordercolor
+                Sets the color of the border enclosing the
+                legend.
+            borderwidth
+                Sets the width (in px) of the border enclosing
+                the legend.
+            entrywidth
+                Sets the width (in px or fraction) of the
+                legend. Use 0 to size the entry based on the
+                text width, when `entrywidthmode` is set to
+                "pixels".
+            entrywidthmode
+                Determines what entrywidth means.
+            font
+                Sets the font used to text the legend items.
+            groupclick
+                Determines the behavior on legend group item
+                click. "toggleitem" toggles the visibility of
+                the individual item clicked on the graph.
+                "togglegroup" toggles the visibility of all
+                items in the same legendgroup as the item
+                clicked on the graph.
+            grouptitlefont
+                Sets the font for group titles in legend.
+                Defaults to `legend.font` with its size
+                increased about 10%.
+            indentation
+                Sets the indentation (in px) of the legend
+                entries.
+            itemclick
+                Determines the behavior on legend item click.
+                "toggle" toggles the visibility of the item
+                clicked on the graph. "toggleothers" makes the
+                clicked item the sole visible item on the
+                graph. False disables legend item click
+                interactions.
+            itemdoubleclick
+                Determines the behavior on legend item double-
+                click. "toggle" toggles the visibility of the
+                item clicked on the graph. "toggleothers" makes
+                the clicked item the sole visible item on the
+                graph. False disables legend item double-click
+                interactions.
+            itemsizing
+                Determines if the legend items symbols scale
+                with their corresponding "trace" attributes or
+                remain "constant" independent of the symbol
+                size on the graph.
+            itemwidth
+                Sets the width (in px) of the legend item
+                symbols (the part other than the title.text).
+            orientation
+                Sets the orientation of the legend.
+            title
+                :class:`plotly.graph_objects.layout.legend.Titl
+                e` instance or dict with compatible properties
+            tracegroupgap
+                Sets the amount of vertical space (in px)
+                between legend groups.
+            traceorder
+                Determines the order at which the legend items
+                are displayed. If "normal", the items are
+                displayed top-to-bottom in the same order as
+                the input data. If "reversed", the items are
+                displayed in the opposite order as "normal". If
+                "grouped", the items are displayed in groups
+                (when a trace `legendgroup` is provided). if
+                "grouped+reversed", the items are displayed in
+                the opposite order as "grouped".
+            uirevision
+                Controls persistence of legend-driven changes
+                in trace and pie label visibility. Defaults to
+                `layout.uirevision`.
+            valign
+                Sets the vertical alignment of the symbols with
+                respect to their associated text.
+            visible
+                Determines whether or not this legend is
+                visible.
+            x
+                Sets the x position with respect to `xref` (in
+                normalized coordinates) of the legend. When
+                `xref` is "paper", defaults to 1.02 for
+                vertical legends and defaults to 0 for
+                horizontal legends. When `xref` is "container",
+                defaults to 1 for vertical legends and defaults
+                to 0 for horizontal legends. Must be between 0
+                and 1 if `xref` is "container". and between
+                "-2" and 3 if `xref` is "paper".
+            xanchor
+                Sets the legend's horizontal position anchor.
+                This anchor binds the `x` position to the
+                "left", "center" or "right" of the legend.
+                Value "auto" anchors legends to the right for
+                `x` values greater than or equal to 2/3,
+                anchors legends to the left for `x` values less
+                than or equal to 1/3 and anchors legends with
+                respect to their center otherwise.
+            xref
+                Sets the container `x` refers to. "container"
+                spans the entire `width` of the plot. "paper"
+                refers to the width of the plotting area only.
+            y
+                Sets the y position with respect to `yref` (in
+                normalized coordinates) of the legend. When
+                `yref` is "paper", defaults to 1 for vertical
+                legends, defaults to "-0.1" for horizontal
+                legends on graphs w/o range sliders and
+                defaults to 1.1 for horizontal legends on graph
+                with one or multiple range sliders. When `yref`
+                is "container", defaults to 1. Must be between
+                0 and 1 if `yref` is "container" and between
+                "-2" and 3 if `yref` is "paper".
+            yanchor
+                Sets the legend's vertical position anchor This
+                anchor binds the `y` position to the "top",
+                "middle" or "bottom" of the legend. Value
+                "auto" anchors legends at their bottom for `y`
+                values less than or equal to 1/3, anchors
+                legends to at their top for `y` values greater
+                than or equal to 2/3 and anchors legends with
+                respect to their middle otherwise.
+            yref
+                Sets the container `y` refers to. "container"
+                spans the entire `height` of the plot. "paper"
+                refers to the height of the plotting area only.
+""",
+            },
+        ),
+        "ImagedefaultsValidator": (
+            "imagedefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Image",
+                "data_docs": """
+""",
+            },
+        ),
+        "ImagesValidator": (
+            "images",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Image",
+                "data_docs": """
+            layer
+                Specifies whether images are drawn below or
+                above traces. When `xref` and `yref` are both
+                set to `paper`, image is drawn below the entire
+                plot area.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            opacity
+                Sets the opacity of the image.
+            sizex
+                Sets the image container size horizontally. The
+                image will be sized based on the `position`
+                value. When `xref` is set to `paper`, units are
+                sized relative to the plot width. When `xref`
+                ends with ` domain`, units are sized relative
+                to the axis width.
+            sizey
+                Sets the image container size vertically. The
+                image will be sized based on the `position`
+                value. When `yref` is set to `paper`, units are
+                sized relative to the plot height. When `yref`
+                ends with ` domain`, units are sized relative
+                to the axis height.
+            sizing
+                Specifies which dimension of the image to
+                constrain.
+            source
+                Specifies the URL of the image to be used. The
+                URL must be accessible from the domain where
+                the plot code is run, and can be either
+                relative or absolute.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            visible
+                Determines whether or not this image is
+                visible.
+            x
+                Sets the image's x position. When `xref` is set
+                to `paper`, units are sized relative to the
+                plot height. See `xref` for more info
+            xanchor
+                Sets the anchor for the x position
+            xref
+                Sets the images's x coordinate axis. If set to
+                a x axis id (e.g. "x" or "x2"), the `x`
+                position refers to a x coordinate. If set to
+                "paper", the `x` position refers to the
+                distance from the left of the plotting area in
+                normalized coordinates where 0 (1) corresponds
+                to the left (right). If set to a x axis ID
+                followed by "domain" (separated by a space),
+                the position behaves like for "paper", but
+                refers to the distance in fractions of the
+                domain length from the left of the domain of
+                that axis: e.g., *x2 domain* refers to the
+                domain of the second x  axis and a x position
+                of 0.5 refers to the point between the left and
+                the right of the domain of the second x axis.
+            y
+                Sets the image's y position. When `yref` is set
+                to `paper`, units are sized relative to the
+                plot height. See `yref` for more info
+            yanchor
+                Sets the anchor for the y position.
+            yref
+                Sets the images's y coordinate axis. If set to
+                a y axis id (e.g. "y" or "y2"), the `y`
+                position refers to a y coordinate. If set to
+                "paper", the `y` position refers to the
+                distance from the bottom of the plotting area
+                in normalized coordinates where 0 (1)
+                corresponds to the bottom (top). If set to a y
+                axis ID followed by "domain" (separated by a
+                space), the position behaves like for "paper",
+                but refers to the distance in fractions of the
+                domain length from the bottom of the domain of
+                that axis: e.g., *y2 domain* refers to the
+                domain of the second y  axis and a y position
+                of 0.5 refers to the point between the bottom
+                and the top of the domain of the second y axis.
+""",
+            },
+        ),
+        "IciclecolorwayValidator": (
+            "iciclecolorway",
+            "_plotly_utils.basevalidators.ColorlistValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HoversubplotsValidator": (
+            "hoversubplots",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["single", "overlaying", "axis"],
+            },
+        ),
+        "HovermodeValidator": (
+            "hovermode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "modebar",
+                "values": ["x", "y", "closest", False, "x unified", "y unified"],
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            bgcolor
+                Sets the background color of all hover labels
+                on graph
+            bordercolor
+                Sets the border color of all hover labels on
+                graph.
+            font
+                Sets the default hover label font used by all
+                traces on the graph.
+            grouptitlefont
+                Sets the font for group titles in hover
+                (unified modes). Defaults to `hoverlabel.font`.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+""",
+            },
+        ),
+        "HoverdistanceValidator": (
+            "hoverdistance",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "none",
+                "min": -1,
+            },
+        ),
+        "HidesourcesValidator": (
+            "hidesources",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "HiddenlabelssrcValidator": (
+            "hiddenlabelssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HiddenlabelsValidator": (
+            "hiddenlabels",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HeightValidator": (
+            "height",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 10,
+            },
+        ),
+        "GridValidator": (
+            "grid",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Grid",
+                "data_docs": """
+            columns
+                The number of columns in the grid. If you
+                provide a 2D `subplots` array, the length of
+                its longest row is used as the default. If you
+                give an `xaxes` array, its length is used as
+                the default. But it's also possible to have a
+                different length, if you want to leave a row at
+                the end for non-cartesian subplots.
+            domain
+                :class:`plotly.graph_objects.layout.grid.Domain
+                ` instance or dict with compatible properties
+            pattern
+                If no `subplots`, `xaxes`, or `yaxes` are given
+                but we do have `rows` and `columns`, we can
+                generate defaults using consecutive axis IDs,
+                in two ways: "coupled" gives one x axis per
+                column and one y axis per row. "independent"
+                uses a new xy pair for each cell, left-to-right
+                across each row then iterating rows according
+                to `roworder`.
+            roworder
+                Is the first row the top or the bottom? Note
+                that columns are always enumerated from left to
+                right.
+            rows
+                The number of rows in the grid. If you provide
+                a 2D `subplots` array or a `yaxes` array, its
+                length is used as the default. But it's also
+                possible to have a different length, if you
+                want to leave a row at the end for non-
+                cartesian subplots.
+            subplots
+                Used for freeform grids, where some axes may be
+                shared across subplots but others are not. Each
+                entry should be a cartesian subplot id, like
+                "xy" or "x3y2", or "" to leave that cell empty.
+                You may reuse x axes within the same column,
+                and y axes within the same row. Non-cartesian
+                subplots and traces that support `domain` can
+                place themselves in this grid separately using
+                the `gridcell` attribute.
+            xaxes
+                Used with `yaxes` when the x and y axes are
+                shared across columns and rows. Each entry
+                should be an x axis id like "x", "x2", etc., or
+                "" to not put an x axis in that column. Entries
+                other than "" must be unique. Ignored if
+                `subplots` is present. If missing but `yaxes`
+                is present, will generate consecutive IDs.
+            xgap
+                Horizontal space between grid cells, expressed
+                as a fraction of the total width available to
+                one cell. Defaults to 0.1 for coupled-axes
+                grids and 0.2 for independent grids.
+            xside
+                Sets where the x axis labels and titles go.
+                "bottom" means the very bottom of the grid.
+                "bottom plot" is the lowest plot that each x
+                axis is used in. "top" and "top plot" are
+                similar.
+            yaxes
+                Used with `yaxes` when the x and y axes are
+                shared across columns and rows. Each entry
+                should be an y axis id like "y", "y2", etc., or
+                "" to not put a y axis in that row. Entries
+                other than "" must be unique. Ignored if
+                `subplots` is present. If missing but `xaxes`
+                is present, will generate consecutive IDs.
+            ygap
+                Vertical space between grid cells, expressed as
+                a fraction of the total height available to one
+                cell. Defaults to 0.1 for coupled-axes grids
+                and 0.3 for independent grids.
+            yside
+                Sets where the y axis labels and titles go.
+                "left" means the very left edge of the grid.
+                *left plot* is the leftmost plot that each y
+                axis is used in. "right" and *right plot* are
+                similar.
+""",
+            },
+        ),
+        "GeoValidator": (
+            "geo",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Geo",
+                "data_docs": """
+            bgcolor
+                Set the background color of the map
+            center
+                :class:`plotly.graph_objects.layout.geo.Center`
+                instance or dict with compatible properties
+            coastlinecolor
+                Sets the coastline color.
+            coastlinewidth
+                Sets the coastline stroke width (in px).
+            countrycolor
+                Sets line color of the country boundaries.
+            countrywidth
+                Sets line width (in px) of the country
+                boundaries.
+            domain
+                :class:`plotly.graph_objects.layout.geo.Domain`
+                instance or dict with compatible properties
+            fitbounds
+                Determines if this subplot's view settings are
+                auto-computed to fit trace data. On scoped
+                maps, setting `fitbounds` leads to `center.lon`
+                and `center.lat` getting auto-filled. On maps
+                with a non-clipped projection, setting
+                `fitbounds` leads to `center.lon`,
+                `center.lat`, and `projection.rotation.lon`
+                getting auto-filled. On maps with a clipped
+                projection, setting `fitbounds` leads to
+                `center.lon`, `center.lat`,
+                `projection.rotation.lon`,
+                `projection.rotation.lat`, `lonaxis.range` and
+                `lonaxis.range` getting auto-filled. If
+                "locations", only the trace's visible locations
+                are considered in the `fitbounds` computations.
+                If "geojson", the entire trace input `geojson`
+                (if provided) is considered in the `fitbounds`
+                computations, Defaults to False.
+            framecolor
+                Sets the color the frame.
+            framewidth
+                Sets the stroke width (in px) of the frame.
+            lakecolor
+                Sets the color of the lakes.
+            landcolor
+                Sets the land mass color.
+            lataxis
+                :class:`plotly.graph_objects.layout.geo.Lataxis
+                ` instance or dict with compatible properties
+            lonaxis
+                :class:`plotly.graph_objects.layout.geo.Lonaxis
+                ` instance or dict with compatible properties
+            oceancolor
+                Sets the ocean color
+            projection
+                :class:`plotly.graph_objects.layout.geo.Project
+                ion` instance or dict with compatible
+                properties
+            resolution
+                Sets the resolution of the base layers. The
+                values have units of km/mm e.g. 110 corresponds
+                to a scale ratio of 1:110,000,000.
+            rivercolor
+                Sets color of the rivers.
+            riverwidth
+                Sets the stroke width (in px) of the rivers.
+            scope
+                Set the scope of the map.
+            showcoastlines
+                Sets whether or not the coastlines are drawn.
+            showcountries
+                Sets whether or not country boundaries are
+                drawn.
+            showframe
+                Sets whether or not a frame is drawn around the
+                map.
+            showlakes
+                Sets whether or not lakes are drawn.
+            showland
+                Sets whether or not land masses are filled in
+                color.
+            showocean
+                Sets whether or not oceans are filled in color.
+            showrivers
+                Sets whether or not rivers are drawn.
+            showsubunits
+                Sets whether or not boundaries of subunits
+                within countries (e.g. states, provinces) are
+                drawn.
+            subunitcolor
+                Sets the color of the subunits boundaries.
+            subunitwidth
+                Sets the stroke width (in px) of the subunits
+                boundaries.
+            uirevision
+                Controls persistence of user-driven changes in
+                the view (projection and center). Defaults to
+                `layout.uirevision`.
+            visible
+                Sets the default visibility of the base layers.
+""",
+            },
+        ),
+        "FunnelmodeValidator": (
+            "funnelmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["stack", "group", "overlay"],
+            },
+        ),
+        "FunnelgroupgapValidator": (
+            "funnelgroupgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "FunnelgapValidator": (
+            "funnelgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "FunnelareacolorwayValidator": (
+            "funnelareacolorway",
+            "_plotly_utils.basevalidators.ColorlistValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
+
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "ExtendtreemapcolorsValidator": (
+            "extendtreemapcolors",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ExtendsunburstcolorsValidator": (
+            "extendsunburstcolors",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ExtendpiecolorsValidator": (
+            "extendpiecolors",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ExtendiciclecolorsValidator": (
+            "extendiciclecolors",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ExtendfunnelareacolorsValidator": (
+            "extendfunnelareacolors",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "EditrevisionValidator": (
+            "editrevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "DragmodeValidator": (
+            "dragmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "modebar",
+                "values": [
+                    "zoom",
+                    "pan",
+                    "select",
+                    "lasso",
+                    "drawclosedpath",
+                    "drawopenpath",
+                    "drawline",
+                    "drawrect",
+                    "drawcircle",
+                    "orbit",
+                    "turntable",
+                    False,
+                ],
+            },
+        ),
+        "DatarevisionValidator": (
+            "datarevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ComputedValidator": (
+            "computed",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColorwayValidator": (
+            "colorway",
+            "_plotly_utils.basevalidators.ColorlistValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ColorscaleValidator": (
+            "colorscale",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Colorscale",
+                "data_docs": """
+            diverging
+                Sets the default diverging colorscale. Note
+                that `autocolorscale` must be true for this
+                attribute to work.
+            sequential
+                Sets the default sequential colorscale for
+                positive values. Note that `autocolorscale`
+                must be true for this attribute to work.
+            sequentialminus
+                Sets the default sequential colorscale for
+                negative values. Note that `autocolorscale`
+                must be true for this attribute to work.
+""",
+            },
+        ),
+        "ColoraxisValidator": (
+            "coloraxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Coloraxis",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `colorscale`. In case
+                `colorscale` is unspecified or `autocolorscale`
+                is true, the default palette will be chosen
+                according to whether numbers in the `color`
+                array are all positive, all negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                corresponding trace color array(s)) or the
+                bounds set in `cmin` and `cmax` Defaults to
+                `false` when `cmin` and `cmax` are set by the
+                user.
+            cmax
+                Sets the upper bound of the color domain. Value
+                should have the same units as corresponding
+                trace color array(s) and if set, `cmin` must be
+                set as well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `cmin` and/or `cmax` to be equidistant
+                to this point. Value should have the same units
+                as corresponding trace color array(s). Has no
+                effect when `cauto` is `false`.
+            cmin
+                Sets the lower bound of the color domain. Value
+                should have the same units as corresponding
+                trace color array(s) and if set, `cmax` must be
+                set as well.
+            colorbar
+                :class:`plotly.graph_objects.layout.coloraxis.C
+                olorBar` instance or dict with compatible
+                properties
+            colorscale
+                Sets the colorscale. The colorscale must be an
+                array containing arrays mapping a normalized
+                value to an rgb, rgba, hex, hsl, hsv, or named
+                color string. At minimum, a mapping for the
+                lowest (0) and highest (1) values are required.
+                For example, `[[0, 'rgb(0,0,255)'], [1,
+                'rgb(255,0,0)']]`. To control the bounds of the
+                colorscale in color space, use `cmin` and
+                `cmax`. Alternatively, `colorscale` may be a
+                palette name string of the following list: Blac
+                kbody,Bluered,Blues,Cividis,Earth,Electric,Gree
+                ns,Greys,Hot,Jet,Picnic,Portland,Rainbow,RdBu,R
+                eds,Viridis,YlGnBu,YlOrRd.
+            reversescale
+                Reverses the color mapping if true. If true,
+                `cmin` will correspond to the last color in the
+                array and `cmax` will correspond to the first
+                color.
+            showscale
+                Determines whether or not a colorbar is
+                displayed for this trace.
+""",
+            },
+        ),
+        "ClickmodeValidator": (
+            "clickmode",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "plot",
+                "extras": ["none"],
+                "flags": ["event", "select"],
+            },
+        ),
+        "CalendarValidator": (
+            "calendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "BoxmodeValidator": (
+            "boxmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["group", "overlay"],
+            },
+        ),
+        "BoxgroupgapValidator": (
+            "boxgroupgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "BoxgapValidator": (
+            "boxgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "BarnormValidator": (
+            "barnorm",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["", "fraction", "percent"],
+            },
+        ),
+        "BarmodeValidator": (
+            "barmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["stack", "group", "overlay", "relative"],
+            },
+        ),
+        "BargroupgapValidator": (
+            "bargroupgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "BargapValidator": (
+            "bargap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "BarcornerradiusValidator": (
+            "barcornerradius",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "AutotypenumbersValidator": (
+            "autotypenumbers",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["convert types", "strict"],
+            },
+        ),
+        "AutosizeValidator": (
+            "autosize",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "AnnotationdefaultsValidator": (
+            "annotationdefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Annotation",
+                "data_docs": """
+""",
+            },
+        ),
+        "AnnotationsValidator": (
+            "annotations",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Annotation",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the `text`
+                within the box. Has an effect only if `text`
+                spans two or more lines (i.e. `text` contains
+                one or more <br> HTML tags) or if an explicit
+                width is set to override the text width.
+            arrowcolor
+                Sets the color of the annotation arrow.
+            arrowhead
+                Sets the end annotation arrow head style.
+            arrowside
+                Sets the annotation arrow head position.
+            arrowsize
+                Sets the size of the end annotation arrow head,
+                relative to `arrowwidth`. A value of 1
+                (default) gives a head about 3x as wide as the
+                line.
+            arrowwidth
+                Sets the width (in px) of annotation arrow
+                line.
+            ax
+                Sets the x component of the arrow tail about
+                the arrow head. If `axref` is `pixel`, a
+                positive (negative) component corresponds to an
+                arrow pointing from right to left (left to
+                right). If `axref` is not `pixel` and is
+                exactly the same as `xref`, this is an absolute
+                value on that axis, like `x`, specified in the
+                same coordinates as `xref`.
+            axref
+                Indicates in what coordinates the tail of the
+                annotation (ax,ay) is specified. If set to a x
+                axis id (e.g. "x" or "x2"), the `x` position
+                refers to a x coordinate. If set to "paper",
+                the `x` position refers to the distance from
+                the left of the plotting area in normalized
+                coordinates where 0 (1) corresponds to the left
+                (right). If set to a x axis ID followed by
+                "domain" (separated by a space), the position
+                behaves like for "paper", but refers to the
+                distance in fractions of the domain length from
+                the left of the domain of that axis: e.g., *x2
+                domain* refers to the domain of the second x
+                axis and a x position of 0.5 refers to the
+                point between the left and the right of the
+                domain of the second x axis. In order for
+                absolute positioning of the arrow to work,
+                "axref" must be exactly the same as "xref",
+                otherwise "axref" will revert to "pixel"
+                (explained next). For relative positioning,
+                "axref" can be set to "pixel", in which case
+                the "ax" value is specified in pixels relative
+                to "x". Absolute positioning is useful for
+                trendline annotations which should continue to
+                indicate the correct trend when zoomed.
+                Relative positioning is useful for specifying
+                the text offset for an annotated point.
+            ay
+                Sets the y component of the arrow tail about
+                the arrow head. If `ayref` is `pixel`, a
+                positive (negative) component corresponds to an
+                arrow pointing from bottom to top (top to
+                bottom). If `ayref` is not `pixel` and is
+                exactly the same as `yref`, this is an absolute
+                value on that axis, like `y`, specified in the
+                same coordinates as `yref`.
+            ayref
+                Indicates in what coordinates the tail of the
+                annotation (ax,ay) is specified. If set to a y
+                axis id (e.g. "y" or "y2"), the `y` position
+                refers to a y coordinate. If set to "paper",
+                the `y` position refers to the distance from
+                the bottom of the plotting area in normalized
+                coordinates where 0 (1) corresponds to the
+                bottom (top). If set to a y axis ID followed by
+                "domain" (separated by a space), the position
+                behaves like for "paper", but refers to the
+                distance in fractions of the domain length from
+                the bottom of the domain of that axis: e.g.,
+                *y2 domain* refers to the domain of the second
+                y  axis and a y position of 0.5 refers to the
+                point between the bottom and the top of the
+                domain of the second y axis. In order for
+                absolute positioning of the arrow to work,
+                "ayref" must be exactly the same as "yref",
+                otherwise "ayref" will revert to "pixel"
+                (explained next). For relative positioning,
+                "ayref" can be set to "pixel", in which case
+                the "ay" value is specified in pixels relative
+                to "y". Absolute positioning is useful for
+                trendline annotations which should continue to
+                indicate the correct trend when zoomed.
+                Relative positioning is useful for specifying
+                the text offset for an annotated point.
+            bgcolor
+                Sets the background color of the annotation.
+            bordercolor
+                Sets the color of the border enclosing the
+                annotation `text`.
+            borderpad
+                Sets the padding (in px) between the `text` and
+                the enclosing border.
+            borderwidth
+                Sets the width (in px) of the border enclosing
+                the annotation `text`.
+            captureevents
+                Determines whether the annotation text box
+                captures mouse move and click events, or allows
+                those events to pass through to data points in
+                the plot that may be behind the annotation. By
+                default `captureevents` is False unless
+                `hovertext` is provided. If you use the event
+                `plotly_clickannotation` without `hovertext`
+                you must explicitly enable `captureevents`.
+            clicktoshow
+                Makes this annotation respond to clicks on the
+                plot. If you click a data point that exactly
+                matches the `x` and `y` values of this
+                annotation, and it is hidden (visible: false),
+                it will appear. In "onoff" mode, you must click
+                the same point again to make it disappear, so
+                if you click multiple points, you can show
+                multiple annotations. In "onout" mode, a click
+                anywhere else in the plot (on another data
+                point or not) will hide this annotation. If you
+                need to show/hide this annotation in response
+                to different `x` or `y` values, you can set
+                `xclick` and/or `yclick`. This is useful for
+                example to label the side of a bar. To label
+                markers though, `standoff` is preferred over
+                `xclick` and `yclick`.
+            font
+                Sets the annotation text font.
+            height
+                Sets an explicit height for the text box. null
+                (default) lets the text set the box height.
+                Taller text will be clipped.
+            hoverlabel
+                :class:`plotly.graph_objects.layout.annotation.
+                Hoverlabel` instance or dict with compatible
+                properties
+            hovertext
+                Sets text to appear when hovering over this
+                annotation. If omitted or blank, no hover label
+                will appear.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            opacity
+                Sets the opacity of the annotation (text +
+                arrow).
+            showarrow
+                Determines whether or not the annotation is
+                drawn with an arrow. If True, `text` is placed
+                near the arrow's tail. If False, `text` lines
+                up with the `x` and `y` provided.
+            standoff
+                Sets a distance, in pixels, to move the end
+                arrowhead away from the position it is pointing
+                at, for example to point at the edge of a
+                marker independent of zoom. Note that this
+                shortens the arrow from the `ax` / `ay` vector,
+                in contrast to `xshift` / `yshift` which moves
+                everything by this amount.
+            startarrowhead
+                Sets the start annotation arrow head style.
+            startarrowsize
+                Sets the size of the start annotation arrow
+                head, relative to `arrowwidth`. A value of 1
+                (default) gives a head about 3x as wide as the
+                line.
+            startstandoff
+                Sets a distance, in pixels, to move the start
+                arrowhead away from the position it is pointing
+                at, for example to point at the edge of a
+                marker independent of zoom. Note that this
+                shortens the arrow from the `ax` / `ay` vector,
+                in contrast to `xshift` / `yshift` which moves
+                everything by this amount.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            text
+                Sets the text associated with this annotation.
+                Plotly uses a subset of HTML tags to do things
+                like newline (<br>), bold (<b></b>), italics
+                (<i></i>), hyperlinks (<a href='...'></a>).
+                Tags <em>, <sup>, <sub> <span> are also
+                supported.
+            textangle
+                Sets the angle at which the `text` is drawn
+                with respect to the horizontal.
+            valign
+                Sets the vertical alignment of the `text`
+                within the box. Has an effect only if an
+                explicit height is set to override the text
+                height.
+            visible
+                Determines whether or not this annotation is
+                visible.
+            width
+                Sets an explicit width for the text box. null
+                (default) lets the text set the box width.
+                Wider text will be clipped. There is no
+                automatic wrapping; use <br> to start a new
+                line.
+            x
+                Sets the annotation's x position. If the axis
+                `type` is "log", then you must take the log of
+                your desired range. If the axis `type` is
+                "date", it should be date strings, like date
+                data, though Date objects and unix milliseconds
+                will be accepted and converted to strings. If
+                the axis `type` is "category", it should be
+                numbers, using the scale where each category is
+                assigned a serial number from zero in the order
+                it appears.
+            xanchor
+                Sets the text box's horizontal position anchor
+                This anchor binds the `x` position to the
+                "left", "center" or "right" of the annotation.
+                For example, if `x` is set to 1, `xref` to
+                "paper" and `xanchor` to "right" then the
+                right-most portion of the annotation lines up
+                with the right-most edge of the plotting area.
+                If "auto", the anchor is equivalent to "center"
+                for data-referenced annotations or if there is
+                an arrow, whereas for paper-referenced with no
+                arrow, the anchor picked corresponds to the
+                closest side.
+            xclick
+                Toggle this annotation when clicking a data
+                point whose `x` value is `xclick` rather than
+                the annotation's `x` value.
+            xref
+                Sets the annotation's x coordinate axis. If set
+                to a x axis id (e.g. "x" or "x2"), the `x`
+                position refers to a x coordinate. If set to
+                "paper", the `x` position refers to the
+                distance from the left of the plotting area in
+                normalized coordinates where 0 (1) corresponds
+                to the left (right). If set to a x axis ID
+                followed by "domain" (separated by a space),
+                the position behaves like for "paper", but
+                refers to the distance in fractions of the
+                domain length from the left of the domain of
+                that axis: e.g., *x2 domain* refers to the
+                domain of the second x  axis and a x position
+                of 0.5 refers to the point between the left and
+                the right of the domain of the second x axis.
+            xshift
+                Shifts the position of the whole annotation and
+                arrow to the right (positive) or left
+                (negative) by this many pixels.
+            y
+                Sets the annotation's y position. If the axis
+                `type` is "log", then you must take the log of
+                your desired range. If the axis `type` is
+                "date", it should be date strings, like date
+                data, though Date objects and unix milliseconds
+                will be accepted and converted to strings. If
+                the axis `type` is "category", it should be
+                numbers, using the scale where each category is
+                assigned a serial number from zero in the order
+                it appears.
+            yanchor
+                Sets the text box's vertical position anchor
+                This anchor binds the `y` position to the
+                "top", "middle" or "bottom" of the annotation.
+                For example, if `y` is set to 1, `yref` to
+                "paper" and `yanchor` to "top" then the top-
+                most portion of the annotation lines up with
+                the top-most edge of the plotting area. If
+                "auto", the anchor is equivalent to "middle"
+                for data-referenced annotations or if there is
+                an arrow, whereas for paper-referenced with no
+                arrow, the anchor picked corresponds to the
+                closest side.
+            yclick
+                Toggle this annotation when clicking a data
+                point whose `y` value is `yclick` rather than
+                the annotation's `y` value.
+            yref
+                Sets the annotation's y coordinate axis. If set
+                to a y axis id (e.g. "y" or "y2"), the `y`
+                position refers to a y coordinate. If set to
+                "paper", the `y` position refers to the
+                distance from the bottom of the plotting area
+                in normalized coordinates where 0 (1)
+                corresponds to the bottom (top). If set to a y
+                axis ID followed by "domain" (separated by a
+                space), the position behaves like for "paper",
+                but refers to the distance in fractions of the
+                domain length from the bottom of the domain of
+                that axis: e.g., *y2 domain* refers to the
+                domain of the second y  axis and a y position
+                of 0.5 refers to the point between the bottom
+                and the top of the domain of the second y axis.
+            yshift
+                Shifts the position of the whole annotation and
+                arrow up (positive) or down (negative) by this
+                many pixels.
+""",
+            },
+        ),
+        "ActiveshapeValidator": (
+            "activeshape",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Activeshape",
+                "data_docs": """
+            fillcolor
+                Sets the color filling the active shape'
+                interior.
+            opacity
+                Sets the opacity of the active shape.
+""",
+            },
+        ),
+        "ActiveselectionValidator": (
+            "activeselection",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Activeselection",
+                "data_docs": """
+            fillcolor
+                Sets the color filling the active selection'
+                interior.
+            opacity
+                Sets the opacity of the active selection.
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,99 +1,380 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yshift import YshiftValidator
-    from ._yref import YrefValidator
-    from ._yclick import YclickValidator
-    from ._yanchor import YanchorValidator
-    from ._y import YValidator
-    from ._xshift import XshiftValidator
-    from ._xref import XrefValidator
-    from ._xclick import XclickValidator
-    from ._xanchor import XanchorValidator
-    from ._x import XValidator
-    from ._width import WidthValidator
-    from ._visible import VisibleValidator
-    from ._valign import ValignValidator
-    from ._textangle import TextangleValidator
-    from ._text import TextValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._startstandoff import StartstandoffValidator
-    from ._startarrowsize import StartarrowsizeValidator
-    from ._startarrowhead import StartarrowheadValidator
-    from ._standoff import StandoffValidator
-    from ._showarrow import ShowarrowValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._hovertext import HovertextValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._height import HeightValidator
-    from ._font import FontValidator
-    from ._clicktoshow import ClicktoshowValidator
-    from ._captureevents import CaptureeventsValidator
-    from ._borderwidth import BorderwidthValidator
-    from ._borderpad import BorderpadValidator
-    from ._bordercolor import BordercolorValidator
-    from ._bgcolor import BgcolorValidator
-    from ._ayref import AyrefValidator
-    from ._ay import AyValidator
-    from ._axref import AxrefValidator
-    from ._ax import AxValidator
-    from ._arrowwidth import ArrowwidthValidator
-    from ._arrowsize import ArrowsizeValidator
-    from ._arrowside import ArrowsideValidator
-    from ._arrowhead import ArrowheadValidator
-    from ._arrowcolor import ArrowcolorValidator
-    from ._align import AlignValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.annotation",
+    {
+        "YshiftValidator": (
+            "yshift",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "YrefValidator": (
+            "yref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["paper", "/^y([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "YclickValidator": (
+            "yclick",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "YanchorValidator": (
+            "yanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "values": ["auto", "top", "middle", "bottom"],
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "XshiftValidator": (
+            "xshift",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "XrefValidator": (
+            "xref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["paper", "/^x([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "XclickValidator": (
+            "xclick",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "XanchorValidator": (
+            "xanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "values": ["auto", "left", "center", "right"],
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 1,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "ValignValidator": (
+            "valign",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["top", "middle", "bottom"],
+            },
+        ),
+        "TextangleValidator": (
+            "textangle",
+            "_plotly_utils.basevalidators.AngleValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "TextValidator": (
+            "text",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "StartstandoffValidator": (
+            "startstandoff",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0,
+            },
+        ),
+        "StartarrowsizeValidator": (
+            "startarrowsize",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0.3,
+            },
+        ),
+        "StartarrowheadValidator": (
+            "startarrowhead",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 8,
+                "min": 0,
+            },
+        ),
+        "StandoffValidator": (
+            "standoff",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0,
+            },
+        ),
+        "ShowarrowValidator": (
+            "showarrow",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HovertextValidator": (
+            "hovertext",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            bgcolor
+                Sets the background color of the hover label.
+                By default uses the annotation's `bgcolor` made
+                opaque, or white if it was transparent.
+            bordercolor
+                Sets the border color of the hover label. By
+                default uses either dark grey or white, for
+                maximum contrast with `hoverlabel.bgcolor`.
+            font
+                Sets the hover label text font. By default uses
+                the global hover font and size, with color from
+                `hoverlabel.bordercolor`.
+""",
+            },
+        ),
+        "HeightValidator": (
+            "height",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 1,
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yshift.YshiftValidator",
-            "._yref.YrefValidator",
-            "._yclick.YclickValidator",
-            "._yanchor.YanchorValidator",
-            "._y.YValidator",
-            "._xshift.XshiftValidator",
-            "._xref.XrefValidator",
-            "._xclick.XclickValidator",
-            "._xanchor.XanchorValidator",
-            "._x.XValidator",
-            "._width.WidthValidator",
-            "._visible.VisibleValidator",
-            "._valign.ValignValidator",
-            "._textangle.TextangleValidator",
-            "._text.TextValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._startstandoff.StartstandoffValidator",
-            "._startarrowsize.StartarrowsizeValidator",
-            "._startarrowhead.StartarrowheadValidator",
-            "._standoff.StandoffValidator",
-            "._showarrow.ShowarrowValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._hovertext.HovertextValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._height.HeightValidator",
-            "._font.FontValidator",
-            "._clicktoshow.ClicktoshowValidator",
-            "._captureevents.CaptureeventsValidator",
-            "._borderwidth.BorderwidthValidator",
-            "._borderpad.BorderpadValidator",
-            "._bordercolor.BordercolorValidator",
-            "._bgcolor.BgcolorValidator",
-            "._ayref.AyrefValidator",
-            "._ay.AyValidator",
-            "._axref.AxrefValidator",
-            "._ax.AxValidator",
-            "._arrowwidth.ArrowwidthValidator",
-            "._arrowsize.ArrowsizeValidator",
-            "._arrowside.ArrowsideValidator",
-            "._arrowhead.ArrowheadValidator",
-            "._arrowcolor.ArrowcolorValidator",
-            "._align.AlignValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "ClicktoshowValidator": (
+            "clicktoshow",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": [False, "onoff", "onout"],
+            },
+        ),
+        "CaptureeventsValidator": (
+            "captureevents",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "BorderwidthValidator": (
+            "borderwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0,
+            },
+        ),
+        "BorderpadValidator": (
+            "borderpad",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0,
+            },
+        ),
+        "BordercolorValidator": (
+            "bordercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "AyrefValidator": (
+            "ayref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["pixel", "/^y([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "AyValidator": (
+            "ay",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "AxrefValidator": (
+            "axref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["pixel", "/^x([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "AxValidator": (
+            "ax",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "ArrowwidthValidator": (
+            "arrowwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0.1,
+            },
+        ),
+        "ArrowsizeValidator": (
+            "arrowsize",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0.3,
+            },
+        ),
+        "ArrowsideValidator": (
+            "arrowside",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "arraydraw",
+                "extras": ["none"],
+                "flags": ["end", "start"],
+            },
+        ),
+        "ArrowheadValidator": (
+            "arrowhead",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 8,
+                "min": 0,
+            },
+        ),
+        "ArrowcolorValidator": (
+            "arrowcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "AlignValidator": (
+            "align",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["left", "center", "right"],
+            },
+        ),
+    },
+    [],
+)
@@ -1,19 +1,30 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._sequentialminus import SequentialminusValidator
-    from ._sequential import SequentialValidator
-    from ._diverging import DivergingValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._sequentialminus.SequentialminusValidator",
-            "._sequential.SequentialValidator",
-            "._diverging.DivergingValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.colorscale",
+    {
+        "SequentialminusValidator": (
+            "sequentialminus",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SequentialValidator": (
+            "sequential",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DivergingValidator": (
+            "diverging",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
@@ -1,77 +1,361 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._uirevision import UirevisionValidator
-    from ._subunitwidth import SubunitwidthValidator
-    from ._subunitcolor import SubunitcolorValidator
-    from ._showsubunits import ShowsubunitsValidator
-    from ._showrivers import ShowriversValidator
-    from ._showocean import ShowoceanValidator
-    from ._showland import ShowlandValidator
-    from ._showlakes import ShowlakesValidator
-    from ._showframe import ShowframeValidator
-    from ._showcountries import ShowcountriesValidator
-    from ._showcoastlines import ShowcoastlinesValidator
-    from ._scope import ScopeValidator
-    from ._riverwidth import RiverwidthValidator
-    from ._rivercolor import RivercolorValidator
-    from ._resolution import ResolutionValidator
-    from ._projection import ProjectionValidator
-    from ._oceancolor import OceancolorValidator
-    from ._lonaxis import LonaxisValidator
-    from ._lataxis import LataxisValidator
-    from ._landcolor import LandcolorValidator
-    from ._lakecolor import LakecolorValidator
-    from ._framewidth import FramewidthValidator
-    from ._framecolor import FramecolorValidator
-    from ._fitbounds import FitboundsValidator
-    from ._domain import DomainValidator
-    from ._countrywidth import CountrywidthValidator
-    from ._countrycolor import CountrycolorValidator
-    from ._coastlinewidth import CoastlinewidthValidator
-    from ._coastlinecolor import CoastlinecolorValidator
-    from ._center import CenterValidator
-    from ._bgcolor import BgcolorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._uirevision.UirevisionValidator",
-            "._subunitwidth.SubunitwidthValidator",
-            "._subunitcolor.SubunitcolorValidator",
-            "._showsubunits.ShowsubunitsValidator",
-            "._showrivers.ShowriversValidator",
-            "._showocean.ShowoceanValidator",
-            "._showland.ShowlandValidator",
-            "._showlakes.ShowlakesValidator",
-            "._showframe.ShowframeValidator",
-            "._showcountries.ShowcountriesValidator",
-            "._showcoastlines.ShowcoastlinesValidator",
-            "._scope.ScopeValidator",
-            "._riverwidth.RiverwidthValidator",
-            "._rivercolor.RivercolorValidator",
-            "._resolution.ResolutionValidator",
-            "._projection.ProjectionValidator",
-            "._oceancolor.OceancolorValidator",
-            "._lonaxis.LonaxisValidator",
-            "._lataxis.LataxisValidator",
-            "._landcolor.LandcolorValidator",
-            "._lakecolor.LakecolorValidator",
-            "._framewidth.FramewidthValidator",
-            "._framecolor.FramecolorValidator",
-            "._fitbounds.FitboundsValidator",
-            "._domain.DomainValidator",
-            "._countrywidth.CountrywidthValidator",
-            "._countrycolor.CountrycolorValidator",
-            "._coastlinewidth.CoastlinewidthValidator",
-            "._coastlinecolor.CoastlinecolorValidator",
-            "._center.CenterValidator",
-            "._bgcolor.BgcolorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.geo",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SubunitwidthValidator": (
+            "subunitwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "SubunitcolorValidator": (
+            "subunitcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowsubunitsValidator": (
+            "showsubunits",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowriversValidator": (
+            "showrivers",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowoceanValidator": (
+            "showocean",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowlandValidator": (
+            "showland",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowlakesValidator": (
+            "showlakes",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowframeValidator": (
+            "showframe",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowcountriesValidator": (
+            "showcountries",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowcoastlinesValidator": (
+            "showcoastlines",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ScopeValidator": (
+            "scope",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "africa",
+                    "asia",
+                    "europe",
+                    "north america",
+                    "south america",
+                    "usa",
+                    "world",
+                ],
+            },
+        ),
+        "RiverwidthValidator": (
+            "riverwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "RivercolorValidator": (
+            "rivercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ResolutionValidator": (
+            "resolution",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "coerce_number": True,
+                "edit_type": "plot",
+                "values": [110, 50],
+            },
+        ),
+        "ProjectionValidator": (
+            "projection",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Projection",
+                "data_docs": """
+            distance
+                For satellite projection type only. Sets the
+                distance from the center of the sphere to the
+                point of view as a proportion of the sphere’s
+                radius.
+            parallels
+                For conic projection types only. Sets the
+                parallels (tangent, secant) where the cone
+                intersects the sphere.
+            rotation
+                :class:`plotly.graph_objects.layout.geo.project
+                ion.Rotation` instance or dict with compatible
+                properties
+            scale
+                Zooms in or out on the map view. A scale of 1
+                corresponds to the largest zoom level that fits
+                the map's lon and lat ranges.
+            tilt
+                For satellite projection type only. Sets the
+                tilt angle of perspective projection.
+            type
+                Sets the projection type.
+""",
+            },
+        ),
+        "OceancolorValidator": (
+            "oceancolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "LonaxisValidator": (
+            "lonaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Lonaxis",
+                "data_docs": """
+            dtick
+                Sets the graticule's longitude/latitude tick
+                step.
+            gridcolor
+                Sets the graticule's stroke color.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the graticule's stroke width (in px).
+            range
+                Sets the range of this axis (in degrees), sets
+                the map's clipped coordinates.
+            showgrid
+                Sets whether or not graticule are shown on the
+                map.
+            tick0
+                Sets the graticule's starting tick
+                longitude/latitude.
+""",
+            },
+        ),
+        "LataxisValidator": (
+            "lataxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Lataxis",
+                "data_docs": """
+            dtick
+                Sets the graticule's longitude/latitude tick
+                step.
+            gridcolor
+                Sets the graticule's stroke color.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the graticule's stroke width (in px).
+            range
+                Sets the range of this axis (in degrees), sets
+                the map's clipped coordinates.
+            showgrid
+                Sets whether or not graticule are shown on the
+                map.
+            tick0
+                Sets the graticule's starting tick
+                longitude/latitude.
+""",
+            },
+        ),
+        "LandcolorValidator": (
+            "landcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "LakecolorValidator": (
+            "lakecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "FramewidthValidator": (
+            "framewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "FramecolorValidator": (
+            "framecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "FitboundsValidator": (
+            "fitbounds",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [False, "locations", "geojson"],
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this geo subplot .
+                Note that geo subplots are constrained by
+                domain. In general, when `projection.scale` is
+                set to 1. a map will fit either its x or y
+                domain, but not both.
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this geo subplot .
+                Note that geo subplots are constrained by
+                domain. In general, when `projection.scale` is
+                set to 1. a map will fit either its x or y
+                domain, but not both.
+            x
+                Sets the horizontal domain of this geo subplot
+                (in plot fraction). Note that geo subplots are
+                constrained by domain. In general, when
+                `projection.scale` is set to 1. a map will fit
+                either its x or y domain, but not both.
+            y
+                Sets the vertical domain of this geo subplot
+                (in plot fraction). Note that geo subplots are
+                constrained by domain. In general, when
+                `projection.scale` is set to 1. a map will fit
+                either its x or y domain, but not both.
+""",
+            },
+        ),
+        "CountrywidthValidator": (
+            "countrywidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "CountrycolorValidator": (
+            "countrycolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "CoastlinewidthValidator": (
+            "coastlinewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "CoastlinecolorValidator": (
+            "coastlinecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "CenterValidator": (
+            "center",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Center",
+                "data_docs": """
+            lat
+                Sets the latitude of the map's center. For all
+                projection types, the map's latitude center
+                lies at the middle of the latitude range by
+                default.
+            lon
+                Sets the longitude of the map's center. By
+                default, the map's longitude center lies at the
+                middle of the longitude range for scoped
+                projection and above `projection.rotation.lon`
+                otherwise.
+""",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
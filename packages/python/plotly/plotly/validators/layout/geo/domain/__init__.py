@@ -1,21 +1,47 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._y import YValidator
-    from ._x import XValidator
-    from ._row import RowValidator
-    from ._column import ColumnValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._y.YValidator",
-            "._x.XValidator",
-            "._row.RowValidator",
-            "._column.ColumnValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.geo.domain",
+    {
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "max": 1, "min": 0, "valType": "number"},
+                    {"editType": "plot", "max": 1, "min": 0, "valType": "number"},
+                ],
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "max": 1, "min": 0, "valType": "number"},
+                    {"editType": "plot", "max": 1, "min": 0, "valType": "number"},
+                ],
+            },
+        ),
+        "RowValidator": (
+            "row",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "ColumnValidator": (
+            "column",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
@@ -1,27 +1,71 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._tick0 import Tick0Validator
-    from ._showgrid import ShowgridValidator
-    from ._range import RangeValidator
-    from ._gridwidth import GridwidthValidator
-    from ._griddash import GriddashValidator
-    from ._gridcolor import GridcolorValidator
-    from ._dtick import DtickValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._tick0.Tick0Validator",
-            "._showgrid.ShowgridValidator",
-            "._range.RangeValidator",
-            "._gridwidth.GridwidthValidator",
-            "._griddash.GriddashValidator",
-            "._gridcolor.GridcolorValidator",
-            "._dtick.DtickValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.geo.lonaxis",
+    {
+        "Tick0Validator": (
+            "tick0",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShowgridValidator": (
+            "showgrid",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "RangeValidator": (
+            "range",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "valType": "number"},
+                    {"editType": "plot", "valType": "number"},
+                ],
+            },
+        ),
+        "GridwidthValidator": (
+            "gridwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "GriddashValidator": (
+            "griddash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "GridcolorValidator": (
+            "gridcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "DtickValidator": (
+            "dtick",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
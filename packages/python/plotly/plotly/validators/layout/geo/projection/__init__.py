@@ -1,25 +1,155 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._type import TypeValidator
-    from ._tilt import TiltValidator
-    from ._scale import ScaleValidator
-    from ._rotation import RotationValidator
-    from ._parallels import ParallelsValidator
-    from ._distance import DistanceValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._type.TypeValidator",
-            "._tilt.TiltValidator",
-            "._scale.ScaleValidator",
-            "._rotation.RotationValidator",
-            "._parallels.ParallelsValidator",
-            "._distance.DistanceValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.geo.projection",
+    {
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "airy",
+                    "aitoff",
+                    "albers",
+                    "albers usa",
+                    "august",
+                    "azimuthal equal area",
+                    "azimuthal equidistant",
+                    "baker",
+                    "bertin1953",
+                    "boggs",
+                    "bonne",
+                    "bottomley",
+                    "bromley",
+                    "collignon",
+                    "conic conformal",
+                    "conic equal area",
+                    "conic equidistant",
+                    "craig",
+                    "craster",
+                    "cylindrical equal area",
+                    "cylindrical stereographic",
+                    "eckert1",
+                    "eckert2",
+                    "eckert3",
+                    "eckert4",
+                    "eckert5",
+                    "eckert6",
+                    "eisenlohr",
+                    "equal earth",
+                    "equirectangular",
+                    "fahey",
+                    "foucaut",
+                    "foucaut sinusoidal",
+                    "ginzburg4",
+                    "ginzburg5",
+                    "ginzburg6",
+                    "ginzburg8",
+                    "ginzburg9",
+                    "gnomonic",
+                    "gringorten",
+                    "gringorten quincuncial",
+                    "guyou",
+                    "hammer",
+                    "hill",
+                    "homolosine",
+                    "hufnagel",
+                    "hyperelliptical",
+                    "kavrayskiy7",
+                    "lagrange",
+                    "larrivee",
+                    "laskowski",
+                    "loximuthal",
+                    "mercator",
+                    "miller",
+                    "mollweide",
+                    "mt flat polar parabolic",
+                    "mt flat polar quartic",
+                    "mt flat polar sinusoidal",
+                    "natural earth",
+                    "natural earth1",
+                    "natural earth2",
+                    "nell hammer",
+                    "nicolosi",
+                    "orthographic",
+                    "patterson",
+                    "peirce quincuncial",
+                    "polyconic",
+                    "rectangular polyconic",
+                    "robinson",
+                    "satellite",
+                    "sinu mollweide",
+                    "sinusoidal",
+                    "stereographic",
+                    "times",
+                    "transverse mercator",
+                    "van der grinten",
+                    "van der grinten2",
+                    "van der grinten3",
+                    "van der grinten4",
+                    "wagner4",
+                    "wagner6",
+                    "wiechel",
+                    "winkel tripel",
+                    "winkel3",
+                ],
+            },
+        ),
+        "TiltValidator": (
+            "tilt",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ScaleValidator": (
+            "scale",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "RotationValidator": (
+            "rotation",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Rotation",
+                "data_docs": """
+            lat
+                Rotates the map along meridians (in degrees
+                North).
+            lon
+                Rotates the map along parallels (in degrees
+                East). Defaults to the center of the
+                `lonaxis.range` values.
+            roll
+                Roll the map (in degrees) For example, a roll
+                of 180 makes the map appear upside down.
+""",
+            },
+        ),
+        "ParallelsValidator": (
+            "parallels",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "valType": "number"},
+                    {"editType": "plot", "valType": "number"},
+                ],
+            },
+        ),
+        "DistanceValidator": (
+            "distance",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 1.001,
+            },
+        ),
+    },
+    [],
+)
@@ -1,37 +1,134 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yside import YsideValidator
-    from ._ygap import YgapValidator
-    from ._yaxes import YaxesValidator
-    from ._xside import XsideValidator
-    from ._xgap import XgapValidator
-    from ._xaxes import XaxesValidator
-    from ._subplots import SubplotsValidator
-    from ._rows import RowsValidator
-    from ._roworder import RoworderValidator
-    from ._pattern import PatternValidator
-    from ._domain import DomainValidator
-    from ._columns import ColumnsValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yside.YsideValidator",
-            "._ygap.YgapValidator",
-            "._yaxes.YaxesValidator",
-            "._xside.XsideValidator",
-            "._xgap.XgapValidator",
-            "._xaxes.XaxesValidator",
-            "._subplots.SubplotsValidator",
-            "._rows.RowsValidator",
-            "._roworder.RoworderValidator",
-            "._pattern.PatternValidator",
-            "._domain.DomainValidator",
-            "._columns.ColumnsValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.grid",
+    {
+        "YsideValidator": (
+            "yside",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["left", "left plot", "right plot", "right"],
+            },
+        ),
+        "YgapValidator": (
+            "ygap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "YaxesValidator": (
+            "yaxes",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "free_length": True,
+                "items": {
+                    "editType": "plot",
+                    "valType": "enumerated",
+                    "values": ["/^y([2-9]|[1-9][0-9]+)?( domain)?$/", ""],
+                },
+            },
+        ),
+        "XsideValidator": (
+            "xside",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["bottom", "bottom plot", "top plot", "top"],
+            },
+        ),
+        "XgapValidator": (
+            "xgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "XaxesValidator": (
+            "xaxes",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "free_length": True,
+                "items": {
+                    "editType": "plot",
+                    "valType": "enumerated",
+                    "values": ["/^x([2-9]|[1-9][0-9]+)?( domain)?$/", ""],
+                },
+            },
+        ),
+        "SubplotsValidator": (
+            "subplots",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "dimensions": 2,
+                "edit_type": "plot",
+                "free_length": True,
+                "items": {
+                    "editType": "plot",
+                    "valType": "enumerated",
+                    "values": ["/^x([2-9]|[1-9][0-9]+)?y([2-9]|[1-9][0-9]+)?$/", ""],
+                },
+            },
+        ),
+        "RowsValidator": (
+            "rows",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+                "min": 1,
+            },
+        ),
+        "RoworderValidator": (
+            "roworder",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["top to bottom", "bottom to top"],
+            },
+        ),
+        "PatternValidator": (
+            "pattern",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["independent", "coupled"],
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            x
+                Sets the horizontal domain of this grid subplot
+                (in plot fraction). The first and last cells
+                end exactly at the domain edges, with no grout
+                around the edges.
+            y
+                Sets the vertical domain of this grid subplot
+                (in plot fraction). The first and last cells
+                end exactly at the domain edges, with no grout
+                around the edges.
+""",
+            },
+        ),
+        "ColumnsValidator": (
+            "columns",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "plot",
+                "min": 1,
+            },
+        ),
+    },
+    [],
+)
@@ -1,43 +1,122 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yref import YrefValidator
-    from ._yanchor import YanchorValidator
-    from ._y import YValidator
-    from ._xref import XrefValidator
-    from ._xanchor import XanchorValidator
-    from ._x import XValidator
-    from ._visible import VisibleValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._source import SourceValidator
-    from ._sizing import SizingValidator
-    from ._sizey import SizeyValidator
-    from ._sizex import SizexValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._layer import LayerValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yref.YrefValidator",
-            "._yanchor.YanchorValidator",
-            "._y.YValidator",
-            "._xref.XrefValidator",
-            "._xanchor.XanchorValidator",
-            "._x.XValidator",
-            "._visible.VisibleValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._source.SourceValidator",
-            "._sizing.SizingValidator",
-            "._sizey.SizeyValidator",
-            "._sizex.SizexValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._layer.LayerValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.image",
+    {
+        "YrefValidator": (
+            "yref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["paper", "/^y([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "YanchorValidator": (
+            "yanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["top", "middle", "bottom"],
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "XrefValidator": (
+            "xref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["paper", "/^x([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "XanchorValidator": (
+            "xanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["left", "center", "right"],
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SourceValidator": (
+            "source",
+            "_plotly_utils.basevalidators.ImageUriValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "SizingValidator": (
+            "sizing",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["fill", "contain", "stretch"],
+            },
+        ),
+        "SizeyValidator": (
+            "sizey",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "SizexValidator": (
+            "sizex",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LayerValidator": (
+            "layer",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["below", "above"],
+            },
+        ),
+    },
+    [],
+)
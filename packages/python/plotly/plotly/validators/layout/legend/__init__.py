@@ -1,65 +1,285 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yref import YrefValidator
-    from ._yanchor import YanchorValidator
-    from ._y import YValidator
-    from ._xref import XrefValidator
-    from ._xanchor import XanchorValidator
-    from ._x import XValidator
-    from ._visible import VisibleValidator
-    from ._valign import ValignValidator
-    from ._uirevision import UirevisionValidator
-    from ._traceorder import TraceorderValidator
-    from ._tracegroupgap import TracegroupgapValidator
-    from ._title import TitleValidator
-    from ._orientation import OrientationValidator
-    from ._itemwidth import ItemwidthValidator
-    from ._itemsizing import ItemsizingValidator
-    from ._itemdoubleclick import ItemdoubleclickValidator
-    from ._itemclick import ItemclickValidator
-    from ._indentation import IndentationValidator
-    from ._grouptitlefont import GrouptitlefontValidator
-    from ._groupclick import GroupclickValidator
-    from ._font import FontValidator
-    from ._entrywidthmode import EntrywidthmodeValidator
-    from ._entrywidth import EntrywidthValidator
-    from ._borderwidth import BorderwidthValidator
-    from ._bordercolor import BordercolorValidator
-    from ._bgcolor import BgcolorValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.legend",
+    {
+        "YrefValidator": (
+            "yref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "layoutstyle",
+                "values": ["container", "paper"],
+            },
+        ),
+        "YanchorValidator": (
+            "yanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["auto", "top", "middle", "bottom"],
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+            },
+        ),
+        "XrefValidator": (
+            "xref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "layoutstyle",
+                "values": ["container", "paper"],
+            },
+        ),
+        "XanchorValidator": (
+            "xanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["auto", "left", "center", "right"],
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "legend",
+            },
+        ),
+        "ValignValidator": (
+            "valign",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["top", "middle", "bottom"],
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TraceorderValidator": (
+            "traceorder",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "legend",
+                "extras": ["normal"],
+                "flags": ["reversed", "grouped"],
+            },
+        ),
+        "TracegroupgapValidator": (
+            "tracegroupgap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+                "min": 0,
+            },
+        ),
+        "TitleValidator": (
+            "title",
+            "_plotly_utils.basevalidators.TitleValidator",
+            {
+                "data_class_str": "Title",
+                "data_docs": """
+            font
+                Sets this legend's title font. Defaults to
+                `legend.font` with its size increased about
+                20%.
+            side
+                Determines the location of legend's title with
+                respect to the legend items. Defaulted to "top"
+                with `orientation` is "h". Defaulted to "left"
+                with `orientation` is "v". The *top left*
+                options could be used to expand top center and
+                top right are for horizontal alignment legend
+                area in both x and y sides.
+            text
+                Sets the title of the legend.
+""",
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["v", "h"],
+            },
+        ),
+        "ItemwidthValidator": (
+            "itemwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+                "min": 30,
+            },
+        ),
+        "ItemsizingValidator": (
+            "itemsizing",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["trace", "constant"],
+            },
+        ),
+        "ItemdoubleclickValidator": (
+            "itemdoubleclick",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["toggle", "toggleothers", False],
+            },
+        ),
+        "ItemclickValidator": (
+            "itemclick",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["toggle", "toggleothers", False],
+            },
+        ),
+        "IndentationValidator": (
+            "indentation",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+                "min": -15,
+            },
+        ),
+        "GrouptitlefontValidator": (
+            "grouptitlefont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Grouptitlefont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yref.YrefValidator",
-            "._yanchor.YanchorValidator",
-            "._y.YValidator",
-            "._xref.XrefValidator",
-            "._xanchor.XanchorValidator",
-            "._x.XValidator",
-            "._visible.VisibleValidator",
-            "._valign.ValignValidator",
-            "._uirevision.UirevisionValidator",
-            "._traceorder.TraceorderValidator",
-            "._tracegroupgap.TracegroupgapValidator",
-            "._title.TitleValidator",
-            "._orientation.OrientationValidator",
-            "._itemwidth.ItemwidthValidator",
-            "._itemsizing.ItemsizingValidator",
-            "._itemdoubleclick.ItemdoubleclickValidator",
-            "._itemclick.ItemclickValidator",
-            "._indentation.IndentationValidator",
-            "._grouptitlefont.GrouptitlefontValidator",
-            "._groupclick.GroupclickValidator",
-            "._font.FontValidator",
-            "._entrywidthmode.EntrywidthmodeValidator",
-            "._entrywidth.EntrywidthValidator",
-            "._borderwidth.BorderwidthValidator",
-            "._bordercolor.BordercolorValidator",
-            "._bgcolor.BgcolorValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "GroupclickValidator": (
+            "groupclick",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["toggleitem", "togglegroup"],
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
+
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "EntrywidthmodeValidator": (
+            "entrywidthmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "legend",
+                "values": ["fraction", "pixels"],
+            },
+        ),
+        "EntrywidthValidator": (
+            "entrywidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+                "min": 0,
+            },
+        ),
+        "BorderwidthValidator": (
+            "borderwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "legend",
+                "min": 0,
+            },
+        ),
+        "BordercolorValidator": (
+            "bordercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "legend",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "legend",
+            },
+        ),
+    },
+    [],
+)
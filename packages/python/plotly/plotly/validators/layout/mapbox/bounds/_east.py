@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class EastValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(
-        self, plotly_name="east", parent_name="layout.mapbox.bounds", **kwargs
-    ):
-        super(EastValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "plot"),
-            **kwargs,
-        )
@@ -1,12 +1,23 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._lon import LonValidator
-    from ._lat import LatValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._lon.LonValidator", "._lat.LatValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.mapbox.center",
+    {
+        "LonValidator": (
+            "lon",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "LatValidator": (
+            "lat",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
@@ -1,49 +1,198 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._type import TypeValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._symbol import SymbolValidator
-    from ._sourcetype import SourcetypeValidator
-    from ._sourcelayer import SourcelayerValidator
-    from ._sourceattribution import SourceattributionValidator
-    from ._source import SourceValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._minzoom import MinzoomValidator
-    from ._maxzoom import MaxzoomValidator
-    from ._line import LineValidator
-    from ._fill import FillValidator
-    from ._coordinates import CoordinatesValidator
-    from ._color import ColorValidator
-    from ._circle import CircleValidator
-    from ._below import BelowValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._type.TypeValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._symbol.SymbolValidator",
-            "._sourcetype.SourcetypeValidator",
-            "._sourcelayer.SourcelayerValidator",
-            "._sourceattribution.SourceattributionValidator",
-            "._source.SourceValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._minzoom.MinzoomValidator",
-            "._maxzoom.MaxzoomValidator",
-            "._line.LineValidator",
-            "._fill.FillValidator",
-            "._coordinates.CoordinatesValidator",
-            "._color.ColorValidator",
-            "._circle.CircleValidator",
-            "._below.BelowValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.mapbox.layer",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["circle", "line", "fill", "symbol", "raster"],
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "SymbolValidator": (
+            "symbol",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Symbol",
+                "data_docs": """
+            icon
+                Sets the symbol icon image
+                (mapbox.layer.layout.icon-image). Full list:
+                https://www.mapbox.com/maki-icons/
+            iconsize
+                Sets the symbol icon size
+                (mapbox.layer.layout.icon-size). Has an effect
+                only when `type` is set to "symbol".
+            placement
+                Sets the symbol and/or text placement
+                (mapbox.layer.layout.symbol-placement). If
+                `placement` is "point", the label is placed
+                where the geometry is located If `placement` is
+                "line", the label is placed along the line of
+                the geometry If `placement` is "line-center",
+                the label is placed on the center of the
+                geometry
+            text
+                Sets the symbol text (mapbox.layer.layout.text-
+                field).
+            textfont
+                Sets the icon text font
+                (color=mapbox.layer.paint.text-color,
+                size=mapbox.layer.layout.text-size). Has an
+                effect only when `type` is set to "symbol".
+            textposition
+                Sets the positions of the `text` elements with
+                respects to the (x,y) coordinates.
+""",
+            },
+        ),
+        "SourcetypeValidator": (
+            "sourcetype",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["geojson", "vector", "raster", "image"],
+            },
+        ),
+        "SourcelayerValidator": (
+            "sourcelayer",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "SourceattributionValidator": (
+            "sourceattribution",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "SourceValidator": (
+            "source",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "MinzoomValidator": (
+            "minzoom",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 24,
+                "min": 0,
+            },
+        ),
+        "MaxzoomValidator": (
+            "maxzoom",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 24,
+                "min": 0,
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            dash
+                Sets the length of dashes and gaps
+                (mapbox.layer.paint.line-dasharray). Has an
+                effect only when `type` is set to "line".
+            dashsrc
+                Sets the source reference on Chart Studio Cloud
+                for `dash`.
+            width
+                Sets the line width (mapbox.layer.paint.line-
+                width). Has an effect only when `type` is set
+                to "line".
+""",
+            },
+        ),
+        "FillValidator": (
+            "fill",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Fill",
+                "data_docs": """
+            outlinecolor
+                Sets the fill outline color
+                (mapbox.layer.paint.fill-outline-color). Has an
+                effect only when `type` is set to "fill".
+""",
+            },
+        ),
+        "CoordinatesValidator": (
+            "coordinates",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "CircleValidator": (
+            "circle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Circle",
+                "data_docs": """
+            radius
+                Sets the circle radius
+                (mapbox.layer.paint.circle-radius). Has an
+                effect only when `type` is set to "circle".
+""",
+            },
+        ),
+        "BelowValidator": (
+            "below",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
@@ -1,25 +1,56 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._t import TValidator
-    from ._r import RValidator
-    from ._pad import PadValidator
-    from ._l import LValidator
-    from ._b import BValidator
-    from ._autoexpand import AutoexpandValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._t.TValidator",
-            "._r.RValidator",
-            "._pad.PadValidator",
-            "._l.LValidator",
-            "._b.BValidator",
-            "._autoexpand.AutoexpandValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.margin",
+    {
+        "TValidator": (
+            "t",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "RValidator": (
+            "r",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "PadValidator": (
+            "pad",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "LValidator": (
+            "l",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "BValidator": (
+            "b",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "AutoexpandValidator": (
+            "autoexpand",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
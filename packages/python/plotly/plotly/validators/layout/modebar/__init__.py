@@ -1,31 +1,75 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._uirevision import UirevisionValidator
-    from ._removesrc import RemovesrcValidator
-    from ._remove import RemoveValidator
-    from ._orientation import OrientationValidator
-    from ._color import ColorValidator
-    from ._bgcolor import BgcolorValidator
-    from ._addsrc import AddsrcValidator
-    from ._add import AddValidator
-    from ._activecolor import ActivecolorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._uirevision.UirevisionValidator",
-            "._removesrc.RemovesrcValidator",
-            "._remove.RemoveValidator",
-            "._orientation.OrientationValidator",
-            "._color.ColorValidator",
-            "._bgcolor.BgcolorValidator",
-            "._addsrc.AddsrcValidator",
-            "._add.AddValidator",
-            "._activecolor.ActivecolorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.modebar",
+    {
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "RemovesrcValidator": (
+            "removesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "RemoveValidator": (
+            "remove",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "modebar",
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "modebar",
+                "values": ["v", "h"],
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "modebar",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "modebar",
+            },
+        ),
+        "AddsrcValidator": (
+            "addsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "AddValidator": (
+            "add",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "array_ok": True,
+                "edit_type": "modebar",
+            },
+        ),
+        "ActivecolorValidator": (
+            "activecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "modebar",
+            },
+        ),
+    },
+    [],
+)
@@ -1,12 +1,37 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._mode import ModeValidator
-    from ._line import LineValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._mode.ModeValidator", "._line.LineValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.newselection",
+    {
+        "ModeValidator": (
+            "mode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["immediate", "gradual"],
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the line color. By default uses either
+                dark grey or white to increase contrast with
+                background color.
+            dash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            width
+                Sets the line width (in px).
+""",
+            },
+        ),
+    },
+    [],
+)
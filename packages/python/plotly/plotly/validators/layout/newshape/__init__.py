@@ -1,43 +1,210 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._showlegend import ShowlegendValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._line import LineValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._layer import LayerValidator
-    from ._label import LabelValidator
-    from ._fillrule import FillruleValidator
-    from ._fillcolor import FillcolorValidator
-    from ._drawdirection import DrawdirectionValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._showlegend.ShowlegendValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._line.LineValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._layer.LayerValidator",
-            "._label.LabelValidator",
-            "._fillrule.FillruleValidator",
-            "._fillcolor.FillcolorValidator",
-            "._drawdirection.DrawdirectionValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.newshape",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "none",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the line color. By default uses either
+                dark grey or white to increase contrast with
+                background color.
+            dash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            width
+                Sets the line width (in px).
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "none",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "none",
+            },
+        ),
+        "LayerValidator": (
+            "layer",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["below", "above", "between"],
+            },
+        ),
+        "LabelValidator": (
+            "label",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Label",
+                "data_docs": """
+            font
+                Sets the new shape label text font.
+            padding
+                Sets padding (in px) between edge of label and
+                edge of new shape.
+            text
+                Sets the text to display with the new shape. It
+                is also used for legend item if `name` is not
+                provided.
+            textangle
+                Sets the angle at which the label text is drawn
+                with respect to the horizontal. For lines,
+                angle "auto" is the same angle as the line. For
+                all other shapes, angle "auto" is horizontal.
+            textposition
+                Sets the position of the label text relative to
+                the new shape. Supported values for rectangles,
+                circles and paths are *top left*, *top center*,
+                *top right*, *middle left*, *middle center*,
+                *middle right*, *bottom left*, *bottom center*,
+                and *bottom right*. Supported values for lines
+                are "start", "middle", and "end". Default:
+                *middle center* for rectangles, circles, and
+                paths; "middle" for lines.
+            texttemplate
+                Template string used for rendering the new
+                shape's label. Note that this will override
+                `text`. Variables are inserted using
+                %{variable}, for example "x0: %{x0}". Numbers
+                are formatted using d3-format's syntax
+                %{variable:d3-format}, for example "Price:
+                %{x0:$.2f}". See https://github.com/d3/d3-
+                format/tree/v1.4.5#d3-format for details on the
+                formatting syntax. Dates are formatted using
+                d3-time-format's syntax %{variable|d3-time-
+                format}, for example "Day: %{x0|%m %b %Y}". See
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format for details on
+                the date formatting syntax. A single
+                multiplication or division operation may be
+                applied to numeric variables, and combined with
+                d3 number formatting, for example "Length in
+                cm: %{x0*2.54}", "%{slope*60:.1f} meters per
+                second." For log axes, variable values are
+                given in log units. For date axes, x/y
+                coordinate variables and center variables use
+                datetimes, while all other variable values use
+                values in ms. Finally, the template string has
+                access to variables `x0`, `x1`, `y0`, `y1`,
+                `slope`, `dx`, `dy`, `width`, `height`,
+                `length`, `xcenter` and `ycenter`.
+            xanchor
+                Sets the label's horizontal position anchor
+                This anchor binds the specified `textposition`
+                to the "left", "center" or "right" of the label
+                text. For example, if `textposition` is set to
+                *top right* and `xanchor` to "right" then the
+                right-most portion of the label text lines up
+                with the right-most edge of the new shape.
+            yanchor
+                Sets the label's vertical position anchor This
+                anchor binds the specified `textposition` to
+                the "top", "middle" or "bottom" of the label
+                text. For example, if `textposition` is set to
+                *top right* and `yanchor` to "top" then the
+                top-most portion of the label text lines up
+                with the top-most edge of the new shape.
+""",
+            },
+        ),
+        "FillruleValidator": (
+            "fillrule",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["evenodd", "nonzero"],
+            },
+        ),
+        "FillcolorValidator": (
+            "fillcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "DrawdirectionValidator": (
+            "drawdirection",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["ortho", "horizontal", "vertical", "diagonal"],
+            },
+        ),
+    },
+    [],
+)
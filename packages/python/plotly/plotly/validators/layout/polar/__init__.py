@@ -1,33 +1,736 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._uirevision import UirevisionValidator
-    from ._sector import SectorValidator
-    from ._radialaxis import RadialaxisValidator
-    from ._hole import HoleValidator
-    from ._gridshape import GridshapeValidator
-    from ._domain import DomainValidator
-    from ._bgcolor import BgcolorValidator
-    from ._barmode import BarmodeValidator
-    from ._bargap import BargapValidator
-    from ._angularaxis import AngularaxisValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._uirevision.UirevisionValidator",
-            "._sector.SectorValidator",
-            "._radialaxis.RadialaxisValidator",
-            "._hole.HoleValidator",
-            "._gridshape.GridshapeValidator",
-            "._domain.DomainValidator",
-            "._bgcolor.BgcolorValidator",
-            "._barmode.BarmodeValidator",
-            "._bargap.BargapValidator",
-            "._angularaxis.AngularaxisValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.polar",
+    {
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SectorValidator": (
+            "sector",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "valType": "number"},
+                    {"editType": "plot", "valType": "number"},
+                ],
+            },
+        ),
+        "RadialaxisValidator": (
+            "radialaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "RadialAxis",
+                "data_docs": """
+            angle
+                Sets the angle (in degrees) from which the
+                radial axis is drawn. Note that by default,
+                radial axis line on the theta=0 line
+                corresponds to a line pointing right (like what
+                mathematicians prefer). Defaults to the first
+                `polar.sector` angle.
+            autorange
+                Determines whether or not the range of this
+                axis is computed in relation to the input data.
+                See `rangemode` for more info. If `range` is
+                provided and it has a value for both the lower
+                and upper bound, `autorange` is set to False.
+                Using "min" applies autorange only to set the
+                minimum. Using "max" applies autorange only to
+                set the maximum. Using *min reversed* applies
+                autorange only to set the minimum on a reversed
+                axis. Using *max reversed* applies autorange
+                only to set the maximum on a reversed axis.
+                Using "reversed" applies autorange on both ends
+                and reverses the axis direction.
+            autorangeoptions
+                :class:`plotly.graph_objects.layout.polar.radia
+                laxis.Autorangeoptions` instance or dict with
+                compatible properties
+            autotickangles
+                When `tickangle` is set to "auto", it will be
+                set to the first angle in this array that is
+                large enough to prevent label overlap.
+            autotypenumbers
+                Using "strict" a numeric string in trace data
+                is not converted to a number. Using *convert
+                types* a numeric string in trace data may be
+                treated as a number during automatic axis
+                `type` detection. Defaults to
+                layout.autotypenumbers.
+            calendar
+                Sets the calendar system to use for `range` and
+                `tick0` if this is a date axis. This does not
+                set the calendar for interpreting data on this
+                axis, that's specified in the trace or via the
+                global `layout.calendar`
+            categoryarray
+                Sets the order in which categories on this axis
+                appear. Only has an effect if `categoryorder`
+                is set to "array". Used with `categoryorder`.
+            categoryarraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `categoryarray`.
+            categoryorder
+                Specifies the ordering logic for the case of
+                categorical variables. By default, plotly uses
+                "trace", which specifies the order that is
+                present in the data supplied. Set
+                `categoryorder` to *category ascending* or
+                *category descending* if order should be
+                determined by the alphanumerical order of the
+                category names. Set `categoryorder` to "array"
+                to derive the ordering from the attribute
+                `categoryarray`. If a category is not found in
+                the `categoryarray` array, the sorting behavior
+                for that attribute will be identical to the
+                "trace" mode. The unspecified categories will
+                follow the categories in `categoryarray`. Set
+                `categoryorder` to *total ascending* or *total
+                descending* if order should be determined by
+                the numerical order of the values. Similarly,
+                the order can be determined by the min, max,
+                sum, mean or median of all the values.
+            color
+                Sets default for all colors associated with
+                this axis all at once: line, font, tick, and
+                grid colors. Grid color is lightened by
+                blending this with the plot background
+                Individual pieces can override this.
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            exponentformat
+                Determines a formatting rule for the tick
+                exponents. For example, consider the number
+                1,000,000,000. If "none", it appears as
+                1,000,000,000. If "e", 1e+9. If "E", 1E+9. If
+                "power", 1x10^9 (with 9 in a super script). If
+                "SI", 1G. If "B", 1B.
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            hoverformat
+                Sets the hover text formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            layer
+                Sets the layer on which this axis is displayed.
+                If *above traces*, this axis is displayed above
+                all the subplot's traces If *below traces*,
+                this axis is displayed below all the subplot's
+                traces, but above the grid lines. Useful when
+                used together with scatter-like traces with
+                `cliponaxis` set to False to show markers
+                and/or text nodes above this axis.
+            linecolor
+                Sets the axis line color.
+            linewidth
+                Sets the width (in px) of the axis line.
+            maxallowed
+                Determines the maximum range of this axis.
+            minallowed
+                Determines the minimum range of this axis.
+            minexponent
+                Hide SI prefix for 10^n if |n| is below this
+                number. This only has an effect when
+                `tickformat` is "SI" or "B".
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            range
+                Sets the range of this axis. If the axis `type`
+                is "log", then you must take the log of your
+                desired range (e.g. to set the range from 1 to
+                100, set the range from 0 to 2). If the axis
+                `type` is "date", it should be date strings,
+                like date data, though Date objects and unix
+                milliseconds will be accepted and converted to
+                strings. If the axis `type` is "category", it
+                should be numbers, using the scale where each
+                category is assigned a serial number from zero
+                in the order it appears. Leaving either or both
+                elements `null` impacts the default
+                `autorange`.
+            rangemode
+                If *tozero*`, the range extends to 0,
+                regardless of the input data If "nonnegative",
+                the range is non-negative, regardless of the
+                input data. If "normal", the range is computed
+                in relation to the extrema of the input data
+                (same behavior as for cartesian axes).
+            separatethousands
+                If "true", even 4-digit integers are separated
+            showexponent
+                If "all", all exponents are shown besides their
+                significands. If "first", only the exponent of
+                the first tick is shown. If "last", only the
+                exponent of the last tick is shown. If "none",
+                no exponents appear.
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            showline
+                Determines whether or not a line bounding this
+                axis is drawn.
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            side
+                Determines on which side of radial axis line
+                the tick and tick labels appear.
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the tick font.
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            tickformatstops
+                A tuple of :class:`plotly.graph_objects.layout.
+                polar.radialaxis.Tickformatstop` instances or
+                dicts with compatible properties
+            tickformatstopdefaults
+                When used in a template (as layout.template.lay
+                out.polar.radialaxis.tickformatstopdefaults),
+                sets the default property values to use for
+                elements of
+                layout.polar.radialaxis.tickformatstops
+            ticklabelstep
+                Sets the spacing between tick labels as
+                compared to the spacing between ticks. A value
+                of 1 (default) means each tick gets a label. A
+                value of 2 means shows every 2nd label. A
+                larger value n means only every nth tick is
+                labeled. `tick0` determines which labels are
+                shown. Not implemented for axes with `type`
+                "log" or "multicategory", or when `tickmode` is
+                "array".
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided).
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            ticksuffix
+                Sets a tick label suffix.
+            ticktext
+                Sets the text displayed at the ticks position
+                via `tickvals`. Only has an effect if
+                `tickmode` is set to "array". Used with
+                `tickvals`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            title
+                :class:`plotly.graph_objects.layout.polar.radia
+                laxis.Title` instance or dict with compatible
+                properties
+            titlefont
+                Deprecated: Please use
+                layout.polar.radialaxis.title.font instead.
+                Sets this axis' title font. Note that the
+                title's font used to be customized by the now
+                deprecated `titlefont` attribute.
+            type
+                Sets the axis type. By default, plotly attempts
+                to determined the axis type by looking into the
+                data of the traces that referenced the axis in
+                question.
+            uirevision
+                Controls persistence of user-driven changes in
+                axis `range`, `autorange`, `angle`, and `title`
+                if in `editable: true` configuration. Defaults
+                to `polar<N>.uirevision`.
+            visible
+                A single toggle to hide the axis while
+                preserving interaction like dragging. Default
+                is true when a cheater plot is present on the
+                axis, otherwise false
+""",
+            },
+        ),
+        "HoleValidator": (
+            "hole",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "GridshapeValidator": (
+            "gridshape",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["circular", "linear"],
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this polar subplot
+                .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this polar subplot .
+            x
+                Sets the horizontal domain of this polar
+                subplot (in plot fraction).
+            y
+                Sets the vertical domain of this polar subplot
+                (in plot fraction).
+""",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "BarmodeValidator": (
+            "barmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["stack", "overlay"],
+            },
+        ),
+        "BargapValidator": (
+            "bargap",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "AngularaxisValidator": (
+            "angularaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "AngularAxis",
+                "data_docs": """
+            autotypenumbers
+                Using "strict" a numeric string in trace data
+                is not converted to a number. Using *convert
+                types* a numeric string in trace data may be
+                treated as a number during automatic axis
+                `type` detection. Defaults to
+                layout.autotypenumbers.
+            categoryarray
+                Sets the order in which categories on this axis
+                appear. Only has an effect if `categoryorder`
+                is set to "array". Used with `categoryorder`.
+            categoryarraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `categoryarray`.
+            categoryorder
+                Specifies the ordering logic for the case of
+                categorical variables. By default, plotly uses
+                "trace", which specifies the order that is
+                present in the data supplied. Set
+                `categoryorder` to *category ascending* or
+                *category descending* if order should be
+                determined by the alphanumerical order of the
+                category names. Set `categoryorder` to "array"
+                to derive the ordering from the attribute
+                `categoryarray`. If a category is not found in
+                the `categoryarray` array, the sorting behavior
+                for that attribute will be identical to the
+                "trace" mode. The unspecified categories will
+                follow the categories in `categoryarray`. Set
+                `categoryorder` to *total ascending* or *total
+                descending* if order should be determined by
+                the numerical order of the values. Similarly,
+                the order can be determined by the min, max,
+                sum, mean or median of all the values.
+            color
+                Sets default for all colors associated with
+                this axis all at once: line, font, tick, and
+                grid colors. Grid color is lightened by
+                blending this with the plot background
+                Individual pieces can override this.
+            direction
+                Sets the direction corresponding to positive
+                angles.
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            exponentformat
+                Determines a formatting rule for the tick
+                exponents. For example, consider the number
+                1,000,000,000. If "none", it appears as
+                1,000,000,000. If "e", 1e+9. If "E", 1E+9. If
+                "power", 1x10^9 (with 9 in a super script). If
+                "SI", 1G. If "B", 1B.
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            hoverformat
+                Sets the hover text formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            layer
+                Sets the layer on which this axis is displayed.
+                If *above traces*, this axis is displayed above
+                all the subplot's traces If *below traces*,
+                this axis is displayed below all the subplot's
+                traces, but above the grid lines. Useful when
+                used together with scatter-like traces with
+                `cliponaxis` set to False to show markers
+                and/or text nodes above this axis.
+            linecolor
+                Sets the axis line color.
+            linewidth
+                Sets the width (in px) of the axis line.
+            minexponent
+                Hide SI prefix for 10^n if |n| is below this
+                number. This only has an effect when
+                `tickformat` is "SI" or "B".
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            period
+                Set the angular period. Has an effect only when
+                `angularaxis.type` is "category".
+            rotation
+                Sets that start position (in degrees) of the
+                angular axis By default, polar subplots with
+                `direction` set to "counterclockwise" get a
+                `rotation` of 0 which corresponds to due East
+                (like what mathematicians prefer). In turn,
+                polar with `direction` set to "clockwise" get a
+                rotation of 90 which corresponds to due North
+                (like on a compass),
+            separatethousands
+                If "true", even 4-digit integers are separated
+            showexponent
+                If "all", all exponents are shown besides their
+                significands. If "first", only the exponent of
+                the first tick is shown. If "last", only the
+                exponent of the last tick is shown. If "none",
+                no exponents appear.
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            showline
+                Determines whether or not a line bounding this
+                axis is drawn.
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            thetaunit
+                Sets the format unit of the formatted "theta"
+                values. Has an effect only when
+                `angularaxis.type` is "linear".
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the tick font.
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            tickformatstops
+                A tuple of :class:`plotly.graph_objects.layout.
+                polar.angularaxis.Tickformatstop` instances or
+                dicts with compatible properties
+            tickformatstopdefaults
+                When used in a template (as layout.template.lay
+                out.polar.angularaxis.tickformatstopdefaults),
+                sets the default property values to use for
+                elements of
+                layout.polar.angularaxis.tickformatstops
+            ticklabelstep
+                Sets the spacing between tick labels as
+                compared to the spacing between ticks. A value
+                of 1 (default) means each tick gets a label. A
+                value of 2 means shows every 2nd label. A
+                larger value n means only every nth tick is
+                labeled. `tick0` determines which labels are
+                shown. Not implemented for axes with `type`
+                "log" or "multicategory", or when `tickmode` is
+                "array".
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided).
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            ticksuffix
+                Sets a tick label suffix.
+            ticktext
+                Sets the text displayed at the ticks position
+                via `tickvals`. Only has an effect if
+                `tickmode` is set to "array". Used with
+                `tickvals`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            type
+                Sets the angular axis type. If "linear", set
+                `thetaunit` to determine the unit in which axis
+                value are shown. If *category, use `period` to
+                set the number of integer coordinates around
+                polar axis.
+            uirevision
+                Controls persistence of user-driven changes in
+                axis `rotation`. Defaults to
+                `polar<N>.uirevision`.
+            visible
+                A single toggle to hide the axis while
+                preserving interaction like dragging. Default
+                is true when a cheater plot is present on the
+                axis, otherwise false
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,37 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class CategoryorderValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self,
-        plotly_name="categoryorder",
-        parent_name="layout.polar.angularaxis",
-        **kwargs,
-    ):
-        super(CategoryorderValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            values=kwargs.pop(
-                "values",
-                [
-                    "trace",
-                    "category ascending",
-                    "category descending",
-                    "array",
-                    "total ascending",
-                    "total descending",
-                    "min ascending",
-                    "min descending",
-                    "max ascending",
-                    "max descending",
-                    "sum ascending",
-                    "sum descending",
-                    "mean ascending",
-                    "mean descending",
-                    "median ascending",
-                    "median descending",
-                ],
-            ),
-            **kwargs,
-        )
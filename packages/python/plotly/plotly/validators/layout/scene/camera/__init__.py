@@ -1,21 +1,67 @@
-import sys
-from typing import TYPE_CHECKING
-
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._up import UpValidator
-    from ._projection import ProjectionValidator
-    from ._eye import EyeValidator
-    from ._center import CenterValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._up.UpValidator",
-            "._projection.ProjectionValidator",
-            "._eye.EyeValidator",
-            "._center.CenterValidator",
-        ],
-    )
+from _plotly_utils.importers import validator_table
+
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.scene.camera",
+    {
+        "UpValidator": (
+            "up",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Up",
+                "data_docs": """
+            x
+
+            y
+
+            z
+
+""",
+            },
+        ),
+        "ProjectionValidator": (
+            "projection",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Projection",
+                "data_docs": """
+            type
+                Sets the projection type. The projection type
+                could be either "perspective" or
+                "orthographic". The default is "perspective".
+""",
+            },
+        ),
+        "EyeValidator": (
+            "eye",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Eye",
+                "data_docs": """
+            x
+
+            y
+
+            z
+
+""",
+            },
+        ),
+        "CenterValidator": (
+            "center",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Center",
+                "data_docs": """
+            x
+
+            y
+
+            z
+
+""",
+            },
+        ),
+    },
+    [],
+)
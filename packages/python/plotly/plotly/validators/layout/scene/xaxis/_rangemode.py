@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class RangemodeValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self, plotly_name="rangemode", parent_name="layout.scene.xaxis", **kwargs
-    ):
-        super(RangemodeValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "plot"),
-            values=kwargs.pop("values", ["normal", "tozero", "nonnegative"]),
-            **kwargs,
-        )
@@ -1,25 +1,57 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._minallowed import MinallowedValidator
-    from ._maxallowed import MaxallowedValidator
-    from ._includesrc import IncludesrcValidator
-    from ._include import IncludeValidator
-    from ._clipmin import ClipminValidator
-    from ._clipmax import ClipmaxValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._minallowed.MinallowedValidator",
-            "._maxallowed.MaxallowedValidator",
-            "._includesrc.IncludesrcValidator",
-            "._include.IncludeValidator",
-            "._clipmin.ClipminValidator",
-            "._clipmax.ClipmaxValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.scene.xaxis.autorangeoptions",
+    {
+        "MinallowedValidator": (
+            "minallowed",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {},
+            },
+        ),
+        "MaxallowedValidator": (
+            "maxallowed",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {},
+            },
+        ),
+        "IncludesrcValidator": (
+            "includesrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IncludeValidator": (
+            "include",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+                "implied_edits": {},
+            },
+        ),
+        "ClipminValidator": (
+            "clipmin",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {},
+            },
+        ),
+        "ClipmaxValidator": (
+            "clipmax",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {},
+            },
+        ),
+    },
+    [],
+)
@@ -1,37 +1,109 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yref import YrefValidator
-    from ._y1 import Y1Validator
-    from ._y0 import Y0Validator
-    from ._xref import XrefValidator
-    from ._x1 import X1Validator
-    from ._x0 import X0Validator
-    from ._type import TypeValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._path import PathValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._line import LineValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yref.YrefValidator",
-            "._y1.Y1Validator",
-            "._y0.Y0Validator",
-            "._xref.XrefValidator",
-            "._x1.X1Validator",
-            "._x0.X0Validator",
-            "._type.TypeValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._path.PathValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._line.LineValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.selection",
+    {
+        "YrefValidator": (
+            "yref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["paper", "/^y([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "Y1Validator": (
+            "y1",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "Y0Validator": (
+            "y0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "XrefValidator": (
+            "xref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["paper", "/^x([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "X1Validator": (
+            "x1",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "X0Validator": (
+            "x0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["rect", "path"],
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "PathValidator": (
+            "path",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the line color.
+            dash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            width
+                Sets the line width (in px).
+""",
+            },
+        ),
+    },
+    [],
+)
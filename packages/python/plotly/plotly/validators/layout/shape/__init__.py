@@ -1,69 +1,302 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._ysizemode import YsizemodeValidator
-    from ._yref import YrefValidator
-    from ._yanchor import YanchorValidator
-    from ._y1 import Y1Validator
-    from ._y0 import Y0Validator
-    from ._xsizemode import XsizemodeValidator
-    from ._xref import XrefValidator
-    from ._xanchor import XanchorValidator
-    from ._x1 import X1Validator
-    from ._x0 import X0Validator
-    from ._visible import VisibleValidator
-    from ._type import TypeValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._showlegend import ShowlegendValidator
-    from ._path import PathValidator
-    from ._opacity import OpacityValidator
-    from ._name import NameValidator
-    from ._line import LineValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legendgroup import LegendgroupValidator
-    from ._legend import LegendValidator
-    from ._layer import LayerValidator
-    from ._label import LabelValidator
-    from ._fillrule import FillruleValidator
-    from ._fillcolor import FillcolorValidator
-    from ._editable import EditableValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._ysizemode.YsizemodeValidator",
-            "._yref.YrefValidator",
-            "._yanchor.YanchorValidator",
-            "._y1.Y1Validator",
-            "._y0.Y0Validator",
-            "._xsizemode.XsizemodeValidator",
-            "._xref.XrefValidator",
-            "._xanchor.XanchorValidator",
-            "._x1.X1Validator",
-            "._x0.X0Validator",
-            "._visible.VisibleValidator",
-            "._type.TypeValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._showlegend.ShowlegendValidator",
-            "._path.PathValidator",
-            "._opacity.OpacityValidator",
-            "._name.NameValidator",
-            "._line.LineValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legendgroup.LegendgroupValidator",
-            "._legend.LegendValidator",
-            "._layer.LayerValidator",
-            "._label.LabelValidator",
-            "._fillrule.FillruleValidator",
-            "._fillcolor.FillcolorValidator",
-            "._editable.EditableValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.shape",
+    {
+        "YsizemodeValidator": (
+            "ysizemode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "values": ["scaled", "pixel"],
+            },
+        ),
+        "YrefValidator": (
+            "yref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["paper", "/^y([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "YanchorValidator": (
+            "yanchor",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "Y1Validator": (
+            "y1",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "Y0Validator": (
+            "y0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "XsizemodeValidator": (
+            "xsizemode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "values": ["scaled", "pixel"],
+            },
+        ),
+        "XrefValidator": (
+            "xref",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["paper", "/^x([2-9]|[1-9][0-9]+)?( domain)?$/"],
+            },
+        ),
+        "XanchorValidator": (
+            "xanchor",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "X1Validator": (
+            "x1",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "X0Validator": (
+            "x0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "values": ["circle", "rect", "path", "line"],
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ShowlegendValidator": (
+            "showlegend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "PathValidator": (
+            "path",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the line color.
+            dash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            width
+                Sets the line width (in px).
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendgroupValidator": (
+            "legendgroup",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+        "LayerValidator": (
+            "layer",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["below", "above", "between"],
+            },
+        ),
+        "LabelValidator": (
+            "label",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Label",
+                "data_docs": """
+            font
+                Sets the shape label text font.
+            padding
+                Sets padding (in px) between edge of label and
+                edge of shape.
+            text
+                Sets the text to display with shape. It is also
+                used for legend item if `name` is not provided.
+            textangle
+                Sets the angle at which the label text is drawn
+                with respect to the horizontal. For lines,
+                angle "auto" is the same angle as the line. For
+                all other shapes, angle "auto" is horizontal.
+            textposition
+                Sets the position of the label text relative to
+                the shape. Supported values for rectangles,
+                circles and paths are *top left*, *top center*,
+                *top right*, *middle left*, *middle center*,
+                *middle right*, *bottom left*, *bottom center*,
+                and *bottom right*. Supported values for lines
+                are "start", "middle", and "end". Default:
+                *middle center* for rectangles, circles, and
+                paths; "middle" for lines.
+            texttemplate
+                Template string used for rendering the shape's
+                label. Note that this will override `text`.
+                Variables are inserted using %{variable}, for
+                example "x0: %{x0}". Numbers are formatted
+                using d3-format's syntax %{variable:d3-format},
+                for example "Price: %{x0:$.2f}". See https://gi
+                thub.com/d3/d3-format/tree/v1.4.5#d3-format for
+                details on the formatting syntax. Dates are
+                formatted using d3-time-format's syntax
+                %{variable|d3-time-format}, for example "Day:
+                %{x0|%m %b %Y}". See
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format for details on
+                the date formatting syntax. A single
+                multiplication or division operation may be
+                applied to numeric variables, and combined with
+                d3 number formatting, for example "Length in
+                cm: %{x0*2.54}", "%{slope*60:.1f} meters per
+                second." For log axes, variable values are
+                given in log units. For date axes, x/y
+                coordinate variables and center variables use
+                datetimes, while all other variable values use
+                values in ms. Finally, the template string has
+                access to variables `x0`, `x1`, `y0`, `y1`,
+                `slope`, `dx`, `dy`, `width`, `height`,
+                `length`, `xcenter` and `ycenter`.
+            xanchor
+                Sets the label's horizontal position anchor
+                This anchor binds the specified `textposition`
+                to the "left", "center" or "right" of the label
+                text. For example, if `textposition` is set to
+                *top right* and `xanchor` to "right" then the
+                right-most portion of the label text lines up
+                with the right-most edge of the shape.
+            yanchor
+                Sets the label's vertical position anchor This
+                anchor binds the specified `textposition` to
+                the "top", "middle" or "bottom" of the label
+                text. For example, if `textposition` is set to
+                *top right* and `yanchor` to "top" then the
+                top-most portion of the label text lines up
+                with the top-most edge of the shape.
+""",
+            },
+        ),
+        "FillruleValidator": (
+            "fillrule",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["evenodd", "nonzero"],
+            },
+        ),
+        "FillcolorValidator": (
+            "fillcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "EditableValidator": (
+            "editable",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc+arraydraw",
+            },
+        ),
+    },
+    [],
+)
@@ -1,30 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class TextpositionValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self, plotly_name="textposition", parent_name="layout.shape.label", **kwargs
-    ):
-        super(TextpositionValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "arraydraw"),
-            values=kwargs.pop(
-                "values",
-                [
-                    "top left",
-                    "top center",
-                    "top right",
-                    "middle left",
-                    "middle center",
-                    "middle right",
-                    "bottom left",
-                    "bottom center",
-                    "bottom right",
-                    "start",
-                    "middle",
-                    "end",
-                ],
-            ),
-            **kwargs,
-        )
@@ -1,13 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class ExecuteValidator(_plotly_utils.basevalidators.BooleanValidator):
-    def __init__(
-        self, plotly_name="execute", parent_name="layout.slider.step", **kwargs
-    ):
-        super(ExecuteValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "arraydraw"),
-            **kwargs,
-        )
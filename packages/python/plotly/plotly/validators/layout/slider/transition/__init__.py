@@ -1,12 +1,62 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._easing import EasingValidator
-    from ._duration import DurationValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._easing.EasingValidator", "._duration.DurationValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.slider.transition",
+    {
+        "EasingValidator": (
+            "easing",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": [
+                    "linear",
+                    "quad",
+                    "cubic",
+                    "sin",
+                    "exp",
+                    "circle",
+                    "elastic",
+                    "back",
+                    "bounce",
+                    "linear-in",
+                    "quad-in",
+                    "cubic-in",
+                    "sin-in",
+                    "exp-in",
+                    "circle-in",
+                    "elastic-in",
+                    "back-in",
+                    "bounce-in",
+                    "linear-out",
+                    "quad-out",
+                    "cubic-out",
+                    "sin-out",
+                    "exp-out",
+                    "circle-out",
+                    "elastic-out",
+                    "back-out",
+                    "bounce-out",
+                    "linear-in-out",
+                    "quad-in-out",
+                    "cubic-in-out",
+                    "sin-in-out",
+                    "exp-in-out",
+                    "circle-in-out",
+                    "elastic-in-out",
+                    "back-in-out",
+                    "bounce-in-out",
+                ],
+            },
+        ),
+        "DurationValidator": (
+            "duration",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
@@ -1,21 +1,294 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._realaxis import RealaxisValidator
-    from ._imaginaryaxis import ImaginaryaxisValidator
-    from ._domain import DomainValidator
-    from ._bgcolor import BgcolorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._realaxis.RealaxisValidator",
-            "._imaginaryaxis.ImaginaryaxisValidator",
-            "._domain.DomainValidator",
-            "._bgcolor.BgcolorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.smith",
+    {
+        "RealaxisValidator": (
+            "realaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Realaxis",
+                "data_docs": """
+            color
+                Sets default for all colors associated with
+                this axis all at once: line, font, tick, and
+                grid colors. Grid color is lightened by
+                blending this with the plot background
+                Individual pieces can override this.
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            hoverformat
+                Sets the hover text formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            layer
+                Sets the layer on which this axis is displayed.
+                If *above traces*, this axis is displayed above
+                all the subplot's traces If *below traces*,
+                this axis is displayed below all the subplot's
+                traces, but above the grid lines. Useful when
+                used together with scatter-like traces with
+                `cliponaxis` set to False to show markers
+                and/or text nodes above this axis.
+            linecolor
+                Sets the axis line color.
+            linewidth
+                Sets the width (in px) of the axis line.
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            showline
+                Determines whether or not a line bounding this
+                axis is drawn.
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            side
+                Determines on which side of real axis line the
+                tick and tick labels appear.
+            tickangle
+                Sets the angle of the tick labels with respect
+                to the horizontal. For example, a `tickangle`
+                of -90 draws the tick labels vertically.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the tick font.
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            ticklen
+                Sets the tick length (in px).
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If "top"
+                ("bottom"), this axis' are drawn above (below)
+                the axis line.
+            ticksuffix
+                Sets a tick label suffix.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            visible
+                A single toggle to hide the axis while
+                preserving interaction like dragging. Default
+                is true when a cheater plot is present on the
+                axis, otherwise false
+""",
+            },
+        ),
+        "ImaginaryaxisValidator": (
+            "imaginaryaxis",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Imaginaryaxis",
+                "data_docs": """
+            color
+                Sets default for all colors associated with
+                this axis all at once: line, font, tick, and
+                grid colors. Grid color is lightened by
+                blending this with the plot background
+                Individual pieces can override this.
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            hoverformat
+                Sets the hover text formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            labelalias
+                Replacement text for specific tick or hover
+                labels. For example using {US: 'USA', CA:
+                'Canada'} changes US to USA and CA to Canada.
+                The labels we would have shown must match the
+                keys exactly, after adding any tickprefix or
+                ticksuffix. For negative numbers the minus sign
+                symbol used (U+2212) is wider than the regular
+                ascii dash. That means you need to use −1
+                instead of -1. labelalias can be used with any
+                axis type, and both keys (if needed) and values
+                (if desired) can include html-like tags or
+                MathJax.
+            layer
+                Sets the layer on which this axis is displayed.
+                If *above traces*, this axis is displayed above
+                all the subplot's traces If *below traces*,
+                this axis is displayed below all the subplot's
+                traces, but above the grid lines. Useful when
+                used together with scatter-like traces with
+                `cliponaxis` set to False to show markers
+                and/or text nodes above this axis.
+            linecolor
+                Sets the axis line color.
+            linewidth
+                Sets the width (in px) of the axis line.
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            showline
+                Determines whether or not a line bounding this
+                axis is drawn.
+            showticklabels
+                Determines whether or not the tick labels are
+                drawn.
+            showtickprefix
+                If "all", all tick labels are displayed with a
+                prefix. If "first", only the first tick is
+                displayed with a prefix. If "last", only the
+                last tick is displayed with a suffix. If
+                "none", tick prefixes are hidden.
+            showticksuffix
+                Same as `showtickprefix` but for tick suffixes.
+            tickcolor
+                Sets the tick color.
+            tickfont
+                Sets the tick font.
+            tickformat
+                Sets the tick label formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format. And for dates see:
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format. We add two
+                items to d3's date formatter: "%h" for half of
+                the year as a decimal number as well as "%{n}f"
+                for fractional seconds with n digits. For
+                example, *2016-10-13 09:15:23.456* with
+                tickformat "%H~%M~%S.%2f" would display
+                "09~15~23.46"
+            ticklen
+                Sets the tick length (in px).
+            tickprefix
+                Sets a tick label prefix.
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            ticksuffix
+                Sets a tick label suffix.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Defaults to `realaxis.tickvals` plus
+                the same as negatives and zero.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+            visible
+                A single toggle to hide the axis while
+                preserving interaction like dragging. Default
+                is true when a cheater plot is present on the
+                axis, otherwise false
+""",
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this smith subplot
+                .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this smith subplot .
+            x
+                Sets the horizontal domain of this smith
+                subplot (in plot fraction).
+            y
+                Sets the vertical domain of this smith subplot
+                (in plot fraction).
+""",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+    },
+    [],
+)
@@ -1,109 +1,441 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._waterfall import WaterfallValidator
-    from ._volume import VolumeValidator
-    from ._violin import ViolinValidator
-    from ._treemap import TreemapValidator
-    from ._table import TableValidator
-    from ._surface import SurfaceValidator
-    from ._sunburst import SunburstValidator
-    from ._streamtube import StreamtubeValidator
-    from ._splom import SplomValidator
-    from ._scatterternary import ScatterternaryValidator
-    from ._scattersmith import ScattersmithValidator
-    from ._scatter import ScatterValidator
-    from ._scatterpolar import ScatterpolarValidator
-    from ._scatterpolargl import ScatterpolarglValidator
-    from ._scattermapbox import ScattermapboxValidator
-    from ._scattergl import ScatterglValidator
-    from ._scattergeo import ScattergeoValidator
-    from ._scattercarpet import ScattercarpetValidator
-    from ._scatter3d import Scatter3DValidator
-    from ._sankey import SankeyValidator
-    from ._pointcloud import PointcloudValidator
-    from ._pie import PieValidator
-    from ._parcoords import ParcoordsValidator
-    from ._parcats import ParcatsValidator
-    from ._ohlc import OhlcValidator
-    from ._mesh3d import Mesh3DValidator
-    from ._isosurface import IsosurfaceValidator
-    from ._indicator import IndicatorValidator
-    from ._image import ImageValidator
-    from ._icicle import IcicleValidator
-    from ._histogram import HistogramValidator
-    from ._histogram2d import Histogram2DValidator
-    from ._histogram2dcontour import Histogram2DcontourValidator
-    from ._heatmap import HeatmapValidator
-    from ._heatmapgl import HeatmapglValidator
-    from ._funnel import FunnelValidator
-    from ._funnelarea import FunnelareaValidator
-    from ._densitymapbox import DensitymapboxValidator
-    from ._contour import ContourValidator
-    from ._contourcarpet import ContourcarpetValidator
-    from ._cone import ConeValidator
-    from ._choropleth import ChoroplethValidator
-    from ._choroplethmapbox import ChoroplethmapboxValidator
-    from ._carpet import CarpetValidator
-    from ._candlestick import CandlestickValidator
-    from ._box import BoxValidator
-    from ._bar import BarValidator
-    from ._barpolar import BarpolarValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._waterfall.WaterfallValidator",
-            "._volume.VolumeValidator",
-            "._violin.ViolinValidator",
-            "._treemap.TreemapValidator",
-            "._table.TableValidator",
-            "._surface.SurfaceValidator",
-            "._sunburst.SunburstValidator",
-            "._streamtube.StreamtubeValidator",
-            "._splom.SplomValidator",
-            "._scatterternary.ScatterternaryValidator",
-            "._scattersmith.ScattersmithValidator",
-            "._scatter.ScatterValidator",
-            "._scatterpolar.ScatterpolarValidator",
-            "._scatterpolargl.ScatterpolarglValidator",
-            "._scattermapbox.ScattermapboxValidator",
-            "._scattergl.ScatterglValidator",
-            "._scattergeo.ScattergeoValidator",
-            "._scattercarpet.ScattercarpetValidator",
-            "._scatter3d.Scatter3DValidator",
-            "._sankey.SankeyValidator",
-            "._pointcloud.PointcloudValidator",
-            "._pie.PieValidator",
-            "._parcoords.ParcoordsValidator",
-            "._parcats.ParcatsValidator",
-            "._ohlc.OhlcValidator",
-            "._mesh3d.Mesh3DValidator",
-            "._isosurface.IsosurfaceValidator",
-            "._indicator.IndicatorValidator",
-            "._image.ImageValidator",
-            "._icicle.IcicleValidator",
-            "._histogram.HistogramValidator",
-            "._histogram2d.Histogram2DValidator",
-            "._histogram2dcontour.Histogram2DcontourValidator",
-            "._heatmap.HeatmapValidator",
-            "._heatmapgl.HeatmapglValidator",
-            "._funnel.FunnelValidator",
-            "._funnelarea.FunnelareaValidator",
-            "._densitymapbox.DensitymapboxValidator",
-            "._contour.ContourValidator",
-            "._contourcarpet.ContourcarpetValidator",
-            "._cone.ConeValidator",
-            "._choropleth.ChoroplethValidator",
-            "._choroplethmapbox.ChoroplethmapboxValidator",
-            "._carpet.CarpetValidator",
-            "._candlestick.CandlestickValidator",
-            "._box.BoxValidator",
-            "._bar.BarValidator",
-            "._barpolar.BarpolarValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.template.data",
+    {
+        "WaterfallValidator": (
+            "waterfall",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Waterfall",
+                "data_docs": """
+""",
+            },
+        ),
+        "VolumeValidator": (
+            "volume",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Volume",
+                "data_docs": """
+""",
+            },
+        ),
+        "ViolinValidator": (
+            "violin",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Violin",
+                "data_docs": """
+""",
+            },
+        ),
+        "TreemapValidator": (
+            "treemap",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Treemap",
+                "data_docs": """
+""",
+            },
+        ),
+        "TableValidator": (
+            "table",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Table",
+                "data_docs": """
+""",
+            },
+        ),
+        "SurfaceValidator": (
+            "surface",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Surface",
+                "data_docs": """
+""",
+            },
+        ),
+        "SunburstValidator": (
+            "sunburst",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Sunburst",
+                "data_docs": """
+""",
+            },
+        ),
+        "StreamtubeValidator": (
+            "streamtube",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Streamtube",
+                "data_docs": """
+""",
+            },
+        ),
+        "SplomValidator": (
+            "splom",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Splom",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScatterternaryValidator": (
+            "scatterternary",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scatterternary",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScattersmithValidator": (
+            "scattersmith",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scattersmith",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScatterValidator": (
+            "scatter",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scatter",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScatterpolarValidator": (
+            "scatterpolar",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scatterpolar",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScatterpolarglValidator": (
+            "scatterpolargl",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scatterpolargl",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScattermapboxValidator": (
+            "scattermapbox",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scattermapbox",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScatterglValidator": (
+            "scattergl",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scattergl",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScattergeoValidator": (
+            "scattergeo",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scattergeo",
+                "data_docs": """
+""",
+            },
+        ),
+        "ScattercarpetValidator": (
+            "scattercarpet",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scattercarpet",
+                "data_docs": """
+""",
+            },
+        ),
+        "Scatter3DValidator": (
+            "scatter3d",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Scatter3d",
+                "data_docs": """
+""",
+            },
+        ),
+        "SankeyValidator": (
+            "sankey",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Sankey",
+                "data_docs": """
+""",
+            },
+        ),
+        "PointcloudValidator": (
+            "pointcloud",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Pointcloud",
+                "data_docs": """
+""",
+            },
+        ),
+        "PieValidator": (
+            "pie",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Pie",
+                "data_docs": """
+""",
+            },
+        ),
+        "ParcoordsValidator": (
+            "parcoords",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Parcoords",
+                "data_docs": """
+""",
+            },
+        ),
+        "ParcatsValidator": (
+            "parcats",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Parcats",
+                "data_docs": """
+""",
+            },
+        ),
+        "OhlcValidator": (
+            "ohlc",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Ohlc",
+                "data_docs": """
+""",
+            },
+        ),
+        "Mesh3DValidator": (
+            "mesh3d",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Mesh3d",
+                "data_docs": """
+""",
+            },
+        ),
+        "IsosurfaceValidator": (
+            "isosurface",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Isosurface",
+                "data_docs": """
+""",
+            },
+        ),
+        "IndicatorValidator": (
+            "indicator",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Indicator",
+                "data_docs": """
+""",
+            },
+        ),
+        "ImageValidator": (
+            "image",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Image",
+                "data_docs": """
+""",
+            },
+        ),
+        "IcicleValidator": (
+            "icicle",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Icicle",
+                "data_docs": """
+""",
+            },
+        ),
+        "HistogramValidator": (
+            "histogram",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Histogram",
+                "data_docs": """
+""",
+            },
+        ),
+        "Histogram2DValidator": (
+            "histogram2d",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Histogram2d",
+                "data_docs": """
+""",
+            },
+        ),
+        "Histogram2DcontourValidator": (
+            "histogram2dcontour",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Histogram2dContour",
+                "data_docs": """
+""",
+            },
+        ),
+        "HeatmapValidator": (
+            "heatmap",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Heatmap",
+                "data_docs": """
+""",
+            },
+        ),
+        "HeatmapglValidator": (
+            "heatmapgl",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Heatmapgl",
+                "data_docs": """
+""",
+            },
+        ),
+        "FunnelValidator": (
+            "funnel",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Funnel",
+                "data_docs": """
+""",
+            },
+        ),
+        "FunnelareaValidator": (
+            "funnelarea",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Funnelarea",
+                "data_docs": """
+""",
+            },
+        ),
+        "DensitymapboxValidator": (
+            "densitymapbox",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Densitymapbox",
+                "data_docs": """
+""",
+            },
+        ),
+        "ContourValidator": (
+            "contour",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Contour",
+                "data_docs": """
+""",
+            },
+        ),
+        "ContourcarpetValidator": (
+            "contourcarpet",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Contourcarpet",
+                "data_docs": """
+""",
+            },
+        ),
+        "ConeValidator": (
+            "cone",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Cone",
+                "data_docs": """
+""",
+            },
+        ),
+        "ChoroplethValidator": (
+            "choropleth",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Choropleth",
+                "data_docs": """
+""",
+            },
+        ),
+        "ChoroplethmapboxValidator": (
+            "choroplethmapbox",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Choroplethmapbox",
+                "data_docs": """
+""",
+            },
+        ),
+        "CarpetValidator": (
+            "carpet",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Carpet",
+                "data_docs": """
+""",
+            },
+        ),
+        "CandlestickValidator": (
+            "candlestick",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Candlestick",
+                "data_docs": """
+""",
+            },
+        ),
+        "BoxValidator": (
+            "box",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Box",
+                "data_docs": """
+""",
+            },
+        ),
+        "BarValidator": (
+            "bar",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Bar",
+                "data_docs": """
+""",
+            },
+        ),
+        "BarpolarValidator": (
+            "barpolar",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Barpolar",
+                "data_docs": """
+""",
+            },
+        ),
+    },
+    [],
+)
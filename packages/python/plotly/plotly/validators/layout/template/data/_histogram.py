@@ -1,18 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class HistogramValidator(_plotly_utils.basevalidators.CompoundArrayValidator):
-    def __init__(
-        self, plotly_name="histogram", parent_name="layout.template.data", **kwargs
-    ):
-        super(HistogramValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            data_class_str=kwargs.pop("data_class_str", "Histogram"),
-            data_docs=kwargs.pop(
-                "data_docs",
-                """
-""",
-            ),
-            **kwargs,
-        )
@@ -1,49 +1,246 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._yanchor import YanchorValidator
-    from ._y import YValidator
-    from ._xanchor import XanchorValidator
-    from ._x import XValidator
-    from ._visible import VisibleValidator
-    from ._type import TypeValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._showactive import ShowactiveValidator
-    from ._pad import PadValidator
-    from ._name import NameValidator
-    from ._font import FontValidator
-    from ._direction import DirectionValidator
-    from ._buttondefaults import ButtondefaultsValidator
-    from ._buttons import ButtonsValidator
-    from ._borderwidth import BorderwidthValidator
-    from ._bordercolor import BordercolorValidator
-    from ._bgcolor import BgcolorValidator
-    from ._active import ActiveValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.updatemenu",
+    {
+        "YanchorValidator": (
+            "yanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["auto", "top", "middle", "bottom"],
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 3,
+                "min": -2,
+            },
+        ),
+        "XanchorValidator": (
+            "xanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["auto", "left", "center", "right"],
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "max": 3,
+                "min": -2,
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["dropdown", "buttons"],
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "ShowactiveValidator": (
+            "showactive",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "PadValidator": (
+            "pad",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Pad",
+                "data_docs": """
+            b
+                The amount of padding (in px) along the bottom
+                of the component.
+            l
+                The amount of padding (in px) on the left side
+                of the component.
+            r
+                The amount of padding (in px) on the right side
+                of the component.
+            t
+                The amount of padding (in px) along the top of
+                the component.
+""",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "FontValidator": (
+            "font",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Font",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._yanchor.YanchorValidator",
-            "._y.YValidator",
-            "._xanchor.XanchorValidator",
-            "._x.XValidator",
-            "._visible.VisibleValidator",
-            "._type.TypeValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._showactive.ShowactiveValidator",
-            "._pad.PadValidator",
-            "._name.NameValidator",
-            "._font.FontValidator",
-            "._direction.DirectionValidator",
-            "._buttondefaults.ButtondefaultsValidator",
-            "._buttons.ButtonsValidator",
-            "._borderwidth.BorderwidthValidator",
-            "._bordercolor.BordercolorValidator",
-            "._bgcolor.BgcolorValidator",
-            "._active.ActiveValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "DirectionValidator": (
+            "direction",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["left", "right", "up", "down"],
+            },
+        ),
+        "ButtondefaultsValidator": (
+            "buttondefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Button",
+                "data_docs": """
+""",
+            },
+        ),
+        "ButtonsValidator": (
+            "buttons",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Button",
+                "data_docs": """
+            args
+                Sets the arguments values to be passed to the
+                Plotly method set in `method` on click.
+            args2
+                Sets a 2nd set of `args`, these arguments
+                values are passed to the Plotly method set in
+                `method` when clicking this button while in the
+                active state. Use this to create toggle
+                buttons.
+            execute
+                When true, the API method is executed. When
+                false, all other behaviors are the same and
+                command execution is skipped. This may be
+                useful when hooking into, for example, the
+                `plotly_buttonclicked` method and executing the
+                API command manually without losing the benefit
+                of the updatemenu automatically binding to the
+                state of the plot through the specification of
+                `method` and `args`.
+            label
+                Sets the text label to appear on the button.
+            method
+                Sets the Plotly method to be called on click.
+                If the `skip` method is used, the API
+                updatemenu will function as normal but will
+                perform no API calls and will not bind
+                automatically to state updates. This may be
+                used to create a component interface and attach
+                to updatemenu events manually via JavaScript.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            visible
+                Determines whether or not this button is
+                visible.
+""",
+            },
+        ),
+        "BorderwidthValidator": (
+            "borderwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "arraydraw",
+                "min": 0,
+            },
+        ),
+        "BordercolorValidator": (
+            "bordercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "BgcolorValidator": (
+            "bgcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "ActiveValidator": (
+            "active",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "arraydraw",
+                "min": -1,
+            },
+        ),
+    },
+    [],
+)
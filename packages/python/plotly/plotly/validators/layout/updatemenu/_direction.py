@@ -1,14 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class DirectionValidator(_plotly_utils.basevalidators.EnumeratedValidator):
-    def __init__(
-        self, plotly_name="direction", parent_name="layout.updatemenu", **kwargs
-    ):
-        super(DirectionValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "arraydraw"),
-            values=kwargs.pop("values", ["left", "right", "up", "down"]),
-            **kwargs,
-        )
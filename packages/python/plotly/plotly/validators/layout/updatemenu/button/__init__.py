@@ -1,29 +1,78 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._name import NameValidator
-    from ._method import MethodValidator
-    from ._label import LabelValidator
-    from ._execute import ExecuteValidator
-    from ._args2 import Args2Validator
-    from ._args import ArgsValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._name.NameValidator",
-            "._method.MethodValidator",
-            "._label.LabelValidator",
-            "._execute.ExecuteValidator",
-            "._args2.Args2Validator",
-            "._args.ArgsValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.updatemenu.button",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "MethodValidator": (
+            "method",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "arraydraw",
+                "values": ["restyle", "relayout", "animate", "update", "skip"],
+            },
+        ),
+        "LabelValidator": (
+            "label",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "ExecuteValidator": (
+            "execute",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "arraydraw",
+            },
+        ),
+        "Args2Validator": (
+            "args2",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "arraydraw",
+                "free_length": True,
+                "items": [
+                    {"editType": "arraydraw", "valType": "any"},
+                    {"editType": "arraydraw", "valType": "any"},
+                    {"editType": "arraydraw", "valType": "any"},
+                ],
+            },
+        ),
+        "ArgsValidator": (
+            "args",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "arraydraw",
+                "free_length": True,
+                "items": [
+                    {"editType": "arraydraw", "valType": "any"},
+                    {"editType": "arraydraw", "valType": "any"},
+                    {"editType": "arraydraw", "valType": "any"},
+                ],
+            },
+        ),
+    },
+    [],
+)
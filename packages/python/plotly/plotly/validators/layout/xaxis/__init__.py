@@ -1,191 +1,1125 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._zerolinewidth import ZerolinewidthValidator
-    from ._zerolinecolor import ZerolinecolorValidator
-    from ._zeroline import ZerolineValidator
-    from ._visible import VisibleValidator
-    from ._uirevision import UirevisionValidator
-    from ._type import TypeValidator
-    from ._title import TitleValidator
-    from ._tickwidth import TickwidthValidator
-    from ._tickvalssrc import TickvalssrcValidator
-    from ._tickvals import TickvalsValidator
-    from ._ticktextsrc import TicktextsrcValidator
-    from ._ticktext import TicktextValidator
-    from ._ticksuffix import TicksuffixValidator
-    from ._tickson import TicksonValidator
-    from ._ticks import TicksValidator
-    from ._tickprefix import TickprefixValidator
-    from ._tickmode import TickmodeValidator
-    from ._ticklen import TicklenValidator
-    from ._ticklabelstep import TicklabelstepValidator
-    from ._ticklabelposition import TicklabelpositionValidator
-    from ._ticklabeloverflow import TicklabeloverflowValidator
-    from ._ticklabelmode import TicklabelmodeValidator
-    from ._tickformatstopdefaults import TickformatstopdefaultsValidator
-    from ._tickformatstops import TickformatstopsValidator
-    from ._tickformat import TickformatValidator
-    from ._tickfont import TickfontValidator
-    from ._tickcolor import TickcolorValidator
-    from ._tickangle import TickangleValidator
-    from ._tick0 import Tick0Validator
-    from ._spikethickness import SpikethicknessValidator
-    from ._spikesnap import SpikesnapValidator
-    from ._spikemode import SpikemodeValidator
-    from ._spikedash import SpikedashValidator
-    from ._spikecolor import SpikecolorValidator
-    from ._side import SideValidator
-    from ._showticksuffix import ShowticksuffixValidator
-    from ._showtickprefix import ShowtickprefixValidator
-    from ._showticklabels import ShowticklabelsValidator
-    from ._showspikes import ShowspikesValidator
-    from ._showline import ShowlineValidator
-    from ._showgrid import ShowgridValidator
-    from ._showexponent import ShowexponentValidator
-    from ._showdividers import ShowdividersValidator
-    from ._separatethousands import SeparatethousandsValidator
-    from ._scaleratio import ScaleratioValidator
-    from ._scaleanchor import ScaleanchorValidator
-    from ._rangeslider import RangesliderValidator
-    from ._rangeselector import RangeselectorValidator
-    from ._rangemode import RangemodeValidator
-    from ._rangebreakdefaults import RangebreakdefaultsValidator
-    from ._rangebreaks import RangebreaksValidator
-    from ._range import RangeValidator
-    from ._position import PositionValidator
-    from ._overlaying import OverlayingValidator
-    from ._nticks import NticksValidator
-    from ._mirror import MirrorValidator
-    from ._minor import MinorValidator
-    from ._minexponent import MinexponentValidator
-    from ._minallowed import MinallowedValidator
-    from ._maxallowed import MaxallowedValidator
-    from ._matches import MatchesValidator
-    from ._linewidth import LinewidthValidator
-    from ._linecolor import LinecolorValidator
-    from ._layer import LayerValidator
-    from ._labelalias import LabelaliasValidator
-    from ._insiderange import InsiderangeValidator
-    from ._hoverformat import HoverformatValidator
-    from ._gridwidth import GridwidthValidator
-    from ._griddash import GriddashValidator
-    from ._gridcolor import GridcolorValidator
-    from ._fixedrange import FixedrangeValidator
-    from ._exponentformat import ExponentformatValidator
-    from ._dtick import DtickValidator
-    from ._domain import DomainValidator
-    from ._dividerwidth import DividerwidthValidator
-    from ._dividercolor import DividercolorValidator
-    from ._constraintoward import ConstraintowardValidator
-    from ._constrain import ConstrainValidator
-    from ._color import ColorValidator
-    from ._categoryorder import CategoryorderValidator
-    from ._categoryarraysrc import CategoryarraysrcValidator
-    from ._categoryarray import CategoryarrayValidator
-    from ._calendar import CalendarValidator
-    from ._autotypenumbers import AutotypenumbersValidator
-    from ._autotickangles import AutotickanglesValidator
-    from ._autorangeoptions import AutorangeoptionsValidator
-    from ._autorange import AutorangeValidator
-    from ._automargin import AutomarginValidator
-    from ._anchor import AnchorValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.xaxis",
+    {
+        "ZerolinewidthValidator": (
+            "zerolinewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "ZerolinecolorValidator": (
+            "zerolinecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "ZerolineValidator": (
+            "zeroline",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["-", "linear", "log", "date", "category", "multicategory"],
+            },
+        ),
+        "TitleValidator": (
+            "title",
+            "_plotly_utils.basevalidators.TitleValidator",
+            {
+                "data_class_str": "Title",
+                "data_docs": """
+            font
+                Sets this axis' title font. Note that the
+                title's font used to be customized by the now
+                deprecated `titlefont` attribute.
+            standoff
+                Sets the standoff distance (in px) between the
+                axis labels and the title text The default
+                value is a function of the axis tick labels,
+                the title `font.size` and the axis `linewidth`.
+                Note that the axis title position is always
+                constrained within the margins, so the actual
+                standoff distance is always less than the set
+                or default value. By setting `standoff` and
+                turning on `automargin`, plotly.js will push
+                the margins to fit the axis title at given
+                standoff distance.
+            text
+                Sets the title of this axis. Note that before
+                the existence of `title.text`, the title's
+                contents used to be defined as the `title`
+                attribute itself. This behavior has been
+                deprecated.
+""",
+            },
+        ),
+        "TickwidthValidator": (
+            "tickwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks",
+                "min": 0,
+            },
+        ),
+        "TickvalssrcValidator": (
+            "tickvalssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TickvalsValidator": (
+            "tickvals",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "TicktextsrcValidator": (
+            "ticktextsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "TicktextValidator": (
+            "ticktext",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "TicksuffixValidator": (
+            "ticksuffix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "TicksonValidator": (
+            "tickson",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["labels", "boundaries"],
+            },
+        ),
+        "TicksValidator": (
+            "ticks",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["outside", "inside", ""],
+            },
+        ),
+        "TickprefixValidator": (
+            "tickprefix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "TickmodeValidator": (
+            "tickmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "implied_edits": {},
+                "values": ["auto", "linear", "array", "sync"],
+            },
+        ),
+        "TicklenValidator": (
+            "ticklen",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks",
+                "min": 0,
+            },
+        ),
+        "TicklabelstepValidator": (
+            "ticklabelstep",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "ticks",
+                "min": 1,
+            },
+        ),
+        "TicklabelpositionValidator": (
+            "ticklabelposition",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "outside",
+                    "inside",
+                    "outside top",
+                    "inside top",
+                    "outside left",
+                    "inside left",
+                    "outside right",
+                    "inside right",
+                    "outside bottom",
+                    "inside bottom",
+                ],
+            },
+        ),
+        "TicklabeloverflowValidator": (
+            "ticklabeloverflow",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["allow", "hide past div", "hide past domain"],
+            },
+        ),
+        "TicklabelmodeValidator": (
+            "ticklabelmode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["instant", "period"],
+            },
+        ),
+        "TickformatstopdefaultsValidator": (
+            "tickformatstopdefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickformatstop",
+                "data_docs": """
+""",
+            },
+        ),
+        "TickformatstopsValidator": (
+            "tickformatstops",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Tickformatstop",
+                "data_docs": """
+            dtickrange
+                range [*min*, *max*], where "min", "max" -
+                dtick values which describe some zoom level, it
+                is possible to omit "min" or "max" value by
+                passing "null"
+            enabled
+                Determines whether or not this stop is used. If
+                `false`, this stop is ignored even within its
+                `dtickrange`.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            value
+                string - dtickformat for described zoom level,
+                the same as "tickformat"
+""",
+            },
+        ),
+        "TickformatValidator": (
+            "tickformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "TickfontValidator": (
+            "tickfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._zerolinewidth.ZerolinewidthValidator",
-            "._zerolinecolor.ZerolinecolorValidator",
-            "._zeroline.ZerolineValidator",
-            "._visible.VisibleValidator",
-            "._uirevision.UirevisionValidator",
-            "._type.TypeValidator",
-            "._title.TitleValidator",
-            "._tickwidth.TickwidthValidator",
-            "._tickvalssrc.TickvalssrcValidator",
-            "._tickvals.TickvalsValidator",
-            "._ticktextsrc.TicktextsrcValidator",
-            "._ticktext.TicktextValidator",
-            "._ticksuffix.TicksuffixValidator",
-            "._tickson.TicksonValidator",
-            "._ticks.TicksValidator",
-            "._tickprefix.TickprefixValidator",
-            "._tickmode.TickmodeValidator",
-            "._ticklen.TicklenValidator",
-            "._ticklabelstep.TicklabelstepValidator",
-            "._ticklabelposition.TicklabelpositionValidator",
-            "._ticklabeloverflow.TicklabeloverflowValidator",
-            "._ticklabelmode.TicklabelmodeValidator",
-            "._tickformatstopdefaults.TickformatstopdefaultsValidator",
-            "._tickformatstops.TickformatstopsValidator",
-            "._tickformat.TickformatValidator",
-            "._tickfont.TickfontValidator",
-            "._tickcolor.TickcolorValidator",
-            "._tickangle.TickangleValidator",
-            "._tick0.Tick0Validator",
-            "._spikethickness.SpikethicknessValidator",
-            "._spikesnap.SpikesnapValidator",
-            "._spikemode.SpikemodeValidator",
-            "._spikedash.SpikedashValidator",
-            "._spikecolor.SpikecolorValidator",
-            "._side.SideValidator",
-            "._showticksuffix.ShowticksuffixValidator",
-            "._showtickprefix.ShowtickprefixValidator",
-            "._showticklabels.ShowticklabelsValidator",
-            "._showspikes.ShowspikesValidator",
-            "._showline.ShowlineValidator",
-            "._showgrid.ShowgridValidator",
-            "._showexponent.ShowexponentValidator",
-            "._showdividers.ShowdividersValidator",
-            "._separatethousands.SeparatethousandsValidator",
-            "._scaleratio.ScaleratioValidator",
-            "._scaleanchor.ScaleanchorValidator",
-            "._rangeslider.RangesliderValidator",
-            "._rangeselector.RangeselectorValidator",
-            "._rangemode.RangemodeValidator",
-            "._rangebreakdefaults.RangebreakdefaultsValidator",
-            "._rangebreaks.RangebreaksValidator",
-            "._range.RangeValidator",
-            "._position.PositionValidator",
-            "._overlaying.OverlayingValidator",
-            "._nticks.NticksValidator",
-            "._mirror.MirrorValidator",
-            "._minor.MinorValidator",
-            "._minexponent.MinexponentValidator",
-            "._minallowed.MinallowedValidator",
-            "._maxallowed.MaxallowedValidator",
-            "._matches.MatchesValidator",
-            "._linewidth.LinewidthValidator",
-            "._linecolor.LinecolorValidator",
-            "._layer.LayerValidator",
-            "._labelalias.LabelaliasValidator",
-            "._insiderange.InsiderangeValidator",
-            "._hoverformat.HoverformatValidator",
-            "._gridwidth.GridwidthValidator",
-            "._griddash.GriddashValidator",
-            "._gridcolor.GridcolorValidator",
-            "._fixedrange.FixedrangeValidator",
-            "._exponentformat.ExponentformatValidator",
-            "._dtick.DtickValidator",
-            "._domain.DomainValidator",
-            "._dividerwidth.DividerwidthValidator",
-            "._dividercolor.DividercolorValidator",
-            "._constraintoward.ConstraintowardValidator",
-            "._constrain.ConstrainValidator",
-            "._color.ColorValidator",
-            "._categoryorder.CategoryorderValidator",
-            "._categoryarraysrc.CategoryarraysrcValidator",
-            "._categoryarray.CategoryarrayValidator",
-            "._calendar.CalendarValidator",
-            "._autotypenumbers.AutotypenumbersValidator",
-            "._autotickangles.AutotickanglesValidator",
-            "._autorangeoptions.AutorangeoptionsValidator",
-            "._autorange.AutorangeValidator",
-            "._automargin.AutomarginValidator",
-            "._anchor.AnchorValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "TickcolorValidator": (
+            "tickcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "TickangleValidator": (
+            "tickangle",
+            "_plotly_utils.basevalidators.AngleValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "Tick0Validator": (
+            "tick0",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "ticks",
+                "implied_edits": {"tickmode": "linear"},
+            },
+        ),
+        "SpikethicknessValidator": (
+            "spikethickness",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SpikesnapValidator": (
+            "spikesnap",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "none",
+                "values": ["data", "cursor", "hovered data"],
+            },
+        ),
+        "SpikemodeValidator": (
+            "spikemode",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "none",
+                "flags": ["toaxis", "across", "marker"],
+            },
+        ),
+        "SpikedashValidator": (
+            "spikedash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "none",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "SpikecolorValidator": (
+            "spikecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "SideValidator": (
+            "side",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["top", "bottom", "left", "right"],
+            },
+        ),
+        "ShowticksuffixValidator": (
+            "showticksuffix",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowtickprefixValidator": (
+            "showtickprefix",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowticklabelsValidator": (
+            "showticklabels",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "ShowspikesValidator": (
+            "showspikes",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "modebar",
+            },
+        ),
+        "ShowlineValidator": (
+            "showline",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "ticks+layoutstyle",
+            },
+        ),
+        "ShowgridValidator": (
+            "showgrid",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "ShowexponentValidator": (
+            "showexponent",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["all", "first", "last", "none"],
+            },
+        ),
+        "ShowdividersValidator": (
+            "showdividers",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "SeparatethousandsValidator": (
+            "separatethousands",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "ScaleratioValidator": (
+            "scaleratio",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "ScaleanchorValidator": (
+            "scaleanchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "/^x([2-9]|[1-9][0-9]+)?( domain)?$/",
+                    "/^y([2-9]|[1-9][0-9]+)?( domain)?$/",
+                    False,
+                ],
+            },
+        ),
+        "RangesliderValidator": (
+            "rangeslider",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Rangeslider",
+                "data_docs": """
+            autorange
+                Determines whether or not the range slider
+                range is computed in relation to the input
+                data. If `range` is provided, then `autorange`
+                is set to False.
+            bgcolor
+                Sets the background color of the range slider.
+            bordercolor
+                Sets the border color of the range slider.
+            borderwidth
+                Sets the border width of the range slider.
+            range
+                Sets the range of the range slider. If not set,
+                defaults to the full xaxis range. If the axis
+                `type` is "log", then you must take the log of
+                your desired range. If the axis `type` is
+                "date", it should be date strings, like date
+                data, though Date objects and unix milliseconds
+                will be accepted and converted to strings. If
+                the axis `type` is "category", it should be
+                numbers, using the scale where each category is
+                assigned a serial number from zero in the order
+                it appears.
+            thickness
+                The height of the range slider as a fraction of
+                the total plot area height.
+            visible
+                Determines whether or not the range slider will
+                be visible. If visible, perpendicular axes will
+                be set to `fixedrange`
+            yaxis
+                :class:`plotly.graph_objects.layout.xaxis.range
+                slider.YAxis` instance or dict with compatible
+                properties
+""",
+            },
+        ),
+        "RangeselectorValidator": (
+            "rangeselector",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Rangeselector",
+                "data_docs": """
+            activecolor
+                Sets the background color of the active range
+                selector button.
+            bgcolor
+                Sets the background color of the range selector
+                buttons.
+            bordercolor
+                Sets the color of the border enclosing the
+                range selector.
+            borderwidth
+                Sets the width (in px) of the border enclosing
+                the range selector.
+            buttons
+                Sets the specifications for each buttons. By
+                default, a range selector comes with no
+                buttons.
+            buttondefaults
+                When used in a template (as layout.template.lay
+                out.xaxis.rangeselector.buttondefaults), sets
+                the default property values to use for elements
+                of layout.xaxis.rangeselector.buttons
+            font
+                Sets the font of the range selector button
+                text.
+            visible
+                Determines whether or not this range selector
+                is visible. Note that range selectors are only
+                available for x axes of `type` set to or auto-
+                typed to "date".
+            x
+                Sets the x position (in normalized coordinates)
+                of the range selector.
+            xanchor
+                Sets the range selector's horizontal position
+                anchor. This anchor binds the `x` position to
+                the "left", "center" or "right" of the range
+                selector.
+            y
+                Sets the y position (in normalized coordinates)
+                of the range selector.
+            yanchor
+                Sets the range selector's vertical position
+                anchor This anchor binds the `y` position to
+                the "top", "middle" or "bottom" of the range
+                selector.
+""",
+            },
+        ),
+        "RangemodeValidator": (
+            "rangemode",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["normal", "tozero", "nonnegative"],
+            },
+        ),
+        "RangebreakdefaultsValidator": (
+            "rangebreakdefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Rangebreak",
+                "data_docs": """
+""",
+            },
+        ),
+        "RangebreaksValidator": (
+            "rangebreaks",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Rangebreak",
+                "data_docs": """
+            bounds
+                Sets the lower and upper bounds of this axis
+                rangebreak. Can be used with `pattern`.
+            dvalue
+                Sets the size of each `values` item. The
+                default is one day in milliseconds.
+            enabled
+                Determines whether this axis rangebreak is
+                enabled or disabled. Please note that
+                `rangebreaks` only work for "date" axis type.
+            name
+                When used in a template, named items are
+                created in the output figure in addition to any
+                items the figure already has in this array. You
+                can modify these items in the output figure by
+                making your own item with `templateitemname`
+                matching this `name` alongside your
+                modifications (including `visible: false` or
+                `enabled: false` to hide it). Has no effect
+                outside of a template.
+            pattern
+                Determines a pattern on the time line that
+                generates breaks. If *day of week* - days of
+                the week in English e.g. 'Sunday' or `sun`
+                (matching is case-insensitive and considers
+                only the first three characters), as well as
+                Sunday-based integers between 0 and 6. If
+                "hour" - hour (24-hour clock) as decimal
+                numbers between 0 and 24. for more info.
+                Examples: - { pattern: 'day of week', bounds:
+                [6, 1] }  or simply { bounds: ['sat', 'mon'] }
+                breaks from Saturday to Monday (i.e. skips the
+                weekends). - { pattern: 'hour', bounds: [17, 8]
+                }   breaks from 5pm to 8am (i.e. skips non-work
+                hours).
+            templateitemname
+                Used to refer to a named item in this array in
+                the template. Named items from the template
+                will be created even without a matching item in
+                the input figure, but you can modify one by
+                making an item with `templateitemname` matching
+                its `name`, alongside your modifications
+                (including `visible: false` or `enabled: false`
+                to hide it). If there is no template or no
+                matching item, this item will be hidden unless
+                you explicitly show it with `visible: true`.
+            values
+                Sets the coordinate values corresponding to the
+                rangebreaks. An alternative to `bounds`. Use
+                `dvalue` to set the size of the values along
+                the axis.
+""",
+            },
+        ),
+        "RangeValidator": (
+            "range",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "anim": True,
+                "edit_type": "axrange",
+                "implied_edits": {"autorange": False},
+                "items": [
+                    {
+                        "anim": True,
+                        "editType": "axrange",
+                        "impliedEdits": {"^autorange": False},
+                        "valType": "any",
+                    },
+                    {
+                        "anim": True,
+                        "editType": "axrange",
+                        "impliedEdits": {"^autorange": False},
+                        "valType": "any",
+                    },
+                ],
+            },
+        ),
+        "PositionValidator": (
+            "position",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "OverlayingValidator": (
+            "overlaying",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "free",
+                    "/^x([2-9]|[1-9][0-9]+)?( domain)?$/",
+                    "/^y([2-9]|[1-9][0-9]+)?( domain)?$/",
+                ],
+            },
+        ),
+        "NticksValidator": (
+            "nticks",
+            "_plotly_utils.basevalidators.IntegerValidator",
+            {
+                "edit_type": "ticks",
+                "min": 0,
+            },
+        ),
+        "MirrorValidator": (
+            "mirror",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks+layoutstyle",
+                "values": [True, "ticks", False, "all", "allticks"],
+            },
+        ),
+        "MinorValidator": (
+            "minor",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Minor",
+                "data_docs": """
+            dtick
+                Sets the step in-between ticks on this axis.
+                Use with `tick0`. Must be a positive number, or
+                special strings available to "log" and "date"
+                axes. If the axis `type` is "log", then ticks
+                are set every 10^(n*dtick) where n is the tick
+                number. For example, to set a tick mark at 1,
+                10, 100, 1000, ... set dtick to 1. To set tick
+                marks at 1, 100, 10000, ... set dtick to 2. To
+                set tick marks at 1, 5, 25, 125, 625, 3125, ...
+                set dtick to log_10(5), or 0.69897000433. "log"
+                has several special values; "L<f>", where `f`
+                is a positive number, gives ticks linearly
+                spaced in value (but not position). For example
+                `tick0` = 0.1, `dtick` = "L0.5" will put ticks
+                at 0.1, 0.6, 1.1, 1.6 etc. To show powers of 10
+                plus small digits between, use "D1" (all
+                digits) or "D2" (only 2 and 5). `tick0` is
+                ignored for "D1" and "D2". If the axis `type`
+                is "date", then you must convert the time to
+                milliseconds. For example, to set the interval
+                between ticks to one day, set `dtick` to
+                86400000.0. "date" also has special values
+                "M<n>" gives ticks spaced by a number of
+                months. `n` must be a positive integer. To set
+                ticks on the 15th of every third month, set
+                `tick0` to "2000-01-15" and `dtick` to "M3". To
+                set ticks every 4 years, set `dtick` to "M48"
+            gridcolor
+                Sets the color of the grid lines.
+            griddash
+                Sets the dash style of lines. Set to a dash
+                type string ("solid", "dot", "dash",
+                "longdash", "dashdot", or "longdashdot") or a
+                dash length list in px (eg "5px,10px,2px,2px").
+            gridwidth
+                Sets the width (in px) of the grid lines.
+            nticks
+                Specifies the maximum number of ticks for the
+                particular axis. The actual number of ticks
+                will be chosen automatically to be less than or
+                equal to `nticks`. Has an effect only if
+                `tickmode` is set to "auto".
+            showgrid
+                Determines whether or not grid lines are drawn.
+                If True, the grid lines are drawn at every tick
+                mark.
+            tick0
+                Sets the placement of the first tick on this
+                axis. Use with `dtick`. If the axis `type` is
+                "log", then you must take the log of your
+                starting tick (e.g. to set the starting tick to
+                100, set the `tick0` to 2) except when
+                `dtick`=*L<f>* (see `dtick` for more info). If
+                the axis `type` is "date", it should be a date
+                string, like date data. If the axis `type` is
+                "category", it should be a number, using the
+                scale where each category is assigned a serial
+                number from zero in the order it appears.
+            tickcolor
+                Sets the tick color.
+            ticklen
+                Sets the tick length (in px).
+            tickmode
+                Sets the tick mode for this axis. If "auto",
+                the number of ticks is set via `nticks`. If
+                "linear", the placement of the ticks is
+                determined by a starting position `tick0` and a
+                tick step `dtick` ("linear" is the default
+                value if `tick0` and `dtick` are provided). If
+                "array", the placement of the ticks is set via
+                `tickvals` and the tick text is `ticktext`.
+                ("array" is the default value if `tickvals` is
+                provided).
+            ticks
+                Determines whether ticks are drawn or not. If
+                "", this axis' ticks are not drawn. If
+                "outside" ("inside"), this axis' are drawn
+                outside (inside) the axis lines.
+            tickvals
+                Sets the values at which ticks on this axis
+                appear. Only has an effect if `tickmode` is set
+                to "array". Used with `ticktext`.
+            tickvalssrc
+                Sets the source reference on Chart Studio Cloud
+                for `tickvals`.
+            tickwidth
+                Sets the tick width (in px).
+""",
+            },
+        ),
+        "MinexponentValidator": (
+            "minexponent",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks",
+                "min": 0,
+            },
+        ),
+        "MinallowedValidator": (
+            "minallowed",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"^autorange": False},
+            },
+        ),
+        "MaxallowedValidator": (
+            "maxallowed",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "plot",
+                "implied_edits": {"^autorange": False},
+            },
+        ),
+        "MatchesValidator": (
+            "matches",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "/^x([2-9]|[1-9][0-9]+)?( domain)?$/",
+                    "/^y([2-9]|[1-9][0-9]+)?( domain)?$/",
+                ],
+            },
+        ),
+        "LinewidthValidator": (
+            "linewidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks+layoutstyle",
+                "min": 0,
+            },
+        ),
+        "LinecolorValidator": (
+            "linecolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "layoutstyle",
+            },
+        ),
+        "LayerValidator": (
+            "layer",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["above traces", "below traces"],
+            },
+        ),
+        "LabelaliasValidator": (
+            "labelalias",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "InsiderangeValidator": (
+            "insiderange",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "valType": "any"},
+                    {"editType": "plot", "valType": "any"},
+                ],
+            },
+        ),
+        "HoverformatValidator": (
+            "hoverformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "GridwidthValidator": (
+            "gridwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks",
+                "min": 0,
+            },
+        ),
+        "GriddashValidator": (
+            "griddash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "ticks",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "GridcolorValidator": (
+            "gridcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "FixedrangeValidator": (
+            "fixedrange",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ExponentformatValidator": (
+            "exponentformat",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "ticks",
+                "values": ["none", "e", "E", "power", "SI", "B"],
+            },
+        ),
+        "DtickValidator": (
+            "dtick",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "ticks",
+                "implied_edits": {"tickmode": "linear"},
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "plot",
+                "items": [
+                    {"editType": "plot", "max": 1, "min": 0, "valType": "number"},
+                    {"editType": "plot", "max": 1, "min": 0, "valType": "number"},
+                ],
+            },
+        ),
+        "DividerwidthValidator": (
+            "dividerwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "DividercolorValidator": (
+            "dividercolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "ConstraintowardValidator": (
+            "constraintoward",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["left", "center", "right", "top", "middle", "bottom"],
+            },
+        ),
+        "ConstrainValidator": (
+            "constrain",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["range", "domain"],
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "ticks",
+            },
+        ),
+        "CategoryorderValidator": (
+            "categoryorder",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "trace",
+                    "category ascending",
+                    "category descending",
+                    "array",
+                    "total ascending",
+                    "total descending",
+                    "min ascending",
+                    "min descending",
+                    "max ascending",
+                    "max descending",
+                    "sum ascending",
+                    "sum descending",
+                    "mean ascending",
+                    "mean descending",
+                    "median ascending",
+                    "median descending",
+                ],
+            },
+        ),
+        "CategoryarraysrcValidator": (
+            "categoryarraysrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CategoryarrayValidator": (
+            "categoryarray",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CalendarValidator": (
+            "calendar",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [
+                    "chinese",
+                    "coptic",
+                    "discworld",
+                    "ethiopian",
+                    "gregorian",
+                    "hebrew",
+                    "islamic",
+                    "jalali",
+                    "julian",
+                    "mayan",
+                    "nanakshahi",
+                    "nepali",
+                    "persian",
+                    "taiwan",
+                    "thai",
+                    "ummalqura",
+                ],
+            },
+        ),
+        "AutotypenumbersValidator": (
+            "autotypenumbers",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["convert types", "strict"],
+            },
+        ),
+        "AutotickanglesValidator": (
+            "autotickangles",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "ticks",
+                "free_length": True,
+                "items": {"valType": "angle"},
+            },
+        ),
+        "AutorangeoptionsValidator": (
+            "autorangeoptions",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Autorangeoptions",
+                "data_docs": """
+            clipmax
+                Clip autorange maximum if it goes beyond this
+                value. Has no effect when
+                `autorangeoptions.maxallowed` is provided.
+            clipmin
+                Clip autorange minimum if it goes beyond this
+                value. Has no effect when
+                `autorangeoptions.minallowed` is provided.
+            include
+                Ensure this value is included in autorange.
+            includesrc
+                Sets the source reference on Chart Studio Cloud
+                for `include`.
+            maxallowed
+                Use this value exactly as autorange maximum.
+            minallowed
+                Use this value exactly as autorange minimum.
+""",
+            },
+        ),
+        "AutorangeValidator": (
+            "autorange",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "axrange",
+                "implied_edits": {},
+                "values": [
+                    True,
+                    False,
+                    "reversed",
+                    "min reversed",
+                    "max reversed",
+                    "min",
+                    "max",
+                ],
+            },
+        ),
+        "AutomarginValidator": (
+            "automargin",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "ticks",
+                "extras": [True, False],
+                "flags": ["height", "width", "left", "right", "top", "bottom"],
+            },
+        ),
+        "AnchorValidator": (
+            "anchor",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "free",
+                    "/^x([2-9]|[1-9][0-9]+)?( domain)?$/",
+                    "/^y([2-9]|[1-9][0-9]+)?( domain)?$/",
+                ],
+            },
+        ),
+    },
+    [],
+)
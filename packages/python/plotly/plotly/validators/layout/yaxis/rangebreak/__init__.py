@@ -1,27 +1,66 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._values import ValuesValidator
-    from ._templateitemname import TemplateitemnameValidator
-    from ._pattern import PatternValidator
-    from ._name import NameValidator
-    from ._enabled import EnabledValidator
-    from ._dvalue import DvalueValidator
-    from ._bounds import BoundsValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._values.ValuesValidator",
-            "._templateitemname.TemplateitemnameValidator",
-            "._pattern.PatternValidator",
-            "._name.NameValidator",
-            "._enabled.EnabledValidator",
-            "._dvalue.DvalueValidator",
-            "._bounds.BoundsValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "layout.yaxis.rangebreak",
+    {
+        "ValuesValidator": (
+            "values",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "calc",
+                "free_length": True,
+                "items": {"editType": "calc", "valType": "any"},
+            },
+        ),
+        "TemplateitemnameValidator": (
+            "templateitemname",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "PatternValidator": (
+            "pattern",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["day of week", "hour", ""],
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "EnabledValidator": (
+            "enabled",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "DvalueValidator": (
+            "dvalue",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "BoundsValidator": (
+            "bounds",
+            "_plotly_utils.basevalidators.InfoArrayValidator",
+            {
+                "edit_type": "calc",
+                "items": [
+                    {"editType": "calc", "valType": "any"},
+                    {"editType": "calc", "valType": "any"},
+                ],
+            },
+        ),
+    },
+    [],
+)
@@ -1,59 +1,455 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._tickfont import TickfontValidator
-    from ._stream import StreamValidator
-    from ._sortpaths import SortpathsValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._line import LineValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._labelfont import LabelfontValidator
-    from ._hovertemplate import HovertemplateValidator
-    from ._hoveron import HoveronValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._domain import DomainValidator
-    from ._dimensiondefaults import DimensiondefaultsValidator
-    from ._dimensions import DimensionsValidator
-    from ._countssrc import CountssrcValidator
-    from ._counts import CountsValidator
-    from ._bundlecolors import BundlecolorsValidator
-    from ._arrangement import ArrangementValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "parcats",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TickfontValidator": (
+            "tickfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Tickfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._tickfont.TickfontValidator",
-            "._stream.StreamValidator",
-            "._sortpaths.SortpathsValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._line.LineValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._labelfont.LabelfontValidator",
-            "._hovertemplate.HovertemplateValidator",
-            "._hoveron.HoveronValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._domain.DomainValidator",
-            "._dimensiondefaults.DimensiondefaultsValidator",
-            "._dimensions.DimensionsValidator",
-            "._countssrc.CountssrcValidator",
-            "._counts.CountsValidator",
-            "._bundlecolors.BundlecolorsValidator",
-            "._arrangement.ArrangementValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "SortpathsValidator": (
+            "sortpaths",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["forward", "backward"],
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            autocolorscale
+                Determines whether the colorscale is a default
+                palette (`autocolorscale: true`) or the palette
+                determined by `line.colorscale`. Has an effect
+                only if in `line.color` is set to a numerical
+                array. In case `colorscale` is unspecified or
+                `autocolorscale` is true, the default palette
+                will be chosen according to whether numbers in
+                the `color` array are all positive, all
+                negative or mixed.
+            cauto
+                Determines whether or not the color domain is
+                computed with respect to the input data (here
+                in `line.color`) or the bounds set in
+                `line.cmin` and `line.cmax` Has an effect only
+                if in `line.color` is set to a numerical array.
+                Defaults to `false` when `line.cmin` and
+                `line.cmax` are set by the user.
+            cmax
+                Sets the upper bound of the color domain. Has
+                an effect only if in `line.color` is set to a
+                numerical array. Value should have the same
+                units as in `line.color` and if set,
+                `line.cmin` must be set as well.
+            cmid
+                Sets the mid-point of the color domain by
+                scaling `line.cmin` and/or `line.cmax` to be
+                equidistant to this point. Has an effect only
+                if in `line.color` is set to a numerical array.
+                Value should have the same units as in
+                `line.color`. Has no effect when `line.cauto`
+                is `false`.
+            cmin
+                Sets the lower bound of the color domain. Has
+                an effect only if in `line.color` is set to a
+                numerical array. Value should have the same
+                units as in `line.color` and if set,
+                `line.cmax` must be set as well.
+            color
+                Sets the line color. It accepts either a
+                specific color or an array of numbers that are
+                mapped to the colorscale relative to the max
+                and min values of the array or relative to
+                `line.cmin` and `line.cmax` if set.
+            coloraxis
+                Sets a reference to a shared color axis.
+                References to these shared color axes are
+                "coloraxis", "coloraxis2", "coloraxis3", etc.
+                Settings for these shared color axes are set in
+                the layout, under `layout.coloraxis`,
+                `layout.coloraxis2`, etc. Note that multiple
+                color scales can be linked to the same color
+                axis.
+            colorbar
+                :class:`plotly.graph_objects.parcats.line.Color
+                Bar` instance or dict with compatible
+                properties
+            colorscale
+                Sets the colorscale. Has an effect only if in
+                `line.color` is set to a numerical array. The
+                colorscale must be an array containing arrays
+                mapping a normalized value to an rgb, rgba,
+                hex, hsl, hsv, or named color string. At
+                minimum, a mapping for the lowest (0) and
+                highest (1) values are required. For example,
+                `[[0, 'rgb(0,0,255)'], [1, 'rgb(255,0,0)']]`.
+                To control the bounds of the colorscale in
+                color space, use `line.cmin` and `line.cmax`.
+                Alternatively, `colorscale` may be a palette
+                name string of the following list: Blackbody,Bl
+                uered,Blues,Cividis,Earth,Electric,Greens,Greys
+                ,Hot,Jet,Picnic,Portland,Rainbow,RdBu,Reds,Viri
+                dis,YlGnBu,YlOrRd.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            hovertemplate
+                Template string used for rendering the
+                information that appear on hover box. Note that
+                this will override `hoverinfo`. Variables are
+                inserted using %{variable}, for example "y:
+                %{y}" as well as %{xother}, {%_xother},
+                {%_xother_}, {%xother_}. When showing info for
+                several points, "xother" will be added to those
+                with different x positions from the first
+                point. An underscore before or after
+                "(x|y)other" will add a space on that side,
+                only when this field is shown. Numbers are
+                formatted using d3-format's syntax
+                %{variable:d3-format}, for example "Price:
+                %{y:$.2f}". https://github.com/d3/d3-
+                format/tree/v1.4.5#d3-format for details on the
+                formatting syntax. Dates are formatted using
+                d3-time-format's syntax %{variable|d3-time-
+                format}, for example "Day: %{2019-01-01|%A}".
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format for details on
+                the date formatting syntax. The variables
+                available in `hovertemplate` are the ones
+                emitted as event data described at this link
+                https://plotly.com/javascript/plotlyjs-
+                events/#event-data. Additionally, every
+                attributes that can be specified per-point (the
+                ones that are `arrayOk: true`) are available.
+                This value here applies when hovering over
+                lines.Finally, the template string has access
+                to variables `count` and `probability`.
+                Anything contained in tag `<extra>` is
+                displayed in the secondary box, for example
+                "<extra>{fullData.name}</extra>". To hide the
+                secondary box completely, use an empty tag
+                `<extra></extra>`.
+            reversescale
+                Reverses the color mapping if true. Has an
+                effect only if in `line.color` is set to a
+                numerical array. If true, `line.cmin` will
+                correspond to the last color in the array and
+                `line.cmax` will correspond to the first color.
+            shape
+                Sets the shape of the paths. If `linear`, paths
+                are composed of straight lines. If `hspline`,
+                paths are composed of horizontal curved splines
+            showscale
+                Determines whether or not a colorbar is
+                displayed for this trace. Has an effect only if
+                in `line.color` is set to a numerical array.
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LabelfontValidator": (
+            "labelfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Labelfont",
+                "data_docs": """
+            color
+
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "HovertemplateValidator": (
+            "hovertemplate",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "HoveronValidator": (
+            "hoveron",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["category", "color", "dimension"],
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": False,
+                "edit_type": "plot",
+                "extras": ["all", "none", "skip"],
+                "flags": ["count", "probability"],
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this parcats trace
+                .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this parcats trace .
+            x
+                Sets the horizontal domain of this parcats
+                trace (in plot fraction).
+            y
+                Sets the vertical domain of this parcats trace
+                (in plot fraction).
+""",
+            },
+        ),
+        "DimensiondefaultsValidator": (
+            "dimensiondefaults",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Dimension",
+                "data_docs": """
+""",
+            },
+        ),
+        "DimensionsValidator": (
+            "dimensions",
+            "_plotly_utils.basevalidators.CompoundArrayValidator",
+            {
+                "data_class_str": "Dimension",
+                "data_docs": """
+            categoryarray
+                Sets the order in which categories in this
+                dimension appear. Only has an effect if
+                `categoryorder` is set to "array". Used with
+                `categoryorder`.
+            categoryarraysrc
+                Sets the source reference on Chart Studio Cloud
+                for `categoryarray`.
+            categoryorder
+                Specifies the ordering logic for the categories
+                in the dimension. By default, plotly uses
+                "trace", which specifies the order that is
+                present in the data supplied. Set
+                `categoryorder` to *category ascending* or
+                *category descending* if order should be
+                determined by the alphanumerical order of the
+                category names. Set `categoryorder` to "array"
+                to derive the ordering from the attribute
+                `categoryarray`. If a category is not found in
+                the `categoryarray` array, the sorting behavior
+                for that attribute will be identical to the
+                "trace" mode. The unspecified categories will
+                follow the categories in `categoryarray`.
+            displayindex
+                The display index of dimension, from left to
+                right, zero indexed, defaults to dimension
+                index.
+            label
+                The shown name of the dimension.
+            ticktext
+                Sets alternative tick labels for the categories
+                in this dimension. Only has an effect if
+                `categoryorder` is set to "array". Should be an
+                array the same length as `categoryarray` Used
+                with `categoryorder`.
+            ticktextsrc
+                Sets the source reference on Chart Studio Cloud
+                for `ticktext`.
+            values
+                Dimension values. `values[n]` represents the
+                category value of the `n`th point in the
+                dataset, therefore the `values` vector for all
+                dimensions must be the same (longer vectors
+                will be truncated).
+            valuessrc
+                Sets the source reference on Chart Studio Cloud
+                for `values`.
+            visible
+                Shows the dimension when set to `true` (the
+                default). Hides the dimension for `false`.
+""",
+            },
+        ),
+        "CountssrcValidator": (
+            "countssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CountsValidator": (
+            "counts",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "BundlecolorsValidator": (
+            "bundlecolors",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ArrangementValidator": (
+            "arrangement",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["perpendicular", "freeform", "fixed"],
+            },
+        ),
+    },
+    [],
+)
@@ -1,18 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class DimensiondefaultsValidator(_plotly_utils.basevalidators.CompoundValidator):
-    def __init__(
-        self, plotly_name="dimensiondefaults", parent_name="parcats", **kwargs
-    ):
-        super(DimensiondefaultsValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            data_class_str=kwargs.pop("data_class_str", "Dimension"),
-            data_docs=kwargs.pop(
-                "data_docs",
-                """
-""",
-            ),
-            **kwargs,
-        )
@@ -1,11 +1,26 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._line import LineValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._line.LineValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "parcoords.unselected",
+    {
+        "LineValidator": (
+            "line",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Line",
+                "data_docs": """
+            color
+                Sets the base color of unselected lines. in
+                connection with `unselected.line.opacity`.
+            opacity
+                Sets the opacity of unselected lines. The
+                default "auto" decreases the opacity smoothly
+                as the number of lines increases. Use 1 to
+                achieve exact `unselected.line.color`.
+""",
+            },
+        )
+    },
+    [],
+)
@@ -1,25 +1,68 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._sizemin import SizeminValidator
-    from ._sizemax import SizemaxValidator
-    from ._opacity import OpacityValidator
-    from ._color import ColorValidator
-    from ._border import BorderValidator
-    from ._blend import BlendValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._sizemin.SizeminValidator",
-            "._sizemax.SizemaxValidator",
-            "._opacity.OpacityValidator",
-            "._color.ColorValidator",
-            "._border.BorderValidator",
-            "._blend.BlendValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "pointcloud.marker",
+    {
+        "SizeminValidator": (
+            "sizemin",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 2,
+                "min": 0.1,
+            },
+        ),
+        "SizemaxValidator": (
+            "sizemax",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0.1,
+            },
+        ),
+        "OpacityValidator": (
+            "opacity",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": False,
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": False,
+                "edit_type": "calc",
+            },
+        ),
+        "BorderValidator": (
+            "border",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Border",
+                "data_docs": """
+            arearatio
+                Specifies what fraction of the marker area is
+                covered with the border.
+            color
+                Sets the stroke color. It accepts a specific
+                color. If the color is not fully opaque and
+                there are hundreds of thousands of points, it
+                may cause slower zooming and panning.
+""",
+            },
+        ),
+        "BlendValidator": (
+            "blend",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
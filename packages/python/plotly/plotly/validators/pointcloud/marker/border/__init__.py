@@ -1,12 +1,26 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._color import ColorValidator
-    from ._arearatio import ArearatioValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._color.ColorValidator", "._arearatio.ArearatioValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "pointcloud.marker.border",
+    {
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "array_ok": False,
+                "edit_type": "calc",
+            },
+        ),
+        "ArearatioValidator": (
+            "arearatio",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
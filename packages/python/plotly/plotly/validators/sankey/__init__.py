@@ -1,65 +1,506 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._valuesuffix import ValuesuffixValidator
-    from ._valueformat import ValueformatValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._textfont import TextfontValidator
-    from ._stream import StreamValidator
-    from ._selectedpoints import SelectedpointsValidator
-    from ._orientation import OrientationValidator
-    from ._node import NodeValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._link import LinkValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legend import LegendValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._domain import DomainValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._arrangement import ArrangementValidator
-else:
-    from _plotly_utils.importers import relative_import
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "sankey",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "ValuesuffixValidator": (
+            "valuesuffix",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ValueformatValidator": (
+            "valueformat",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "TextfontValidator": (
+            "textfont",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Textfont",
+                "data_docs": """
+            color
 
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._valuesuffix.ValuesuffixValidator",
-            "._valueformat.ValueformatValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._textfont.TextfontValidator",
-            "._stream.StreamValidator",
-            "._selectedpoints.SelectedpointsValidator",
-            "._orientation.OrientationValidator",
-            "._node.NodeValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._link.LinkValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legend.LegendValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._domain.DomainValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._arrangement.ArrangementValidator",
-        ],
-    )
+            family
+                HTML font family - the typeface that will be
+                applied by the web browser. The web browser
+                will only be able to apply a font if it is
+                available on the system which it operates.
+                Provide multiple font families, separated by
+                commas, to indicate the preference in which to
+                apply fonts if they aren't available on the
+                system. The Chart Studio Cloud (at
+                https://chart-studio.plotly.com or on-premise)
+                generates images on a server, where only a
+                select number of fonts are installed and
+                supported. These include "Arial", "Balto",
+                "Courier New", "Droid Sans",, "Droid Serif",
+                "Droid Sans Mono", "Gravitas One", "Old
+                Standard TT", "Open Sans", "Overpass", "PT Sans
+                Narrow", "Raleway", "Times New Roman".
+            size
+
+            style
+                Sets whether a font should be styled with a
+                normal or italic face from its family.
+            variant
+                Sets the variant of the font.
+            weight
+                Sets the weight (or boldness) of the font.
+""",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "SelectedpointsValidator": (
+            "selectedpoints",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "OrientationValidator": (
+            "orientation",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["v", "h"],
+            },
+        ),
+        "NodeValidator": (
+            "node",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Node",
+                "data_docs": """
+            align
+                Sets the alignment method used to position the
+                nodes along the horizontal axis.
+            color
+                Sets the `node` color. It can be a single
+                value, or an array for specifying color for
+                each `node`. If `node.color` is omitted, then
+                the default `Plotly` color palette will be
+                cycled through to have a variety of colors.
+                These defaults are not fully opaque, to allow
+                some visibility of what is beneath the node.
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            customdata
+                Assigns extra data to each node.
+            customdatasrc
+                Sets the source reference on Chart Studio Cloud
+                for `customdata`.
+            groups
+                Groups of nodes. Each group is defined by an
+                array with the indices of the nodes it
+                contains. Multiple groups can be specified.
+            hoverinfo
+                Determines which trace information appear when
+                hovering nodes. If `none` or `skip` are set, no
+                information is displayed upon hovering. But, if
+                `none` is set, click and hover events are still
+                fired.
+            hoverlabel
+                :class:`plotly.graph_objects.sankey.node.Hoverl
+                abel` instance or dict with compatible
+                properties
+            hovertemplate
+                Template string used for rendering the
+                information that appear on hover box. Note that
+                this will override `hoverinfo`. Variables are
+                inserted using %{variable}, for example "y:
+                %{y}" as well as %{xother}, {%_xother},
+                {%_xother_}, {%xother_}. When showing info for
+                several points, "xother" will be added to those
+                with different x positions from the first
+                point. An underscore before or after
+                "(x|y)other" will add a space on that side,
+                only when this field is shown. Numbers are
+                formatted using d3-format's syntax
+                %{variable:d3-format}, for example "Price:
+                %{y:$.2f}". https://github.com/d3/d3-
+                format/tree/v1.4.5#d3-format for details on the
+                formatting syntax. Dates are formatted using
+                d3-time-format's syntax %{variable|d3-time-
+                format}, for example "Day: %{2019-01-01|%A}".
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format for details on
+                the date formatting syntax. The variables
+                available in `hovertemplate` are the ones
+                emitted as event data described at this link
+                https://plotly.com/javascript/plotlyjs-
+                events/#event-data. Additionally, every
+                attributes that can be specified per-point (the
+                ones that are `arrayOk: true`) are available.
+                Variables `sourceLinks` and `targetLinks` are
+                arrays of link objects.Finally, the template
+                string has access to variables `value` and
+                `label`. Anything contained in tag `<extra>` is
+                displayed in the secondary box, for example
+                "<extra>{fullData.name}</extra>". To hide the
+                secondary box completely, use an empty tag
+                `<extra></extra>`.
+            hovertemplatesrc
+                Sets the source reference on Chart Studio Cloud
+                for `hovertemplate`.
+            label
+                The shown name of the node.
+            labelsrc
+                Sets the source reference on Chart Studio Cloud
+                for `label`.
+            line
+                :class:`plotly.graph_objects.sankey.node.Line`
+                instance or dict with compatible properties
+            pad
+                Sets the padding (in px) between the `nodes`.
+            thickness
+                Sets the thickness (in px) of the `nodes`.
+            x
+                The normalized horizontal position of the node.
+            xsrc
+                Sets the source reference on Chart Studio Cloud
+                for `x`.
+            y
+                The normalized vertical position of the node.
+            ysrc
+                Sets the source reference on Chart Studio Cloud
+                for `y`.
+""",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LinkValidator": (
+            "link",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Link",
+                "data_docs": """
+            arrowlen
+                Sets the length (in px) of the links arrow, if
+                0 no arrow will be drawn.
+            color
+                Sets the `link` color. It can be a single
+                value, or an array for specifying color for
+                each `link`. If `link.color` is omitted, then
+                by default, a translucent grey link will be
+                used.
+            colorscales
+                A tuple of :class:`plotly.graph_objects.sankey.
+                link.Colorscale` instances or dicts with
+                compatible properties
+            colorscaledefaults
+                When used in a template (as layout.template.dat
+                a.sankey.link.colorscaledefaults), sets the
+                default property values to use for elements of
+                sankey.link.colorscales
+            colorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `color`.
+            customdata
+                Assigns extra data to each link.
+            customdatasrc
+                Sets the source reference on Chart Studio Cloud
+                for `customdata`.
+            hovercolor
+                Sets the `link` hover color. It can be a single
+                value, or an array for specifying hover colors
+                for each `link`. If `link.hovercolor` is
+                omitted, then by default, links will become
+                slightly more opaque when hovered over.
+            hovercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `hovercolor`.
+            hoverinfo
+                Determines which trace information appear when
+                hovering links. If `none` or `skip` are set, no
+                information is displayed upon hovering. But, if
+                `none` is set, click and hover events are still
+                fired.
+            hoverlabel
+                :class:`plotly.graph_objects.sankey.link.Hoverl
+                abel` instance or dict with compatible
+                properties
+            hovertemplate
+                Template string used for rendering the
+                information that appear on hover box. Note that
+                this will override `hoverinfo`. Variables are
+                inserted using %{variable}, for example "y:
+                %{y}" as well as %{xother}, {%_xother},
+                {%_xother_}, {%xother_}. When showing info for
+                several points, "xother" will be added to those
+                with different x positions from the first
+                point. An underscore before or after
+                "(x|y)other" will add a space on that side,
+                only when this field is shown. Numbers are
+                formatted using d3-format's syntax
+                %{variable:d3-format}, for example "Price:
+                %{y:$.2f}". https://github.com/d3/d3-
+                format/tree/v1.4.5#d3-format for details on the
+                formatting syntax. Dates are formatted using
+                d3-time-format's syntax %{variable|d3-time-
+                format}, for example "Day: %{2019-01-01|%A}".
+                https://github.com/d3/d3-time-
+                format/tree/v2.2.3#locale_format for details on
+                the date formatting syntax. The variables
+                available in `hovertemplate` are the ones
+                emitted as event data described at this link
+                https://plotly.com/javascript/plotlyjs-
+                events/#event-data. Additionally, every
+                attributes that can be specified per-point (the
+                ones that are `arrayOk: true`) are available.
+                Variables `source` and `target` are node
+                objects.Finally, the template string has access
+                to variables `value` and `label`. Anything
+                contained in tag `<extra>` is displayed in the
+                secondary box, for example
+                "<extra>{fullData.name}</extra>". To hide the
+                secondary box completely, use an empty tag
+                `<extra></extra>`.
+            hovertemplatesrc
+                Sets the source reference on Chart Studio Cloud
+                for `hovertemplate`.
+            label
+                The shown name of the link.
+            labelsrc
+                Sets the source reference on Chart Studio Cloud
+                for `label`.
+            line
+                :class:`plotly.graph_objects.sankey.link.Line`
+                instance or dict with compatible properties
+            source
+                An integer number `[0..nodes.length - 1]` that
+                represents the source node.
+            sourcesrc
+                Sets the source reference on Chart Studio Cloud
+                for `source`.
+            target
+                An integer number `[0..nodes.length - 1]` that
+                represents the target node.
+            targetsrc
+                Sets the source reference on Chart Studio Cloud
+                for `target`.
+            value
+                A numeric value representing the flow volume
+                value.
+            valuesrc
+                Sets the source reference on Chart Studio Cloud
+                for `value`.
+""",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": False,
+                "edit_type": "calc",
+                "extras": ["all", "none", "skip"],
+                "flags": [],
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this sankey trace .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this sankey trace .
+            x
+                Sets the horizontal domain of this sankey trace
+                (in plot fraction).
+            y
+                Sets the vertical domain of this sankey trace
+                (in plot fraction).
+""",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ArrangementValidator": (
+            "arrangement",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["snap", "perpendicular", "freeform", "fixed"],
+            },
+        ),
+    },
+    [],
+)
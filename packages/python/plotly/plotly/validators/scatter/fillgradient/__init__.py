@@ -1,21 +1,38 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._type import TypeValidator
-    from ._stop import StopValidator
-    from ._start import StartValidator
-    from ._colorscale import ColorscaleValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._type.TypeValidator",
-            "._stop.StopValidator",
-            "._start.StartValidator",
-            "._colorscale.ColorscaleValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "scatter.fillgradient",
+    {
+        "TypeValidator": (
+            "type",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": ["radial", "horizontal", "vertical", "none"],
+            },
+        ),
+        "StopValidator": (
+            "stop",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "StartValidator": (
+            "start",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ColorscaleValidator": (
+            "colorscale",
+            "_plotly_utils.basevalidators.ColorscaleValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+    },
+    [],
+)
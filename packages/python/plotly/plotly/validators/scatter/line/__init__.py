@@ -1,29 +1,81 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._width import WidthValidator
-    from ._smoothing import SmoothingValidator
-    from ._simplify import SimplifyValidator
-    from ._shape import ShapeValidator
-    from ._dash import DashValidator
-    from ._color import ColorValidator
-    from ._backoffsrc import BackoffsrcValidator
-    from ._backoff import BackoffValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._width.WidthValidator",
-            "._smoothing.SmoothingValidator",
-            "._simplify.SimplifyValidator",
-            "._shape.ShapeValidator",
-            "._dash.DashValidator",
-            "._color.ColorValidator",
-            "._backoffsrc.BackoffsrcValidator",
-            "._backoff.BackoffValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "scatter.line",
+    {
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "anim": True,
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "SmoothingValidator": (
+            "smoothing",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "max": 1.3,
+                "min": 0,
+            },
+        ),
+        "SimplifyValidator": (
+            "simplify",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "ShapeValidator": (
+            "shape",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": ["linear", "spline", "hv", "vh", "hvh", "vhv"],
+            },
+        ),
+        "DashValidator": (
+            "dash",
+            "_plotly_utils.basevalidators.DashValidator",
+            {
+                "edit_type": "style",
+                "values": [
+                    "solid",
+                    "dot",
+                    "dash",
+                    "longdash",
+                    "dashdot",
+                    "longdashdot",
+                ],
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "anim": True,
+                "edit_type": "style",
+            },
+        ),
+        "BackoffsrcValidator": (
+            "backoffsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "BackoffValidator": (
+            "backoff",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
@@ -1,13 +1,60 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._z import ZValidator
-    from ._y import YValidator
-    from ._x import XValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._z.ZValidator", "._y.YValidator", "._x.XValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "scatter3d.projection",
+    {
+        "ZValidator": (
+            "z",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Z",
+                "data_docs": """
+            opacity
+                Sets the projection color.
+            scale
+                Sets the scale factor determining the size of
+                the projection marker points.
+            show
+                Sets whether or not projections are shown along
+                the z axis.
+""",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Y",
+                "data_docs": """
+            opacity
+                Sets the projection color.
+            scale
+                Sets the scale factor determining the size of
+                the projection marker points.
+            show
+                Sets whether or not projections are shown along
+                the y axis.
+""",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "X",
+                "data_docs": """
+            opacity
+                Sets the projection color.
+            scale
+                Sets the scale factor determining the size of
+                the projection marker points.
+            show
+                Sets whether or not projections are shown along
+                the x axis.
+""",
+            },
+        ),
+    },
+    [],
+)
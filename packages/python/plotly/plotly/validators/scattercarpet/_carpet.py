@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class CarpetValidator(_plotly_utils.basevalidators.StringValidator):
-    def __init__(self, plotly_name="carpet", parent_name="scattercarpet", **kwargs):
-        super(CarpetValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            **kwargs,
-        )
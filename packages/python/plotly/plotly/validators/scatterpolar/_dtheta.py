@@ -1,11 +0,0 @@
-import _plotly_utils.basevalidators
-
-
-class DthetaValidator(_plotly_utils.basevalidators.NumberValidator):
-    def __init__(self, plotly_name="dtheta", parent_name="scatterpolar", **kwargs):
-        super(DthetaValidator, self).__init__(
-            plotly_name=plotly_name,
-            parent_name=parent_name,
-            edit_type=kwargs.pop("edit_type", "calc"),
-            **kwargs,
-        )
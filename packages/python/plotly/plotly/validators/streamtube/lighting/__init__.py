@@ -1,27 +1,72 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._vertexnormalsepsilon import VertexnormalsepsilonValidator
-    from ._specular import SpecularValidator
-    from ._roughness import RoughnessValidator
-    from ._fresnel import FresnelValidator
-    from ._facenormalsepsilon import FacenormalsepsilonValidator
-    from ._diffuse import DiffuseValidator
-    from ._ambient import AmbientValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._vertexnormalsepsilon.VertexnormalsepsilonValidator",
-            "._specular.SpecularValidator",
-            "._roughness.RoughnessValidator",
-            "._fresnel.FresnelValidator",
-            "._facenormalsepsilon.FacenormalsepsilonValidator",
-            "._diffuse.DiffuseValidator",
-            "._ambient.AmbientValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "streamtube.lighting",
+    {
+        "VertexnormalsepsilonValidator": (
+            "vertexnormalsepsilon",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "SpecularValidator": (
+            "specular",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 2,
+                "min": 0,
+            },
+        ),
+        "RoughnessValidator": (
+            "roughness",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "FresnelValidator": (
+            "fresnel",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 5,
+                "min": 0,
+            },
+        ),
+        "FacenormalsepsilonValidator": (
+            "facenormalsepsilon",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "DiffuseValidator": (
+            "diffuse",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+        "AmbientValidator": (
+            "ambient",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 1,
+                "min": 0,
+            },
+        ),
+    },
+    [],
+)
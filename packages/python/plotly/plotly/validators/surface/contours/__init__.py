@@ -1,13 +1,135 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._z import ZValidator
-    from ._y import YValidator
-    from ._x import XValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._z.ZValidator", "._y.YValidator", "._x.XValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "surface.contours",
+    {
+        "ZValidator": (
+            "z",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Z",
+                "data_docs": """
+            color
+                Sets the color of the contour lines.
+            end
+                Sets the end contour level value. Must be more
+                than `contours.start`
+            highlight
+                Determines whether or not contour lines about
+                the z dimension are highlighted on hover.
+            highlightcolor
+                Sets the color of the highlighted contour
+                lines.
+            highlightwidth
+                Sets the width of the highlighted contour
+                lines.
+            project
+                :class:`plotly.graph_objects.surface.contours.z
+                .Project` instance or dict with compatible
+                properties
+            show
+                Determines whether or not contour lines about
+                the z dimension are drawn.
+            size
+                Sets the step between each contour level. Must
+                be positive.
+            start
+                Sets the starting contour level value. Must be
+                less than `contours.end`
+            usecolormap
+                An alternate to "color". Determines whether or
+                not the contour lines are colored using the
+                trace "colorscale".
+            width
+                Sets the width of the contour lines.
+""",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Y",
+                "data_docs": """
+            color
+                Sets the color of the contour lines.
+            end
+                Sets the end contour level value. Must be more
+                than `contours.start`
+            highlight
+                Determines whether or not contour lines about
+                the y dimension are highlighted on hover.
+            highlightcolor
+                Sets the color of the highlighted contour
+                lines.
+            highlightwidth
+                Sets the width of the highlighted contour
+                lines.
+            project
+                :class:`plotly.graph_objects.surface.contours.y
+                .Project` instance or dict with compatible
+                properties
+            show
+                Determines whether or not contour lines about
+                the y dimension are drawn.
+            size
+                Sets the step between each contour level. Must
+                be positive.
+            start
+                Sets the starting contour level value. Must be
+                less than `contours.end`
+            usecolormap
+                An alternate to "color". Determines whether or
+                not the contour lines are colored using the
+                trace "colorscale".
+            width
+                Sets the width of the contour lines.
+""",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "X",
+                "data_docs": """
+            color
+                Sets the color of the contour lines.
+            end
+                Sets the end contour level value. Must be more
+                than `contours.start`
+            highlight
+                Determines whether or not contour lines about
+                the x dimension are highlighted on hover.
+            highlightcolor
+                Sets the color of the highlighted contour
+                lines.
+            highlightwidth
+                Sets the width of the highlighted contour
+                lines.
+            project
+                :class:`plotly.graph_objects.surface.contours.x
+                .Project` instance or dict with compatible
+                properties
+            show
+                Determines whether or not contour lines about
+                the x dimension are drawn.
+            size
+                Sets the step between each contour level. Must
+                be positive.
+            start
+                Sets the starting contour level value. Must be
+                less than `contours.end`
+            usecolormap
+                An alternate to "color". Determines whether or
+                not the contour lines are colored using the
+                trace "colorscale".
+            width
+                Sets the width of the contour lines.
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,35 +1,111 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._width import WidthValidator
-    from ._usecolormap import UsecolormapValidator
-    from ._start import StartValidator
-    from ._size import SizeValidator
-    from ._show import ShowValidator
-    from ._project import ProjectValidator
-    from ._highlightwidth import HighlightwidthValidator
-    from ._highlightcolor import HighlightcolorValidator
-    from ._highlight import HighlightValidator
-    from ._end import EndValidator
-    from ._color import ColorValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._width.WidthValidator",
-            "._usecolormap.UsecolormapValidator",
-            "._start.StartValidator",
-            "._size.SizeValidator",
-            "._show.ShowValidator",
-            "._project.ProjectValidator",
-            "._highlightwidth.HighlightwidthValidator",
-            "._highlightcolor.HighlightcolorValidator",
-            "._highlight.HighlightValidator",
-            "._end.EndValidator",
-            "._color.ColorValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "surface.contours.x",
+    {
+        "WidthValidator": (
+            "width",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 16,
+                "min": 1,
+            },
+        ),
+        "UsecolormapValidator": (
+            "usecolormap",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "StartValidator": (
+            "start",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "SizeValidator": (
+            "size",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "min": 0,
+            },
+        ),
+        "ShowValidator": (
+            "show",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ProjectValidator": (
+            "project",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Project",
+                "data_docs": """
+            x
+                Determines whether or not these contour lines
+                are projected on the x plane. If `highlight` is
+                set to True (the default), the projected lines
+                are shown on hover. If `show` is set to True,
+                the projected lines are shown in permanence.
+            y
+                Determines whether or not these contour lines
+                are projected on the y plane. If `highlight` is
+                set to True (the default), the projected lines
+                are shown on hover. If `show` is set to True,
+                the projected lines are shown in permanence.
+            z
+                Determines whether or not these contour lines
+                are projected on the z plane. If `highlight` is
+                set to True (the default), the projected lines
+                are shown on hover. If `show` is set to True,
+                the projected lines are shown in permanence.
+""",
+            },
+        ),
+        "HighlightwidthValidator": (
+            "highlightwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+                "max": 16,
+                "min": 1,
+            },
+        ),
+        "HighlightcolorValidator": (
+            "highlightcolor",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HighlightValidator": (
+            "highlight",
+            "_plotly_utils.basevalidators.BooleanValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "EndValidator": (
+            "end",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ColorValidator": (
+            "color",
+            "_plotly_utils.basevalidators.ColorValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+    },
+    [],
+)
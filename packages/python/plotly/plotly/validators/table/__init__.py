@@ -1,63 +1,362 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._visible import VisibleValidator
-    from ._uirevision import UirevisionValidator
-    from ._uid import UidValidator
-    from ._stream import StreamValidator
-    from ._name import NameValidator
-    from ._metasrc import MetasrcValidator
-    from ._meta import MetaValidator
-    from ._legendwidth import LegendwidthValidator
-    from ._legendrank import LegendrankValidator
-    from ._legendgrouptitle import LegendgrouptitleValidator
-    from ._legend import LegendValidator
-    from ._idssrc import IdssrcValidator
-    from ._ids import IdsValidator
-    from ._hoverlabel import HoverlabelValidator
-    from ._hoverinfosrc import HoverinfosrcValidator
-    from ._hoverinfo import HoverinfoValidator
-    from ._header import HeaderValidator
-    from ._domain import DomainValidator
-    from ._customdatasrc import CustomdatasrcValidator
-    from ._customdata import CustomdataValidator
-    from ._columnwidthsrc import ColumnwidthsrcValidator
-    from ._columnwidth import ColumnwidthValidator
-    from ._columnordersrc import ColumnordersrcValidator
-    from ._columnorder import ColumnorderValidator
-    from ._cells import CellsValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._visible.VisibleValidator",
-            "._uirevision.UirevisionValidator",
-            "._uid.UidValidator",
-            "._stream.StreamValidator",
-            "._name.NameValidator",
-            "._metasrc.MetasrcValidator",
-            "._meta.MetaValidator",
-            "._legendwidth.LegendwidthValidator",
-            "._legendrank.LegendrankValidator",
-            "._legendgrouptitle.LegendgrouptitleValidator",
-            "._legend.LegendValidator",
-            "._idssrc.IdssrcValidator",
-            "._ids.IdsValidator",
-            "._hoverlabel.HoverlabelValidator",
-            "._hoverinfosrc.HoverinfosrcValidator",
-            "._hoverinfo.HoverinfoValidator",
-            "._header.HeaderValidator",
-            "._domain.DomainValidator",
-            "._customdatasrc.CustomdatasrcValidator",
-            "._customdata.CustomdataValidator",
-            "._columnwidthsrc.ColumnwidthsrcValidator",
-            "._columnwidth.ColumnwidthValidator",
-            "._columnordersrc.ColumnordersrcValidator",
-            "._columnorder.ColumnorderValidator",
-            "._cells.CellsValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "table",
+    {
+        "VisibleValidator": (
+            "visible",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "calc",
+                "values": [True, False, "legendonly"],
+            },
+        ),
+        "UirevisionValidator": (
+            "uirevision",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "UidValidator": (
+            "uid",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "plot",
+            },
+        ),
+        "StreamValidator": (
+            "stream",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Stream",
+                "data_docs": """
+            maxpoints
+                Sets the maximum number of points to keep on
+                the plots from an incoming stream. If
+                `maxpoints` is set to 50, only the newest 50
+                points will be displayed on the plot.
+            token
+                The stream id number links a data trace on a
+                plot with a stream. See https://chart-
+                studio.plotly.com/settings for more details.
+""",
+            },
+        ),
+        "NameValidator": (
+            "name",
+            "_plotly_utils.basevalidators.StringValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "MetasrcValidator": (
+            "metasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "MetaValidator": (
+            "meta",
+            "_plotly_utils.basevalidators.AnyValidator",
+            {
+                "array_ok": True,
+                "edit_type": "plot",
+            },
+        ),
+        "LegendwidthValidator": (
+            "legendwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+                "min": 0,
+            },
+        ),
+        "LegendrankValidator": (
+            "legendrank",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "style",
+            },
+        ),
+        "LegendgrouptitleValidator": (
+            "legendgrouptitle",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Legendgrouptitle",
+                "data_docs": """
+            font
+                Sets this legend group's title font.
+            text
+                Sets the title of the legend group.
+""",
+            },
+        ),
+        "LegendValidator": (
+            "legend",
+            "_plotly_utils.basevalidators.SubplotidValidator",
+            {
+                "dflt": "legend",
+                "edit_type": "style",
+            },
+        ),
+        "IdssrcValidator": (
+            "idssrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "IdsValidator": (
+            "ids",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "HoverlabelValidator": (
+            "hoverlabel",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Hoverlabel",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the text
+                content within hover label box. Has an effect
+                only if the hover label text spans more two or
+                more lines
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            bgcolor
+                Sets the background color of the hover labels
+                for this trace
+            bgcolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bgcolor`.
+            bordercolor
+                Sets the border color of the hover labels for
+                this trace.
+            bordercolorsrc
+                Sets the source reference on Chart Studio Cloud
+                for `bordercolor`.
+            font
+                Sets the font used in hover labels.
+            namelength
+                Sets the default length (in number of
+                characters) of the trace name in the hover
+                labels for all traces. -1 shows the whole name
+                regardless of length. 0-3 shows the first 0-3
+                characters, and an integer >3 will show the
+                whole name if it is less than that many
+                characters, but if it is longer, will truncate
+                to `namelength - 3` characters and add an
+                ellipsis.
+            namelengthsrc
+                Sets the source reference on Chart Studio Cloud
+                for `namelength`.
+""",
+            },
+        ),
+        "HoverinfosrcValidator": (
+            "hoverinfosrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "HoverinfoValidator": (
+            "hoverinfo",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "array_ok": True,
+                "edit_type": "none",
+                "extras": ["all", "none", "skip"],
+                "flags": ["x", "y", "z", "text", "name"],
+            },
+        ),
+        "HeaderValidator": (
+            "header",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Header",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the `text`
+                within the box. Has an effect only if `text`
+                spans two or more lines (i.e. `text` contains
+                one or more <br> HTML tags) or if an explicit
+                width is set to override the text width.
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            fill
+                :class:`plotly.graph_objects.table.header.Fill`
+                instance or dict with compatible properties
+            font
+                :class:`plotly.graph_objects.table.header.Font`
+                instance or dict with compatible properties
+            format
+                Sets the cell value formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format.
+            formatsrc
+                Sets the source reference on Chart Studio Cloud
+                for `format`.
+            height
+                The height of cells.
+            line
+                :class:`plotly.graph_objects.table.header.Line`
+                instance or dict with compatible properties
+            prefix
+                Prefix for cell values.
+            prefixsrc
+                Sets the source reference on Chart Studio Cloud
+                for `prefix`.
+            suffix
+                Suffix for cell values.
+            suffixsrc
+                Sets the source reference on Chart Studio Cloud
+                for `suffix`.
+            values
+                Header cell values. `values[m][n]` represents
+                the value of the `n`th point in column `m`,
+                therefore the `values[m]` vector length for all
+                columns must be the same (longer vectors will
+                be truncated). Each value must be a finite
+                number or a string.
+            valuessrc
+                Sets the source reference on Chart Studio Cloud
+                for `values`.
+""",
+            },
+        ),
+        "DomainValidator": (
+            "domain",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Domain",
+                "data_docs": """
+            column
+                If there is a layout grid, use the domain for
+                this column in the grid for this table trace .
+            row
+                If there is a layout grid, use the domain for
+                this row in the grid for this table trace .
+            x
+                Sets the horizontal domain of this table trace
+                (in plot fraction).
+            y
+                Sets the vertical domain of this table trace
+                (in plot fraction).
+""",
+            },
+        ),
+        "CustomdatasrcValidator": (
+            "customdatasrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "CustomdataValidator": (
+            "customdata",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "ColumnwidthsrcValidator": (
+            "columnwidthsrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColumnwidthValidator": (
+            "columnwidth",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "array_ok": True,
+                "edit_type": "calc",
+            },
+        ),
+        "ColumnordersrcValidator": (
+            "columnordersrc",
+            "_plotly_utils.basevalidators.SrcValidator",
+            {
+                "edit_type": "none",
+            },
+        ),
+        "ColumnorderValidator": (
+            "columnorder",
+            "_plotly_utils.basevalidators.DataArrayValidator",
+            {
+                "edit_type": "calc",
+            },
+        ),
+        "CellsValidator": (
+            "cells",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Cells",
+                "data_docs": """
+            align
+                Sets the horizontal alignment of the `text`
+                within the box. Has an effect only if `text`
+                spans two or more lines (i.e. `text` contains
+                one or more <br> HTML tags) or if an explicit
+                width is set to override the text width.
+            alignsrc
+                Sets the source reference on Chart Studio Cloud
+                for `align`.
+            fill
+                :class:`plotly.graph_objects.table.cells.Fill`
+                instance or dict with compatible properties
+            font
+                :class:`plotly.graph_objects.table.cells.Font`
+                instance or dict with compatible properties
+            format
+                Sets the cell value formatting rule using d3
+                formatting mini-languages which are very
+                similar to those in Python. For numbers, see: h
+                ttps://github.com/d3/d3-format/tree/v1.4.5#d3-
+                format.
+            formatsrc
+                Sets the source reference on Chart Studio Cloud
+                for `format`.
+            height
+                The height of cells.
+            line
+                :class:`plotly.graph_objects.table.cells.Line`
+                instance or dict with compatible properties
+            prefix
+                Prefix for cell values.
+            prefixsrc
+                Sets the source reference on Chart Studio Cloud
+                for `prefix`.
+            suffix
+                Suffix for cell values.
+            suffixsrc
+                Sets the source reference on Chart Studio Cloud
+                for `suffix`.
+            values
+                Cell values. `values[m][n]` represents the
+                value of the `n`th point in column `m`,
+                therefore the `values[m]` vector length for all
+                columns must be the same (longer vectors will
+                be truncated). Each value must be a finite
+                number or a string.
+            valuessrc
+                Sets the source reference on Chart Studio Cloud
+                for `values`.
+""",
+            },
+        ),
+    },
+    [],
+)
@@ -1,21 +1,48 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._squarifyratio import SquarifyratioValidator
-    from ._pad import PadValidator
-    from ._packing import PackingValidator
-    from ._flip import FlipValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__,
-        [],
-        [
-            "._squarifyratio.SquarifyratioValidator",
-            "._pad.PadValidator",
-            "._packing.PackingValidator",
-            "._flip.FlipValidator",
-        ],
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "treemap.tiling",
+    {
+        "SquarifyratioValidator": (
+            "squarifyratio",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 1,
+            },
+        ),
+        "PadValidator": (
+            "pad",
+            "_plotly_utils.basevalidators.NumberValidator",
+            {
+                "edit_type": "plot",
+                "min": 0,
+            },
+        ),
+        "PackingValidator": (
+            "packing",
+            "_plotly_utils.basevalidators.EnumeratedValidator",
+            {
+                "edit_type": "plot",
+                "values": [
+                    "squarify",
+                    "binary",
+                    "dice",
+                    "slice",
+                    "slice-dice",
+                    "dice-slice",
+                ],
+            },
+        ),
+        "FlipValidator": (
+            "flip",
+            "_plotly_utils.basevalidators.FlaglistValidator",
+            {
+                "edit_type": "plot",
+                "flags": ["x", "y"],
+            },
+        ),
+    },
+    [],
+)
@@ -1,13 +1,75 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._z import ZValidator
-    from ._y import YValidator
-    from ._x import XValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._z.ZValidator", "._y.YValidator", "._x.XValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "volume.caps",
+    {
+        "ZValidator": (
+            "z",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Z",
+                "data_docs": """
+            fill
+                Sets the fill ratio of the `caps`. The default
+                fill value of the `caps` is 1 meaning that they
+                are entirely shaded. On the other hand Applying
+                a `fill` ratio less than one would allow the
+                creation of openings parallel to the edges.
+            show
+                Sets the fill ratio of the `slices`. The
+                default fill value of the z `slices` is 1
+                meaning that they are entirely shaded. On the
+                other hand Applying a `fill` ratio less than
+                one would allow the creation of openings
+                parallel to the edges.
+""",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Y",
+                "data_docs": """
+            fill
+                Sets the fill ratio of the `caps`. The default
+                fill value of the `caps` is 1 meaning that they
+                are entirely shaded. On the other hand Applying
+                a `fill` ratio less than one would allow the
+                creation of openings parallel to the edges.
+            show
+                Sets the fill ratio of the `slices`. The
+                default fill value of the y `slices` is 1
+                meaning that they are entirely shaded. On the
+                other hand Applying a `fill` ratio less than
+                one would allow the creation of openings
+                parallel to the edges.
+""",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "X",
+                "data_docs": """
+            fill
+                Sets the fill ratio of the `caps`. The default
+                fill value of the `caps` is 1 meaning that they
+                are entirely shaded. On the other hand Applying
+                a `fill` ratio less than one would allow the
+                creation of openings parallel to the edges.
+            show
+                Sets the fill ratio of the `slices`. The
+                default fill value of the x `slices` is 1
+                meaning that they are entirely shaded. On the
+                other hand Applying a `fill` ratio less than
+                one would allow the creation of openings
+                parallel to the edges.
+""",
+            },
+        ),
+    },
+    [],
+)
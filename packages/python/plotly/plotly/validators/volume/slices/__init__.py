@@ -1,13 +1,90 @@
-import sys
-from typing import TYPE_CHECKING
+from _plotly_utils.importers import validator_table
 
-if sys.version_info < (3, 7) or TYPE_CHECKING:
-    from ._z import ZValidator
-    from ._y import YValidator
-    from ._x import XValidator
-else:
-    from _plotly_utils.importers import relative_import
-
-    __all__, __getattr__, __dir__ = relative_import(
-        __name__, [], ["._z.ZValidator", "._y.YValidator", "._x.XValidator"]
-    )
+__all__, __getattr__, __dir__ = validator_table(
+    __name__,
+    "volume.slices",
+    {
+        "ZValidator": (
+            "z",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Z",
+                "data_docs": """
+            fill
+                Sets the fill ratio of the `slices`. The
+                default fill value of the `slices` is 1 meaning
+                that they are entirely shaded. On the other
+                hand Applying a `fill` ratio less than one
+                would allow the creation of openings parallel
+                to the edges.
+            locations
+                Specifies the location(s) of slices on the
+                axis. When not specified slices would be
+                created for all points of the axis z except
+                start and end.
+            locationssrc
+                Sets the source reference on Chart Studio Cloud
+                for `locations`.
+            show
+                Determines whether or not slice planes about
+                the z dimension are drawn.
+""",
+            },
+        ),
+        "YValidator": (
+            "y",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "Y",
+                "data_docs": """
+            fill
+                Sets the fill ratio of the `slices`. The
+                default fill value of the `slices` is 1 meaning
+                that they are entirely shaded. On the other
+                hand Applying a `fill` ratio less than one
+                would allow the creation of openings parallel
+                to the edges.
+            locations
+                Specifies the location(s) of slices on the
+                axis. When not specified slices would be
+                created for all points of the axis y except
+                start and end.
+            locationssrc
+                Sets the source reference on Chart Studio Cloud
+                for `locations`.
+            show
+                Determines whether or not slice planes about
+                the y dimension are drawn.
+""",
+            },
+        ),
+        "XValidator": (
+            "x",
+            "_plotly_utils.basevalidators.CompoundValidator",
+            {
+                "data_class_str": "X",
+                "data_docs": """
+            fill
+                Sets the fill ratio of the `slices`. The
+                default fill value of the `slices` is 1 meaning
+                that they are entirely shaded. On the other
+                hand Applying a `fill` ratio less than one
+                would allow the creation of openings parallel
+                to the edges.
+            locations
+                Specifies the location(s) of slices on the
+                axis. When not specified slices would be
+                created for all points of the axis x except
+                start and end.
+            locationssrc
+                Sets the source reference on Chart Studio Cloud
+                for `locations`.
+            show
+                Determines whether or not slice planes about
+                the x dimension are drawn.
+""",
+            },
+        ),
+    },
+    [],
+)
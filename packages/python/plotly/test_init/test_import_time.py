@@ -0,0 +1,73 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+from . import version_skip
+
+# Upper bound on the wall time needed to import plotly.graph_objects and
+# construct an empty figure in a fresh interpreter. This takes a few tenths of
+# a second, the budget is deliberately generous so that it only catches
+# regressions such as eagerly importing all of graph_objs, not slow machines
+FIGURE_WALL_TIME_BUDGET_SECONDS = 5.0
+
+
+def run_with_importtime(code):
+    """
+    Run code in a fresh interpreter with `-X importtime` and return a dict
+    from imported module name to cumulative import time in seconds, along
+    with anything the code printed to stdout
+    """
+    plotly_dir = importlib.util.find_spec("plotly").submodule_search_locations[0]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(plotly_dir), env.get("PYTHONPATH", "")]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative) / 1e6
+    return times, proc.stdout
+
+
+@version_skip
+def test_figure_import_budget():
+    code = (
+        "import time; t = time.perf_counter(); "
+        "import plotly.graph_objects as go; go.Figure(); "
+        "print(time.perf_counter() - t)"
+    )
+
+    # Warm-up run so that the timed run doesn't include writing bytecode caches
+    run_with_importtime(code)
+    times, elapsed = run_with_importtime(code)
+
+    # Heavy optional dependencies must not be imported to build a figure
+    for module in ["IPython", "numpy", "pandas", "PIL", "xarray"]:
+        assert module not in times
+
+    # Only the graph_objs/validators modules that are actually touched are
+    # imported
+    validators = [m for m in times if m.startswith("plotly.validators")]
+    graph_objs = [m for m in times if m.startswith("plotly.graph_objs")]
+    assert len(validators) < 20
+    assert len(graph_objs) < 20
+
+    assert float(elapsed) < FIGURE_WALL_TIME_BUDGET_SECONDS
+
+
+@version_skip
+def test_express_import_does_not_load_optional_dependencies():
+    times, _ = run_with_importtime("import plotly.express")
+    for module in ["IPython", "PIL", "xarray"]:
+        assert module not in times